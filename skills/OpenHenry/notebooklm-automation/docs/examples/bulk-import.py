@@ -3,8 +3,8 @@
 
 This script demonstrates:
 1. Create a notebook
-2. Add multiple sources of different types
-3. Handle errors gracefully
+2. Add multiple sources of different types in one concurrent batch
+3. Handle errors per item
 4. Report import status
 
 Prerequisites:
@@ -51,51 +51,31 @@ async def main():
         nb = await client.notebooks.create("Bulk Import Demo")
         print(f"  Created: {nb.id}\n")
 
-        results = {"success": [], "failed": []}
-
-        # 2. Import URLs
-        print("Importing URLs...")
-        for url in SOURCES["urls"]:
-            try:
-                source = await client.sources.add_url(nb.id, url)
-                results["success"].append(f"URL: {source.title}")
-                print(f"  + {source.title}")
-            except Exception as e:
-                results["failed"].append(f"URL: {url} - {e}")
-                print(f"  - Failed: {url}")
-
-        # 3. Import YouTube videos (add_url auto-detects YouTube)
-        print("\nImporting YouTube videos...")
-        for url in SOURCES["youtube"]:
-            try:
-                source = await client.sources.add_url(nb.id, url)
-                results["success"].append(f"YouTube: {source.title}")
-                print(f"  + {source.title}")
-            except Exception as e:
-                results["failed"].append(f"YouTube: {url} - {e}")
-                print(f"  - Failed: {url}")
-
-        # 4. Import text content
-        print("\nImporting text content...")
-        for item in SOURCES["text"]:
-            try:
-                source = await client.sources.add_text(nb.id, item["title"], item["content"])
-                results["success"].append(f"Text: {source.title}")
-                print(f"  + {source.title}")
-            except Exception as e:
-                results["failed"].append(f"Text: {item['title']} - {e}")
-                print(f"  - Failed: {item['title']}")
-
-        # 5. Report results
+        # 2. Import everything in one concurrent batch. add_url auto-detects
+        #    YouTube, duplicates are skipped, and failures are reported per
+        #    item instead of aborting the batch.
+        items = [*SOURCES["urls"], *SOURCES["youtube"], *SOURCES["text"]]
+
+        def show(result):
+            label = result.source.title if result.source else result.item
+            mark = {"added": "+", "skipped": "=", "failed": "-"}[result.status]
+            print(f"  {mark} {label}")
+
+        print("Importing sources...")
+        results = await client.sources.add_many(nb.id, items, on_progress=show)
+
+        # 3. Report results
+        failed = [r for r in results if r.is_failed]
         print("\n" + "=" * 40)
         print("Import complete!")
-        print(f"  Successful: {len(results['success'])}")
-        print(f"  Failed: {len(results['failed'])}")
+        print(f"  Added: {sum(r.is_added for r in results)}")
+        print(f"  Skipped: {sum(r.is_skipped for r in results)}")
+        print(f"  Failed: {len(failed)}")
 
-        if results["failed"]:
+        if failed:
             print("\nFailed imports:")
-            for item in results["failed"]:
-                print(f"  - {item}")
+            for result in failed:
+                print(f"  - {result.item}: {result.error}")
 
         print(f"\n  Notebook ID: {nb.id}")
         print("  (Notebook kept for review - delete manually when done)")
@@ -34,6 +34,17 @@ except PackageNotFoundError:
         __version__,
     )
 
+# Public API: Local caches and stores
+from ._answers import AnswerCache
+from ._cache import ArtifactCache
+from ._conversations import ConversationStore, MemoryConversationStore, SQLiteConversationStore
+from ._fingerprints import SourceFingerprints
+from ._inventory import write_inventory
+from ._polling import GenerationStats
+from ._search import SourceIndex
+from ._sync import DirectorySync
+from ._uploads import UploadSessionStore
+
 # Public API: Authentication
 from .auth import DEFAULT_STORAGE_PATH, AuthTokens
 
@@ -82,6 +93,7 @@ from .types import (
     Artifact,
     ArtifactType,
     AskResult,
+    AskStreamChunk,
     AudioFormat,
     AudioLength,
     ChatGoal,
@@ -97,11 +109,16 @@ from .types import (
     Note,
     Notebook,
     NotebookDescription,
+    NotebookInventory,
+    NoteImportResult,
+    QuestionResult,
     QuizDifficulty,
     QuizQuantity,
     ReportFormat,
     ReportSuggestion,
+    ResearchTaskResult,
     ShareAccess,
+    ShareChangeResult,
     SharedUser,
     SharePermission,
     ShareStatus,
@@ -109,11 +126,16 @@ from .types import (
     SlideDeckFormat,
     SlideDeckLength,
     Source,
+    SourceAddResult,
+    SourceColumns,
     SourceFulltext,
+    SourceRefreshResult,
+    SourceSearchHit,
     SourceStatus,
     SourceType,
     # Enums for configuration
     SuggestedTopic,
+    SyncReport,
     # Warnings
     UnknownTypeWarning,
     VideoFormat,
@@ -124,25 +146,47 @@ __all__ = [
     "__version__",
     # Client (main entry point)
     "NotebookLMClient",
+    "ArtifactCache",
+    "GenerationStats",
+    "UploadSessionStore",
+    "SourceIndex",
+    "DirectorySync",
+    "SourceFingerprints",
+    "write_inventory",
+    "ConversationStore",
+    "MemoryConversationStore",
+    "SQLiteConversationStore",
+    "AnswerCache",
     # Auth
     "AuthTokens",
     "DEFAULT_STORAGE_PATH",
     # Types
     "Notebook",
     "NotebookDescription",
+    "NotebookInventory",
     "SuggestedTopic",
     "Source",
+    "SourceColumns",
     "SourceFulltext",
+    "SourceAddResult",
+    "SourceSearchHit",
+    "SourceRefreshResult",
+    "ResearchTaskResult",
+    "SyncReport",
     "Artifact",
     "GenerationStatus",
     "ReportSuggestion",
     "Note",
+    "NoteImportResult",
     "ConversationTurn",
     "ChatReference",
     "AskResult",
+    "AskStreamChunk",
+    "QuestionResult",
     "ChatMode",
     "SharedUser",
     "ShareStatus",
+    "ShareChangeResult",
     # Base Exceptions
     "NotebookLMError",
     "ValidationError",
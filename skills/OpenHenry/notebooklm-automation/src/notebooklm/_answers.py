@@ -0,0 +1,140 @@
+"""Local cache of chat answers for batch question runs.
+
+Evaluation sets ask the same questions of a notebook again and again.
+``AnswerCache`` stores each answer under its notebook, the exact set of
+sources it was asked against, and the question text, so
+``ChatAPI.ask_many()`` only sends the questions that have not been
+answered yet.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+from .paths import get_cache_dir
+from .types import AskResult, ChatReference
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    notebook_id TEXT NOT NULL,
+    sources_key TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    references_json TEXT NOT NULL,
+    conversation_id TEXT NOT NULL,
+    answered_at REAL NOT NULL,
+    PRIMARY KEY (notebook_id, sources_key, question)
+);
+"""
+
+
+def sources_key(source_ids: list[str]) -> str:
+    """Order-independent key of a set of source IDs."""
+    return hashlib.sha256("\n".join(sorted(set(source_ids))).encode("utf-8")).hexdigest()
+
+
+class AnswerCache:
+    """SQLite cache of answers keyed by (notebook, source set, question).
+
+    ``ChatAPI.ask_many()`` calls it from worker threads; a lock serializes
+    access to the connection.
+
+    Usage:
+        cache = AnswerCache()  # ~/.notebooklm/cache/answers.db
+        async with NotebookLMClient(auth, answer_cache=cache) as client:
+            results = await client.chat.ask_many(nb_id, questions)
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file, or ``":memory:"`` for a per-process
+                cache. Defaults to ``get_cache_dir() / "answers.db"``.
+        """
+        if path == ":memory:":
+            self.path: Path | None = None
+        else:
+            self.path = Path(path) if path else get_cache_dir() / "answers.db"
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def get(self, notebook_id: str, source_ids: list[str], question: str) -> AskResult | None:
+        """Return the cached answer to a question, or None."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT answer, references_json, conversation_id FROM answers "
+                    "WHERE notebook_id = ? AND sources_key = ? AND question = ?",
+                    (notebook_id, sources_key(source_ids), question),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        answer, references_json, conversation_id = row
+        try:
+            references = [ChatReference(**ref) for ref in json.loads(references_json)]
+        except (ValueError, TypeError) as e:
+            logger.debug("Ignoring unreadable cached references: %s", e)
+            references = []
+        return AskResult(
+            answer=answer,
+            conversation_id=conversation_id,
+            turn_number=1,
+            is_follow_up=False,
+            references=references,
+        )
+
+    def put(
+        self, notebook_id: str, source_ids: list[str], question: str, result: AskResult
+    ) -> None:
+        """Store the answer to a question."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO answers (notebook_id, sources_key, question, answer, "
+                "references_json, conversation_id, answered_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    notebook_id,
+                    sources_key(source_ids),
+                    question,
+                    result.answer,
+                    json.dumps([asdict(ref) for ref in result.references]),
+                    result.conversation_id,
+                    time.time(),
+                ),
+            )
+
+    def clear(self, notebook_id: str | None = None) -> None:
+        """Drop one notebook's answers, or everything if notebook_id is None."""
+        with self._lock, self._connect() as conn:
+            if notebook_id is None:
+                conn.execute("DELETE FROM answers")
+            else:
+                conn.execute("DELETE FROM answers WHERE notebook_id = ?", (notebook_id,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path is None:
+                conn = sqlite3.connect(":memory:", check_same_thread=False)
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
@@ -12,14 +12,20 @@ import html
 import json
 import logging
 import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from ._cache import ArtifactCache
+from ._callbacks import invoke_callback
 from ._core import ClientCore
+from ._file_utils import unique_filename
+from ._polling import GenerationStats, schedule_poll
 from .auth import load_httpx_cookies
-from .exceptions import ValidationError
+from .exceptions import ConfigurationError, NotebookLMError, ValidationError
 from .rpc import (
     ArtifactStatus,
     ArtifactTypeCode,
@@ -52,6 +58,9 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Callback for as_completed() status transitions; may return an awaitable
+StatusCallback = Callable[[GenerationStatus], Awaitable[None] | None]
+
 # Media artifact types that require URL availability before reporting completion
 _MEDIA_ARTIFACT_TYPES = frozenset(
     {
@@ -66,6 +75,34 @@ if TYPE_CHECKING:
     from ._notes import NotesAPI
 
 
+# Artifact types download_all() can export from a single list snapshot
+_EXPORTABLE_ARTIFACT_TYPES = frozenset(
+    {
+        ArtifactType.REPORT,
+        ArtifactType.DATA_TABLE,
+        ArtifactType.QUIZ,
+        ArtifactType.FLASHCARDS,
+        ArtifactType.MIND_MAP,
+    }
+)
+
+# File extensions for quiz/flashcard output formats
+_INTERACTIVE_EXTENSIONS = {"json": ".json", "markdown": ".md", "html": ".html"}
+
+# Output formats for data tables and rows buffered per Parquet record batch
+_DATA_TABLE_FORMATS = ("csv", "parquet")
+_PARQUET_BATCH_ROWS = 10_000
+
+
+def _artifact_created_timestamp(art: list[Any]) -> float | None:
+    """Creation time (epoch seconds) of a raw artifact row, at index 15, position 0."""
+    if len(art) > 15 and isinstance(art[15], list) and art[15]:
+        ts = art[15][0]
+        if isinstance(ts, (int, float)) and not isinstance(ts, bool):
+            return float(ts)
+    return None
+
+
 def _extract_app_data(html_content: str) -> dict:
     """Extract JSON from data-app-data HTML attribute.
 
@@ -123,27 +160,32 @@ def _format_flashcards_markdown(title: str, cards: list[dict]) -> str:
 
 
 def _extract_cell_text(cell: Any) -> str:
-    """Recursively extract text from a nested cell structure.
+    """Extract text from a nested cell structure.
 
     Data table cells have deeply nested arrays with position markers (integers)
-    and text content (strings). This function traverses the structure and
-    concatenates all text fragments found.
+    and text content (strings). This function traverses the structure with an
+    explicit stack (no recursion) and concatenates all text fragments found.
     """
     if isinstance(cell, str):
         return cell
-    if isinstance(cell, int):
-        return ""
-    if isinstance(cell, list):
-        return "".join(text for item in cell if (text := _extract_cell_text(item)))
-    return ""
 
+    fragments: list[str] = []
+    stack: list[Any] = [cell]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            fragments.append(item)
+        elif isinstance(item, list):
+            # Push in reverse so fragments come out in document order
+            stack.extend(reversed(item))
+    return "".join(fragments)
 
-def _parse_data_table(raw_data: list) -> tuple[list[str], list[list[str]]]:
-    """Parse rich-text data table into headers and rows.
 
-    Data tables from NotebookLM have a complex nested structure with position
-    markers. This function navigates to the rows array and extracts text from
-    each cell.
+def _iter_data_table(raw_data: list) -> Iterator[list[str]]:
+    """Lazily yield the header row and then each data row of a data table.
+
+    Rows are produced one at a time so callers can stream them into a writer
+    without building the whole table in memory.
 
     Structure: raw_data[0][0][0][0][4][2] contains the rows array where:
     - [0][0][0][0] navigates through wrapper layers
@@ -153,53 +195,112 @@ def _parse_data_table(raw_data: list) -> tuple[list[str], list[list[str]]]:
     Each row has format: [start_pos, end_pos, [cell_array]]
     Each cell is deeply nested: [pos, pos, [[pos, pos, [[pos, pos, [["text"]]]]]]]
 
-    Returns:
-        Tuple of (headers, rows) where headers is a list of column names
-        and rows is a list of row data (each row is a list of cell strings).
+    Yields:
+        The header row first, then each data row as a list of cell strings.
 
     Raises:
-        ArtifactParseError: If the data structure cannot be parsed or is empty.
+        ArtifactParseError: If the data structure cannot be parsed or has no headers.
     """
     try:
-        # Navigate through nested wrappers to reach the rows array
         rows_array = raw_data[0][0][0][0][4][2]
-        if not rows_array:
-            raise ArtifactParseError("data_table", details="Empty data table")
+    except (IndexError, TypeError, KeyError) as e:
+        raise ArtifactParseError(
+            "data_table",
+            details=f"Failed to parse data table structure: {e}",
+            cause=e,
+        ) from e
+    if not rows_array:
+        raise ArtifactParseError("data_table", details="Empty data table")
 
-        headers: list[str] = []
-        rows: list[list[str]] = []
+    for i, row_section in enumerate(rows_array):
+        # Each row_section is [start_pos, end_pos, cell_array]
+        cell_array = (
+            row_section[2] if isinstance(row_section, list) and len(row_section) >= 3 else None
+        )
+        if not isinstance(cell_array, list):
+            if i == 0:
+                break
+            continue
 
-        for i, row_section in enumerate(rows_array):
-            # Each row_section is [start_pos, end_pos, cell_array]
-            if not isinstance(row_section, list) or len(row_section) < 3:
-                continue
+        row_values = [_extract_cell_text(cell) for cell in cell_array]
+        if i == 0 and not row_values:
+            break
+        yield row_values
+    else:
+        return
 
-            cell_array = row_section[2]
-            if not isinstance(cell_array, list):
-                continue
+    # The first row section is the header row; without it the table is unusable
+    raise ArtifactParseError(
+        "data_table",
+        details="Failed to extract headers from data table",
+    )
 
-            row_values = [_extract_cell_text(cell) for cell in cell_array]
 
-            if i == 0:
-                headers = row_values
-            else:
-                rows.append(row_values)
+def _parse_data_table(raw_data: list) -> tuple[list[str], list[list[str]]]:
+    """Parse rich-text data table into headers and rows.
 
-        # Validate we extracted usable data
-        if not headers:
-            raise ArtifactParseError(
-                "data_table",
-                details="Failed to extract headers from data table",
-            )
+    Materializing wrapper around :func:`_iter_data_table`; prefer the iterator
+    when writing rows straight to a file.
 
-        return headers, rows
+    Returns:
+        Tuple of (headers, rows) where headers is a list of column names
+        and rows is a list of row data (each row is a list of cell strings).
+
+    Raises:
+        ArtifactParseError: If the data structure cannot be parsed or is empty.
+    """
+    rows = _iter_data_table(raw_data)
+    headers = next(rows)
+    return headers, builtins.list(rows)
 
-    except (IndexError, TypeError, KeyError) as e:
-        raise ArtifactParseError(
-            "data_table",
-            details=f"Failed to parse data table structure: {e}",
-            cause=e,
-        ) from e
+
+def _write_data_table_parquet(
+    headers: list[str], rows: Iterator[list[str]], output_path: Path
+) -> None:
+    """Stream data table rows into a Parquet file in fixed-size record batches.
+
+    Requires the optional ``pyarrow`` package. All columns are written as
+    strings; short rows are padded and long rows truncated to the header width.
+
+    Raises:
+        ConfigurationError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ConfigurationError(
+            "Parquet output requires pyarrow. Install it with: pip install pyarrow"
+        ) from None
+
+    # Parquet needs non-empty, unique column names
+    names: list[str] = []
+    for i, header in enumerate(headers):
+        name = header or f"column_{i + 1}"
+        base, n = name, 2
+        while name in names:
+            name = f"{base}_{n}"
+            n += 1
+        names.append(name)
+
+    width = len(names)
+    schema = pa.schema([(name, pa.string()) for name in names])
+
+    def _to_batch(batch: list[list[str]]) -> Any:
+        columns = zip(*batch, strict=True)
+        return pa.RecordBatch.from_arrays(
+            [pa.array(c, pa.string()) for c in columns], schema=schema
+        )
+
+    with pq.ParquetWriter(str(output_path), schema) as writer:
+        batch: list[list[str]] = []
+        for row in rows:
+            batch.append((row + [""] * width)[:width])
+            if len(batch) >= _PARQUET_BATCH_ROWS:
+                writer.write_batch(_to_batch(batch))
+                batch = []
+        if batch:
+            writer.write_batch(_to_batch(batch))
 
 
 class ArtifactsAPI:
@@ -222,15 +323,25 @@ class ArtifactsAPI:
             await client.artifacts.rename(notebook_id, artifact_id, "New Title")
     """
 
-    def __init__(self, core: ClientCore, notes_api: "NotesAPI"):
+    def __init__(
+        self,
+        core: ClientCore,
+        notes_api: "NotesAPI",
+        cache: ArtifactCache | None = None,
+        stats: GenerationStats | None = None,
+    ):
         """Initialize the artifacts API.
 
         Args:
             core: The core client infrastructure.
             notes_api: The notes API for accessing notes/mind maps.
+            cache: Optional on-disk cache for completed artifact content.
+            stats: Optional generation-time stats used to schedule polls.
         """
         self._core = core
         self._notes = notes_api
+        self._cache = cache
+        self._stats = stats
 
     # =========================================================================
     # List/Get Operations
@@ -1208,7 +1319,16 @@ class ArtifactsAPI:
             ) from e
 
     async def _get_artifact_content(self, notebook_id: str, artifact_id: str) -> str | None:
-        """Fetch artifact HTML content for quiz/flashcard types."""
+        """Fetch artifact HTML content for quiz/flashcard types.
+
+        Callers only request content for completed artifacts, which never
+        change, so the content cache (when configured) is consulted first.
+        """
+        if self._cache is not None:
+            cached = await asyncio.to_thread(self._cache.get, notebook_id, artifact_id, "html")
+            if cached is not None:
+                return cached
+
         result = await self._core.rpc_call(
             RPCMethod.GET_INTERACTIVE_HTML,
             [artifact_id],
@@ -1216,11 +1336,15 @@ class ArtifactsAPI:
             allow_null=True,
         )
         # Response is wrapped: result[0] contains the artifact data
+        content = None
         if result and isinstance(result, list) and len(result) > 0:
             data = result[0]
             if isinstance(data, list) and len(data) > 9 and data[9]:
-                return data[9][0]  # HTML content
-        return None
+                content = data[9][0]  # HTML content
+
+        if self._cache is not None and isinstance(content, str) and content:
+            await asyncio.to_thread(self._cache.put, notebook_id, artifact_id, "html", content)
+        return content
 
     async def _download_interactive_artifact(
         self,
@@ -1252,9 +1376,7 @@ class ArtifactsAPI:
                 f"Invalid output_format: {output_format!r}. Use one of: {', '.join(valid_formats)}"
             )
 
-        # Type-specific configuration
         is_quiz = artifact_type == "quiz"
-        default_title = "Untitled Quiz" if is_quiz else "Untitled Flashcards"
 
         # Fetch and filter artifacts
         artifacts = (
@@ -1279,6 +1401,35 @@ class ArtifactsAPI:
 
         # Fetch and parse HTML content
         html_content = await self._get_artifact_content(notebook_id, artifact.id)
+        return await asyncio.to_thread(
+            self._write_interactive,
+            artifact,
+            html_content,
+            output_path,
+            output_format,
+            artifact_type,
+        )
+
+    def _write_interactive(
+        self,
+        artifact: Artifact,
+        html_content: str | None,
+        output_path: str,
+        output_format: str,
+        artifact_type: str,
+    ) -> str:
+        """Format fetched quiz/flashcard HTML and write it to disk.
+
+        Args:
+            artifact: The quiz or flashcard artifact.
+            html_content: HTML returned by GET_INTERACTIVE_HTML, or None.
+            output_path: Output file path.
+            output_format: Output format - json, markdown, or html.
+            artifact_type: Either "quiz" or "flashcards".
+
+        Returns:
+            Path to the written file.
+        """
         if not html_content:
             raise ArtifactDownloadError(artifact_type, details="Failed to fetch content")
 
@@ -1289,21 +1440,17 @@ class ArtifactsAPI:
                 artifact_type, details=f"Failed to parse content: {e}", cause=e
             ) from e
 
-        # Format output
+        is_quiz = artifact_type == "quiz"
+        default_title = "Untitled Quiz" if is_quiz else "Untitled Flashcards"
         title = artifact.title or default_title
         content = self._format_interactive_content(
             app_data, title, output_format, html_content, is_quiz
         )
 
-        # Create parent directories and write file
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
-
-        def _write_file() -> None:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(content)
-
-        await asyncio.to_thread(_write_file)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(content)
         return output_path
 
     def _format_interactive_content(
@@ -1369,27 +1516,7 @@ class ArtifactsAPI:
         ]
 
         report_art = self._select_artifact(report_candidates, artifact_id, "Report", "report")
-
-        try:
-            content_wrapper = report_art[7]
-            markdown_content = (
-                content_wrapper[0]
-                if isinstance(content_wrapper, list) and content_wrapper
-                else content_wrapper
-            )
-
-            if not isinstance(markdown_content, str):
-                raise ArtifactParseError("report_content", details="Invalid structure")
-
-            output = Path(output_path)
-            output.parent.mkdir(parents=True, exist_ok=True)
-            output.write_text(markdown_content, encoding="utf-8")
-            return str(output)
-
-        except (IndexError, TypeError) as e:
-            raise ArtifactParseError(
-                "report", details=f"Failed to parse structure: {e}", cause=e
-            ) from e
+        return self._write_report(report_art, output_path)
 
     async def download_mind_map(
         self,
@@ -1420,39 +1547,40 @@ class ArtifactsAPI:
         else:
             mind_map = mind_maps[0]
 
-        try:
-            json_string = mind_map[1][1]
-            if not isinstance(json_string, str):
-                raise ArtifactParseError("mind_map_content", details="Invalid structure")
-
-            json_data = json.loads(json_string)
-
-            output = Path(output_path)
-            output.parent.mkdir(parents=True, exist_ok=True)
-            output.write_text(json.dumps(json_data, indent=2, ensure_ascii=False), encoding="utf-8")
-            return str(output)
-
-        except (IndexError, TypeError, json.JSONDecodeError) as e:
-            raise ArtifactParseError(
-                "mind_map", details=f"Failed to parse structure: {e}", cause=e
-            ) from e
+        return self._write_mind_map(mind_map, output_path)
 
     async def download_data_table(
         self,
         notebook_id: str,
         output_path: str,
         artifact_id: str | None = None,
+        output_format: str = "csv",
     ) -> str:
-        """Download a data table as CSV.
+        """Download a data table as CSV or Parquet.
+
+        Rows are streamed from the parser straight into the file writer, so
+        the parsed table is never held in memory as a whole.
 
         Args:
             notebook_id: The notebook ID.
-            output_path: Path to save the CSV file.
+            output_path: Path to save the file.
             artifact_id: Specific artifact ID, or uses first completed data table.
+            output_format: "csv" (default) or "parquet". Parquet output requires
+                the optional ``pyarrow`` package.
 
         Returns:
             The output path where the file was saved.
+
+        Raises:
+            ValidationError: If output_format is not supported.
+            ConfigurationError: If Parquet is requested and pyarrow is missing.
         """
+        if output_format not in _DATA_TABLE_FORMATS:
+            raise ValidationError(
+                f"Invalid output_format: {output_format!r}. "
+                f"Use one of: {', '.join(_DATA_TABLE_FORMATS)}"
+            )
+
         artifacts_data = await self._list_raw(notebook_id)
 
         table_candidates = [
@@ -1465,25 +1593,9 @@ class ArtifactsAPI:
         ]
 
         table_art = self._select_artifact(table_candidates, artifact_id, "Data table", "data table")
-
-        try:
-            raw_data = table_art[18]
-            headers, rows = _parse_data_table(raw_data)
-
-            output = Path(output_path)
-            output.parent.mkdir(parents=True, exist_ok=True)
-
-            with output.open("w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-                writer.writerows(rows)
-
-            return str(output)
-
-        except (IndexError, TypeError, ValueError) as e:
-            raise ArtifactParseError(
-                "data_table", details=f"Failed to parse structure: {e}", cause=e
-            ) from e
+        return await asyncio.to_thread(
+            self._write_data_table, table_art, output_path, output_format
+        )
 
     async def download_quiz(
         self,
@@ -1535,6 +1647,231 @@ class ArtifactsAPI:
             notebook_id, output_path, artifact_id, output_format, "flashcards"
         )
 
+    async def download_all(
+        self,
+        notebook_id: str,
+        output_dir: str,
+        artifact_types: Iterable[ArtifactType | str] | None = None,
+        output_format: str = "json",
+        max_concurrency: int = 4,
+    ) -> dict[str, str]:
+        """Export every completed document-style artifact from one snapshot.
+
+        Unlike calling ``download_report``/``download_quiz``/... once per
+        artifact, this fetches LIST_ARTIFACTS and the notes/mind map list
+        exactly once and writes all matching artifacts from that snapshot.
+        Quiz and flashcard content (GET_INTERACTIVE_HTML) is fetched
+        concurrently, bounded by ``max_concurrency``.
+
+        Media artifacts (audio, video, infographic, slide deck) are not
+        exported here; use the corresponding ``download_*`` method.
+
+        Files are named after the artifact title (sanitized, de-duplicated)
+        with an extension matching the content: ``.md`` for reports,
+        ``.csv`` for data tables, ``.json`` for mind maps, and ``.json``/
+        ``.md``/``.html`` for quizzes and flashcards depending on
+        ``output_format``.
+
+        Args:
+            notebook_id: The notebook ID.
+            output_dir: Directory to write files into (created if missing).
+            artifact_types: Types to export. Defaults to reports, data tables,
+                quizzes, flashcards, and mind maps.
+            output_format: Format for quizzes and flashcards - json, markdown, or html.
+            max_concurrency: Maximum concurrent interactive content fetches.
+
+        Returns:
+            Mapping of artifact ID to the written file path. Artifacts whose
+            content cannot be fetched or parsed are logged and omitted.
+
+        Raises:
+            ValidationError: If an artifact type or output format is unsupported.
+
+        Example:
+            paths = await client.artifacts.download_all(nb_id, "./export")
+            for artifact_id, path in paths.items():
+                print(artifact_id, path)
+        """
+        if artifact_types is None:
+            wanted = set(_EXPORTABLE_ARTIFACT_TYPES)
+        else:
+            try:
+                wanted = {ArtifactType(t) for t in artifact_types}
+            except ValueError as e:
+                raise ValidationError(str(e)) from e
+        unsupported = wanted - _EXPORTABLE_ARTIFACT_TYPES
+        if unsupported:
+            names = ", ".join(sorted(t.value for t in unsupported))
+            raise ValidationError(
+                f"Unsupported artifact types for download_all: {names}. "
+                "Use the matching download_* method for media artifacts."
+            )
+        if output_format not in _INTERACTIVE_EXTENSIONS:
+            raise ValidationError(
+                f"Invalid output_format: {output_format!r}. "
+                f"Use one of: {', '.join(_INTERACTIVE_EXTENSIONS)}"
+            )
+        if max_concurrency < 1:
+            raise ValidationError("max_concurrency must be at least 1")
+
+        logger.debug("Exporting artifacts %s from notebook %s", sorted(wanted), notebook_id)
+
+        async def _no_rows() -> builtins.list[Any]:
+            return []
+
+        # One snapshot of each list, fetched concurrently
+        needs_studio = bool(wanted - {ArtifactType.MIND_MAP})
+        needs_mind_maps = ArtifactType.MIND_MAP in wanted
+        rows, mind_maps = await asyncio.gather(
+            self._list_raw(notebook_id) if needs_studio else _no_rows(),
+            self._notes.list_mind_maps(notebook_id) if needs_mind_maps else _no_rows(),
+        )
+
+        out_dir = Path(output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        used_names: set[str] = set()
+        written: dict[str, str] = {}
+        interactive: builtins.list[tuple[Artifact, str]] = []
+
+        def _path_for(artifact: Artifact, ext: str) -> str:
+            name = unique_filename(artifact.title or artifact.kind.value, ext, used_names)
+            return str(out_dir / name)
+
+        for row in rows:
+            if not isinstance(row, list) or len(row) <= 4:
+                continue
+            artifact = Artifact.from_api_response(row)
+            if artifact.kind not in wanted or not artifact.is_completed:
+                continue
+            try:
+                if artifact.kind == ArtifactType.REPORT:
+                    written[artifact.id] = await asyncio.to_thread(
+                        self._write_report, row, _path_for(artifact, ".md")
+                    )
+                elif artifact.kind == ArtifactType.DATA_TABLE:
+                    written[artifact.id] = await asyncio.to_thread(
+                        self._write_data_table, row, _path_for(artifact, ".csv")
+                    )
+                else:
+                    ext = _INTERACTIVE_EXTENSIONS[output_format]
+                    interactive.append((artifact, _path_for(artifact, ext)))
+            except ArtifactParseError as e:
+                logger.warning("Skipping artifact %s: %s", artifact.id, e)
+
+        for mm_data in mind_maps:
+            mind_map = Artifact.from_mind_map(mm_data)
+            if mind_map is None:
+                continue
+            try:
+                written[mind_map.id] = await asyncio.to_thread(
+                    self._write_mind_map, mm_data, _path_for(mind_map, ".json")
+                )
+            except ArtifactParseError as e:
+                logger.warning("Skipping mind map %s: %s", mind_map.id, e)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _export(artifact: Artifact, path: str) -> str | None:
+            # One failed fetch must not abort the other artifacts of the export
+            try:
+                async with semaphore:
+                    html_content = await self._get_artifact_content(notebook_id, artifact.id)
+                return await asyncio.to_thread(
+                    self._write_interactive,
+                    artifact,
+                    html_content,
+                    path,
+                    output_format,
+                    artifact.kind.value,
+                )
+            except (NotebookLMError, httpx.HTTPError) as e:
+                logger.warning("Skipping artifact %s: %s", artifact.id, e)
+                return None
+
+        paths = await asyncio.gather(*(_export(a, path) for a, path in interactive))
+        for (artifact, _), path in zip(interactive, paths, strict=True):
+            if path is not None:
+                written[artifact.id] = path
+
+        return written
+
+    def _write_report(self, art: builtins.list[Any], output_path: str) -> str:
+        """Write the markdown body of a raw report artifact to disk."""
+        try:
+            content_wrapper = art[7]
+            markdown_content = (
+                content_wrapper[0]
+                if isinstance(content_wrapper, list) and content_wrapper
+                else content_wrapper
+            )
+
+            if not isinstance(markdown_content, str):
+                raise ArtifactParseError("report_content", details="Invalid structure")
+
+            output = Path(output_path)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(markdown_content, encoding="utf-8")
+            return str(output)
+
+        except (IndexError, TypeError) as e:
+            raise ArtifactParseError(
+                "report", details=f"Failed to parse structure: {e}", cause=e
+            ) from e
+
+    def _write_mind_map(self, mind_map: builtins.list[Any], output_path: str) -> str:
+        """Write the JSON tree of a raw mind map note to disk."""
+        try:
+            json_string = mind_map[1][1]
+            if not isinstance(json_string, str):
+                raise ArtifactParseError("mind_map_content", details="Invalid structure")
+
+            json_data = json.loads(json_string)
+
+            output = Path(output_path)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_text(json.dumps(json_data, indent=2, ensure_ascii=False), encoding="utf-8")
+            return str(output)
+
+        except (IndexError, TypeError, json.JSONDecodeError) as e:
+            raise ArtifactParseError(
+                "mind_map", details=f"Failed to parse structure: {e}", cause=e
+            ) from e
+
+    def _write_data_table(
+        self, art: builtins.list[Any], output_path: str, output_format: str = "csv"
+    ) -> str:
+        """Stream a raw data table artifact to disk as CSV or Parquet.
+
+        Rows go straight from the parser to the writer via a temp file that is
+        only moved into place once the whole table has been written.
+        """
+        output = Path(output_path)
+        temp_file = output.with_suffix(output.suffix + ".tmp")
+        try:
+            rows = _iter_data_table(art[18])
+            headers = next(rows)
+
+            output.parent.mkdir(parents=True, exist_ok=True)
+            if output_format == "parquet":
+                _write_data_table_parquet(headers, rows, temp_file)
+            else:
+                with temp_file.open("w", newline="", encoding="utf-8-sig") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(headers)
+                    writer.writerows(rows)
+
+            temp_file.replace(output)
+            return str(output)
+
+        except (IndexError, TypeError, ValueError) as e:
+            temp_file.unlink(missing_ok=True)
+            raise ArtifactParseError(
+                "data_table", details=f"Failed to parse structure: {e}", cause=e
+            ) from e
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
+
     # =========================================================================
     # Management Operations
     # =========================================================================
@@ -1585,31 +1922,8 @@ class ArtifactsAPI:
         Returns:
             GenerationStatus with current status.
         """
-        # List all artifacts and find by ID (no poll-by-ID RPC exists)
-        artifacts_data = await self._list_raw(notebook_id)
-        for art in artifacts_data:
-            if len(art) > 0 and art[0] == task_id:
-                status_code = art[4] if len(art) > 4 else 0
-                artifact_type = art[2] if len(art) > 2 else 0
-
-                # For media artifacts, verify URL availability before reporting completion.
-                # The API may set status=COMPLETED before media URLs are populated.
-                if status_code == ArtifactStatus.COMPLETED:
-                    if not self._is_media_ready(art, artifact_type):
-                        type_name = self._get_artifact_type_name(artifact_type)
-                        logger.debug(
-                            "Artifact %s (type=%s) status=COMPLETED but media not ready, "
-                            "continuing poll",
-                            task_id,
-                            type_name,
-                        )
-                        # Downgrade to PROCESSING to continue polling
-                        status_code = ArtifactStatus.PROCESSING
-
-                status = artifact_status_to_str(status_code)
-                return GenerationStatus(task_id=task_id, status=status)
-
-        return GenerationStatus(task_id=task_id, status="pending")
+        status, _ = await self._poll_row(notebook_id, task_id)
+        return status
 
     async def wait_for_completion(
         self,
@@ -1622,7 +1936,10 @@ class ArtifactsAPI:
     ) -> GenerationStatus:
         """Wait for a generation task to complete.
 
-        Uses exponential backoff for polling to reduce API load.
+        Uses exponential backoff for polling to reduce API load. When the
+        client has ``generation_stats``, polls are instead scheduled around
+        the typical completion time for the artifact type, and the observed
+        duration is recorded on completion.
 
         Args:
             notebook_id: The notebook ID.
@@ -1651,12 +1968,16 @@ class ArtifactsAPI:
 
         start_time = asyncio.get_running_loop().time()
         current_interval = initial_interval
+        seen_unfinished = False
 
         while True:
-            status = await self.poll_status(notebook_id, task_id)
+            status, art = await self._poll_row(notebook_id, task_id)
 
             if status.is_complete or status.is_failed:
+                if status.is_complete and seen_unfinished:
+                    await self._record_generation_time(art)
                 return status
+            seen_unfinished = True
 
             elapsed = asyncio.get_running_loop().time() - start_time
             if elapsed > timeout:
@@ -1664,13 +1985,117 @@ class ArtifactsAPI:
 
             # Clamp sleep duration to respect timeout
             remaining_time = timeout - elapsed
-            sleep_duration = min(current_interval, remaining_time)
+            adaptive = self._adaptive_interval(art, initial_interval, max_interval)
+            sleep_duration = min(
+                adaptive if adaptive is not None else current_interval, remaining_time
+            )
             if sleep_duration > 0:
                 await asyncio.sleep(sleep_duration)
 
             # Exponential backoff: double the interval up to max_interval
             current_interval = min(current_interval * 2, max_interval)
 
+    async def as_completed(
+        self,
+        notebook_id: str,
+        task_ids: Iterable[str],
+        initial_interval: float = 2.0,
+        max_interval: float = 10.0,
+        timeout: float = 300.0,
+        on_status_change: StatusCallback | None = None,
+    ) -> AsyncIterator[GenerationStatus]:
+        """Yield final statuses of generation tasks as each one finishes.
+
+        Like ``asyncio.as_completed``, tasks are yielded in completion order
+        rather than input order, so callers can start downloading the first
+        finished artifact immediately. All tasks are polled with a single
+        artifact list call per tick, using the same backoff as
+        ``wait_for_completion``.
+
+        Args:
+            notebook_id: The notebook ID.
+            task_ids: Task/artifact IDs to wait for.
+            initial_interval: Initial seconds between status checks.
+            max_interval: Maximum seconds between status checks.
+            timeout: Maximum seconds to wait for all tasks.
+            on_status_change: Optional callback invoked with the new
+                GenerationStatus whenever a task's status changes (including
+                the first observation). May be a plain function or a
+                coroutine function, e.g. to post to a webhook.
+
+        Yields:
+            GenerationStatus for each task once it is completed or failed.
+
+        Raises:
+            TimeoutError: If some tasks don't finish within timeout.
+
+        Example:
+            async for status in client.artifacts.as_completed(nb_id, task_ids):
+                if status.is_complete:
+                    await client.artifacts.download_audio(
+                        nb_id, f"{status.task_id}.mp4", artifact_id=status.task_id
+                    )
+        """
+        pending = builtins.list(dict.fromkeys(task_ids))
+        last_status: dict[str, str] = {}
+        pending_rows: dict[str, builtins.list[Any] | None] = {}
+        start_time = asyncio.get_running_loop().time()
+        current_interval = initial_interval
+
+        while pending:
+            rows = {
+                art[0]: art
+                for art in await self._list_raw(notebook_id)
+                if isinstance(art, list) and len(art) > 0
+            }
+
+            still_pending = []
+            for task_id in pending:
+                art = rows.get(task_id)
+                status = (
+                    self._status_from_row(task_id, art)
+                    if art is not None
+                    else GenerationStatus(task_id=task_id, status="pending")
+                )
+
+                previous = last_status.get(task_id)
+                if previous != status.status:
+                    last_status[task_id] = status.status
+                    await invoke_callback(on_status_change, status)
+
+                if status.is_complete or status.is_failed:
+                    if status.is_complete and previous is not None:
+                        await self._record_generation_time(art)
+                    yield status
+                else:
+                    still_pending.append(task_id)
+                    pending_rows[task_id] = art
+            pending = still_pending
+            if not pending:
+                return
+
+            elapsed = asyncio.get_running_loop().time() - start_time
+            if elapsed > timeout:
+                raise TimeoutError(f"Tasks {', '.join(pending)} timed out after {timeout}s")
+
+            # Poll as soon as the earliest-expected task may be done
+            remaining_time = timeout - elapsed
+            adaptive = [
+                interval
+                for task_id in pending
+                if (
+                    interval := self._adaptive_interval(
+                        pending_rows.get(task_id), initial_interval, max_interval
+                    )
+                )
+                is not None
+            ]
+            sleep_duration = min(min(adaptive, default=current_interval), remaining_time)
+            if sleep_duration > 0:
+                await asyncio.sleep(sleep_duration)
+
+            current_interval = min(current_interval * 2, max_interval)
+
     # =========================================================================
     # Export Operations
     # =========================================================================
@@ -2000,6 +2425,61 @@ class ArtifactsAPI:
             temp_file.unlink(missing_ok=True)
             raise
 
+    async def _poll_row(
+        self, notebook_id: str, task_id: str
+    ) -> tuple[GenerationStatus, builtins.list[Any] | None]:
+        """Poll one task, returning its status and raw artifact row (if listed)."""
+        # List all artifacts and find by ID (no poll-by-ID RPC exists)
+        artifacts_data = await self._list_raw(notebook_id)
+        for art in artifacts_data:
+            if len(art) > 0 and art[0] == task_id:
+                return self._status_from_row(task_id, art), art
+
+        return GenerationStatus(task_id=task_id, status="pending"), None
+
+    def _adaptive_interval(
+        self, art: builtins.list[Any] | None, initial_interval: float, max_interval: float
+    ) -> float | None:
+        """Next poll interval from generation stats, or None to use plain backoff."""
+        if self._stats is None or art is None:
+            return None
+        created_at = _artifact_created_timestamp(art)
+        if created_at is None or len(art) <= 2:
+            return None
+        expected = self._stats.expected_duration(art[2])
+        if expected is None:
+            return None
+        return schedule_poll(expected, time.time() - created_at, initial_interval, max_interval)
+
+    async def _record_generation_time(self, art: builtins.list[Any] | None) -> None:
+        """Record how long a just-completed artifact took to generate."""
+        if self._stats is None or art is None or len(art) <= 2:
+            return
+        created_at = _artifact_created_timestamp(art)
+        if created_at is not None:
+            await asyncio.to_thread(self._stats.record, art[2], time.time() - created_at)
+
+    def _status_from_row(self, task_id: str, art: builtins.list[Any]) -> GenerationStatus:
+        """Build the GenerationStatus for one raw artifact list row."""
+        status_code = art[4] if len(art) > 4 else 0
+        artifact_type = art[2] if len(art) > 2 else 0
+
+        # For media artifacts, verify URL availability before reporting completion.
+        # The API may set status=COMPLETED before media URLs are populated.
+        if status_code == ArtifactStatus.COMPLETED:
+            if not self._is_media_ready(art, artifact_type):
+                type_name = self._get_artifact_type_name(artifact_type)
+                logger.debug(
+                    "Artifact %s (type=%s) status=COMPLETED but media not ready, continuing poll",
+                    task_id,
+                    type_name,
+                )
+                # Downgrade to PROCESSING to continue polling
+                status_code = ArtifactStatus.PROCESSING
+
+        status = artifact_status_to_str(status_code)
+        return GenerationStatus(task_id=task_id, status=status)
+
     def _parse_generation_result(self, result: Any) -> GenerationStatus:
         """Parse generation API result into GenerationStatus.
 
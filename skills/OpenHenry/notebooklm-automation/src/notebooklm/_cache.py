@@ -0,0 +1,138 @@
+"""On-disk cache for immutable artifact content.
+
+Once an artifact reaches COMPLETED its content never changes, so payloads
+fetched for it (e.g. quiz/flashcard HTML) can be reused across client
+sessions and CLI invocations. Entries are stored one file per key under
+``NOTEBOOKLM_HOME/cache/artifacts`` and evicted least-recently-used first
+once the cache grows beyond its size cap.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from .paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Default size cap for the artifact content cache (bytes)
+DEFAULT_ARTIFACT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".cache"
+
+
+class ArtifactCache:
+    """Size-capped LRU cache of artifact payloads on disk.
+
+    Keys are ``(notebook_id, artifact_id, format)``; the file name is the
+    SHA-256 of the key, so IDs never reach the filesystem verbatim. Reads
+    refresh an entry's modification time, which is what eviction orders by,
+    so the cache can be shared safely by concurrent processes.
+
+    Usage:
+        cache = ArtifactCache()  # ~/.notebooklm/cache/artifacts, 256 MB
+        async with NotebookLMClient(auth, artifact_cache=cache) as client:
+            await client.artifacts.download_quiz(nb_id, "quiz.json")
+            # Re-downloading in another format is served from disk
+            await client.artifacts.download_quiz(nb_id, "quiz.md", output_format="markdown")
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_bytes: int = DEFAULT_ARTIFACT_CACHE_MAX_BYTES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries. Defaults to
+                ``get_cache_dir() / "artifacts"``.
+            max_bytes: Total size cap; least recently used entries are
+                evicted once it is exceeded.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else get_cache_dir() / "artifacts"
+        self.max_bytes = max_bytes
+
+    def get(self, notebook_id: str, artifact_id: str, fmt: str) -> str | None:
+        """Return cached content, or None on a miss."""
+        path = self._entry_path(notebook_id, artifact_id, fmt)
+        try:
+            content = path.read_text(encoding="utf-8")
+            os.utime(path)  # Mark as recently used
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+        except OSError as e:
+            logger.debug("Artifact cache read failed for %s: %s", artifact_id, e)
+            return None
+        logger.debug("Artifact cache hit: %s (%s)", artifact_id, fmt)
+        return content
+
+    def put(self, notebook_id: str, artifact_id: str, fmt: str, content: str) -> None:
+        """Store content, then evict old entries if over the size cap.
+
+        Write failures are logged and ignored; the cache is best-effort.
+        """
+        path = self._entry_path(notebook_id, artifact_id, fmt)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(content)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug("Artifact cache write failed for %s: %s", artifact_id, e)
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+
+    @property
+    def size(self) -> int:
+        """Total size of cached entries in bytes."""
+        total = 0
+        for path in self._entries():
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
+
+    def _entry_path(self, notebook_id: str, artifact_id: str, fmt: str) -> Path:
+        key = "\0".join((notebook_id, artifact_id, fmt)).encode("utf-8")
+        return self.cache_dir / f"{hashlib.sha256(key).hexdigest()}{_ENTRY_SUFFIX}"
+
+    def _entries(self) -> list[Path]:
+        try:
+            return list(self.cache_dir.glob(f"*{_ENTRY_SUFFIX}"))
+        except OSError:
+            return []
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under the size cap."""
+        stats = []
+        for path in self._entries():
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            stats.append((st.st_mtime_ns, st.st_size, path))
+
+        total = sum(size for _, size, _ in stats)
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(stats, key=lambda s: s[0]):
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug("Evicted artifact cache entry %s", path.name)
+            if total <= self.max_bytes:
+                break
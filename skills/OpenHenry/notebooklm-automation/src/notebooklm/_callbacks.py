@@ -0,0 +1,24 @@
+"""Invocation of user callbacks that may be sync or async.
+
+Progress is reported through optional callbacks such as
+``on_status_change``. Callers may pass a plain function or a coroutine
+function; ``invoke_callback()`` handles both.
+"""
+
+import inspect
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+async def invoke_callback(callback: Callable[[T], Any] | None, value: T) -> None:
+    """Call ``callback(value)`` and await the outcome if it is awaitable.
+
+    Does nothing if ``callback`` is None.
+    """
+    if callback is None:
+        return
+    outcome = callback(value)
+    if inspect.isawaitable(outcome):
+        await outcome
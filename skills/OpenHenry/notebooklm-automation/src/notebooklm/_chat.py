@@ -4,20 +4,26 @@ Provides operations for asking questions, managing conversations, and
 retrieving conversation history.
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
 import uuid
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import quote, urlencode
 
 import httpx
 
+from ._answers import AnswerCache
+from ._callbacks import invoke_callback
 from ._core import ClientCore
-from .exceptions import ChatError, NetworkError, ValidationError
+from ._source_rows import accessor
+from .exceptions import ChatError, NetworkError, NotebookLMError, ValidationError
 from .rpc import QUERY_URL, RPCMethod
-from .types import AskResult, ChatReference, ConversationTurn
+from .types import AskResult, AskStreamChunk, ChatReference, ConversationTurn, QuestionResult
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +36,54 @@ _UUID_PATTERN = re.compile(
 # Minimum answer length to be considered valid (filters out status messages)
 _MIN_ANSWER_LENGTH = 20
 
+# Index paths into a response chunk's answer (``first``) and its citations
+_ANSWER_FIRST = accessor(0)
+_CITATIONS = accessor(4, 3)
+_CITE_CHUNK_ID = accessor(0, 0)
+_CITE_DETAILS = accessor(1)
+# Usual position of the parent source UUID inside cite[1][5]
+_CITE_SOURCE_ID = accessor(5, 0, 0, 0)
+
+
+@dataclass
+class _AnswerState:
+    """Answer parsed so far from a chat response.
+
+    Citations are kept undecoded until needed: ``citations`` is the raw
+    citation array of the chunk holding the current answer, and
+    ``references`` holds the first ``decoded`` entries of it as
+    ChatReferences.
+    """
+
+    answer: str = ""
+    citations: list[Any] = field(default_factory=list)
+    decoded: int = 0
+    references: list[ChatReference] = field(default_factory=list)
+
+    def set_snapshot(self, answer: str, citations: list[Any]) -> bool:
+        """Install a newer answer snapshot.
+
+        Returns:
+            True if the snapshot revised earlier text or citations rather
+            than extending them; decoded references are then dropped.
+        """
+        replaced = not answer.startswith(self.answer) or (
+            citations[: self.decoded] != self.citations[: self.decoded]
+        )
+        if replaced:
+            self.decoded = 0
+            self.references = []
+        self.answer = answer
+        self.citations = citations
+        return replaced
+
+    def decode_new_references(self, api: "ChatAPI") -> list[ChatReference]:
+        """Decode citations not yet decoded, returning the new references."""
+        refs = api._decode_references(self.citations[self.decoded :], len(self.references))
+        self.decoded = max(self.decoded, len(self.citations))
+        self.references.extend(refs)
+        return refs
+
 
 class ChatAPI:
     """Operations for notebook chat/conversations.
@@ -51,13 +105,15 @@ class ChatAPI:
             )
     """
 
-    def __init__(self, core: ClientCore):
+    def __init__(self, core: ClientCore, answer_cache: AnswerCache | None = None):
         """Initialize the chat API.
 
         Args:
             core: The core client infrastructure.
+            answer_cache: Optional local cache of answers used by ``ask_many()``.
         """
         self._core = core
+        self._answer_cache = answer_cache
 
     async def ask(
         self,
@@ -93,87 +149,196 @@ class ChatAPI:
             notebook_id,
             conversation_id or "new",
         )
-        if source_ids is None:
-            source_ids = await self._core.get_source_ids(notebook_id)
-
-        is_new_conversation = conversation_id is None
-        if is_new_conversation:
-            conversation_id = str(uuid.uuid4())
-            conversation_history = None
-        else:
-            assert conversation_id is not None  # Type narrowing for mypy
-            conversation_history = self._build_conversation_history(conversation_id)
+        url, body, conversation_id, is_new_conversation = await self._prepare_ask(
+            notebook_id, question, source_ids, conversation_id
+        )
 
-        sources_array = [[[sid]] for sid in source_ids] if source_ids else []
+        http_client = self._core.get_http_client()
+        try:
+            async with self._core.request_slot():
+                response = await http_client.post(url, content=body)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise self._chat_request_error(e) from e
 
-        params = [
-            sources_array,
+        answer_text, references = self._parse_ask_response_with_references(response.text)
+        return await self._finish_ask(
             question,
-            conversation_history,
-            [2, None, [1]],
             conversation_id,
-        ]
+            is_new_conversation,
+            answer_text,
+            references,
+            response.text[:1000],
+        )
 
-        params_json = json.dumps(params, separators=(",", ":"))
-        f_req = [None, params_json]
-        f_req_json = json.dumps(f_req, separators=(",", ":"))
+    async def ask_many(
+        self,
+        notebook_id: str,
+        questions: list[str],
+        source_ids: list[str] | None = None,
+        concurrency: int = 5,
+        use_cache: bool = True,
+        on_result: Callable[[QuestionResult], Any] | None = None,
+    ) -> list[QuestionResult]:
+        """Ask many independent questions concurrently.
+
+        Each question starts its own conversation. The notebook's source IDs
+        are resolved once, and at most ``concurrency`` questions are in
+        flight (all requests also share the client's request limit). If the
+        client has an answer cache, questions already answered for the same
+        notebook and source set are served from it, and new answers are
+        stored in it. Repeated questions are only asked once. A failing
+        question never aborts the batch; its error is recorded in the report.
 
-        encoded_req = quote(f_req_json, safe="")
+        Args:
+            notebook_id: The notebook ID.
+            questions: The questions to ask.
+            source_ids: Specific source IDs to query. If None, uses all sources.
+            concurrency: Maximum number of questions asked at once (default: 5).
+            use_cache: Serve answers from the answer cache when possible.
+                New answers are cached either way.
+            on_result: Optional callback (sync or async) invoked with each
+                question's QuestionResult as soon as it completes.
 
-        body_parts = [f"f.req={encoded_req}"]
-        if self._core.auth.csrf_token:
-            encoded_at = quote(self._core.auth.csrf_token, safe="")
-            body_parts.append(f"at={encoded_at}")
+        Returns:
+            One QuestionResult per question, in input order.
 
-        body = "&".join(body_parts) + "&"
+        Raises:
+            ValidationError: If concurrency is less than 1.
 
-        self._core._reqid_counter += 100000
-        url_params = {
-            "bl": os.environ.get("NOTEBOOKLM_BL", "boq_labs-tailwind-frontend_20251221.14_p0"),
-            "hl": "en",
-            "_reqid": str(self._core._reqid_counter),
-            "rt": "c",
-        }
-        if self._core.auth.session_id:
-            url_params["f.sid"] = self._core.auth.session_id
+        Example:
+            results = await client.chat.ask_many(nb_id, ["What is X?", "Who wrote Y?"])
+            for r in results:
+                print(r.question, r.result.answer if r.result else r.error)
+        """
+        if concurrency < 1:
+            raise ValidationError(f"concurrency must be at least 1, got {concurrency}")
+        if source_ids is None:
+            source_ids = await self._core.get_source_ids(notebook_id)
 
-        query_string = urlencode(url_params)
-        url = f"{QUERY_URL}?{query_string}"
+        results: list[QuestionResult | None] = [None] * len(questions)
+
+        async def report(result: QuestionResult) -> None:
+            results[result.index] = result
+            await invoke_callback(on_result, result)
+
+        # Group repeated questions so each distinct question is asked once
+        indices_by_question: dict[str, list[int]] = {}
+        for index, question in enumerate(questions):
+            indices_by_question.setdefault(question, []).append(index)
+
+        to_ask: list[str] = []
+        for question, indices in indices_by_question.items():
+            cached = None
+            if use_cache and self._answer_cache is not None:
+                cached = await asyncio.to_thread(
+                    self._answer_cache.get, notebook_id, source_ids, question
+                )
+            if cached is None:
+                to_ask.append(question)
+                continue
+            for index in indices:
+                await report(QuestionResult(index, question, "cached", result=cached))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def ask_one(question: str) -> None:
+            async with semaphore:
+                try:
+                    answer = await self.ask(notebook_id, question, source_ids=source_ids)
+                except NotebookLMError as e:
+                    logger.warning("Failed to ask %r: %s", question[:80], e)
+                    for index in indices_by_question[question]:
+                        await report(QuestionResult(index, question, "failed", error=str(e)))
+                    return
+            if answer.answer and self._answer_cache is not None:
+                await asyncio.to_thread(
+                    self._answer_cache.put, notebook_id, source_ids, question, answer
+                )
+            for index in indices_by_question[question]:
+                await report(QuestionResult(index, question, "answered", result=answer))
+
+        await asyncio.gather(*(ask_one(question) for question in to_ask))
+        return [result for result in results if result is not None]
+
+    async def ask_stream(
+        self,
+        notebook_id: str,
+        question: str,
+        source_ids: list[str] | None = None,
+        conversation_id: str | None = None,
+    ) -> AsyncIterator[AskStreamChunk]:
+        """Ask the notebook a question, yielding the answer as it is generated.
 
-        http_client = self._core.get_http_client()
-        try:
-            response = await http_client.post(url, content=body)
-            response.raise_for_status()
-        except httpx.TimeoutException as e:
-            raise NetworkError(
-                f"Chat request timed out: {e}",
-                original_error=e,
-            ) from e
-        except httpx.HTTPStatusError as e:
-            raise ChatError(f"Chat request failed with HTTP {e.response.status_code}: {e}") from e
-        except httpx.RequestError as e:
-            raise NetworkError(
-                f"Chat request failed: {e}",
-                original_error=e,
-            ) from e
+        Sends the same request as ``ask()``, but decodes the streamed
+        response line by line, so answer text and citations are available
+        as soon as the server sends them instead of after the full answer.
 
-        answer_text, references = self._parse_ask_response_with_references(response.text)
+        Args:
+            notebook_id: The notebook ID.
+            question: The question to ask.
+            source_ids: Specific source IDs to query. If None, uses all sources.
+            conversation_id: Existing conversation ID for follow-up questions.
 
-        turns = self._core.get_cached_conversation(conversation_id)
-        if answer_text:
-            turn_number = len(turns) + 1
-            self._core.cache_conversation_turn(conversation_id, question, answer_text, turn_number)
-        else:
-            turn_number = len(turns)
+        Yields:
+            AskStreamChunk for each answer update. The last chunk has an
+            empty delta and carries the complete AskResult in ``result``.
 
-        return AskResult(
-            answer=answer_text,
-            conversation_id=conversation_id,
-            turn_number=turn_number,
-            is_follow_up=not is_new_conversation,
-            references=references,
-            raw_response=response.text[:1000],
+        Example:
+            async for chunk in client.chat.ask_stream(notebook_id, "Summarize"):
+                print(chunk.delta, end="", flush=True)
+                if chunk.is_final:
+                    conversation_id = chunk.result.conversation_id
+        """
+        logger.debug(
+            "Streaming question in notebook %s (conversation=%s)",
+            notebook_id,
+            conversation_id or "new",
+        )
+        url, body, conversation_id, is_new_conversation = await self._prepare_ask(
+            notebook_id, question, source_ids, conversation_id
+        )
+
+        state = _AnswerState()
+        raw_parts: list[str] = []
+        raw_length = 0
+
+        http_client = self._core.get_http_client()
+        try:
+            async with (
+                self._core.request_slot(),
+                http_client.stream("POST", url, content=body) as response,
+            ):
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if raw_length < 1000:
+                        raw_parts.append(line)
+                        raw_length += len(line) + 1
+                    previous = state.answer
+                    replaced = self._parse_response_line(line, state)
+                    if replaced is None:
+                        continue
+                    # Snapshots repeat earlier citations; only decode the new tail
+                    new_refs = state.decode_new_references(self)
+                    delta = state.answer if replaced else state.answer[len(previous) :]
+                    yield AskStreamChunk(
+                        delta=delta,
+                        answer=state.answer,
+                        references=new_refs,
+                        replaced=replaced,
+                    )
+        except httpx.HTTPError as e:
+            raise self._chat_request_error(e) from e
+
+        result = await self._finish_ask(
+            question,
+            conversation_id,
+            is_new_conversation,
+            state.answer,
+            state.references,
+            "\n".join(raw_parts)[:1000],
         )
+        yield AskStreamChunk(delta="", answer=result.answer, result=result)
 
     async def get_history(self, notebook_id: str, limit: int = 20) -> Any:
         """Get conversation history from the API.
@@ -291,9 +456,113 @@ class ChatAPI:
     # Private Helpers
     # =========================================================================
 
-    def _build_conversation_history(self, conversation_id: str) -> list | None:
+    async def _prepare_ask(
+        self,
+        notebook_id: str,
+        question: str,
+        source_ids: list[str] | None,
+        conversation_id: str | None,
+    ) -> tuple[str, str, str, bool]:
+        """Build the chat request.
+
+        Returns:
+            Tuple of (url, body, conversation_id, is_new_conversation).
+        """
+        if source_ids is None:
+            # Follow-up turns reuse cached IDs and refresh them in the background
+            source_ids = await self._core.get_source_ids(notebook_id, allow_stale=True)
+
+        is_new_conversation = conversation_id is None
+        if conversation_id is None:
+            conversation_id = str(uuid.uuid4())
+            conversation_history = None
+        else:
+            conversation_history = await self._build_conversation_history(conversation_id)
+
+        sources_array = [[[sid]] for sid in source_ids] if source_ids else []
+
+        params = [
+            sources_array,
+            question,
+            conversation_history,
+            [2, None, [1]],
+            conversation_id,
+        ]
+
+        params_json = json.dumps(params, separators=(",", ":"))
+        f_req = [None, params_json]
+        f_req_json = json.dumps(f_req, separators=(",", ":"))
+
+        encoded_req = quote(f_req_json, safe="")
+
+        body_parts = [f"f.req={encoded_req}"]
+        if self._core.auth.csrf_token:
+            encoded_at = quote(self._core.auth.csrf_token, safe="")
+            body_parts.append(f"at={encoded_at}")
+
+        body = "&".join(body_parts) + "&"
+
+        self._core._reqid_counter += 100000
+        url_params = {
+            "bl": os.environ.get("NOTEBOOKLM_BL", "boq_labs-tailwind-frontend_20251221.14_p0"),
+            "hl": "en",
+            "_reqid": str(self._core._reqid_counter),
+            "rt": "c",
+        }
+        if self._core.auth.session_id:
+            url_params["f.sid"] = self._core.auth.session_id
+
+        query_string = urlencode(url_params)
+        url = f"{QUERY_URL}?{query_string}"
+        return url, body, conversation_id, is_new_conversation
+
+    async def _finish_ask(
+        self,
+        question: str,
+        conversation_id: str,
+        is_new_conversation: bool,
+        answer_text: str,
+        references: list[ChatReference],
+        raw_response: str,
+    ) -> AskResult:
+        """Cache the answered turn and build the AskResult."""
+        # Stores may block on disk or on other processes' locks
+        turns = await asyncio.to_thread(self._core.get_cached_conversation, conversation_id)
+        # Stores keep only the latest turns, so number from the last one kept
+        last_turn = turns[-1]["turn_number"] if turns else 0
+        if answer_text:
+            turn_number = last_turn + 1
+            await asyncio.to_thread(
+                self._core.cache_conversation_turn,
+                conversation_id,
+                question,
+                answer_text,
+                turn_number,
+            )
+        else:
+            turn_number = last_turn
+
+        return AskResult(
+            answer=answer_text,
+            conversation_id=conversation_id,
+            turn_number=turn_number,
+            is_follow_up=not is_new_conversation,
+            references=references,
+            raw_response=raw_response,
+        )
+
+    @staticmethod
+    def _chat_request_error(error: httpx.HTTPError) -> NotebookLMError:
+        """Map an httpx failure of the chat request to a library exception."""
+        if isinstance(error, httpx.TimeoutException):
+            return NetworkError(f"Chat request timed out: {error}", original_error=error)
+        if isinstance(error, httpx.HTTPStatusError):
+            return ChatError(f"Chat request failed with HTTP {error.response.status_code}: {error}")
+        return NetworkError(f"Chat request failed: {error}", original_error=error)
+
+    async def _build_conversation_history(self, conversation_id: str) -> list | None:
         """Build conversation history for follow-up requests."""
-        turns = self._core.get_cached_conversation(conversation_id)
+        turns = await asyncio.to_thread(self._core.get_cached_conversation, conversation_id)
         if not turns:
             return None
 
@@ -308,59 +577,47 @@ class ChatAPI:
     ) -> tuple[str, list[ChatReference]]:
         """Parse the streaming response to extract answer and references.
 
+        Only the citations of the final (longest) answer are decoded.
+
         Returns:
             Tuple of (answer_text, list of ChatReference objects).
         """
 
-        if response_text.startswith(")]}'"):
-            response_text = response_text[4:]
-
-        lines = response_text.strip().split("\n")
-        longest_answer = ""
-        all_references: list[ChatReference] = []
-
-        def process_chunk(json_str: str) -> None:
-            """Process a JSON chunk, updating longest_answer and all_references."""
-            nonlocal longest_answer
-            text, is_answer, refs = self._extract_answer_and_refs_from_chunk(json_str)
-            if text and is_answer and len(text) > len(longest_answer):
-                longest_answer = text
-            all_references.extend(refs)
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if not line:
-                i += 1
-                continue
+        lines = response_text.split("\n")
+        state = _AnswerState()
+        for line in lines:
+            self._parse_response_line(line, state)
 
-            try:
-                int(line)
-                i += 1
-                if i < len(lines):
-                    process_chunk(lines[i])
-                i += 1
-            except ValueError:
-                process_chunk(line)
-                i += 1
-
-        if not longest_answer:
+        if not state.answer:
             logger.debug(
                 "No answer extracted from response (%d lines parsed)",
                 len(lines),
             )
 
-        # Assign citation numbers based on order of appearance
-        for idx, ref in enumerate(all_references, start=1):
-            if ref.citation_number is None:
-                ref.citation_number = idx
+        return state.answer, self._decode_references(state.citations)
+
+    def _parse_response_line(self, line: str, state: "_AnswerState") -> bool | None:
+        """Parse one line of the streamed response into ``state``.
 
-        return longest_answer, all_references
+        The server sends growing snapshots of the answer; the longest answer
+        seen so far is kept together with its (undecoded) citations.
 
-    def _extract_answer_and_refs_from_chunk(
-        self, json_str: str
-    ) -> tuple[str | None, bool, list[ChatReference]]:
-        """Extract answer text and references from a response chunk.
+        Returns:
+            None if the line left the answer unchanged, otherwise whether the
+            new snapshot revised (True) or extended (False) the previous one.
+        """
+        line = line.strip()
+        chunk = self._extract_answer_chunk(line) if line else None
+        if chunk is None:
+            return None
+        text, is_answer, first = chunk
+        if not is_answer or len(text) <= len(state.answer):
+            return None
+        citations = _CITATIONS(first)
+        return state.set_snapshot(text, citations if type(citations) is list else [])
+
+    def _extract_answer_chunk(self, line: str) -> tuple[str, bool, list[Any]] | None:
+        """Extract the answer text of a response chunk, leaving citations undecoded.
 
         Response structure (discovered via reverse engineering):
         - first[0]: answer text
@@ -376,50 +633,38 @@ class ChatAPI:
             - cite[1][5][0][0][0]: parent SOURCE ID (this is the real source UUID)
 
         Returns:
-            Tuple of (text, is_answer, references).
+            Tuple of (text, is_answer, first), or None if the line holds no
+            answer text. The ")]}'" prefix and chunk length lines are
+            rejected before any JSON decoding.
         """
-        refs: list[ChatReference] = []
-
+        if not line.startswith("[") or '"wrb.fr"' not in line:
+            return None
         try:
-            data = json.loads(json_str)
+            data = json.loads(line)
         except json.JSONDecodeError:
-            return None, False, refs
-
-        if not isinstance(data, list):
-            return None, False, refs
+            return None
+        if type(data) is not list:
+            return None
 
         for item in data:
-            if not isinstance(item, list) or len(item) < 3:
-                continue
-            if item[0] != "wrb.fr":
+            if type(item) is not list or len(item) < 3 or item[0] != "wrb.fr":
                 continue
-
             inner_json = item[2]
-            if not isinstance(inner_json, str):
+            if type(inner_json) is not str:
                 continue
-
             try:
-                inner_data = json.loads(inner_json)
-                if isinstance(inner_data, list) and len(inner_data) > 0:
-                    first = inner_data[0]
-                    if isinstance(first, list) and len(first) > 0:
-                        text = first[0]
-                        is_answer = False
-                        if isinstance(text, str) and len(text) > _MIN_ANSWER_LENGTH:
-                            if len(first) > 4 and isinstance(first[4], list):
-                                type_info = first[4]
-                                if len(type_info) > 0 and type_info[-1] == 1:
-                                    is_answer = True
-
-                            # Extract references from first[4][3] - the detailed citation array
-                            # Each citation contains chunk ID, parent source ID, and cited text
-                            refs = self._parse_citations(first)
-
-                            return text, is_answer, refs
+                first = _ANSWER_FIRST(json.loads(inner_json))
             except json.JSONDecodeError:
                 continue
+            if type(first) is not list or not first:
+                continue
+            text = first[0]
+            if type(text) is str and len(text) > _MIN_ANSWER_LENGTH:
+                type_info = first[4] if len(first) > 4 else None
+                is_answer = type(type_info) is list and bool(type_info) and type_info[-1] == 1
+                return text, is_answer, first
 
-        return None, False, refs
+        return None
 
     def _parse_citations(self, first: list) -> list[ChatReference]:
         """Parse citation details from response structure.
@@ -430,31 +675,42 @@ class ChatAPI:
           - cite[1][4]: array of text passages with character positions
           - cite[1][5]: nested structure containing the parent SOURCE ID (UUID)
 
+        Args:
+            first: The first element of the parsed response.
+
+        Returns:
+            List of ChatReference objects with source IDs and cited text.
+        """
+        citations = _CITATIONS(first)
+        if type(citations) is not list:
+            return []
+        return self._decode_references(citations)
+
+    def _decode_references(
+        self, citations: list[Any], numbered_from: int = 0
+    ) -> list[ChatReference]:
+        """Decode raw citation entries into numbered ChatReferences.
+
         Note:
             This parsing relies on reverse-engineered response structures that
             Google can change at any time. Parsing failures are logged and
             result in graceful degradation (empty references list).
 
         Args:
-            first: The first element of the parsed response.
+            citations: Entries of a first[4][3] citation array.
+            numbered_from: Number of references that precede these ones.
 
         Returns:
-            List of ChatReference objects with source IDs and cited text.
+            References for the entries with a valid source ID, numbered
+            ``numbered_from + 1`` onwards.
         """
+        refs: list[ChatReference] = []
         try:
-            # Validate path to citations array: first[4][3]
-            if len(first) <= 4 or not isinstance(first[4], list):
-                return []
-            type_info = first[4]
-            if len(type_info) <= 3 or not isinstance(type_info[3], list):
-                return []
-
-            refs: list[ChatReference] = []
-            for cite in type_info[3]:
+            for cite in citations:
                 ref = self._parse_single_citation(cite)
                 if ref is not None:
                     refs.append(ref)
-            return refs
+                    ref.citation_number = numbered_from + len(refs)
         except (IndexError, TypeError, AttributeError) as e:
             logger.debug(
                 "Citation parsing failed (API structure may have changed): %s",
@@ -462,6 +718,7 @@ class ChatAPI:
                 exc_info=True,
             )
             return []
+        return refs
 
     def _parse_single_citation(self, cite: Any) -> ChatReference | None:
         """Parse a single citation entry into a ChatReference.
@@ -472,25 +729,23 @@ class ChatAPI:
         Returns:
             ChatReference if valid source ID found, None otherwise.
         """
-        if not isinstance(cite, list) or len(cite) < 2:
-            return None
-
-        cite_inner = cite[1]
-        if not isinstance(cite_inner, list):
+        cite_inner = _CITE_DETAILS(cite)
+        if type(cite_inner) is not list:
             return None
 
-        # Extract source ID from cite[1][5] - required for valid reference
-        source_id_data = cite_inner[5] if len(cite_inner) > 5 else None
-        source_id = self._extract_uuid_from_nested(source_id_data)
+        # Extract source ID from cite[1][5] - required for valid reference.
+        # Try its usual position before searching the whole structure.
+        source_id = _CITE_SOURCE_ID(cite_inner)
+        if type(source_id) is not str or not _UUID_PATTERN.match(source_id):
+            source_id_data = cite_inner[5] if len(cite_inner) > 5 else None
+            source_id = self._extract_uuid_from_nested(source_id_data)
         if source_id is None:
             return None
 
         # Extract chunk ID from cite[0][0]
-        chunk_id = None
-        if isinstance(cite[0], list) and cite[0]:
-            first_item = cite[0][0]
-            if isinstance(first_item, str):
-                chunk_id = first_item
+        chunk_id = _CITE_CHUNK_ID(cite)
+        if type(chunk_id) is not str:
+            chunk_id = None
 
         # Extract text passages and char positions from cite[1][4]
         cited_text, start_char, end_char = self._extract_text_passages(cite_inner)
@@ -0,0 +1,263 @@
+"""Local stores for chat conversation turns.
+
+Follow-up questions must send the previous turns of a conversation along
+with the new question, and the API offers no way to fetch them by
+conversation ID. ``ClientCore`` therefore keeps every answered turn in a
+``ConversationStore``: ``MemoryConversationStore`` (the default) lives as
+long as the client, while ``SQLiteConversationStore`` lets separate
+processes - CLI invocations, worker pools - continue the same conversation.
+
+Both stores evict the least recently used conversation once more than
+``max_conversations`` are held, and keep only the last ``max_turns`` turns
+of each conversation. ``ChatAPI`` calls stores from worker threads, so
+they must be thread-safe.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Protocol
+
+from .paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of conversations to keep (least recently used evicted first)
+MAX_CONVERSATION_CACHE_SIZE = 100
+
+# Maximum number of turns kept per conversation (oldest dropped first)
+MAX_CONVERSATION_TURNS = 50
+
+# Seconds a writer waits for another process's lock before failing
+_BUSY_TIMEOUT = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    conversation_id TEXT PRIMARY KEY,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS conversations_last_used ON conversations (last_used);
+CREATE TABLE IF NOT EXISTS conversation_turns (
+    conversation_id TEXT NOT NULL,
+    turn_number INTEGER NOT NULL,
+    query TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    PRIMARY KEY (conversation_id, turn_number)
+);
+"""
+
+
+class ConversationStore(Protocol):
+    """Interface of a conversation turn store.
+
+    Turns are dicts with ``query``, ``answer`` and ``turn_number`` keys,
+    returned oldest first. Methods may be called from worker threads.
+    """
+
+    def get(self, conversation_id: str) -> list[dict[str, Any]]:
+        """Return the stored turns of a conversation (empty if unknown)."""
+        ...
+
+    def append(self, conversation_id: str, query: str, answer: str, turn_number: int) -> None:
+        """Store one answered turn."""
+        ...
+
+    def clear(self, conversation_id: str | None = None) -> bool:
+        """Drop one conversation, or all if None. Returns True if anything was cleared."""
+        ...
+
+
+class MemoryConversationStore:
+    """Per-process conversation store backed by an ``OrderedDict``."""
+
+    def __init__(
+        self,
+        max_conversations: int = MAX_CONVERSATION_CACHE_SIZE,
+        max_turns: int = MAX_CONVERSATION_TURNS,
+    ):
+        """Initialize the store.
+
+        Args:
+            max_conversations: Conversations kept before the least recently
+                used one is evicted.
+            max_turns: Turns kept per conversation.
+        """
+        self.max_conversations = max_conversations
+        self.max_turns = max_turns
+        self._conversations: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, conversation_id: str) -> list[dict[str, Any]]:
+        """Return the stored turns of a conversation (empty if unknown)."""
+        with self._lock:
+            turns = self._conversations.get(conversation_id)
+            if turns is None:
+                return []
+            self._conversations.move_to_end(conversation_id)
+            return list(turns)
+
+    def append(self, conversation_id: str, query: str, answer: str, turn_number: int) -> None:
+        """Store one answered turn."""
+        with self._lock:
+            turns = self._conversations.get(conversation_id)
+            if turns is None:
+                # Only evict when adding a NEW conversation at capacity
+                while self._conversations and len(self._conversations) >= self.max_conversations:
+                    self._conversations.popitem(last=False)
+                turns = self._conversations[conversation_id] = []
+            else:
+                self._conversations.move_to_end(conversation_id)
+
+            turns.append({"query": query, "answer": answer, "turn_number": turn_number})
+            del turns[: -self.max_turns]
+
+    def clear(self, conversation_id: str | None = None) -> bool:
+        """Drop one conversation, or all if None. Returns True if anything was cleared."""
+        with self._lock:
+            if conversation_id is None:
+                self._conversations.clear()
+                return True
+            return self._conversations.pop(conversation_id, None) is not None
+
+
+class SQLiteConversationStore:
+    """Conversation store in an SQLite database shared between processes.
+
+    Writes run in ``BEGIN IMMEDIATE`` transactions on a WAL-mode database,
+    so concurrent CLI sessions and workers can append to it safely.
+
+    Usage:
+        store = SQLiteConversationStore()  # ~/.notebooklm/cache/conversations.db
+        async with NotebookLMClient(auth, conversation_store=store) as client:
+            result = await client.chat.ask(nb_id, "Summarize")
+        # Later, in another process:
+        async with NotebookLMClient(auth, conversation_store=SQLiteConversationStore()) as client:
+            await client.chat.ask(nb_id, "Go on", conversation_id=result.conversation_id)
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_conversations: int = MAX_CONVERSATION_CACHE_SIZE,
+        max_turns: int = MAX_CONVERSATION_TURNS,
+    ):
+        """Initialize the store.
+
+        Args:
+            path: SQLite database file, or ``":memory:"`` for a per-process
+                store. Defaults to ``get_cache_dir() / "conversations.db"``.
+            max_conversations: Conversations kept before the least recently
+                used one is evicted.
+            max_turns: Turns kept per conversation.
+        """
+        if path == ":memory:":
+            self.path: Path | None = None
+        else:
+            self.path = Path(path) if path else get_cache_dir() / "conversations.db"
+        self.max_conversations = max_conversations
+        self.max_turns = max_turns
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def get(self, conversation_id: str) -> list[dict[str, Any]]:
+        """Return the stored turns of a conversation (empty if unknown)."""
+        with self._write() as conn:
+            rows = conn.execute(
+                "SELECT query, answer, turn_number FROM conversation_turns "
+                "WHERE conversation_id = ? ORDER BY turn_number",
+                (conversation_id,),
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    "UPDATE conversations SET last_used = ? WHERE conversation_id = ?",
+                    (time.time(), conversation_id),
+                )
+        return [
+            {"query": query, "answer": answer, "turn_number": turn_number}
+            for query, answer, turn_number in rows
+        ]
+
+    def append(self, conversation_id: str, query: str, answer: str, turn_number: int) -> None:
+        """Store one answered turn."""
+        with self._write() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO conversation_turns "
+                "(conversation_id, turn_number, query, answer) VALUES (?, ?, ?, ?)",
+                (conversation_id, turn_number, query, answer),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO conversations (conversation_id, last_used) VALUES (?, ?)",
+                (conversation_id, time.time()),
+            )
+            conn.execute(
+                "DELETE FROM conversation_turns WHERE conversation_id = ? AND turn_number NOT IN "
+                "(SELECT turn_number FROM conversation_turns WHERE conversation_id = ? "
+                "ORDER BY turn_number DESC LIMIT ?)",
+                (conversation_id, conversation_id, self.max_turns),
+            )
+            evicted = conn.execute(
+                "SELECT conversation_id FROM conversations ORDER BY last_used DESC "
+                "LIMIT -1 OFFSET ?",
+                (self.max_conversations,),
+            ).fetchall()
+            for (evicted_id,) in evicted:
+                self._delete(conn, evicted_id)
+
+    def clear(self, conversation_id: str | None = None) -> bool:
+        """Drop one conversation, or all if None. Returns True if anything was cleared."""
+        with self._write() as conn:
+            if conversation_id is None:
+                conn.execute("DELETE FROM conversation_turns")
+                conn.execute("DELETE FROM conversations")
+                return True
+            return self._delete(conn, conversation_id)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, conversation_id: str) -> bool:
+        conn.execute("DELETE FROM conversation_turns WHERE conversation_id = ?", (conversation_id,))
+        cursor = conn.execute(
+            "DELETE FROM conversations WHERE conversation_id = ?", (conversation_id,)
+        )
+        return cursor.rowcount > 0
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run a block in one immediate (write-locked) transaction."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path is None:
+                conn = sqlite3.connect(":memory:", isolation_level=None, check_same_thread=False)
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+                conn = sqlite3.connect(
+                    self.path,
+                    timeout=_BUSY_TIMEOUT,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
@@ -3,13 +3,15 @@
 import asyncio
 import logging
 import time
-from collections import OrderedDict
 from collections.abc import Awaitable, Callable, Coroutine
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Any, cast
 from urllib.parse import urlencode
 
 import httpx
 
+from ._conversations import ConversationStore, MemoryConversationStore
+from ._source_rows import notebook_source_rows, source_ids
 from .auth import AuthTokens
 from .rpc import (
     BATCHEXECUTE_URL,
@@ -28,13 +30,22 @@ from .rpc import (
 
 logger = logging.getLogger(__name__)
 
-# Maximum number of conversations to cache (FIFO eviction)
-MAX_CONVERSATION_CACHE_SIZE = 100
-
 # Default HTTP timeouts in seconds
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_CONNECT_TIMEOUT = 10.0  # Connection establishment timeout
 
+# Default cap on concurrent in-flight HTTP requests per client. Bulk helpers
+# fan out with asyncio.gather; this keeps them from flooding the API.
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+# Seconds a notebook's source IDs are reused before GET_NOTEBOOK is fetched
+# again. Adding or deleting a source through this client invalidates them.
+DEFAULT_SOURCE_IDS_TTL = 30.0
+
+# Expired source IDs up to this old may still be served to chat while a
+# background refresh runs, so a follow-up question costs one round trip.
+SOURCE_IDS_MAX_STALE = 600.0
+
 # Auth error detection patterns (case-insensitive)
 AUTH_ERROR_PATTERNS = (
     "authentication",
@@ -82,7 +93,7 @@ class ClientCore:
     - HTTP client lifecycle (open/close)
     - RPC call encoding/decoding
     - Authentication headers
-    - Conversation cache
+    - Conversation store
 
     This class is used internally by the sub-client APIs (NotebooksAPI,
     ArtifactsAPI, etc.) and should not be used directly.
@@ -95,6 +106,9 @@ class ClientCore:
         connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
         refresh_callback: Callable[[], Awaitable[AuthTokens]] | None = None,
         refresh_retry_delay: float = 0.2,
+        max_concurrent_requests: int | None = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        source_ids_ttl: float = DEFAULT_SOURCE_IDS_TTL,
+        conversation_store: ConversationStore | None = None,
     ):
         """Initialize the core client.
 
@@ -107,6 +121,12 @@ class ClientCore:
             refresh_callback: Optional async callback to refresh auth tokens on failure.
                 If provided, rpc_call will automatically retry once after refreshing.
             refresh_retry_delay: Delay in seconds before retrying after refresh.
+            max_concurrent_requests: Maximum number of HTTP requests in flight at
+                once across all sub-APIs. None disables the limit.
+            source_ids_ttl: Seconds to reuse a notebook's source IDs in
+                ``get_source_ids``. 0 disables the cache.
+            conversation_store: Where answered chat turns are kept for
+                follow-up questions. Defaults to an in-memory store.
         """
         self.auth = auth
         self._timeout = timeout
@@ -116,10 +136,20 @@ class ClientCore:
         self._refresh_lock: asyncio.Lock | None = asyncio.Lock() if refresh_callback else None
         self._refresh_task: asyncio.Task[AuthTokens] | None = None
         self._http_client: httpx.AsyncClient | None = None
+        self._request_semaphore: asyncio.Semaphore | None = (
+            asyncio.Semaphore(max_concurrent_requests) if max_concurrent_requests else None
+        )
         # Request ID counter for chat API (must be unique per request)
         self._reqid_counter: int = 100000
-        # OrderedDict for FIFO eviction when cache exceeds MAX_CONVERSATION_CACHE_SIZE
-        self._conversation_cache: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        self._conversations: ConversationStore = (
+            conversation_store if conversation_store is not None else MemoryConversationStore()
+        )
+        # Per-notebook (fetched_at, source_ids), see get_source_ids
+        self._source_ids_ttl = source_ids_ttl
+        self._source_ids_cache: dict[str, tuple[float, list[str]]] = {}
+        # Bumped on every invalidation so in-flight fetches don't store old IDs
+        self._source_ids_epoch: int = 0
+        self._source_ids_refreshes: dict[str, asyncio.Task[list[str]]] = {}
 
     async def open(self) -> None:
         """Open the HTTP client connection.
@@ -148,6 +178,12 @@ class ClientCore:
 
         Called automatically by NotebookLMClient.__aexit__.
         """
+        refreshes = list(self._source_ids_refreshes.values())
+        for task in refreshes:
+            task.cancel()
+        if refreshes:
+            await asyncio.gather(*refreshes, return_exceptions=True)
+
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
@@ -227,7 +263,8 @@ class ClientCore:
         body = build_request_body(rpc_request, self.auth.csrf_token)
 
         try:
-            response = await self._http_client.post(url, content=body)
+            async with self.request_slot():
+                response = await self._http_client.post(url, content=body)
             response.raise_for_status()
         except (httpx.HTTPStatusError, httpx.RequestError) as e:
             elapsed = time.perf_counter() - start
@@ -417,6 +454,20 @@ class ClientCore:
         # Retry with refreshed tokens
         return await self.rpc_call(method, params, source_path, allow_null, _is_retry=True)
 
+    def request_slot(self) -> AbstractAsyncContextManager[Any]:
+        """Reserve one of the client's concurrent request slots.
+
+        Wrap each outgoing HTTP request (not retries or backoff sleeps) in
+        ``async with core.request_slot():`` so that bulk operations running
+        many calls concurrently stay under ``max_concurrent_requests``.
+
+        Returns:
+            An async context manager; a no-op when the limit is disabled.
+        """
+        if self._request_semaphore is None:
+            return nullcontext()
+        return self._request_semaphore
+
     def get_http_client(self) -> httpx.AsyncClient:
         """Get the underlying HTTP client for direct requests.
 
@@ -435,9 +486,9 @@ class ClientCore:
     def cache_conversation_turn(
         self, conversation_id: str, query: str, answer: str, turn_number: int
     ) -> None:
-        """Cache a conversation turn locally.
+        """Store a conversation turn in the conversation store.
 
-        Uses FIFO eviction when cache exceeds MAX_CONVERSATION_CACHE_SIZE.
+        The store evicts the least recently used conversation when full.
 
         Args:
             conversation_id: The conversation ID.
@@ -445,22 +496,7 @@ class ClientCore:
             answer: The AI's response.
             turn_number: The turn number in the conversation.
         """
-        is_new_conversation = conversation_id not in self._conversation_cache
-
-        # Only evict when adding a NEW conversation at capacity
-        if is_new_conversation:
-            while len(self._conversation_cache) >= MAX_CONVERSATION_CACHE_SIZE:
-                # popitem(last=False) removes oldest entry (FIFO)
-                self._conversation_cache.popitem(last=False)
-            self._conversation_cache[conversation_id] = []
-
-        self._conversation_cache[conversation_id].append(
-            {
-                "query": query,
-                "answer": answer,
-                "turn_number": turn_number,
-            }
-        )
+        self._conversations.append(conversation_id, query, answer, turn_number)
 
     def get_cached_conversation(self, conversation_id: str) -> list[dict[str, Any]]:
         """Get cached conversation turns.
@@ -471,7 +507,7 @@ class ClientCore:
         Returns:
             List of cached turns, or empty list if not found.
         """
-        return self._conversation_cache.get(conversation_id, [])
+        return self._conversations.get(conversation_id)
 
     def clear_conversation_cache(self, conversation_id: str | None = None) -> bool:
         """Clear conversation cache.
@@ -482,23 +518,20 @@ class ClientCore:
         Returns:
             True if cache was cleared.
         """
-        if conversation_id:
-            if conversation_id in self._conversation_cache:
-                del self._conversation_cache[conversation_id]
-                return True
-            return False
-        else:
-            self._conversation_cache.clear()
-            return True
+        return self._conversations.clear(conversation_id)
 
-    async def get_source_ids(self, notebook_id: str) -> list[str]:
+    async def get_source_ids(self, notebook_id: str, *, allow_stale: bool = False) -> list[str]:
         """Extract all source IDs from a notebook.
 
         Fetches notebook data and extracts source IDs for use with
         chat and artifact generation when targeting specific sources.
+        Results are reused for ``source_ids_ttl`` seconds; adding or deleting
+        a source through this client invalidates them.
 
         Args:
             notebook_id: The notebook ID.
+            allow_stale: Return expired IDs (up to ``SOURCE_IDS_MAX_STALE``
+                seconds old) immediately and refresh them in the background.
 
         Returns:
             List of source IDs. Empty list if no sources or on error.
@@ -506,6 +539,28 @@ class ClientCore:
         Note:
             Source IDs are triple-nested in RPC: source[0][0] contains the ID.
         """
+        entry = self._source_ids_cache.get(notebook_id)
+        if entry is not None:
+            fetched_at, ids = entry
+            age = time.monotonic() - fetched_at
+            if age < self._source_ids_ttl:
+                return list(ids)
+            if allow_stale and age < SOURCE_IDS_MAX_STALE:
+                self._refresh_source_ids(notebook_id)
+                return list(ids)
+        return await self._fetch_source_ids(notebook_id)
+
+    def invalidate_source_ids(self, notebook_id: str | None = None) -> None:
+        """Drop cached source IDs for a notebook, or for all notebooks if None."""
+        self._source_ids_epoch += 1
+        if notebook_id is None:
+            self._source_ids_cache.clear()
+        else:
+            self._source_ids_cache.pop(notebook_id, None)
+
+    async def _fetch_source_ids(self, notebook_id: str) -> list[str]:
+        """Fetch a notebook's source IDs and cache them."""
+        epoch = self._source_ids_epoch
         params = [notebook_id, None, [2], None, 0]
         notebook_data = await self.rpc_call(
             RPCMethod.GET_NOTEBOOK,
@@ -513,23 +568,22 @@ class ClientCore:
             source_path=f"/notebook/{notebook_id}",
         )
 
-        source_ids: list[str] = []
-        if not notebook_data or not isinstance(notebook_data, list):
-            return source_ids
-
-        try:
-            if len(notebook_data) > 0 and isinstance(notebook_data[0], list):
-                notebook_info = notebook_data[0]
-                if len(notebook_info) > 1 and isinstance(notebook_info[1], list):
-                    sources = notebook_info[1]
-                    for source in sources:
-                        if isinstance(source, list) and len(source) > 0:
-                            first = source[0]
-                            if isinstance(first, list) and len(first) > 0:
-                                sid = first[0]
-                                if isinstance(sid, str):
-                                    source_ids.append(sid)
-        except (IndexError, TypeError):
-            pass
-
-        return source_ids
+        rows = notebook_source_rows(notebook_data)
+        ids = source_ids(rows) if rows is not None else []
+        if self._source_ids_ttl > 0 and epoch == self._source_ids_epoch:
+            self._source_ids_cache[notebook_id] = (time.monotonic(), ids)
+        return list(ids)
+
+    def _refresh_source_ids(self, notebook_id: str) -> None:
+        """Start a background refresh unless one is already running."""
+        if notebook_id in self._source_ids_refreshes:
+            return
+        task = asyncio.create_task(self._fetch_source_ids(notebook_id))
+        self._source_ids_refreshes[notebook_id] = task
+
+        def done(task: asyncio.Task[list[str]]) -> None:
+            self._source_ids_refreshes.pop(notebook_id, None)
+            if not task.cancelled() and (error := task.exception()) is not None:
+                logger.debug("Background source ID refresh for %s failed: %s", notebook_id, error)
+
+        task.add_done_callback(done)
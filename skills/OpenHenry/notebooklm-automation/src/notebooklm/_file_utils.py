@@ -0,0 +1,29 @@
+"""Filename utilities for bulk exports.
+
+Exports write one file per artifact or note, named after its title. Titles
+may contain characters that are invalid in filenames and may repeat within
+one export.
+"""
+
+import re
+
+
+def unique_filename(title: str, extension: str, used_names: set[str]) -> str:
+    """Build a filesystem-safe, unique filename from a title.
+
+    Args:
+        title: Artifact or note title.
+        extension: File extension including the leading dot.
+        used_names: Names already taken in this export; updated in place.
+
+    Returns:
+        Filename such as ``"Study Guide.md"`` or ``"Study Guide (2).md"``.
+    """
+    stem = re.sub(r'[/\\:*?"<>|\x00-\x1f]', "_", title).strip(". ")[:200] or "untitled"
+    name = f"{stem}{extension}"
+    counter = 2
+    while name.lower() in used_names:
+        name = f"{stem} ({counter}){extension}"
+        counter += 1
+    used_names.add(name.lower())
+    return name
@@ -0,0 +1,130 @@
+"""Content fingerprints of the sources added to each notebook.
+
+Adding the same URL, text or file to a notebook twice costs an upload plus
+server-side processing and leaves a duplicate source behind. A fingerprint
+identifies a source's content before anything is sent: the normalized URL,
+the SHA-256 of a file's bytes, or the SHA-256 of pasted text.
+``SourceFingerprints`` records the fingerprint → source ID of every source
+added through this library, because the notebook itself only reports URLs.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from ._url_utils import normalize_source_url
+from .paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+
+def hash_file(path: Path) -> str:
+    """Return the hex SHA-256 of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def url_fingerprint(url: str) -> str:
+    """Fingerprint of a URL source."""
+    return f"url:{normalize_source_url(url)}"
+
+
+def content_fingerprint(sha256: str) -> str:
+    """Fingerprint of an uploaded document from the SHA-256 of its bytes."""
+    return f"sha256:{sha256}"
+
+
+def text_fingerprint(content: str) -> str:
+    """Fingerprint of a pasted text source (the title is not part of it)."""
+    return f"text:{hashlib.sha256(content.encode('utf-8')).hexdigest()}"
+
+
+class SourceFingerprints:
+    """Per-notebook fingerprint → source ID manifest, persisted as JSON.
+
+    Usage:
+        fingerprints = SourceFingerprints()  # ~/.notebooklm/cache/source_fingerprints.json
+        async with NotebookLMClient(auth, source_fingerprints=fingerprints) as client:
+            await client.sources.add_file(nb_id, "paper.pdf")
+            await client.sources.add_file(nb_id, "paper-copy.pdf")  # returns the first source
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """Initialize the manifest.
+
+        Args:
+            path: JSON file to persist fingerprints in, or ``":memory:"`` to
+                keep them for this process only. Defaults to
+                ``get_cache_dir() / "source_fingerprints.json"``.
+        """
+        if path == ":memory:":
+            self.path: Path | None = None
+        else:
+            self.path = Path(path) if path else get_cache_dir() / "source_fingerprints.json"
+        self._notebooks: dict[str, dict[str, str]] | None = None
+
+    def get(self, notebook_id: str) -> dict[str, str]:
+        """Return ``{fingerprint: source_id}`` recorded for a notebook."""
+        return dict(self._load().get(notebook_id, {}))
+
+    def add(self, notebook_id: str, fingerprint: str, source_id: str) -> None:
+        """Record that ``source_id`` holds the content of ``fingerprint``."""
+        self._load().setdefault(notebook_id, {})[fingerprint] = source_id
+        self._save()
+
+    def remove_sources(self, notebook_id: str, source_ids: set[str]) -> None:
+        """Forget every fingerprint pointing at one of ``source_ids``."""
+        entries = self._load().get(notebook_id)
+        if not entries:
+            return
+        stale = [fp for fp, source_id in entries.items() if source_id in source_ids]
+        if stale:
+            for fp in stale:
+                del entries[fp]
+            self._save()
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        if self._notebooks is None:
+            data: object = {}
+            if self.path is not None:
+                try:
+                    data = json.loads(self.path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    data = {}
+            self._notebooks = (
+                {
+                    notebook_id: {
+                        str(fp): str(source_id)
+                        for fp, source_id in entries.items()
+                        if isinstance(source_id, str)
+                    }
+                    for notebook_id, entries in data.items()
+                    if isinstance(entries, dict)
+                }
+                if isinstance(data, dict)
+                else {}
+            )
+        return self._notebooks
+
+    def _save(self) -> None:
+        """Write the manifest atomically; failures are logged and ignored."""
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._notebooks, f)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug("Failed to save source fingerprints: %s", e)
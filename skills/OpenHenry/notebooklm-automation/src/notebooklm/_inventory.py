@@ -0,0 +1,469 @@
+"""Account-wide inventory of notebooks and their contents.
+
+Cataloguing an account means, per notebook, reading its sources, artifacts,
+notes and sharing status. ``iter_inventory()`` fans these reads out
+concurrently (bounded per notebook and by the client's request limit),
+reads notebook metadata and sources from one GET_NOTEBOOK call, and yields
+each notebook's ``NotebookInventory`` as soon as it is complete.
+``write_inventory()`` streams those records to a JSONL file or an SQLite
+database.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+import httpx
+
+from .exceptions import NotebookLMError, ValidationError
+from .types import Notebook, NotebookInventory, Source
+
+if TYPE_CHECKING:
+    from .client import NotebookLMClient
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+_SQLITE_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notebooks (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    created_at TEXT,
+    sources_count INTEGER NOT NULL,
+    is_owner INTEGER NOT NULL,
+    is_public INTEGER,
+    errors TEXT NOT NULL,
+    inventoried_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sources (
+    notebook_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT,
+    url TEXT,
+    kind TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    created_at TEXT,
+    PRIMARY KEY (notebook_id, id)
+);
+CREATE TABLE IF NOT EXISTS artifacts (
+    notebook_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    created_at TEXT,
+    url TEXT,
+    PRIMARY KEY (notebook_id, id)
+);
+CREATE TABLE IF NOT EXISTS notes (
+    notebook_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    PRIMARY KEY (notebook_id, id)
+);
+CREATE TABLE IF NOT EXISTS shared_users (
+    notebook_id TEXT NOT NULL,
+    email TEXT NOT NULL,
+    permission TEXT NOT NULL,
+    display_name TEXT,
+    PRIMARY KEY (notebook_id, email)
+);
+"""
+
+
+async def iter_inventory(
+    client: "NotebookLMClient",
+    notebook_ids: list[str] | None = None,
+    concurrency: int = 4,
+) -> AsyncIterator[NotebookInventory]:
+    """Yield the inventory of each notebook as soon as it has been read.
+
+    See ``NotebookLMClient.inventory()``.
+    """
+    if concurrency < 1:
+        raise ValidationError(f"concurrency must be at least 1, got {concurrency}")
+
+    if notebook_ids is None:
+        listed = {nb.id: nb for nb in await client.notebooks.list()}
+        notebook_ids = list(listed)
+    else:
+        listed = {}
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def read_one(notebook_id: str) -> NotebookInventory:
+        async with semaphore:
+            return await _read_notebook(client, notebook_id, listed.get(notebook_id))
+
+    tasks = [asyncio.ensure_future(read_one(notebook_id)) for notebook_id in notebook_ids]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # The consumer may stop early; don't leave reads running
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _read_notebook(
+    client: "NotebookLMClient", notebook_id: str, listed: Notebook | None
+) -> NotebookInventory:
+    """Read all parts of one notebook concurrently; failed parts are recorded."""
+    errors: dict[str, str] = {}
+
+    async def part(name: str, read: Awaitable[T], default: T) -> T:
+        try:
+            return await read
+        except (NotebookLMError, httpx.HTTPError) as e:
+            logger.warning("Inventory of %s in notebook %s failed: %s", name, notebook_id, e)
+            errors[name] = str(e)
+            return default
+
+    # notes.list() and artifacts.list() running together share one notes fetch
+    (notebook, sources), artifacts, notes, share_status = await asyncio.gather(
+        part("notebook", _notebook_and_sources(client, notebook_id, listed), (None, [])),
+        part("artifacts", client.artifacts.list(notebook_id), []),
+        part("notes", client.notes.list(notebook_id), []),
+        part("sharing", client.sharing.get_status(notebook_id), None),
+    )
+    if notebook is None:
+        notebook = listed or Notebook(id=notebook_id, title="")
+    return NotebookInventory(
+        notebook=notebook,
+        sources=sources,
+        artifacts=artifacts,
+        notes=notes,
+        share_status=share_status,
+        errors=errors,
+    )
+
+
+async def _notebook_and_sources(
+    client: "NotebookLMClient", notebook_id: str, listed: Notebook | None
+) -> tuple[Notebook, list[Source]]:
+    """Read notebook metadata and sources from a single GET_NOTEBOOK call."""
+    notebook, sources = await client.notebooks.get_with_sources(notebook_id)
+    if not notebook.id:
+        fallback = listed or Notebook(id=notebook_id, title="")
+        fallback.sources_count = notebook.sources_count
+        notebook = fallback
+    if listed is not None:
+        notebook.is_owner = listed.is_owner
+    return notebook, sources
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def inventory_record(inventory: NotebookInventory) -> dict[str, Any]:
+    """Convert a NotebookInventory to a JSON-serializable dict."""
+    notebook = inventory.notebook
+    status = inventory.share_status
+    return {
+        "notebook": {
+            "id": notebook.id,
+            "title": notebook.title,
+            "created_at": _iso(notebook.created_at),
+            "sources_count": notebook.sources_count,
+            "is_owner": notebook.is_owner,
+        },
+        "sources": [
+            {
+                "id": source.id,
+                "title": source.title,
+                "url": source.url,
+                "kind": source.kind.value,
+                "status": int(source.status),
+                "created_at": _iso(source.created_at),
+            }
+            for source in inventory.sources
+        ],
+        "artifacts": [
+            {
+                "id": artifact.id,
+                "title": artifact.title,
+                "kind": artifact.kind.value,
+                "status": artifact.status,
+                "created_at": _iso(artifact.created_at),
+                "url": artifact.url,
+            }
+            for artifact in inventory.artifacts
+        ],
+        "notes": [
+            {"id": note.id, "title": note.title, "content": note.content}
+            for note in inventory.notes
+        ],
+        "sharing": None
+        if status is None
+        else {
+            "is_public": status.is_public,
+            "users": [
+                {
+                    "email": user.email,
+                    "permission": user.permission.name.lower(),
+                    "display_name": user.display_name,
+                }
+                for user in status.shared_users
+            ],
+        },
+        "errors": inventory.errors,
+    }
+
+
+class InventoryWriter(Protocol):
+    """Destination for inventory records."""
+
+    def write(self, inventory: NotebookInventory) -> None:
+        """Store one notebook's inventory."""
+        ...
+
+    def prune(self, notebook_ids: set[str]) -> None:
+        """Forget notebooks not in ``notebook_ids`` (after a full-account run)."""
+        ...
+
+    def close(self) -> None:
+        """Flush and release the destination."""
+        ...
+
+
+class JSONLInventoryWriter:
+    """Writes one JSON object per notebook and line (see ``inventory_record()``)."""
+
+    def __init__(self, path: str | Path):
+        """Initialize the writer; the file is truncated on the first write.
+
+        Args:
+            path: Output file.
+        """
+        self.path = Path(path)
+        self._file: Any = None
+
+    def write(self, inventory: NotebookInventory) -> None:
+        """Append one notebook's record."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8")  # noqa: SIM115
+        self._file.write(json.dumps(inventory_record(inventory), ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def prune(self, notebook_ids: set[str]) -> None:
+        """Nothing to do: the file only holds this run's notebooks."""
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SQLiteInventoryWriter:
+    """Writes inventories into relational tables of an SQLite database.
+
+    Tables: ``notebooks``, ``sources``, ``artifacts``, ``notes`` and
+    ``shared_users``, keyed by notebook ID. Each notebook is written in one
+    transaction that replaces its previous rows, so a nightly run updates
+    the catalog in place. Parts that failed to load keep their old rows and
+    ``notebooks`` columns (metadata for "notebook", ``is_public`` for
+    "sharing"). ``prune()`` removes notebooks that no longer exist.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the writer.
+
+        Args:
+            path: SQLite database file (created if needed).
+        """
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+
+    def write(self, inventory: NotebookInventory) -> None:
+        """Replace one notebook's rows."""
+        record = inventory_record(inventory)
+        notebook = record["notebook"]
+        nb_id = notebook["id"]
+        sharing = record["sharing"]
+        errors = inventory.errors
+        metadata = (
+            notebook["title"],
+            notebook["created_at"],
+            notebook["sources_count"],
+            notebook["is_owner"],
+        )
+        is_public = None if sharing is None else sharing["is_public"]
+        conn = self._connect()
+        with conn:
+            previous = conn.execute(
+                "SELECT title, created_at, sources_count, is_owner, is_public "
+                "FROM notebooks WHERE id = ?",
+                (nb_id,),
+            ).fetchone()
+            if previous is not None:
+                # Columns of parts that failed to load keep their last known values
+                if "notebook" in errors:
+                    metadata = previous[:4]
+                if sharing is None:
+                    is_public = previous[4]
+            conn.execute(
+                "INSERT OR REPLACE INTO notebooks (id, title, created_at, sources_count, is_owner, "
+                "is_public, errors, inventoried_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (nb_id, *metadata, is_public, json.dumps(errors), time.time()),
+            )
+            if "notebook" not in errors:
+                self._replace(
+                    conn,
+                    "sources (notebook_id, id, title, url, kind, status, created_at)",
+                    nb_id,
+                    [
+                        (
+                            nb_id,
+                            s["id"],
+                            s["title"],
+                            s["url"],
+                            s["kind"],
+                            s["status"],
+                            s["created_at"],
+                        )
+                        for s in record["sources"]
+                    ],
+                )
+            if "artifacts" not in errors:
+                self._replace(
+                    conn,
+                    "artifacts (notebook_id, id, title, kind, status, created_at, url)",
+                    nb_id,
+                    [
+                        (
+                            nb_id,
+                            a["id"],
+                            a["title"],
+                            a["kind"],
+                            a["status"],
+                            a["created_at"],
+                            a["url"],
+                        )
+                        for a in record["artifacts"]
+                    ],
+                )
+            if "notes" not in errors:
+                self._replace(
+                    conn,
+                    "notes (notebook_id, id, title, content)",
+                    nb_id,
+                    [(nb_id, n["id"], n["title"], n["content"]) for n in record["notes"]],
+                )
+            if sharing is not None:
+                self._replace(
+                    conn,
+                    "shared_users (notebook_id, email, permission, display_name)",
+                    nb_id,
+                    [
+                        (nb_id, u["email"], u["permission"], u["display_name"])
+                        for u in sharing["users"]
+                    ],
+                )
+
+    def prune(self, notebook_ids: set[str]) -> None:
+        """Delete the rows of notebooks not in ``notebook_ids``."""
+        conn = self._connect()
+        with conn:
+            stale = [
+                (nb_id,)
+                for (nb_id,) in conn.execute("SELECT id FROM notebooks").fetchall()
+                if nb_id not in notebook_ids
+            ]
+            conn.executemany("DELETE FROM notebooks WHERE id = ?", stale)
+            for table in ("sources", "artifacts", "notes", "shared_users"):
+                conn.executemany(f"DELETE FROM {table} WHERE notebook_id = ?", stale)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _replace(
+        conn: sqlite3.Connection, table_columns: str, notebook_id: str, rows: list[tuple]
+    ) -> None:
+        table = table_columns.split(" ", 1)[0]
+        conn.execute(f"DELETE FROM {table} WHERE notebook_id = ?", (notebook_id,))
+        if rows:
+            placeholders = ", ".join("?" * len(rows[0]))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table_columns} VALUES ({placeholders})", rows
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # write_inventory() calls the writer from worker threads, one at a time
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+
+def open_inventory_writer(path: str | Path) -> InventoryWriter:
+    """Return the writer for a path: JSONL for ``.jsonl``, SQLite for ``.db``/``.sqlite``.
+
+    Raises:
+        ValidationError: If the file extension is not recognized.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in _JSONL_SUFFIXES:
+        return JSONLInventoryWriter(path)
+    if suffix in _SQLITE_SUFFIXES:
+        return SQLiteInventoryWriter(path)
+    raise ValidationError(
+        f"Unsupported inventory file '{path}'. Use a .jsonl, .db or .sqlite extension."
+    )
+
+
+async def write_inventory(
+    inventories: AsyncIterable[NotebookInventory], path: str | Path, prune: bool = False
+) -> int:
+    """Stream inventories into a JSONL file or SQLite database.
+
+    Each notebook is written as soon as it arrives, so memory use does not
+    grow with the size of the account. Writes run in a worker thread.
+
+    Args:
+        inventories: Usually ``client.inventory()``.
+        path: ``.jsonl`` file or ``.db``/``.sqlite`` database.
+        prune: The stream covers the whole account: once it completes,
+            remove notebooks from the SQLite catalog that were not in it
+            (deleted since the last run). Leave False when inventorying
+            selected notebooks.
+
+    Returns:
+        Number of notebooks written.
+
+    Example:
+        async with NotebookLMClient(auth) as client:
+            count = await write_inventory(client.inventory(), "catalog.db", prune=True)
+    """
+    writer = open_inventory_writer(path)
+    seen: set[str] = set()
+    try:
+        async for inventory in inventories:
+            await asyncio.to_thread(writer.write, inventory)
+            seen.add(inventory.notebook.id)
+        # Only a stream that ran to completion lists every notebook
+        if prune:
+            await asyncio.to_thread(writer.prune, seen)
+    finally:
+        writer.close()
+    return len(seen)
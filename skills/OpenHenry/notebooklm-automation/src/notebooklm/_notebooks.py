@@ -1,11 +1,13 @@
 """Notebook operations API."""
 
+import builtins
 import logging
 from typing import Any
 
 from ._core import ClientCore
+from ._source_rows import notebook_source_rows
 from .rpc import RPCMethod
-from .types import Notebook, NotebookDescription, SuggestedTopic
+from .types import Notebook, NotebookDescription, Source, SuggestedTopic
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +83,30 @@ class NotebooksAPI:
         nb_info = result[0] if result and isinstance(result, list) and len(result) > 0 else []
         return Notebook.from_api_response(nb_info)
 
+    async def get_with_sources(self, notebook_id: str) -> tuple[Notebook, builtins.list[Source]]:
+        """Get notebook details and its sources from a single GET_NOTEBOOK call.
+
+        Equivalent to ``get()`` followed by ``client.sources.list()``, with
+        one request instead of two.
+
+        Args:
+            notebook_id: The notebook ID.
+
+        Returns:
+            Tuple of (Notebook, list of Source objects). The notebook's
+            ``sources_count`` is set from the returned sources.
+        """
+        result = await self.get_raw(notebook_id)
+        nb_info = result[0] if result and isinstance(result, list) and len(result) > 0 else []
+        notebook = Notebook.from_api_response(nb_info)
+        sources = []
+        for row in notebook_source_rows(result) or []:
+            source = Source.from_notebook_row(row)
+            if source is not None:
+                sources.append(source)
+        notebook.sources_count = len(sources)
+        return notebook, sources
+
     async def delete(self, notebook_id: str) -> bool:
         """Delete a notebook.
 
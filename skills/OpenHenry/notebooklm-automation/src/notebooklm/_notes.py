@@ -5,16 +5,76 @@ user-created notes in notebooks. Notes are distinct from artifacts -
 they are user-created content, not AI-generated.
 """
 
+import asyncio
 import builtins
+import json
 import logging
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
+import httpx
+
+from ._callbacks import invoke_callback
 from ._core import ClientCore
+from ._file_utils import unique_filename
+from .exceptions import NotebookLMError, ValidationError
 from .rpc import RPCMethod
-from .types import Note
+from .types import Note, NoteImportResult
 
 logger = logging.getLogger(__name__)
 
+_FRONT_MATTER = "---"
+
+
+def note_to_markdown(note: Note) -> str:
+    """Render a note as Markdown with a front matter header.
+
+    The header values are JSON strings (valid YAML), so titles with quotes
+    or colons survive a round trip through ``parse_note_markdown()``.
+    """
+    header = "\n".join(
+        f"{key}: {json.dumps(value, ensure_ascii=False)}"
+        for key, value in (
+            ("note_id", note.id),
+            ("notebook_id", note.notebook_id),
+            ("title", note.title),
+        )
+    )
+    return f"{_FRONT_MATTER}\n{header}\n{_FRONT_MATTER}\n\n{note.content}"
+
+
+def parse_note_markdown(text: str) -> tuple[dict[str, str], str]:
+    """Split a Markdown note into its front matter fields and content.
+
+    Files without front matter return no fields and the whole text.
+    """
+    lines = text.split("\n")
+    if not lines or lines[0].strip() != _FRONT_MATTER:
+        return {}, text
+    for end in range(1, len(lines)):
+        if lines[end].strip() == _FRONT_MATTER:
+            break
+    else:
+        return {}, text
+
+    fields = {}
+    for line in lines[1:end]:
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        value = value.strip()
+        try:
+            decoded = json.loads(value)
+        except ValueError:
+            decoded = value
+        fields[key.strip()] = decoded if isinstance(decoded, str) else value
+
+    body = lines[end + 1 :]
+    if body and not body[0].strip():
+        body = body[1:]
+    return fields, "\n".join(body)
+
 
 class NotesAPI:
     """Operations on NotebookLM notes.
@@ -40,6 +100,9 @@ class NotesAPI:
             core: The core client infrastructure.
         """
         self._core = core
+        # notebook_id -> in-flight GET_NOTES_AND_MIND_MAPS fetch, shared by
+        # concurrent list(), list_mind_maps() and artifacts.list() calls
+        self._snapshots: dict[str, asyncio.Task[builtins.list[Any]]] = {}
 
     async def list(self, notebook_id: str) -> list[Note]:
         """List all text notes in the notebook.
@@ -55,19 +118,7 @@ class NotesAPI:
             List of Note objects.
         """
         logger.debug("Listing notes in notebook: %s", notebook_id)
-        all_items = await self._get_all_notes_and_mind_maps(notebook_id)
-        notes = []
-
-        for item in all_items:
-            # Skip deleted items (status=2): ['id', None, 2]
-            if self._is_deleted(item):
-                continue
-
-            content = self._extract_content(item)
-            is_mind_map = content and ('"children":' in content or '"nodes":' in content)
-            if not is_mind_map:
-                notes.append(self._parse_note(item, notebook_id))
-
+        notes, _ = self._split(await self._get_all_notes_and_mind_maps(notebook_id), notebook_id)
         return notes
 
     async def get(self, notebook_id: str, note_id: str) -> Note | None:
@@ -104,11 +155,14 @@ class NotesAPI:
         """
         logger.debug("Creating note in notebook %s: %s", notebook_id, title)
         params = [notebook_id, "", [1], None, "New Note"]
-        result = await self._core.rpc_call(
-            RPCMethod.CREATE_NOTE,
-            params,
-            source_path=f"/notebook/{notebook_id}",
-        )
+        try:
+            result = await self._core.rpc_call(
+                RPCMethod.CREATE_NOTE,
+                params,
+                source_path=f"/notebook/{notebook_id}",
+            )
+        finally:
+            self._invalidate(notebook_id)
 
         note_id = None
         if result and isinstance(result, list) and len(result) > 0:
@@ -149,12 +203,15 @@ class NotesAPI:
             note_id,
             [[[content, title, [], 0]]],
         ]
-        await self._core.rpc_call(
-            RPCMethod.UPDATE_NOTE,
-            params,
-            source_path=f"/notebook/{notebook_id}",
-            allow_null=True,
-        )
+        try:
+            await self._core.rpc_call(
+                RPCMethod.UPDATE_NOTE,
+                params,
+                source_path=f"/notebook/{notebook_id}",
+                allow_null=True,
+            )
+        finally:
+            self._invalidate(notebook_id)
 
     async def delete(self, notebook_id: str, note_id: str) -> bool:
         """Delete a note from the notebook.
@@ -171,12 +228,15 @@ class NotesAPI:
         """
         logger.debug("Deleting note %s from notebook %s", note_id, notebook_id)
         params = [notebook_id, None, [note_id]]
-        await self._core.rpc_call(
-            RPCMethod.DELETE_NOTE,
-            params,
-            source_path=f"/notebook/{notebook_id}",
-            allow_null=True,
-        )
+        try:
+            await self._core.rpc_call(
+                RPCMethod.DELETE_NOTE,
+                params,
+                source_path=f"/notebook/{notebook_id}",
+                allow_null=True,
+            )
+        finally:
+            self._invalidate(notebook_id)
         return True
 
     async def list_mind_maps(self, notebook_id: str) -> builtins.list[Any]:
@@ -196,18 +256,9 @@ class NotesAPI:
         Returns:
             List of raw mind map data.
         """
-        all_items = await self._get_all_notes_and_mind_maps(notebook_id)
-        mind_maps = []
-
-        for item in all_items:
-            # Skip deleted items (status=2): ['id', None, 2]
-            if self._is_deleted(item):
-                continue
-
-            content = self._extract_content(item)
-            if content and ('"children":' in content or '"nodes":' in content):
-                mind_maps.append(item)
-
+        _, mind_maps = self._split(
+            await self._get_all_notes_and_mind_maps(notebook_id), notebook_id
+        )
         return mind_maps
 
     async def delete_mind_map(self, notebook_id: str, mind_map_id: str) -> bool:
@@ -221,19 +272,184 @@ class NotesAPI:
             True if deletion succeeded.
         """
         params = [notebook_id, None, [mind_map_id]]
-        await self._core.rpc_call(
-            RPCMethod.DELETE_NOTE,
-            params,
-            source_path=f"/notebook/{notebook_id}",
-            allow_null=True,
-        )
+        try:
+            await self._core.rpc_call(
+                RPCMethod.DELETE_NOTE,
+                params,
+                source_path=f"/notebook/{notebook_id}",
+                allow_null=True,
+            )
+        finally:
+            self._invalidate(notebook_id)
         return True
 
+    async def export_markdown(
+        self,
+        notebook_ids: str | builtins.list[str],
+        output_dir: str | Path,
+        max_concurrency: int = 4,
+    ) -> dict[str, str]:
+        """Export every note of one or more notebooks to Markdown files.
+
+        Each notebook's notes are read from a single notes snapshot and
+        written to ``<output_dir>/<notebook_id>/<title>.md`` with a front
+        matter header carrying the note ID, so the directory can be edited
+        and fed back to import_markdown(). Files whose content is unchanged
+        are not rewritten, and exported files of notes that were deleted or
+        renamed since the last export are removed. Notebooks are fetched
+        concurrently.
+
+        Args:
+            notebook_ids: A notebook ID or a list of them.
+            output_dir: Directory to write into (created if needed).
+            max_concurrency: Maximum notebooks fetched at once (default: 4).
+
+        Returns:
+            Mapping of note ID to the path of each file written this run.
+
+        Raises:
+            ValidationError: If max_concurrency is less than 1.
+
+        Example:
+            written = await client.notes.export_markdown([nb_a, nb_b], "notes/")
+            print(f"Exported {len(written)} changed notes")
+        """
+        if max_concurrency < 1:
+            raise ValidationError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        if isinstance(notebook_ids, str):
+            notebook_ids = [notebook_ids]
+
+        out = Path(output_dir)
+        written: dict[str, str] = {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def export_one(notebook_id: str) -> None:
+            async with semaphore:
+                notes = await self.list(notebook_id)
+            written.update(self._write_notebook_notes(out / notebook_id, notes))
+
+        await asyncio.gather(*(export_one(notebook_id) for notebook_id in notebook_ids))
+        return written
+
+    async def import_markdown(
+        self,
+        notebook_id: str,
+        directory: str | Path,
+        concurrency: int = 4,
+        on_result: Callable[[NoteImportResult], Any] | None = None,
+    ) -> builtins.list[NoteImportResult]:
+        """Create or update notes from a directory of Markdown files.
+
+        The notebook's notes are read once, and each ``*.md`` file is matched
+        to a note by the ``note_id`` in its front matter (as written by
+        export_markdown()), or else by title. Matched notes are updated only
+        if their title or content differ; unmatched files create new notes.
+        Files without front matter use the file name as title. A failing
+        file never aborts the others.
+
+        Args:
+            notebook_id: The notebook ID.
+            directory: Directory containing the Markdown files.
+            concurrency: Maximum notes created or updated at once (default: 4).
+            on_result: Optional callback (sync or async) invoked with each
+                file's NoteImportResult as it finishes.
+
+        Returns:
+            One NoteImportResult per file, in file name order.
+
+        Raises:
+            ValidationError: If concurrency is less than 1.
+
+        Example:
+            results = await client.notes.import_markdown(nb_id, "notes/" + nb_id)
+            changed = [r for r in results if r.is_changed]
+        """
+        if concurrency < 1:
+            raise ValidationError(f"concurrency must be at least 1, got {concurrency}")
+
+        paths = sorted(Path(directory).glob("*.md"))
+        notes = await self.list(notebook_id)
+        by_id = {note.id: note for note in notes}
+        by_title: dict[str, builtins.list[Note]] = {}
+        for note in notes:
+            by_title.setdefault(note.title, []).append(note)
+        claimed: set[str] = set()
+
+        # Match every file first so two files never claim the same note
+        planned: builtins.list[tuple[Path, str, str, Note | None] | NoteImportResult] = []
+        for path in paths:
+            try:
+                fields, content = parse_note_markdown(path.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError) as e:
+                planned.append(NoteImportResult(str(path), "failed", error=str(e)))
+                continue
+            title = fields.get("title", path.stem)
+            note = None
+            if fields.get("notebook_id", notebook_id) == notebook_id:
+                note = by_id.get(fields.get("note_id", ""))
+            if note is None or note.id in claimed:
+                note = next((n for n in by_title.get(title, []) if n.id not in claimed), None)
+            if note is not None:
+                claimed.add(note.id)
+            planned.append((path, title, content, note))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def import_one(
+            plan: tuple[Path, str, str, Note | None] | NoteImportResult,
+        ) -> NoteImportResult:
+            if isinstance(plan, NoteImportResult):
+                result = plan
+            else:
+                path, title, content, note = plan
+                try:
+                    if note is None:
+                        async with semaphore:
+                            created = await self.create(notebook_id, title, content)
+                        result = NoteImportResult(str(path), "created", note=created)
+                    elif note.title == title and note.content == content:
+                        result = NoteImportResult(str(path), "unchanged", note=note)
+                    else:
+                        async with semaphore:
+                            await self.update(notebook_id, note.id, content, title)
+                        note.title, note.content = title, content
+                        result = NoteImportResult(str(path), "updated", note=note)
+                except (NotebookLMError, httpx.HTTPError) as e:
+                    logger.warning("Importing note %s failed: %s", path, e)
+                    result = NoteImportResult(str(path), "failed", note=note, error=str(e))
+            await invoke_callback(on_result, result)
+            return result
+
+        return list(await asyncio.gather(*(import_one(plan) for plan in planned)))
+
     # =========================================================================
     # Private Helpers
     # =========================================================================
 
     async def _get_all_notes_and_mind_maps(self, notebook_id: str) -> builtins.list[Any]:
+        """Fetch all notes and mind maps, sharing one request between concurrent callers."""
+        task = self._snapshots.get(notebook_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_notes_and_mind_maps(notebook_id))
+            self._snapshots[notebook_id] = task
+
+            def _done(finished: asyncio.Task[builtins.list[Any]]) -> None:
+                if self._snapshots.get(notebook_id) is finished:
+                    del self._snapshots[notebook_id]
+
+            task.add_done_callback(_done)
+        # Shield so one cancelled caller does not cancel the others' fetch
+        return await asyncio.shield(task)
+
+    def _invalidate(self, notebook_id: str) -> None:
+        """Stop sharing an in-flight fetch that may predate a write.
+
+        Called after every note mutation (also when it fails, since the
+        write may still have landed), so later reads start a fresh fetch.
+        """
+        self._snapshots.pop(notebook_id, None)
+
+    async def _fetch_notes_and_mind_maps(self, notebook_id: str) -> builtins.list[Any]:
         """Fetch all notes and mind maps from the API."""
         params = [notebook_id]
         result = await self._core.rpc_call(
@@ -251,6 +467,28 @@ class NotesAPI:
             return valid_notes
         return []
 
+    def _split(
+        self, items: builtins.list[Any], notebook_id: str
+    ) -> tuple[builtins.list[Note], builtins.list[Any]]:
+        """Split one snapshot into parsed notes and raw mind maps.
+
+        Deleted items (status=2) are skipped. Mind maps are stored in the
+        same structure as notes but contain JSON with 'children'/'nodes'.
+        """
+        notes = []
+        mind_maps = []
+        for item in items:
+            # Skip deleted items (status=2): ['id', None, 2]
+            if self._is_deleted(item):
+                continue
+
+            content = self._extract_content(item)
+            if content and ('"children":' in content or '"nodes":' in content):
+                mind_maps.append(item)
+            else:
+                notes.append(self._parse_note(item, notebook_id))
+        return notes, mind_maps
+
     def _is_deleted(self, item: builtins.list[Any]) -> bool:
         """Check if a note/mind map item is deleted (status=2).
 
@@ -303,3 +541,37 @@ class NotesAPI:
             title=title,
             content=content,
         )
+
+    @staticmethod
+    def _write_notebook_notes(out: Path, notes: builtins.list[Note]) -> dict[str, str]:
+        """Write one notebook's notes into ``out``, returning the files written."""
+        out.mkdir(parents=True, exist_ok=True)
+        # Files from an earlier export, by the note ID in their front matter
+        previous: dict[str, Path] = {}
+        for path in out.glob("*.md"):
+            try:
+                fields, _ = parse_note_markdown(path.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError):
+                continue
+            if fields.get("note_id"):
+                previous[fields["note_id"]] = path
+
+        used_names: set[str] = set()
+        kept: set[Path] = set()
+        written: dict[str, str] = {}
+        for note in notes:
+            path = out / unique_filename(note.title or "Untitled", ".md", used_names)
+            text = note_to_markdown(note)
+            kept.add(path)
+            try:
+                if path.read_text(encoding="utf-8") == text:
+                    continue
+            except (OSError, UnicodeDecodeError):
+                pass
+            path.write_text(text, encoding="utf-8")
+            written[note.id] = str(path)
+
+        for path in previous.values():
+            if path not in kept:
+                path.unlink(missing_ok=True)
+        return written
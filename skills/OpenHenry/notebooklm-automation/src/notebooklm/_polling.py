@@ -0,0 +1,121 @@
+"""Adaptive polling for artifact generation.
+
+Generation time varies by artifact type: quizzes and reports finish in
+seconds while audio and video take minutes. ``GenerationStats`` records how
+long each ``ArtifactTypeCode`` took to complete and ``schedule_poll`` uses
+the typical duration to poll sparsely early on and densely around the
+expected finish time.
+"""
+
+import json
+import logging
+import os
+import statistics
+import tempfile
+from pathlib import Path
+
+from .paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Samples kept per artifact type (most recent first out)
+DEFAULT_MAX_SAMPLES = 20
+
+# Samples required before the typical duration is trusted
+_MIN_SAMPLES = 3
+
+# Longest single sleep while far from the expected finish time
+_MAX_ADAPTIVE_INTERVAL = 60.0
+
+
+class GenerationStats:
+    """Recorded generation durations per artifact type, persisted as JSON.
+
+    Usage:
+        stats = GenerationStats()  # ~/.notebooklm/cache/generation_stats.json
+        async with NotebookLMClient(auth, generation_stats=stats) as client:
+            await client.artifacts.wait_for_completion(nb_id, task_id)
+    """
+
+    def __init__(self, path: str | Path | None = None, max_samples: int = DEFAULT_MAX_SAMPLES):
+        """Initialize the stats store.
+
+        Args:
+            path: JSON file to persist samples in. Defaults to
+                ``get_cache_dir() / "generation_stats.json"``.
+            max_samples: Number of most recent samples kept per type.
+        """
+        self.path = Path(path) if path else get_cache_dir() / "generation_stats.json"
+        self.max_samples = max_samples
+        self._samples: dict[str, list[float]] | None = None
+
+    def expected_duration(self, artifact_type: int) -> float | None:
+        """Median recorded duration in seconds, or None with too few samples."""
+        samples = self._load().get(str(artifact_type), [])
+        if len(samples) < _MIN_SAMPLES:
+            return None
+        return statistics.median(samples)
+
+    def record(self, artifact_type: int, duration: float) -> None:
+        """Record one completed generation and persist the stats.
+
+        Write failures are logged and ignored; the stats are best-effort.
+        """
+        if duration <= 0:
+            return
+        samples = self._load().setdefault(str(artifact_type), [])
+        samples.append(round(duration, 1))
+        del samples[: -self.max_samples]
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._samples, f)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug("Failed to save generation stats: %s", e)
+
+    def _load(self) -> dict[str, list[float]]:
+        if self._samples is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            self._samples = (
+                {
+                    key: [float(v) for v in values if isinstance(v, (int, float))]
+                    for key, values in data.items()
+                    if isinstance(values, list)
+                }
+                if isinstance(data, dict)
+                else {}
+            )
+        return self._samples
+
+
+def schedule_poll(
+    expected: float, age: float, initial_interval: float, max_interval: float
+) -> float:
+    """Seconds to sleep before the next poll of a task.
+
+    Before the expected finish time the sleep is half the remaining time, so
+    polls converge geometrically on it. Past it, the interval grows with the
+    overrun. Every sleep is bounded by ``initial_interval`` and
+    ``max_interval`` (and never exceeds 60 seconds before the expected time).
+
+    Args:
+        expected: Typical generation duration for the artifact type.
+        age: Seconds since the artifact was created.
+        initial_interval: Shortest interval to use.
+        max_interval: Longest interval to use.
+    """
+    remaining = expected - age
+    if remaining > initial_interval:
+        return min(max(remaining / 2, initial_interval), _MAX_ADAPTIVE_INTERVAL, max_interval)
+    overrun = max(-remaining, 0.0)
+    return min(max(overrun / 4, initial_interval), max_interval)
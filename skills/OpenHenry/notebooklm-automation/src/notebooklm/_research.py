@@ -4,16 +4,39 @@ Provides operations for starting research sessions, polling for results,
 and importing discovered sources into notebooks.
 """
 
+import asyncio
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
+from ._callbacks import invoke_callback
 from ._core import ClientCore
-from .exceptions import ValidationError
+from ._source_rows import notebook_source_rows, source_columns
+from ._url_utils import normalize_source_url
+from .exceptions import NotebookLMError, ValidationError
 from .rpc import RPCMethod
+from .types import ResearchTaskResult
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _TaskSources:
+    """Sources parsed so far for one research task.
+
+    POLL_RESEARCH returns a task's whole source list on every poll, and the
+    list only grows while the task runs, so only the raw rows past
+    ``raw_count`` are parsed on the next poll. ``unreported`` holds the
+    sources poll_all() has not returned yet.
+    """
+
+    raw_count: int = 0
+    last_raw: Any = None
+    sources: list[dict[str, str]] = field(default_factory=list)
+    unreported: list[dict[str, str]] = field(default_factory=list)
+
+
 class ResearchAPI:
     """Operations for research sessions (web/drive search).
 
@@ -41,6 +64,8 @@ class ResearchAPI:
             core: The core client infrastructure.
         """
         self._core = core
+        # notebook_id -> task_id -> sources parsed so far
+        self._task_sources: dict[str, dict[str, _TaskSources]] = {}
 
     async def start(
         self,
@@ -69,15 +94,7 @@ class ResearchAPI:
             notebook_id,
             query[:50] if query else "",
         )
-        source_lower = source.lower()
-        mode_lower = mode.lower()
-
-        if source_lower not in ("web", "drive"):
-            raise ValidationError(f"Invalid source '{source}'. Use 'web' or 'drive'.")
-        if mode_lower not in ("fast", "deep"):
-            raise ValidationError(f"Invalid mode '{mode}'. Use 'fast' or 'deep'.")
-        if mode_lower == "deep" and source_lower == "drive":
-            raise ValidationError("Deep Research only supports Web sources.")
+        source_lower, mode_lower = self._validate_mode(source, mode)
 
         # 1 = Web, 2 = Drive
         source_type = 1 if source_lower == "web" else 2
@@ -117,6 +134,46 @@ class ResearchAPI:
             Dictionary with status, query, sources, and summary.
         """
         logger.debug("Polling research status for notebook %s", notebook_id)
+        tasks = await self._poll_tasks(notebook_id)
+        return tasks[0] if tasks else {"status": "no_research"}
+
+    async def poll_all(self, notebook_id: str) -> list[dict[str, Any]]:
+        """Poll every research task of a notebook, reporting new sources.
+
+        Unlike poll(), this returns all tasks (most recent first), which
+        matters when several research sessions run in one notebook. Each
+        task dict has the keys returned by poll() plus ``new_sources``: the
+        sources discovered since the previous poll_all() call for that task
+        (on the first call, all of them). Sources are parsed incrementally,
+        so a long list is not re-processed on every poll.
+
+        Args:
+            notebook_id: The notebook ID.
+
+        Returns:
+            List of dictionaries with task_id, status, query, sources,
+            new_sources, and summary. Empty if no research exists.
+
+        Example:
+            while True:
+                tasks = await client.research.poll_all(nb_id)
+                for task in tasks:
+                    for src in task["new_sources"]:
+                        print(task["query"], src["url"])
+                if all(task["status"] == "completed" for task in tasks):
+                    break
+                await asyncio.sleep(5)
+        """
+        tasks = await self._poll_tasks(notebook_id)
+        tracked = self._task_sources.get(notebook_id, {})
+        for task in tasks:
+            state = tracked[task["task_id"]]
+            task["new_sources"] = state.unreported
+            state.unreported = []
+        return tasks
+
+    async def _poll_tasks(self, notebook_id: str) -> list[dict[str, Any]]:
+        """Fetch and parse every research task of a notebook, most recent first."""
         params = [None, None, notebook_id]
         result = await self._core.rpc_call(
             RPCMethod.POLL_RESEARCH,
@@ -124,73 +181,129 @@ class ResearchAPI:
             source_path=f"/notebook/{notebook_id}",
         )
 
-        if not result or not isinstance(result, list) or len(result) == 0:
-            return {"status": "no_research"}
+        previous = self._task_sources.get(notebook_id, {})
+        tracked: dict[str, _TaskSources] = {}
+        tasks: list[dict[str, Any]] = []
 
-        # Unwrap if needed
-        if isinstance(result[0], list) and len(result[0]) > 0 and isinstance(result[0][0], list):
-            result = result[0]
-
-        # Find most recent task
-        for task_data in result:
-            if not isinstance(task_data, list) or len(task_data) < 2:
-                continue
-
-            task_id = task_data[0]
-            task_info = task_data[1]
-
-            if not isinstance(task_id, str) or not isinstance(task_info, list):
-                continue
-
-            query_info = task_info[1] if len(task_info) > 1 else None
-            sources_and_summary = task_info[3] if len(task_info) > 3 else []
-            status_code = task_info[4] if len(task_info) > 4 else None
-
-            query_text = query_info[0] if query_info else ""
-            sources_data = []
-            summary = ""
-
-            if isinstance(sources_and_summary, list) and len(sources_and_summary) >= 1:
-                sources_data = (
-                    sources_and_summary[0] if isinstance(sources_and_summary[0], list) else []
-                )
-                if len(sources_and_summary) >= 2 and isinstance(sources_and_summary[1], str):
-                    summary = sources_and_summary[1]
-
-            parsed_sources = []
-            for src in sources_data:
-                if not isinstance(src, list) or len(src) < 2:
-                    continue
-
-                title = ""
-                url = ""
-
-                # Fast research: [url, title, desc, type, ...]
-                # Deep research: [None, title, None, type, ..., [report]]
-                if src[0] is None and len(src) > 1 and isinstance(src[1], str):
-                    title = src[1]
-                    url = ""
-                elif isinstance(src[0], str) or len(src) >= 3:
-                    url = src[0] if isinstance(src[0], str) else ""
-                    title = src[1] if len(src) > 1 and isinstance(src[1], str) else ""
+        if result and isinstance(result, list):
+            # Unwrap if needed
+            if (
+                isinstance(result[0], list)
+                and len(result[0]) > 0
+                and isinstance(result[0][0], list)
+            ):
+                result = result[0]
 
-                if title or url:
-                    parsed_sources.append({"url": url, "title": title})
+            for task_data in result:
+                task = self._parse_task(task_data, previous, tracked)
+                if task is not None:
+                    tasks.append(task)
 
-            # NOTE: Research status codes differ from artifact status codes
-            # Research: 1=in_progress, 2=completed
-            # Artifacts: 1=in_progress, 2=pending, 3=completed
-            status = "completed" if status_code == 2 else "in_progress"
+        # Tasks missing from the response are gone; drop their state
+        if tracked:
+            self._task_sources[notebook_id] = tracked
+        else:
+            self._task_sources.pop(notebook_id, None)
+        return tasks
 
-            return {
-                "task_id": task_id,
-                "status": status,
-                "query": query_text,
-                "sources": parsed_sources,
-                "summary": summary,
-            }
+    def _parse_task(
+        self,
+        task_data: Any,
+        previous: dict[str, _TaskSources],
+        tracked: dict[str, _TaskSources],
+    ) -> dict[str, Any] | None:
+        """Parse one task entry of a POLL_RESEARCH response.
 
-        return {"status": "no_research"}
+        Reuses the task's state from ``previous`` and records it in
+        ``tracked``.
+        """
+        if not isinstance(task_data, list) or len(task_data) < 2:
+            return None
+
+        task_id = task_data[0]
+        task_info = task_data[1]
+
+        if not isinstance(task_id, str) or not isinstance(task_info, list):
+            return None
+
+        query_info = task_info[1] if len(task_info) > 1 else None
+        sources_and_summary = task_info[3] if len(task_info) > 3 else []
+        status_code = task_info[4] if len(task_info) > 4 else None
+
+        query_text = query_info[0] if query_info else ""
+        sources_data = []
+        summary = ""
+
+        if isinstance(sources_and_summary, list) and len(sources_and_summary) >= 1:
+            sources_data = (
+                sources_and_summary[0] if isinstance(sources_and_summary[0], list) else []
+            )
+            if len(sources_and_summary) >= 2 and isinstance(sources_and_summary[1], str):
+                summary = sources_and_summary[1]
+
+        state = previous.get(task_id) or _TaskSources()
+        if state.raw_count and (
+            len(sources_data) < state.raw_count
+            or sources_data[state.raw_count - 1] != state.last_raw
+        ):
+            # The list was rewritten rather than extended: parse it again and
+            # keep as unreported only what poll_all() has not returned yet
+            pending = {self._source_key(src) for src in state.unreported}
+            reported = {self._source_key(src) for src in state.sources} - pending
+            state = _TaskSources()
+            parsed_sources = (self._parse_source(src) for src in sources_data)
+            state.sources = [src for src in parsed_sources if src is not None]
+            state.unreported = [
+                src for src in state.sources if self._source_key(src) not in reported
+            ]
+        else:
+            for src in sources_data[state.raw_count :]:
+                parsed = self._parse_source(src)
+                if parsed is not None:
+                    state.sources.append(parsed)
+                    state.unreported.append(parsed)
+        state.raw_count = len(sources_data)
+        state.last_raw = sources_data[-1] if sources_data else None
+        tracked[task_id] = state
+
+        # NOTE: Research status codes differ from artifact status codes
+        # Research: 1=in_progress, 2=completed
+        # Artifacts: 1=in_progress, 2=pending, 3=completed
+        status = "completed" if status_code == 2 else "in_progress"
+
+        return {
+            "task_id": task_id,
+            "status": status,
+            "query": query_text,
+            "sources": list(state.sources),
+            "summary": summary,
+        }
+
+    @staticmethod
+    def _source_key(src: dict[str, str]) -> tuple[str, str]:
+        return src["url"], src["title"]
+
+    @staticmethod
+    def _parse_source(src: Any) -> dict[str, str] | None:
+        """Parse one discovered source row into a dict with 'url' and 'title'."""
+        if not isinstance(src, list) or len(src) < 2:
+            return None
+
+        title = ""
+        url = ""
+
+        # Fast research: [url, title, desc, type, ...]
+        # Deep research: [None, title, None, type, ..., [report]]
+        if src[0] is None and len(src) > 1 and isinstance(src[1], str):
+            title = src[1]
+            url = ""
+        elif isinstance(src[0], str) or len(src) >= 3:
+            url = src[0] if isinstance(src[0], str) else ""
+            title = src[1] if len(src) > 1 and isinstance(src[1], str) else ""
+
+        if title or url:
+            return {"url": url, "title": title}
+        return None
 
     async def import_sources(
         self,
@@ -251,6 +364,7 @@ class ResearchAPI:
             params,
             source_path=f"/notebook/{notebook_id}",
         )
+        self._core.invalidate_source_ids(notebook_id)
 
         imported = []
         if result and isinstance(result, list):
@@ -271,3 +385,214 @@ class ResearchAPI:
                         imported.append({"id": src_id, "title": src_data[1]})
 
         return imported
+
+    async def run_many(
+        self,
+        jobs: list[tuple[str, str] | dict[str, str]],
+        source: str = "web",
+        mode: str = "fast",
+        import_sources: bool = True,
+        skip_existing: bool = True,
+        initial_interval: float = 2.0,
+        max_interval: float = 30.0,
+        timeout: float = 600.0,
+        on_result: Callable[[ResearchTaskResult], Any] | None = None,
+    ) -> list[ResearchTaskResult]:
+        """Run many research queries across notebooks and import their sources.
+
+        All queries are started at once and every task is tracked by its
+        task ID. Each notebook is polled once per tick for all of its tasks,
+        with exponential backoff from ``initial_interval`` to
+        ``max_interval`` that resets whenever a task completes. When all of
+        a notebook's tasks are done, the union of their sources is imported,
+        deduplicated by normalized URL: each URL is imported once, from the
+        first query that found it, and (with ``skip_existing``) URLs already
+        in the notebook are skipped. A failing query never aborts the others.
+
+        Args:
+            jobs: ``(notebook_id, query)`` tuples, or dicts with
+                ``notebook_id`` and ``query`` and optional ``source``/``mode``
+                overriding the defaults below.
+            source: "web" or "drive".
+            mode: "fast" or "deep" (deep only available for web).
+            import_sources: Import the discovered sources when done.
+            skip_existing: Do not import URLs already in the notebook.
+            initial_interval: Initial seconds between polls of a notebook.
+            max_interval: Maximum seconds between polls of a notebook.
+            timeout: Maximum seconds to wait for all tasks.
+            on_result: Optional callback (sync or async) invoked with each
+                task's ResearchTaskResult once it is final (after import).
+
+        Returns:
+            One ResearchTaskResult per job, in input order.
+
+        Raises:
+            ValidationError: If a job is malformed or has an invalid
+                source/mode combination (checked before anything starts).
+
+        Example:
+            results = await client.research.run_many(
+                [(nb_id, "solid-state batteries"), (nb_id, "sodium-ion batteries")],
+                mode="deep",
+            )
+            imported = sum(len(r.imported) for r in results)
+        """
+        specs = [self._job_spec(job, source, mode) for job in jobs]
+        results: list[ResearchTaskResult | None] = [None] * len(specs)
+
+        async def report(index: int, result: ResearchTaskResult) -> None:
+            results[index] = result
+            await invoke_callback(on_result, result)
+
+        async def start_one(index: int) -> None:
+            notebook_id, query, job_source, job_mode = specs[index]
+            try:
+                task = await self.start(notebook_id, query, job_source, job_mode)
+                error = None if task else "Research failed to start"
+            except NotebookLMError as e:
+                task, error = None, str(e)
+            if task is None:
+                logger.warning("Research %r in notebook %s failed: %s", query, notebook_id, error)
+                await report(
+                    index,
+                    ResearchTaskResult(notebook_id, query, job_mode, "failed", error=error),
+                )
+                return
+            results[index] = ResearchTaskResult(
+                notebook_id, query, job_mode, "in_progress", task_id=task["task_id"]
+            )
+
+        await asyncio.gather(*(start_one(index) for index in range(len(specs))))
+
+        by_notebook: dict[str, list[int]] = {}
+        for index, result in enumerate(results):
+            if result is not None and result.status == "in_progress":
+                by_notebook.setdefault(result.notebook_id, []).append(index)
+
+        async def finish_notebook(notebook_id: str, indices: list[int]) -> None:
+            tracked = [r for r in (results[i] for i in indices) if r is not None]
+            await self._wait_for_tasks(
+                notebook_id, tracked, initial_interval, max_interval, timeout
+            )
+            if import_sources:
+                await self._import_union(notebook_id, tracked, skip_existing)
+            for index in indices:
+                result = results[index]
+                if result is not None:
+                    await report(index, result)
+
+        await asyncio.gather(
+            *(finish_notebook(notebook_id, indices) for notebook_id, indices in by_notebook.items())
+        )
+        return [result for result in results if result is not None]
+
+    @staticmethod
+    def _validate_mode(source: str, mode: str) -> tuple[str, str]:
+        """Check a source/mode combination, returning both lowercased."""
+        source_lower = source.lower()
+        mode_lower = mode.lower()
+
+        if source_lower not in ("web", "drive"):
+            raise ValidationError(f"Invalid source '{source}'. Use 'web' or 'drive'.")
+        if mode_lower not in ("fast", "deep"):
+            raise ValidationError(f"Invalid mode '{mode}'. Use 'fast' or 'deep'.")
+        if mode_lower == "deep" and source_lower == "drive":
+            raise ValidationError("Deep Research only supports Web sources.")
+        return source_lower, mode_lower
+
+    def _job_spec(
+        self, job: tuple[str, str] | dict[str, str], source: str, mode: str
+    ) -> tuple[str, str, str, str]:
+        """Normalize a run_many() job to (notebook_id, query, source, mode)."""
+        if isinstance(job, dict):
+            if not job.get("notebook_id") or not job.get("query"):
+                raise ValidationError(f"Research job needs 'notebook_id' and 'query': {job!r}")
+            notebook_id, query = job["notebook_id"], job["query"]
+            source, mode = job.get("source", source), job.get("mode", mode)
+        elif isinstance(job, tuple) and len(job) == 2:
+            notebook_id, query = job
+        else:
+            raise ValidationError(f"Unsupported research job: {job!r}")
+        return (notebook_id, query, *self._validate_mode(source, mode))
+
+    async def _wait_for_tasks(
+        self,
+        notebook_id: str,
+        tracked: list[ResearchTaskResult],
+        initial_interval: float,
+        max_interval: float,
+        timeout: float,
+    ) -> None:
+        """Poll a notebook until all tracked tasks complete or time out."""
+        pending = {result.task_id: result for result in tracked}
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        interval = initial_interval
+
+        while True:
+            completed = False
+            try:
+                tasks = await self._poll_tasks(notebook_id)
+            except NotebookLMError as e:
+                logger.warning("Research poll failed for notebook %s: %s", notebook_id, e)
+                tasks = []
+            for task in tasks:
+                result = pending.get(task["task_id"])
+                if result is not None and task["status"] == "completed":
+                    result.status = "completed"
+                    result.sources = task["sources"]
+                    del pending[task["task_id"]]
+                    completed = True
+            if not pending:
+                return
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                for result in pending.values():
+                    result.status = "timeout"
+                    result.error = f"Research did not complete within {timeout}s"
+                return
+
+            # Back off while nothing finishes; poll promptly again after progress
+            interval = initial_interval if completed else min(interval * 2, max_interval)
+            await asyncio.sleep(min(interval, remaining))
+
+    async def _import_union(
+        self, notebook_id: str, tracked: list[ResearchTaskResult], skip_existing: bool
+    ) -> None:
+        """Import each discovered URL once, from the first task that found it."""
+        seen: set[str] = set()
+        if skip_existing:
+            seen.update(normalize_source_url(url) for url in await self._notebook_urls(notebook_id))
+
+        for result in tracked:
+            if not result.is_completed or result.task_id is None:
+                continue
+            selected = []
+            for src in result.sources:
+                url = src.get("url")
+                if not url:
+                    continue
+                key = normalize_source_url(url)
+                if key not in seen:
+                    seen.add(key)
+                    selected.append(src)
+            if not selected:
+                continue
+            try:
+                result.imported = await self.import_sources(notebook_id, result.task_id, selected)
+            except NotebookLMError as e:
+                logger.warning("Importing research %s failed: %s", result.task_id, e)
+                result.error = f"Import failed: {e}"
+
+    async def _notebook_urls(self, notebook_id: str) -> list[str]:
+        """URLs of the sources already in a notebook."""
+        notebook = await self._core.rpc_call(
+            RPCMethod.GET_NOTEBOOK,
+            [notebook_id, None, [2], None, 0],
+            source_path=f"/notebook/{notebook_id}",
+        )
+        rows = notebook_source_rows(notebook)
+        if rows is None:
+            return []
+        return [url for url in source_columns(rows).urls if url]
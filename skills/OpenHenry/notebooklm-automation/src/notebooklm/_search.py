@@ -0,0 +1,224 @@
+"""Local full-text search index over notebook sources.
+
+Finding which sources mention a term otherwise means downloading every
+source's fulltext. ``SourceIndex`` keeps the fulltexts in an SQLite FTS5
+table so ``SourcesAPI.search()`` only fetches sources that are new,
+renamed, or invalidated (by a refresh) since the last search.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from .exceptions import ValidationError
+from .paths import get_cache_dir
+from .types import SourceSearchHit
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexed_sources (
+    notebook_id TEXT NOT NULL,
+    source_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT,
+    char_count INTEGER NOT NULL,
+    indexed_at REAL NOT NULL,
+    content_sha256 TEXT,
+    PRIMARY KEY (notebook_id, source_id)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS source_text USING fts5(
+    notebook_id UNINDEXED,
+    source_id UNINDEXED,
+    title,
+    content,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+# Tokens of context on each side of a match in search snippets
+_SNIPPET_TOKENS = 16
+
+
+class SourceIndex:
+    """SQLite FTS5 index of source fulltexts, keyed by notebook.
+
+    Each indexed source records the SHA-256 of its text. ``invalidate()``
+    clears it (``SourcesAPI.refresh()`` does so), which marks the source
+    for re-fetching. Methods are safe to call from worker threads.
+
+    Usage:
+        index = SourceIndex()  # ~/.notebooklm/cache/source_index.db
+        async with NotebookLMClient(auth, source_index=index) as client:
+            hits = await client.sources.search(nb_id, "transformer")
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """Initialize the index.
+
+        Args:
+            path: SQLite database file, or ``":memory:"`` for a per-process
+                index. Defaults to ``get_cache_dir() / "source_index.db"``.
+        """
+        if path == ":memory:":
+            self.path: Path | None = None
+        else:
+            self.path = Path(path) if path else get_cache_dir() / "source_index.db"
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def indexed(self, notebook_id: str) -> dict[str, str]:
+        """Return ``{source_id: title}`` for sources indexed in a notebook."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT source_id, title FROM indexed_sources WHERE notebook_id = ?",
+                (notebook_id,),
+            )
+            return dict(rows.fetchall())
+
+    def invalidated(self, notebook_id: str) -> set[str]:
+        """Return IDs of indexed sources whose text must be fetched again."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT source_id FROM indexed_sources "
+                "WHERE notebook_id = ? AND content_sha256 IS NULL",
+                (notebook_id,),
+            )
+            return {source_id for (source_id,) in rows.fetchall()}
+
+    def invalidate(self, notebook_id: str, source_ids: Iterable[str]) -> None:
+        """Mark indexed sources as changed, so their text is fetched again.
+
+        Their current text stays searchable until it is replaced.
+        """
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "UPDATE indexed_sources SET content_sha256 = NULL "
+                    "WHERE notebook_id = ? AND source_id = ?",
+                    [(notebook_id, source_id) for source_id in source_ids],
+                )
+
+    def upsert(
+        self,
+        notebook_id: str,
+        source_id: str,
+        title: str,
+        content: str,
+        url: str | None = None,
+    ) -> None:
+        """Add or replace one source's text in the index."""
+        sha256 = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM source_text WHERE notebook_id = ? AND source_id = ?",
+                    (notebook_id, source_id),
+                )
+                conn.execute(
+                    "INSERT INTO source_text (notebook_id, source_id, title, content) "
+                    "VALUES (?, ?, ?, ?)",
+                    (notebook_id, source_id, title, content),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO indexed_sources "
+                    "(notebook_id, source_id, title, url, char_count, indexed_at, content_sha256) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (notebook_id, source_id, title, url, len(content), time.time(), sha256),
+                )
+
+    def remove(self, notebook_id: str, source_ids: Iterable[str]) -> None:
+        """Drop sources from the index."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                for source_id in source_ids:
+                    conn.execute(
+                        "DELETE FROM source_text WHERE notebook_id = ? AND source_id = ?",
+                        (notebook_id, source_id),
+                    )
+                    conn.execute(
+                        "DELETE FROM indexed_sources WHERE notebook_id = ? AND source_id = ?",
+                        (notebook_id, source_id),
+                    )
+
+    def clear(self, notebook_id: str | None = None) -> None:
+        """Drop one notebook's sources, or everything if notebook_id is None."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if notebook_id is None:
+                    conn.execute("DELETE FROM source_text")
+                    conn.execute("DELETE FROM indexed_sources")
+                else:
+                    conn.execute("DELETE FROM source_text WHERE notebook_id = ?", (notebook_id,))
+                    conn.execute(
+                        "DELETE FROM indexed_sources WHERE notebook_id = ?", (notebook_id,)
+                    )
+
+    def search(self, notebook_id: str, query: str, limit: int = 20) -> list[SourceSearchHit]:
+        """Search indexed sources of a notebook, best matches first.
+
+        Args:
+            notebook_id: The notebook ID.
+            query: FTS5 query, e.g. ``transformer``, ``"neural network"``,
+                ``attention AND NOT rnn``, or ``optim*``.
+            limit: Maximum number of hits.
+
+        Raises:
+            ValidationError: If the query is not valid FTS5 syntax.
+        """
+        try:
+            with self._lock:
+                rows = (
+                    self._connect()
+                    .execute(
+                        "SELECT source_id, title, "
+                        "snippet(source_text, 3, '**', '**', ' … ', ?), bm25(source_text) "
+                        "FROM source_text WHERE source_text MATCH ? AND notebook_id = ? "
+                        "ORDER BY bm25(source_text) LIMIT ?",
+                        (_SNIPPET_TOKENS, query, notebook_id, limit),
+                    )
+                    .fetchall()
+                )
+            return [
+                SourceSearchHit(source_id=source_id, title=title, snippet=snippet, score=-rank)
+                for source_id, title, snippet, rank in rows
+            ]
+        except sqlite3.OperationalError as e:
+            raise ValidationError(f"Invalid search query {query!r}: {e}") from e
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection, opening it on first use. Call with the lock held."""
+        if self._conn is None:
+            if self.path is None:
+                conn = sqlite3.connect(":memory:", check_same_thread=False)
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(indexed_sources)")}
+            if "content_sha256" not in columns:
+                # Indexes written before content hashes: re-fetch everything once
+                conn.execute("ALTER TABLE indexed_sources ADD COLUMN content_sha256 TEXT")
+                conn.commit()
+            self._conn = conn
+        return self._conn
+
+
+def fts_phrase(text: str) -> str:
+    """Quote text as a single FTS5 phrase so it is matched literally."""
+    return '"' + text.replace('"', '""') + '"'
@@ -1,11 +1,19 @@
 """Sharing operations API."""
 
+import asyncio
+import builtins
 import logging
+from collections.abc import Callable
+from typing import Any
 
+import httpx
+
+from ._callbacks import invoke_callback
 from ._core import ClientCore
+from .exceptions import NotebookLMError, ValidationError
 from .rpc import RPCMethod
 from .rpc.types import ShareAccess, SharePermission, ShareViewLevel
-from .types import ShareStatus
+from .types import ShareChangeResult, ShareStatus
 
 logger = logging.getLogger(__name__)
 
@@ -80,19 +88,7 @@ class SharingAPI:
             include concurrent changes from other clients.
         """
         logger.debug("Setting notebook %s public=%s", notebook_id, public)
-        access = ShareAccess.ANYONE_WITH_LINK if public else ShareAccess.RESTRICTED
-        params = [
-            [[notebook_id, None, [access.value], [access.value, ""]]],
-            1,
-            None,
-            [2],
-        ]
-        await self._core.rpc_call(
-            RPCMethod.SHARE_NOTEBOOK,
-            params,
-            source_path=f"/notebook/{notebook_id}",
-            allow_null=True,
-        )
+        await self._set_access(notebook_id, public)
         return await self.get_status(notebook_id)
 
     async def set_view_level(
@@ -173,26 +169,11 @@ class SharingAPI:
         )
 
         message_flag = 0 if welcome_message else 1
-        notify_flag = 1 if notify else 0
-
-        params = [
-            [
-                [
-                    notebook_id,
-                    [[email, None, permission.value]],
-                    None,
-                    [message_flag, welcome_message],
-                ]
-            ],
-            notify_flag,
-            None,
-            [2],
-        ]
-        await self._core.rpc_call(
-            RPCMethod.SHARE_NOTEBOOK,
-            params,
-            source_path=f"/notebook/{notebook_id}",
-            allow_null=True,
+        await self._share_users(
+            notebook_id,
+            [(email, permission)],
+            1 if notify else 0,
+            [message_flag, welcome_message],
         )
         return await self.get_status(notebook_id)
 
@@ -236,9 +217,187 @@ class SharingAPI:
             Updated ShareStatus.
         """
         logger.debug("Removing user %s from notebook %s", email, notebook_id)
+        await self._share_users(notebook_id, [(email, SharePermission._REMOVE)], 0, [0, ""])
+        return await self.get_status(notebook_id)
+
+    async def apply_many(
+        self,
+        notebook_ids: builtins.list[str],
+        users: dict[str, SharePermission | None] | None = None,
+        public: bool | None = None,
+        notify: bool = False,
+        welcome_message: str = "",
+        concurrency: int = 5,
+        dry_run: bool = False,
+        on_result: Callable[[ShareChangeResult], Any] | None = None,
+    ) -> builtins.list[ShareChangeResult]:
+        """Apply one sharing spec to many notebooks with minimal changes.
+
+        The current status of every notebook is read concurrently and
+        compared with the spec; only the differences are sent. Users are
+        granted, changed or removed with at most two SHARE_NOTEBOOK calls
+        per notebook (one for new users, which may be notified, one for
+        permission changes and removals), plus one call if the public link
+        setting differs. Notebook owners are never changed. A failing
+        notebook never aborts the others; if it fails part-way, its result
+        keeps the planned changes and lists the ones sent in ``applied``.
+
+        Args:
+            notebook_ids: Notebooks to apply the spec to.
+            users: Mapping of email to the wanted permission (EDITOR or
+                VIEWER), or None to remove that user's access. Emails are
+                compared case-insensitively.
+            public: True/False to enable/disable public link sharing, or
+                None to leave it unchanged.
+            notify: Send an email notification to newly added users.
+            welcome_message: Optional welcome message for newly added users.
+            concurrency: Maximum notebooks read or changed at once (default: 5).
+            dry_run: Only compute the changes; report them with status
+                "planned" (or "unchanged") without applying anything.
+            on_result: Optional callback (sync or async) invoked with each
+                notebook's ShareChangeResult as it finishes.
+
+        Returns:
+            One ShareChangeResult per notebook, in input order.
+
+        Raises:
+            ValidationError: If concurrency is less than 1 or a permission is
+                OWNER.
+
+        Example:
+            # Offboard a user and make sure the team has edit access
+            results = await client.sharing.apply_many(
+                notebook_ids,
+                {"leaver@example.com": None, "team@example.com": SharePermission.EDITOR},
+            )
+        """
+        if concurrency < 1:
+            raise ValidationError(f"concurrency must be at least 1, got {concurrency}")
+        wanted = {email.lower(): (email, permission) for email, permission in (users or {}).items()}
+        for email, permission in wanted.values():
+            if permission in (SharePermission.OWNER, SharePermission._REMOVE):
+                raise ValidationError(
+                    f"Invalid permission for {email}: use EDITOR, VIEWER or None (remove)"
+                )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def apply_one(notebook_id: str) -> ShareChangeResult:
+            result = ShareChangeResult(notebook_id, "unchanged")
+            async with semaphore:
+                try:
+                    status = await self.get_status(notebook_id)
+                    result = self._plan(notebook_id, status, wanted, public)
+                    if result.has_changes and not dry_run:
+                        await self._apply(result, wanted, notify, welcome_message)
+                    if dry_run:
+                        result.status = "planned" if result.has_changes else "unchanged"
+                    else:
+                        result.status = "changed" if result.has_changes else "unchanged"
+                except (NotebookLMError, httpx.HTTPError) as e:
+                    # Keep the plan: ``applied`` tells which changes were made
+                    logger.warning("Sharing update for notebook %s failed: %s", notebook_id, e)
+                    result.status = "failed"
+                    result.error = str(e)
+            await invoke_callback(on_result, result)
+            return result
+
+        return list(await asyncio.gather(*(apply_one(nb_id) for nb_id in notebook_ids)))
+
+    @staticmethod
+    def _plan(
+        notebook_id: str,
+        status: ShareStatus,
+        wanted: dict[str, tuple[str, SharePermission | None]],
+        public: bool | None,
+    ) -> ShareChangeResult:
+        """Compute the changes that bring one notebook's sharing to the spec."""
+        current = {user.email.lower(): user for user in status.shared_users}
+        result = ShareChangeResult(notebook_id, "unchanged")
+        for key, (email, permission) in wanted.items():
+            user = current.get(key)
+            if user is not None and user.permission == SharePermission.OWNER:
+                result.skipped.append(user.email)
+            elif permission is None:
+                if user is not None:
+                    result.removed.append(user.email)
+            elif user is None:
+                result.added.append(email)
+            elif user.permission != permission:
+                result.updated.append(user.email)
+        if public is not None and public != status.is_public:
+            result.public = public
+        return result
+
+    async def _apply(
+        self,
+        result: ShareChangeResult,
+        wanted: dict[str, tuple[str, SharePermission | None]],
+        notify: bool,
+        welcome_message: str,
+    ) -> None:
+        """Send the planned changes of one notebook, recording each completed step."""
+
+        def permission_of(email: str) -> SharePermission:
+            permission = wanted[email.lower()][1]
+            return SharePermission._REMOVE if permission is None else permission
+
+        if result.added:
+            message_flag = 0 if welcome_message else 1
+            await self._share_users(
+                result.notebook_id,
+                [(email, permission_of(email)) for email in result.added],
+                1 if notify else 0,
+                [message_flag, welcome_message],
+            )
+            result.applied.append("added")
+        changed = result.updated + result.removed
+        if changed:
+            await self._share_users(
+                result.notebook_id,
+                [(email, permission_of(email)) for email in changed],
+                0,
+                [0, ""],
+            )
+            result.applied.extend(step for step in ("updated", "removed") if getattr(result, step))
+        if result.public is not None:
+            await self._set_access(result.notebook_id, result.public)
+            result.applied.append("public")
+
+    async def _share_users(
+        self,
+        notebook_id: str,
+        users: builtins.list[tuple[str, SharePermission]],
+        notify_flag: int,
+        message: builtins.list[Any],
+    ) -> None:
+        """Grant, change or remove (``_REMOVE``) access for users in one call."""
+        params = [
+            [
+                [
+                    notebook_id,
+                    [[email, None, permission.value] for email, permission in users],
+                    None,
+                    message,
+                ]
+            ],
+            notify_flag,
+            None,
+            [2],
+        ]
+        await self._core.rpc_call(
+            RPCMethod.SHARE_NOTEBOOK,
+            params,
+            source_path=f"/notebook/{notebook_id}",
+            allow_null=True,
+        )
+
+    async def _set_access(self, notebook_id: str, public: bool) -> None:
+        """Switch public link sharing on or off."""
+        access = ShareAccess.ANYONE_WITH_LINK if public else ShareAccess.RESTRICTED
         params = [
-            [[notebook_id, [[email, None, SharePermission._REMOVE.value]], None, [0, ""]]],
-            0,
+            [[notebook_id, None, [access.value], [access.value, ""]]],
+            1,
             None,
             [2],
         ]
@@ -248,4 +407,3 @@ class SharingAPI:
             source_path=f"/notebook/{notebook_id}",
             allow_null=True,
         )
-        return await self.get_status(notebook_id)
@@ -0,0 +1,142 @@
+"""Single-pass extraction of source rows from GET_NOTEBOOK responses.
+
+A GET_NOTEBOOK response holds one row per source at ``response[0][1]``::
+
+    [[source_id], title, [.., .., [created_s, ns], .., type_code, .., .., [url]], [.., status]]
+
+``SourcesAPI.list()``, ``Source.from_api_response()`` and
+``ClientCore.get_source_ids()`` all read these rows through the accessors
+below, so the index paths are defined once and each row is walked once.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from .rpc.types import SourceStatus
+
+Accessor = Callable[[Any], Any]
+
+
+def accessor(*path: int) -> Accessor:
+    """Build a getter for a fixed index path that returns None on any miss."""
+
+    def get(node: Any) -> Any:
+        for index in path:
+            if type(node) is not list or len(node) <= index:
+                return None
+            node = node[index]
+        return node
+
+    return get
+
+
+row_id_field = accessor(0)
+row_title = accessor(1)
+row_metadata_first = accessor(2, 0)
+row_created = accessor(2, 2, 0)
+row_type_code = accessor(2, 4)
+row_url = accessor(2, 7, 0)
+row_status = accessor(3, 1)
+_NOTEBOOK_SOURCES = accessor(0, 1)
+
+_KNOWN_STATUSES = frozenset(int(status) for status in SourceStatus)
+
+
+def row_id(row: Any) -> Any:
+    """Source ID of a row: ``row[0][0]``, or ``row[0]`` for flat rows."""
+    first = row_id_field(row)
+    if type(first) is list:
+        return first[0] if first else None
+    return first
+
+
+def row_fields(
+    row: Any,
+) -> tuple[str, str | None, str | None, int | None, int, datetime | None] | None:
+    """Extract ``(id, title, url, type_code, status, created_at)`` from a row.
+
+    Returns None for rows without an ID. Missing or malformed fields fall back
+    to None (status falls back to READY).
+    """
+    source_id = row_id(row)
+    if source_id is None:
+        return None
+
+    url = row_url(row)
+    if type(url) is not str:
+        url = None
+
+    type_code = row_type_code(row)
+    if type(type_code) is not int:
+        type_code = None
+
+    status = row_status(row)
+    if type(status) is not int or status not in _KNOWN_STATUSES:
+        status = SourceStatus.READY
+
+    created_at = None
+    timestamp = row_created(row)
+    if timestamp is not None:
+        try:
+            created_at = datetime.fromtimestamp(timestamp)
+        except (TypeError, ValueError, OverflowError, OSError):
+            pass
+
+    return str(source_id), row_title(row), url, type_code, status, created_at
+
+
+def notebook_source_rows(notebook: Any) -> list[Any] | None:
+    """Return the source rows of a GET_NOTEBOOK response, or None if malformed."""
+    rows = _NOTEBOOK_SOURCES(notebook)
+    return rows if type(rows) is list else None
+
+
+def source_ids(rows: list[Any]) -> list[str]:
+    """Return the string source IDs of ``rows``, reading nothing else."""
+    ids = []
+    for row in rows:
+        first = row_id_field(row)
+        if type(first) is list and first and type(first[0]) is str:
+            ids.append(first[0])
+    return ids
+
+
+@dataclass
+class SourceColumns:
+    """Source rows as parallel lists, one entry per source.
+
+    Cheaper than building a ``Source`` object per row when only a few fields
+    of a large notebook are needed.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    titles: list[str | None] = field(default_factory=list)
+    urls: list[str | None] = field(default_factory=list)
+    type_codes: list[int | None] = field(default_factory=list)
+    statuses: list[int] = field(default_factory=list)
+    created_at: list[datetime | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def source_columns(rows: list[Any]) -> SourceColumns:
+    """Extract all rows into a SourceColumns in a single pass."""
+    columns = SourceColumns()
+    appenders = (
+        columns.ids.append,
+        columns.titles.append,
+        columns.urls.append,
+        columns.type_codes.append,
+        columns.statuses.append,
+        columns.created_at.append,
+    )
+    for row in rows:
+        fields = row_fields(row)
+        if fields is None:
+            continue
+        for append, value in zip(appenders, fields, strict=True):
+            append(value)
+    return columns
@@ -2,8 +2,13 @@
 
 import asyncio
 import builtins
+import hashlib
+import json
 import logging
+import mmap
 import re
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from time import monotonic
@@ -12,22 +17,86 @@ from urllib.parse import parse_qs, urlparse
 
 import httpx
 
+from ._callbacks import invoke_callback
 from ._core import ClientCore
+from ._fingerprints import (
+    SourceFingerprints,
+    content_fingerprint,
+    hash_file,
+    text_fingerprint,
+    url_fingerprint,
+)
+from ._search import SourceIndex
+from ._source_rows import notebook_source_rows, source_columns
+from ._uploads import UploadSessionStore
 from ._url_utils import is_youtube_url
-from .exceptions import ValidationError
+from .exceptions import NotebookLMError, ValidationError
 from .rpc import UPLOAD_URL, RPCError, RPCMethod
-from .rpc.types import SourceStatus
 from .types import (
+    Notebook,
     Source,
     SourceAddError,
+    SourceAddResult,
+    SourceColumns,
     SourceFulltext,
     SourceNotFoundError,
     SourceProcessingError,
+    SourceRefreshResult,
+    SourceSearchHit,
     SourceTimeoutError,
+    SourceType,
 )
 
 logger = logging.getLogger(__name__)
 
+# Resumable upload chunk sizes; must be multiples of 256 KiB
+_UPLOAD_CHUNK_GRANULARITY = 256 * 1024
+DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+MAX_UPLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Size of each piece handed to the HTTP client while streaming a chunk
+_STREAM_PIECE_SIZE = 1024 * 1024
+
+# In-memory limit before add_stream() spills buffered content to disk
+_SPOOL_MAX_MEMORY = 32 * 1024 * 1024
+
+# Manifest written by export_fulltexts() next to the exported files
+_FULLTEXT_MANIFEST = "manifest.json"
+
+# Source types whose content can change upstream and be refreshed
+_REFRESHABLE_SOURCE_TYPES = frozenset(
+    {
+        SourceType.WEB_PAGE,
+        SourceType.YOUTUBE,
+        SourceType.GOOGLE_DOCS,
+        SourceType.GOOGLE_SLIDES,
+        SourceType.GOOGLE_SPREADSHEET,
+        SourceType.GOOGLE_DRIVE_AUDIO,
+        SourceType.GOOGLE_DRIVE_VIDEO,
+    }
+)
+
+# HTTP statuses worth retrying an upload chunk on
+_RETRYABLE_UPLOAD_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _adaptive_chunk_size(total_size: int) -> int:
+    """Pick an upload chunk size for content of ``total_size`` bytes.
+
+    Aims for about 16 chunks, so large uploads need fewer round trips while
+    a failed chunk never costs more than ``MAX_UPLOAD_CHUNK_SIZE`` to resend.
+    """
+    target = -(-total_size // 16)  # ceil division
+    target = -(-target // _UPLOAD_CHUNK_GRANULARITY) * _UPLOAD_CHUNK_GRANULARITY
+    return min(max(target, DEFAULT_UPLOAD_CHUNK_SIZE), MAX_UPLOAD_CHUNK_SIZE)
+
+
+def _is_transient_upload_error(error: httpx.HTTPStatusError | httpx.RequestError) -> bool:
+    """Check if an upload chunk failure is worth resuming after."""
+    if isinstance(error, httpx.RequestError):
+        return True
+    return error.response.status_code in _RETRYABLE_UPLOAD_STATUSES
+
 
 class SourcesAPI:
     """Operations on NotebookLM sources.
@@ -42,13 +111,35 @@ class SourcesAPI:
             await client.sources.rename(notebook_id, new_src.id, "Better Title")
     """
 
-    def __init__(self, core: ClientCore):
+    def __init__(
+        self,
+        core: ClientCore,
+        upload_sessions: UploadSessionStore | None = None,
+        index: SourceIndex | None = None,
+        fingerprints: SourceFingerprints | None = None,
+    ):
         """Initialize the sources API.
 
         Args:
             core: The core client infrastructure.
+            upload_sessions: Optional store of in-progress file uploads, used
+                to resume an interrupted ``add_file`` after a restart.
+            index: Optional full-text index for ``search()``; an in-memory
+                index is created on first search if not given.
+            fingerprints: Optional manifest of source content fingerprints.
+                When given, ``add_*`` methods and ``add_many`` return the
+                existing source instead of adding the same URL, text or file
+                content to a notebook twice.
         """
         self._core = core
+        self._upload_sessions = upload_sessions
+        self._index = index
+        self._fingerprints = fingerprints
+        # notebook_id -> fingerprint -> existing Source, seeded from list()
+        self._known: dict[str, dict[str, Source]] = {}
+        self._known_lock = asyncio.Lock()
+        # (path, size, mtime_ns) -> SHA-256, so a file is hashed once
+        self._file_hashes: dict[tuple[str, int, int], str] = {}
 
     async def list(self, notebook_id: str) -> list[Source]:
         """List all sources in a notebook.
@@ -59,7 +150,38 @@ class SourcesAPI:
         Returns:
             List of Source objects.
         """
-        # Get notebook data which includes sources
+        sources = []
+        for row in await self._source_rows(notebook_id):
+            source = Source.from_notebook_row(row)
+            if source is not None:
+                sources.append(source)
+        return sources
+
+    async def list_columns(self, notebook_id: str) -> SourceColumns:
+        """List all sources in a notebook as parallel columns.
+
+        Same data as ``list()``, but as one list per field (ids, titles,
+        urls, type codes, statuses, creation times) instead of one Source
+        object per row. Useful for notebooks with thousands of sources.
+
+        Args:
+            notebook_id: The notebook ID.
+
+        Returns:
+            SourceColumns with one entry per source in every column.
+
+        Example:
+            columns = await client.sources.list_columns(nb_id)
+            ready = [
+                sid
+                for sid, status in zip(columns.ids, columns.statuses)
+                if status == SourceStatus.READY
+            ]
+        """
+        return source_columns(await self._source_rows(notebook_id))
+
+    async def _source_rows(self, notebook_id: str) -> builtins.list[Any]:
+        """Fetch the raw source rows of a notebook (empty on malformed data)."""
         params = [notebook_id, None, [2], None, 0]
         notebook = await self._core.rpc_call(
             RPCMethod.GET_NOTEBOOK,
@@ -75,83 +197,15 @@ class SourcesAPI:
             )
             return []
 
-        nb_info = notebook[0]
-        if not isinstance(nb_info, list) or len(nb_info) <= 1:
-            logger.warning(
-                "Unexpected notebook structure for %s: expected list with sources at index 1 "
-                "(API structure may have changed)",
-                notebook_id,
-            )
-            return []
-
-        sources_list = nb_info[1]
-        if not isinstance(sources_list, list):
+        rows = notebook_source_rows(notebook)
+        if rows is None:
             logger.warning(
-                "Sources data for %s is not a list (type=%s), returning empty list "
+                "Unexpected notebook structure for %s: expected a list of sources at [0][1] "
                 "(API structure may have changed)",
                 notebook_id,
-                type(sources_list).__name__,
             )
             return []
-
-        # Convert raw source data to Source objects
-        sources = []
-        for src in sources_list:
-            if isinstance(src, list) and len(src) > 0:
-                # Extract basic info from source structure
-                src_id = src[0][0] if isinstance(src[0], list) else src[0]
-                title = src[1] if len(src) > 1 else None
-
-                # Extract URL if present (at src[2][7])
-                url = None
-                if len(src) > 2 and isinstance(src[2], list) and len(src[2]) > 7:
-                    url_list = src[2][7]
-                    if isinstance(url_list, list) and len(url_list) > 0:
-                        url = url_list[0]
-
-                # Extract timestamp from src[2][2] - [seconds, nanoseconds]
-                created_at = None
-                if len(src) > 2 and isinstance(src[2], list) and len(src[2]) > 2:
-                    timestamp_list = src[2][2]
-                    if isinstance(timestamp_list, list) and len(timestamp_list) > 0:
-                        try:
-                            created_at = datetime.fromtimestamp(timestamp_list[0])
-                        except (TypeError, ValueError):
-                            pass
-
-                # Extract status from src[3][1]
-                # See SourceStatus enum for valid values
-                status = SourceStatus.READY  # Default to ready
-                if len(src) > 3 and isinstance(src[3], list) and len(src[3]) > 1:
-                    status_code = src[3][1]
-                    if status_code in (
-                        SourceStatus.PROCESSING,
-                        SourceStatus.READY,
-                        SourceStatus.ERROR,
-                        SourceStatus.PREPARING,
-                    ):
-                        status = status_code
-
-                # Extract source type code from src[2][4]
-                # See SourceType enum for valid values
-                type_code = None
-                if len(src) > 2 and isinstance(src[2], list) and len(src[2]) > 4:
-                    tc = src[2][4]
-                    if isinstance(tc, int):
-                        type_code = tc
-
-                sources.append(
-                    Source(
-                        id=str(src_id),
-                        title=title,
-                        url=url,
-                        _type_code=type_code,
-                        created_at=created_at,
-                        status=status,
-                    )
-                )
-
-        return sources
+        return rows
 
     async def get(self, notebook_id: str, source_id: str) -> Source | None:
         """Get details of a specific source.
@@ -248,21 +302,30 @@ class SourcesAPI:
         notebook_id: str,
         source_ids: builtins.list[str],
         timeout: float = 120.0,
-        **kwargs: Any,
+        initial_interval: float = 1.0,
+        max_interval: float = 10.0,
+        backoff_factor: float = 1.5,
     ) -> builtins.list[Source]:
-        """Wait for multiple sources to become ready in parallel.
+        """Wait for multiple sources to become ready.
+
+        All sources are polled together: each tick lists the notebook's
+        sources once and resolves every pending ID from that result, so
+        waiting on many sources costs one request per tick rather than one
+        per source.
 
         Args:
             notebook_id: The notebook ID.
             source_ids: List of source IDs to wait for.
-            timeout: Per-source timeout in seconds.
-            **kwargs: Additional arguments passed to wait_until_ready().
+            timeout: Maximum time to wait for all sources, in seconds.
+            initial_interval: Initial polling interval in seconds (default: 1).
+            max_interval: Maximum polling interval in seconds (default: 10).
+            backoff_factor: Multiplier for polling interval (default: 1.5).
 
         Returns:
             List of ready Source objects in the same order as source_ids.
 
         Raises:
-            SourceTimeoutError: If any source times out.
+            SourceTimeoutError: If any source is not ready before the timeout.
             SourceProcessingError: If any source fails.
             SourceNotFoundError: If any source is not found.
 
@@ -275,10 +338,46 @@ class SourcesAPI:
                 nb_id, [s.id for s in sources]
             )
         """
-        tasks = [
-            self.wait_until_ready(notebook_id, sid, timeout=timeout, **kwargs) for sid in source_ids
-        ]
-        return list(await asyncio.gather(*tasks))
+        start = monotonic()
+        interval = initial_interval
+        pending = list(dict.fromkeys(source_ids))
+        ready: dict[str, Source] = {}
+        last_status: dict[str, int] = {}
+
+        while pending:
+            # Check timeout before each poll
+            elapsed = monotonic() - start
+            if elapsed >= timeout:
+                raise SourceTimeoutError(pending[0], timeout, last_status.get(pending[0]))
+
+            current = {source.id: source for source in await self.list(notebook_id)}
+
+            still_pending = []
+            for source_id in pending:
+                source = current.get(source_id)
+                if source is None:
+                    raise SourceNotFoundError(source_id)
+
+                last_status[source_id] = source.status
+                if source.is_ready:
+                    ready[source_id] = source
+                elif source.is_error:
+                    raise SourceProcessingError(source_id, source.status)
+                else:
+                    still_pending.append(source_id)
+            pending = still_pending
+            if not pending:
+                break
+
+            # Don't sleep longer than remaining time
+            remaining = timeout - (monotonic() - start)
+            if remaining <= 0:
+                raise SourceTimeoutError(pending[0], timeout, last_status.get(pending[0]))
+
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * backoff_factor, max_interval)
+
+        return [ready[source_id] for source_id in source_ids]
 
     async def add_url(
         self,
@@ -286,6 +385,7 @@ class SourcesAPI:
         url: str,
         wait: bool = False,
         wait_timeout: float = 120.0,
+        skip_duplicates: bool = True,
     ) -> Source:
         """Add a URL source to a notebook.
 
@@ -296,6 +396,8 @@ class SourcesAPI:
             url: The URL to add.
             wait: If True, wait for source to be ready before returning.
             wait_timeout: Maximum seconds to wait if wait=True (default: 120).
+            skip_duplicates: If the client keeps source fingerprints, return
+                the existing source when the URL is already in the notebook.
 
         Returns:
             The created Source object. If wait=False, status may be PROCESSING.
@@ -310,6 +412,10 @@ class SourcesAPI:
             await client.sources.wait_for_sources(nb_id, [s.id for s in sources])
         """
         logger.debug("Adding URL source to notebook %s: %s", notebook_id, url[:80])
+        fingerprint = url_fingerprint(url)
+        if skip_duplicates and (existing := await self._find_duplicate(notebook_id, fingerprint)):
+            return await self._existing_source(notebook_id, existing, wait, wait_timeout)
+
         video_id = self._extract_youtube_video_id(url)
         try:
             if video_id:
@@ -331,6 +437,7 @@ class SourcesAPI:
         if result is None:
             raise SourceAddError(url, message=f"API returned no data for URL: {url}")
         source = Source.from_api_response(result)
+        self._remember(notebook_id, fingerprint, source)
 
         if wait:
             return await self.wait_until_ready(notebook_id, source.id, timeout=wait_timeout)
@@ -344,6 +451,7 @@ class SourcesAPI:
         content: str,
         wait: bool = False,
         wait_timeout: float = 120.0,
+        skip_duplicates: bool = True,
     ) -> Source:
         """Add a text source (copied text) to a notebook.
 
@@ -353,11 +461,18 @@ class SourcesAPI:
             content: Text content.
             wait: If True, wait for source to be ready before returning.
             wait_timeout: Maximum seconds to wait if wait=True (default: 120).
+            skip_duplicates: If the client keeps source fingerprints, return
+                the existing source when the same text was already added
+                (under any title).
 
         Returns:
             The created Source object. If wait=False, status may be PROCESSING.
         """
         logger.debug("Adding text source to notebook %s: %s", notebook_id, title)
+        fingerprint = text_fingerprint(content)
+        if skip_duplicates and (existing := await self._find_duplicate(notebook_id, fingerprint)):
+            return await self._existing_source(notebook_id, existing, wait, wait_timeout)
+
         params = [
             [[None, [title, content], None, None, None, None, None, None]],
             notebook_id,
@@ -382,6 +497,7 @@ class SourcesAPI:
             raise SourceAddError(title, message=f"API returned no data for text source: {title}")
 
         source = Source.from_api_response(result)
+        self._remember(notebook_id, fingerprint, source)
 
         if wait:
             return await self.wait_until_ready(notebook_id, source.id, timeout=wait_timeout)
@@ -395,13 +511,19 @@ class SourcesAPI:
         mime_type: str | None = None,
         wait: bool = False,
         wait_timeout: float = 120.0,
+        skip_duplicates: bool = True,
     ) -> Source:
         """Add a file source to a notebook using resumable upload.
 
         Uses Google's resumable upload protocol:
         1. Register source intent with RPC → get SOURCE_ID
         2. Start upload session with SOURCE_ID (get upload URL)
-        3. Stream upload file content (memory-efficient for large files)
+        3. Upload file content in chunks, resuming from the committed offset
+           after transient failures
+
+        If the client was created with an ``UploadSessionStore``, the upload
+        URL is recorded until the upload finishes, and a later ``add_file``
+        of the same unchanged file resumes that upload instead of restarting.
 
         Args:
             notebook_id: The notebook ID.
@@ -409,6 +531,9 @@ class SourcesAPI:
             mime_type: MIME type of the file (not used in current implementation).
             wait: If True, wait for source to be ready before returning.
             wait_timeout: Maximum seconds to wait if wait=True (default: 120).
+            skip_duplicates: If the client keeps source fingerprints, return
+                the existing source when a file with the same bytes was
+                already added, without uploading.
 
         Returns:
             The created Source object. If wait=False, status may be PROCESSING.
@@ -432,14 +557,49 @@ class SourcesAPI:
         # Get file size without loading into memory
         file_size = file_path.stat().st_size
 
-        # Step 1: Register source intent with RPC → get SOURCE_ID
-        source_id = await self._register_file_source(notebook_id, filename)
+        fingerprint = None
+        if self._fingerprints is not None:
+            fingerprint = content_fingerprint(await asyncio.to_thread(self._file_sha256, file_path))
+            if skip_duplicates and (
+                existing := await self._find_duplicate(notebook_id, fingerprint)
+            ):
+                return await self._existing_source(notebook_id, existing, wait, wait_timeout)
+
+        session_key = None
+        resumed = None
+        if self._upload_sessions is not None:
+            session_key = self._upload_sessions.session_key(notebook_id, file_path)
+            resumed = self._upload_sessions.get(session_key)
+
+        offset = 0
+        finalized = False
+        if resumed is not None:
+            progress = await self._query_upload_offset(resumed.upload_url)
+            if progress is None:
+                # Session expired or was rejected; start a fresh upload
+                self._upload_sessions.remove(session_key)  # type: ignore[union-attr]
+                resumed = None
+            else:
+                offset, finalized = progress
+                source_id, upload_url = resumed.source_id, resumed.upload_url
+                logger.debug("Resuming upload of %s at byte %d of %d", filename, offset, file_size)
+
+        if resumed is None:
+            # Step 1: Register source intent with RPC → get SOURCE_ID
+            source_id = await self._register_file_source(notebook_id, filename)
 
-        # Step 2: Start resumable upload with the SOURCE_ID from step 1
-        upload_url = await self._start_resumable_upload(notebook_id, filename, file_size, source_id)
+            # Step 2: Start resumable upload with the SOURCE_ID from step 1
+            upload_url = await self._start_resumable_upload(
+                notebook_id, filename, file_size, source_id
+            )
+            if session_key is not None:
+                self._upload_sessions.put(session_key, upload_url, source_id)  # type: ignore[union-attr]
 
-        # Step 3: Stream upload file content (memory-efficient)
-        await self._upload_file_streaming(upload_url, file_path)
+        # Step 3: Upload file content in chunks (memory-efficient, resumable)
+        if not finalized:
+            await self._upload_file_streaming(upload_url, file_path, start_offset=offset)
+        if session_key is not None:
+            self._upload_sessions.remove(session_key)  # type: ignore[union-attr]
 
         # Return source with the ID we got from registration
         # Note: _type_code is None because the actual type is determined
@@ -450,12 +610,153 @@ class SourcesAPI:
             title=filename,
             _type_code=None,  # Placeholder until processed
         )
+        self._remember(notebook_id, fingerprint, source)
 
         if wait:
             return await self.wait_until_ready(notebook_id, source.id, timeout=wait_timeout)
 
         return source
 
+    async def add_bytes(
+        self,
+        notebook_id: str,
+        data: bytes | bytearray | memoryview,
+        filename: str,
+        wait: bool = False,
+        wait_timeout: float = 120.0,
+        skip_duplicates: bool = True,
+    ) -> Source:
+        """Add an in-memory document as a file source.
+
+        Uploads directly from the buffer, without writing a temporary file.
+        Chunks are sent as zero-copy slices of the buffer, so it must not be
+        modified until this call returns.
+
+        Args:
+            notebook_id: The notebook ID.
+            data: Document content.
+            filename: File name for the source; its extension tells
+                NotebookLM the document type (e.g. "report.pdf").
+            wait: If True, wait for source to be ready before returning.
+            wait_timeout: Maximum seconds to wait if wait=True (default: 120).
+            skip_duplicates: If the client keeps source fingerprints, return
+                the existing source when the same bytes were already added.
+
+        Returns:
+            The created Source object. If wait=False, status may be PROCESSING.
+
+        Example:
+            pdf_bytes = render_report()
+            source = await client.sources.add_bytes(nb_id, pdf_bytes, "report.pdf")
+        """
+        logger.debug("Adding in-memory source to notebook %s: %s", notebook_id, filename)
+        view = memoryview(data).cast("B")
+
+        async def read_range(start: int, end: int) -> AsyncIterator[memoryview]:
+            for pos in range(start, end, _STREAM_PIECE_SIZE):
+                yield view[pos : min(pos + _STREAM_PIECE_SIZE, end)]
+
+        fingerprint = None
+        if self._fingerprints is not None:
+            fingerprint = content_fingerprint(hashlib.sha256(view).hexdigest())
+        return await self._upload_new_source(
+            notebook_id,
+            filename,
+            len(view),
+            read_range,
+            wait,
+            wait_timeout,
+            fingerprint=fingerprint,
+            skip_duplicates=skip_duplicates,
+        )
+
+    async def add_stream(
+        self,
+        notebook_id: str,
+        stream: AsyncIterable[bytes] | Iterable[bytes],
+        filename: str,
+        wait: bool = False,
+        wait_timeout: float = 120.0,
+        skip_duplicates: bool = True,
+    ) -> Source:
+        """Add a document produced as a stream of byte chunks as a file source.
+
+        The upload protocol needs the total size up front and must be able to
+        resend a chunk after a transient failure, so the stream is buffered
+        first: in memory up to 32 MiB, spilling to an anonymous temporary
+        file beyond that.
+
+        Args:
+            notebook_id: The notebook ID.
+            stream: Sync or async iterable of byte chunks.
+            filename: File name for the source; its extension tells
+                NotebookLM the document type (e.g. "export.md").
+            wait: If True, wait for source to be ready before returning.
+            wait_timeout: Maximum seconds to wait if wait=True (default: 120).
+            skip_duplicates: If the client keeps source fingerprints, return
+                the existing source when the same bytes were already added.
+
+        Returns:
+            The created Source object. If wait=False, status may be PROCESSING.
+        """
+        logger.debug("Adding streamed source to notebook %s: %s", notebook_id, filename)
+        digest = hashlib.sha256() if self._fingerprints is not None else None
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY) as spool:
+            if isinstance(stream, AsyncIterable):
+                async for chunk in stream:
+                    spool.write(chunk)
+                    if digest is not None:
+                        digest.update(chunk)
+            else:
+                for chunk in stream:
+                    spool.write(chunk)
+                    if digest is not None:
+                        digest.update(chunk)
+            total_size = spool.tell()
+
+            async def read_range(start: int, end: int) -> AsyncIterator[bytes]:
+                spool.seek(start)
+                for pos in range(start, end, _STREAM_PIECE_SIZE):
+                    yield spool.read(min(_STREAM_PIECE_SIZE, end - pos))
+
+            return await self._upload_new_source(
+                notebook_id,
+                filename,
+                total_size,
+                read_range,
+                wait,
+                wait_timeout,
+                fingerprint=content_fingerprint(digest.hexdigest()) if digest else None,
+                skip_duplicates=skip_duplicates,
+            )
+
+    async def _upload_new_source(
+        self,
+        notebook_id: str,
+        filename: str,
+        total_size: int,
+        read_range: Callable[[int, int], AsyncIterator[bytes | memoryview]],
+        wait: bool,
+        wait_timeout: float,
+        fingerprint: str | None = None,
+        skip_duplicates: bool = True,
+    ) -> Source:
+        """Register a file source and upload its content from ``read_range``."""
+        if skip_duplicates and (existing := await self._find_duplicate(notebook_id, fingerprint)):
+            return await self._existing_source(notebook_id, existing, wait, wait_timeout)
+
+        source_id = await self._register_file_source(notebook_id, filename)
+        upload_url = await self._start_resumable_upload(
+            notebook_id, filename, total_size, source_id
+        )
+        await self._upload_content(upload_url, read_range, total_size)
+
+        source = Source(id=source_id, title=filename, _type_code=None)
+        self._remember(notebook_id, fingerprint, source)
+        if wait:
+            return await self.wait_until_ready(notebook_id, source.id, timeout=wait_timeout)
+        return source
+
     async def add_drive(
         self,
         notebook_id: str,
@@ -521,12 +822,280 @@ class SourcesAPI:
             allow_null=True,
         )
         source = Source.from_api_response(result)
+        self._core.invalidate_source_ids(notebook_id)
 
         if wait:
             return await self.wait_until_ready(notebook_id, source.id, timeout=wait_timeout)
 
         return source
 
+    async def add_many(
+        self,
+        notebook_id: str,
+        items: builtins.list[str | Path | dict[str, Any]],
+        concurrency: int = 5,
+        skip_existing: bool = True,
+        wait: bool = False,
+        wait_timeout: float = 120.0,
+        on_progress: Callable[[SourceAddResult], Any] | None = None,
+    ) -> builtins.list[SourceAddResult]:
+        """Add many sources to a notebook concurrently.
+
+        Items are added with at most ``concurrency`` in flight. Duplicates
+        within the batch are skipped, and with ``skip_existing`` so are URLs
+        already in the notebook (one ``list()`` call up front) and, if the
+        client keeps source fingerprints, files and texts added before. A
+        failing item never aborts the batch; its error is recorded in the
+        report.
+
+        Args:
+            notebook_id: The notebook ID.
+            items: Sources to add. Each item is one of:
+                - ``str``: a URL (YouTube URLs are detected automatically)
+                - ``Path``: a local file to upload
+                - ``{"url": ...}``
+                - ``{"file": path, "mime_type": ...}`` (mime_type optional)
+                - ``{"title": ..., "content": ...}`` for pasted text
+                - ``{"drive_id": ..., "title": ..., "mime_type": ...}``
+            concurrency: Maximum number of items added at once (default: 5).
+            skip_existing: Skip content already present in the notebook.
+            wait: If True, wait for all added sources to finish processing
+                (polled together via ``wait_for_sources``).
+            wait_timeout: Maximum seconds to wait if wait=True (default: 120).
+            on_progress: Optional callback (sync or async) invoked with each
+                item's SourceAddResult as soon as it completes.
+
+        Returns:
+            One SourceAddResult per input item, in input order.
+
+        Raises:
+            ValidationError: If concurrency is less than 1.
+
+        Example:
+            results = await client.sources.add_many(
+                nb_id,
+                ["https://example.com/a", Path("paper.pdf")],
+                wait=True,
+            )
+            failed = [r for r in results if r.is_failed]
+        """
+        if concurrency < 1:
+            raise ValidationError(f"concurrency must be at least 1, got {concurrency}")
+
+        existing: dict[str, Source] = {}
+        if skip_existing and self._fingerprints is not None:
+            # One list() per batch, so sources deleted elsewhere are not skipped
+            existing = await self._known_sources(notebook_id, refresh=True)
+        elif skip_existing and any(self._bulk_item_url(item) for item in items):
+            for source in await self.list(notebook_id):
+                if source.url:
+                    existing.setdefault(url_fingerprint(source.url), source)
+
+        async def item_key(item: str | Path | dict[str, Any]) -> str | Exception:
+            try:
+                return await self._bulk_item_key(item)
+            except (ValidationError, OSError, ValueError) as e:
+                return e
+
+        # Files are hashed in worker threads, concurrently, before any upload
+        keys = await asyncio.gather(*(item_key(item) for item in items))
+
+        results: builtins.list[SourceAddResult | None] = [None] * len(items)
+        seen: dict[str, int] = {}
+        to_add: builtins.list[int] = []
+        for index, (item, key) in enumerate(zip(items, keys, strict=True)):
+            if isinstance(key, Exception):
+                results[index] = SourceAddResult(item=item, status="failed", error=str(key))
+                continue
+            if key in seen:
+                results[index] = SourceAddResult(
+                    item=item, status="skipped", error=f"duplicate of item {seen[key]}"
+                )
+            elif key in existing:
+                results[index] = SourceAddResult(
+                    item=item,
+                    status="skipped",
+                    source=existing[key],
+                    error="already in notebook",
+                )
+            else:
+                seen[key] = index
+                to_add.append(index)
+
+        async def report(result: SourceAddResult) -> None:
+            await invoke_callback(on_progress, result)
+
+        for result in results:
+            if result is not None:
+                await report(result)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add_one(index: int) -> None:
+            item = items[index]
+            async with semaphore:
+                try:
+                    source = await self._add_bulk_item(notebook_id, item)
+                    result = SourceAddResult(item=item, status="added", source=source)
+                except (NotebookLMError, httpx.HTTPError, OSError, ValueError) as e:
+                    logger.warning("Failed to add source %r: %s", item, e)
+                    result = SourceAddResult(item=item, status="failed", error=str(e))
+            results[index] = result
+            await report(result)
+
+        await asyncio.gather(*(add_one(index) for index in to_add))
+        final = [result for result in results if result is not None]
+
+        added = [result for result in final if result.is_added and result.source]
+        if wait and added:
+            source_ids = [result.source.id for result in added if result.source]
+            try:
+                ready = await self.wait_for_sources(notebook_id, source_ids, timeout=wait_timeout)
+                by_id = {source.id: source for source in ready}
+            except (SourceProcessingError, SourceTimeoutError, SourceNotFoundError) as e:
+                # Some sources did not become ready; report their latest state
+                logger.warning("Not all bulk-added sources became ready: %s", e)
+                by_id = {source.id: source for source in await self.list(notebook_id)}
+            for result in added:
+                if result.source and result.source.id in by_id:
+                    result.source = by_id[result.source.id]
+
+        return final
+
+    @staticmethod
+    def _bulk_item_url(item: str | Path | dict[str, Any]) -> str | None:
+        """Return the URL of an add_many() item, or None for non-URL items."""
+        if isinstance(item, str):
+            return item
+        if isinstance(item, dict) and "url" in item:
+            return str(item["url"])
+        return None
+
+    async def _bulk_item_key(self, item: str | Path | dict[str, Any]) -> str:
+        """Build the dedup key (content fingerprint) for an add_many() item.
+
+        URLs are compared normalized, files by content hash, text by the
+        hash of its content, and Drive items by file ID.
+        """
+        url = self._bulk_item_url(item)
+        if url is not None:
+            return url_fingerprint(url)
+        if isinstance(item, Path) or (isinstance(item, dict) and "file" in item):
+            path = Path(item["file"] if isinstance(item, dict) else item).resolve()
+            return content_fingerprint(await asyncio.to_thread(self._file_sha256, path))
+        if isinstance(item, dict) and "content" in item:
+            return text_fingerprint(item["content"])
+        if isinstance(item, dict) and ("drive_id" in item or "file_id" in item):
+            return f"drive:{item.get('drive_id') or item.get('file_id')}"
+        raise ValidationError(f"Unsupported source item: {item!r}")
+
+    async def _add_bulk_item(self, notebook_id: str, item: str | Path | dict[str, Any]) -> Source:
+        """Dispatch one add_many() item to the matching add_* method."""
+        # add_many() has already skipped duplicates as requested
+        url = self._bulk_item_url(item)
+        if url is not None:
+            return await self.add_url(notebook_id, url, skip_duplicates=False)
+        if isinstance(item, Path):
+            return await self.add_file(notebook_id, item, skip_duplicates=False)
+        if "file" in item:
+            return await self.add_file(
+                notebook_id, item["file"], mime_type=item.get("mime_type"), skip_duplicates=False
+            )
+        if "content" in item:
+            return await self.add_text(
+                notebook_id, item.get("title") or "Untitled", item["content"], skip_duplicates=False
+            )
+        drive_kwargs = {"mime_type": item["mime_type"]} if "mime_type" in item else {}
+        return await self.add_drive(
+            notebook_id,
+            item.get("drive_id") or item["file_id"],
+            item.get("title") or "Untitled",
+            **drive_kwargs,
+        )
+
+    async def _known_sources(self, notebook_id: str, refresh: bool = False) -> dict[str, Source]:
+        """Return fingerprint → existing Source for a notebook.
+
+        Seeded from one ``list()`` call on first use, or again when
+        ``refresh`` is True: URL sources by normalized URL, plus the
+        fingerprint manifest's entries whose source still exists. Entries of
+        deleted sources are pruned from the manifest.
+        """
+        async with self._known_lock:
+            known = self._known.get(notebook_id)
+            if known is None or refresh:
+                live = {source.id: source for source in await self.list(notebook_id)}
+                known = {
+                    url_fingerprint(source.url): source for source in live.values() if source.url
+                }
+                recorded = self._fingerprints.get(notebook_id) if self._fingerprints else {}
+                for fingerprint, source_id in recorded.items():
+                    if source_id in live:
+                        known.setdefault(fingerprint, live[source_id])
+                gone = {source_id for source_id in recorded.values() if source_id not in live}
+                if gone and self._fingerprints is not None:
+                    self._fingerprints.remove_sources(notebook_id, gone)
+                self._known[notebook_id] = known
+            return known
+
+    async def _find_duplicate(self, notebook_id: str, fingerprint: str | None) -> Source | None:
+        """Return the existing source with this fingerprint, if dedup is enabled.
+
+        A hit is confirmed against a fresh ``list()``: the source may have
+        been deleted in the web UI or by another process since seeding.
+        """
+        if self._fingerprints is None or fingerprint is None:
+            return None
+        if fingerprint not in await self._known_sources(notebook_id):
+            return None
+        source = (await self._known_sources(notebook_id, refresh=True)).get(fingerprint)
+        if source is not None:
+            logger.info(
+                "Skipping duplicate source in notebook %s: %s is already source %s",
+                notebook_id,
+                fingerprint[:80],
+                source.id,
+            )
+        return source
+
+    async def _existing_source(
+        self, notebook_id: str, source: Source, wait: bool, wait_timeout: float
+    ) -> Source:
+        """Return a duplicate's existing source, waiting for it if asked."""
+        if wait:
+            return await self.wait_until_ready(notebook_id, source.id, timeout=wait_timeout)
+        return source
+
+    def _remember(self, notebook_id: str, fingerprint: str | None, source: Source) -> None:
+        """Record a newly added source and its fingerprint."""
+        self._core.invalidate_source_ids(notebook_id)
+        if self._fingerprints is None or fingerprint is None:
+            return
+        self._fingerprints.add(notebook_id, fingerprint, source.id)
+        known = self._known.get(notebook_id)
+        if known is not None:
+            known[fingerprint] = source
+
+    def _forget(self, notebook_id: str, source_id: str) -> None:
+        """Forget a deleted source and its fingerprints."""
+        self._core.invalidate_source_ids(notebook_id)
+        if self._fingerprints is None:
+            return
+        self._fingerprints.remove_sources(notebook_id, {source_id})
+        known = self._known.get(notebook_id)
+        if known is not None:
+            for fingerprint in [fp for fp, source in known.items() if source.id == source_id]:
+                del known[fingerprint]
+
+    def _file_sha256(self, path: Path) -> str:
+        """SHA-256 of a file, cached by path, size and modification time."""
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        sha256 = self._file_hashes.get(key)
+        if sha256 is None:
+            sha256 = self._file_hashes[key] = hash_file(path)
+        return sha256
+
     async def delete(self, notebook_id: str, source_id: str) -> bool:
         """Delete a source from a notebook.
 
@@ -545,6 +1114,7 @@ class SourcesAPI:
             source_path=f"/notebook/{notebook_id}",
             allow_null=True,
         )
+        self._forget(notebook_id, source_id)
         return True
 
     async def rename(self, notebook_id: str, source_id: str, new_title: str) -> Source:
@@ -585,8 +1155,132 @@ class SourcesAPI:
             source_path=f"/notebook/{notebook_id}",
             allow_null=True,
         )
+        if self._index is not None:
+            # The indexed text predates the refresh; re-fetch it on next search
+            await asyncio.to_thread(self._index.invalidate, notebook_id, [source_id])
         return True
 
+    async def refresh_stale(
+        self,
+        notebook_id: str | None = None,
+        max_concurrency: int = 8,
+        wait: bool = True,
+        wait_timeout: float = 300.0,
+    ) -> builtins.list[SourceRefreshResult]:
+        """Refresh every stale URL/Drive source in one or all notebooks.
+
+        Freshness of every refreshable source (web pages, YouTube, Google
+        Drive documents) is checked concurrently, and only stale sources are
+        refreshed. With ``wait``, all refreshed sources of a notebook are
+        then awaited together with batched polling.
+
+        Args:
+            notebook_id: Notebook to refresh, or None for all notebooks.
+            max_concurrency: Maximum freshness checks/refreshes in flight
+                across all notebooks (default: 8).
+            wait: Wait for refreshed sources to finish processing.
+            wait_timeout: Maximum seconds to wait per notebook (default: 300).
+
+        Returns:
+            One SourceRefreshResult per refreshable source checked.
+
+        Raises:
+            ValidationError: If max_concurrency is less than 1.
+
+        Example:
+            results = await client.sources.refresh_stale()  # all notebooks
+            refreshed = [r for r in results if r.status == "refreshed"]
+        """
+        if max_concurrency < 1:
+            raise ValidationError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        if notebook_id is None:
+            notebook_ids = await self._list_notebook_ids()
+        else:
+            notebook_ids = [notebook_id]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        per_notebook = await asyncio.gather(
+            *(
+                self._refresh_stale_in(nb_id, semaphore, wait, wait_timeout)
+                for nb_id in notebook_ids
+            )
+        )
+        return [result for results in per_notebook for result in results]
+
+    async def _refresh_stale_in(
+        self,
+        notebook_id: str,
+        semaphore: asyncio.Semaphore,
+        wait: bool,
+        wait_timeout: float,
+    ) -> builtins.list[SourceRefreshResult]:
+        """Check and refresh the refreshable sources of one notebook.
+
+        A notebook whose sources cannot be listed (deleted, no permission)
+        yields one failed result with an empty ``source_id``.
+        """
+        try:
+            listed = await self.list(notebook_id)
+        except (NotebookLMError, httpx.HTTPError) as e:
+            logger.warning("Failed to list sources of notebook %s: %s", notebook_id, e)
+            return [SourceRefreshResult(notebook_id, "", None, "failed", error=str(e))]
+        sources = [
+            source
+            for source in listed
+            if source.is_ready and source.kind in _REFRESHABLE_SOURCE_TYPES
+        ]
+
+        async def check_and_refresh(source: Source) -> SourceRefreshResult:
+            async with semaphore:
+                try:
+                    if await self.check_freshness(notebook_id, source.id):
+                        status = "fresh"
+                    else:
+                        await self.refresh(notebook_id, source.id)
+                        status = "refreshed"
+                except (NotebookLMError, httpx.HTTPError) as e:
+                    logger.warning("Failed to refresh source %s: %s", source.id, e)
+                    return SourceRefreshResult(
+                        notebook_id, source.id, source.title, "failed", error=str(e)
+                    )
+            return SourceRefreshResult(notebook_id, source.id, source.title, status)
+
+        results = await asyncio.gather(*(check_and_refresh(source) for source in sources))
+
+        refreshed = [result for result in results if result.status == "refreshed"]
+        if wait and refreshed:
+            try:
+                await self.wait_for_sources(
+                    notebook_id, [result.source_id for result in refreshed], timeout=wait_timeout
+                )
+            except (SourceProcessingError, SourceTimeoutError, SourceNotFoundError) as e:
+                logger.warning("Not all refreshed sources became ready: %s", e)
+                try:
+                    current = {source.id: source for source in await self.list(notebook_id)}
+                except (NotebookLMError, httpx.HTTPError) as list_error:
+                    logger.warning("Failed to re-list notebook %s: %s", notebook_id, list_error)
+                    for result in refreshed:
+                        result.error = "refresh sent; final state unknown"
+                    return builtins.list(results)
+                for result in refreshed:
+                    source = current.get(result.source_id)
+                    if source is None or source.is_error:
+                        result.status = "failed"
+                        result.error = "source failed to process after refresh"
+                    elif not source.is_ready:
+                        result.error = "still processing"
+        return builtins.list(results)
+
+    async def _list_notebook_ids(self) -> builtins.list[str]:
+        """Return the IDs of all notebooks (one LIST_NOTEBOOKS call)."""
+        result = await self._core.rpc_call(RPCMethod.LIST_NOTEBOOKS, [None, 1, None, [2]])
+        if not result or not isinstance(result, list):
+            return []
+        # Same response shape as NotebooksAPI.list()
+        raw_notebooks = result[0] if isinstance(result[0], list) else result
+        return [Notebook.from_api_response(nb).id for nb in raw_notebooks]
+
     async def check_freshness(self, notebook_id: str, source_id: str) -> bool:
         """Check if a source needs to be refreshed.
 
@@ -686,47 +1380,9 @@ class SourcesAPI:
             Source type codes: 1=google_docs, 2=google_other, 3=pdf, 4=pasted_text,
             5=web_page, 8=generated_text, 9=youtube
         """
-        # GET_SOURCE RPC with params: [[source_id], [2], [2]]
-        params = [[source_id], [2], [2]]
-        result = await self._core.rpc_call(
-            RPCMethod.GET_SOURCE,
-            params,
-            source_path=f"/notebook/{notebook_id}",
-            allow_null=True,
-        )
-
-        # Validate response - raise if source not found
-        if not result or not isinstance(result, list):
-            raise SourceNotFoundError(f"Source {source_id} not found in notebook {notebook_id}")
-
-        # Parse response structure
-        title = ""
-        source_type = None
-        url = None
-        content = ""
-
-        if result and isinstance(result, list):
-            # Title at result[0][1]
-            if len(result) > 0 and isinstance(result[0], list) and len(result[0]) > 1:
-                title = result[0][1] if isinstance(result[0][1], str) else ""
-
-                # Source type at result[0][2][4]
-                if len(result[0]) > 2 and isinstance(result[0][2], list):
-                    if len(result[0][2]) > 4:
-                        source_type = result[0][2][4]
-
-                    # URL at result[0][2][7][0]
-                    if len(result[0][2]) > 7 and isinstance(result[0][2][7], list):
-                        if len(result[0][2][7]) > 0:
-                            url = result[0][2][7][0]
-
-            # Content blocks at result[3][0]
-            # Each block may be nested arrays with text strings
-            if len(result) > 3 and isinstance(result[3], list) and len(result[3]) > 0:
-                content_blocks = result[3][0]
-                if isinstance(content_blocks, list):
-                    texts = self._extract_all_text(content_blocks)
-                    content = "\n".join(texts)
+        result = await self._get_fulltext_raw(notebook_id, source_id)
+        title, source_type, url = self._fulltext_metadata(result)
+        content = "\n".join(self._iter_text_blocks(self._fulltext_blocks(result)))
 
         # Log warning if content is empty but source exists
         if not content:
@@ -746,31 +1402,394 @@ class SourcesAPI:
             char_count=len(content),
         )
 
+    async def export_fulltexts(
+        self,
+        notebook_id: str,
+        output_dir: str | Path,
+        max_concurrency: int = 4,
+        force: bool = False,
+    ) -> dict[str, str]:
+        """Export the full text of every ready source to a directory.
+
+        Each source is written to ``<source_id>.txt``, streaming its text
+        blocks straight to disk, and ``manifest.json`` records title, URL,
+        type, size, SHA-256 and freshness per source. Fulltexts are fetched
+        concurrently (bounded by ``max_concurrency`` and the client's request
+        limit).
+
+        Re-running against the same directory is incremental. Uploaded files
+        and pasted text never change, so they are fetched again only if new,
+        renamed or their file is missing. Web, YouTube and Drive sources are
+        checked with ``check_freshness()``: one that was fresh at the last
+        export and still is keeps its export, while one that is stale, was
+        stale before (and may since have been refreshed) or could not be
+        checked is fetched again, and its file rewritten only if its SHA-256
+        changed. Sources that are not
+        ready (e.g. being refreshed) keep their previous export; files of
+        sources no longer in the notebook are removed. Sources that fail to
+        export are listed under ``"failed"`` in the manifest and keep their
+        previous export.
+
+        Args:
+            notebook_id: The notebook ID.
+            output_dir: Directory to write into (created if needed).
+            max_concurrency: Maximum fulltexts fetched at once (default: 4).
+            force: Re-export every source regardless of the manifest.
+
+        Returns:
+            Mapping of source ID to the path of each file written this run.
+
+        Raises:
+            ValidationError: If max_concurrency is less than 1.
+
+        Example:
+            written = await client.sources.export_fulltexts(nb_id, "corpus/")
+            print(f"Exported {len(written)} changed sources")
+        """
+        if max_concurrency < 1:
+            raise ValidationError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        out = Path(output_dir)
+        out.mkdir(parents=True, exist_ok=True)
+        manifest_path = out / _FULLTEXT_MANIFEST
+        previous: dict[str, dict[str, Any]] = {}
+        if not force:
+            try:
+                data = json.loads(manifest_path.read_text(encoding="utf-8"))
+                if isinstance(data, dict) and data.get("notebook_id") == notebook_id:
+                    previous = data.get("sources") or {}
+            except (OSError, ValueError):
+                previous = {}
+
+        listed = await self.list(notebook_id)
+        sources = [source for source in listed if source.is_ready]
+        entries: dict[str, dict[str, Any]] = {}
+        failed: dict[str, str] = {}
+        written: dict[str, str] = {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def export_one(source: Source) -> None:
+            async with semaphore:
+                entry = previous.get(source.id)
+                if not isinstance(entry, dict):
+                    entry = None
+                refreshable = source.kind in _REFRESHABLE_SOURCE_TYPES
+                fresh = None
+                if refreshable:
+                    try:
+                        fresh = await self.check_freshness(notebook_id, source.id)
+                    except (NotebookLMError, httpx.HTTPError) as e:
+                        logger.debug("Freshness check failed for %s: %s", source.id, e)
+
+                exported = (
+                    entry is not None
+                    and (out / entry.get("file", "")).is_file()
+                    and entry.get("title") == source.title
+                )
+                # Uploaded files and pasted text never change; a web, YouTube or
+                # Drive source fresh at both exports still has the exported text
+                if (
+                    entry is not None
+                    and exported
+                    and (not refreshable or (fresh is True and entry.get("fresh") is True))
+                ):
+                    entries[source.id] = {**entry, "fresh": fresh}
+                    return
+
+                try:
+                    result = await self._get_fulltext_raw(notebook_id, source.id)
+                except SourceNotFoundError:
+                    logger.warning("Source %s disappeared during export", source.id)
+                    return
+                except (NotebookLMError, httpx.HTTPError) as e:
+                    logger.warning("Failed to export source %s: %s", source.id, e)
+                    failed[source.id] = str(e)
+                    if entry is not None:
+                        entries[source.id] = entry  # keep the previous export
+                    return
+                blocks = self._fulltext_blocks(result)
+                sha256 = await asyncio.to_thread(self._text_blocks_sha256, blocks)
+                if entry is not None and exported and entry.get("sha256") == sha256:
+                    entries[source.id] = {**entry, "fresh": fresh}
+                    return
+
+                path = out / f"{source.id}.txt"
+                title, type_code, url = self._fulltext_metadata(result)
+                char_count = await asyncio.to_thread(self._write_text_blocks, path, blocks)
+
+            entries[source.id] = {
+                "file": path.name,
+                "title": source.title or title,
+                "url": source.url or url,
+                "kind": source.kind.value,
+                "type_code": type_code,
+                "char_count": char_count,
+                "sha256": sha256,
+                "fresh": fresh,
+                "exported_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            written[source.id] = str(path)
+
+        await asyncio.gather(*(export_one(source) for source in sources))
+
+        # Sources still in the notebook but not ready (e.g. mid-refresh) keep
+        # their previous export; only sources gone from the notebook are removed
+        for source in listed:
+            entry = previous.get(source.id)
+            if source.id not in entries and isinstance(entry, dict):
+                entries[source.id] = entry
+        for source_id, entry in previous.items():
+            if source_id not in entries and isinstance(entry, dict) and entry.get("file"):
+                (out / entry["file"]).unlink(missing_ok=True)
+
+        ordered = {source.id: entries[source.id] for source in listed if source.id in entries}
+        manifest: dict[str, Any] = {"notebook_id": notebook_id, "sources": ordered}
+        if failed:
+            manifest["failed"] = failed
+        tmp_path = manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        tmp_path.replace(manifest_path)
+        return written
+
+    async def search(
+        self,
+        notebook_id: str,
+        query: str,
+        limit: int = 20,
+        max_concurrency: int = 4,
+    ) -> builtins.list[SourceSearchHit]:
+        """Search the full text of a notebook's sources.
+
+        Searches a local SQLite FTS5 index, updating it first with
+        ``update_index()``, so only sources that are new, renamed or
+        refreshed since the last search are downloaded.
+
+        Args:
+            notebook_id: The notebook ID.
+            query: FTS5 query: words (all must match), ``"exact phrase"``,
+                ``OR``/``NOT``, and ``prefix*``.
+            limit: Maximum number of hits (default: 20).
+            max_concurrency: Maximum fulltexts fetched at once while updating.
+
+        Returns:
+            Matching sources, most relevant first.
+
+        Raises:
+            ValidationError: If the query is not valid FTS5 syntax.
+
+        Example:
+            hits = await client.sources.search(nb_id, '"attention mechanism"')
+            for hit in hits:
+                print(hit.title, hit.snippet)
+        """
+        await self.update_index(notebook_id, max_concurrency=max_concurrency)
+        return await asyncio.to_thread(self._get_index().search, notebook_id, query, limit)
+
+    async def update_index(self, notebook_id: str, max_concurrency: int = 4) -> int:
+        """Bring the local full-text index of a notebook up to date.
+
+        Fetches the fulltext of ready sources that are not yet indexed, whose
+        title changed, or whose indexed text was invalidated, and drops
+        sources no longer in the notebook. ``refresh()`` and
+        ``refresh_stale()`` invalidate the sources they refresh, and a
+        source seen mid-processing (e.g. refreshed in the web UI) is
+        invalidated as well, so its new text is indexed once it is ready.
+        A source whose text cannot be fetched is logged and keeps its
+        previous entry until a later update succeeds. Use
+        ``SourceIndex.clear()`` to force a full re-index.
+
+        Args:
+            notebook_id: The notebook ID.
+            max_concurrency: Maximum fulltexts fetched at once (default: 4).
+
+        Returns:
+            Number of sources (re)indexed.
+        """
+        if max_concurrency < 1:
+            raise ValidationError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        index = self._get_index()
+        listed = await self.list(notebook_id)
+        sources = [source for source in listed if source.is_ready]
+        indexed = await asyncio.to_thread(index.indexed, notebook_id)
+        listed_ids = {source.id for source in listed}
+        gone = [source_id for source_id in indexed if source_id not in listed_ids]
+        processing = [
+            source.id for source in listed if not source.is_ready and source.id in indexed
+        ]
+        if gone:
+            await asyncio.to_thread(index.remove, notebook_id, gone)
+        if processing:
+            await asyncio.to_thread(index.invalidate, notebook_id, processing)
+        invalidated = await asyncio.to_thread(index.invalidated, notebook_id)
+
+        outdated = [
+            source
+            for source in sources
+            if source.id not in indexed
+            or indexed[source.id] != (source.title or "")
+            or source.id in invalidated
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        count = 0
+
+        async def index_one(source: Source) -> None:
+            nonlocal count
+            async with semaphore:
+                try:
+                    result = await self._get_fulltext_raw(notebook_id, source.id)
+                except SourceNotFoundError:
+                    logger.warning("Source %s disappeared during indexing", source.id)
+                    return
+                except (NotebookLMError, httpx.HTTPError) as e:
+                    # Its old entry (or invalidation) stays, so the next update retries it
+                    logger.warning("Failed to index source %s: %s", source.id, e)
+                    return
+            content = "\n".join(self._iter_text_blocks(self._fulltext_blocks(result)))
+            await asyncio.to_thread(
+                index.upsert, notebook_id, source.id, source.title or "", content, source.url
+            )
+            count += 1
+
+        await asyncio.gather(*(index_one(source) for source in outdated))
+        return count
+
     # =========================================================================
     # Private helper methods
     # =========================================================================
 
+    def _get_index(self) -> SourceIndex:
+        if self._index is None:
+            self._index = SourceIndex(":memory:")
+        return self._index
+
+    async def _get_fulltext_raw(self, notebook_id: str, source_id: str) -> builtins.list:
+        """Fetch the raw GET_SOURCE response carrying a source's full text.
+
+        Raises:
+            SourceNotFoundError: If the source is not found or returns no data.
+        """
+        # GET_SOURCE RPC with params: [[source_id], [2], [2]]
+        params = [[source_id], [2], [2]]
+        result = await self._core.rpc_call(
+            RPCMethod.GET_SOURCE,
+            params,
+            source_path=f"/notebook/{notebook_id}",
+            allow_null=True,
+        )
+
+        # Validate response - raise if source not found
+        if not result or not isinstance(result, list):
+            raise SourceNotFoundError(f"Source {source_id} not found in notebook {notebook_id}")
+        return result
+
+    @staticmethod
+    def _fulltext_metadata(result: builtins.list) -> tuple[str, int | None, str | None]:
+        """Extract (title, source type code, URL) from a GET_SOURCE response."""
+        title = ""
+        source_type = None
+        url = None
+        # Title at result[0][1]
+        if len(result) > 0 and isinstance(result[0], list) and len(result[0]) > 1:
+            title = result[0][1] if isinstance(result[0][1], str) else ""
+
+            # Source type at result[0][2][4]
+            if len(result[0]) > 2 and isinstance(result[0][2], list):
+                if len(result[0][2]) > 4:
+                    source_type = result[0][2][4]
+
+                # URL at result[0][2][7][0]
+                if len(result[0][2]) > 7 and isinstance(result[0][2][7], list):
+                    if len(result[0][2][7]) > 0:
+                        url = result[0][2][7][0]
+        return title, source_type, url
+
+    @staticmethod
+    def _fulltext_blocks(result: builtins.list) -> builtins.list:
+        """Return the nested content blocks of a GET_SOURCE response.
+
+        Content blocks live at result[3][0]; each block may be nested arrays
+        with text strings.
+        """
+        if len(result) > 3 and isinstance(result[3], list) and len(result[3]) > 0:
+            content_blocks = result[3][0]
+            if isinstance(content_blocks, list):
+                return content_blocks
+        return []
+
+    def _text_blocks_sha256(self, blocks: builtins.list) -> str:
+        """SHA-256 of the newline-joined text blocks, as ``_write_text_blocks`` writes them."""
+        digest = hashlib.sha256()
+        for index, text in enumerate(self._iter_text_blocks(blocks)):
+            if index:
+                digest.update(b"\n")
+            digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _write_text_blocks(self, path: Path, blocks: builtins.list) -> int:
+        """Stream text blocks to ``path`` newline-separated; return char count.
+
+        Writes to a temporary file first so an interrupted export never
+        leaves a truncated file behind.
+        """
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        char_count = 0
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for index, text in enumerate(self._iter_text_blocks(blocks)):
+                    if index:
+                        f.write("\n")
+                        char_count += 1
+                    f.write(text)
+                    char_count += len(text)
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return char_count
+
     def _extract_all_text(self, data: builtins.list, max_depth: int = 100) -> builtins.list[str]:
-        """Recursively extract all text strings from nested arrays.
+        """Extract all text strings from nested arrays.
 
         Args:
             data: Nested list structure to extract text from.
-            max_depth: Maximum recursion depth to prevent stack overflow.
+            max_depth: Maximum nesting depth to descend into.
 
         Returns:
             List of extracted text strings.
         """
+        return list(self._iter_text_blocks(data, max_depth))
+
+    def _iter_text_blocks(self, data: builtins.list, max_depth: int = 100) -> Iterator[str]:
+        """Yield non-empty text strings from nested arrays in document order.
+
+        Iterative, so deeply nested content cannot exhaust the stack, and lazy,
+        so callers can stream blocks to disk without building the full text.
+
+        Args:
+            data: Nested list structure to extract text from.
+            max_depth: Maximum nesting depth to descend into.
+        """
         if max_depth <= 0:
             logger.warning("Max recursion depth reached in text extraction")
-            return []
-
-        texts: builtins.list[str] = []
-        for item in data:
-            if isinstance(item, str) and len(item) > 0:
-                texts.append(item)
-            elif isinstance(item, builtins.list):
-                texts.extend(self._extract_all_text(item, max_depth - 1))
-        return texts
+            return
+        stack: builtins.list[tuple[Iterator[Any], int]] = [(iter(data), 1)]
+        warned = False
+        while stack:
+            items, depth = stack[-1]
+            for item in items:
+                if isinstance(item, str) and item:
+                    yield item
+                elif isinstance(item, builtins.list):
+                    if depth >= max_depth:
+                        if not warned:
+                            logger.warning("Max recursion depth reached in text extraction")
+                            warned = True
+                        continue
+                    stack.append((iter(item), depth + 1))
+                    break
+            else:
+                stack.pop()
 
     def _extract_youtube_video_id(self, url: str) -> str | None:
         """Extract YouTube video ID from various URL formats.
@@ -963,7 +1982,8 @@ class SourcesAPI:
         )
 
         async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers, content=body)
+            async with self._core.request_slot():
+                response = await client.post(url, headers=headers, content=body)
             response.raise_for_status()
 
             upload_url = response.headers.get("x-goog-upload-url")
@@ -974,16 +1994,8 @@ class SourcesAPI:
 
             return upload_url
 
-    async def _upload_file_streaming(self, upload_url: str, file_path: Path) -> None:
-        """Stream upload file content to the resumable upload URL.
-
-        Uses streaming to avoid loading the entire file into memory,
-        which is important for large PDFs and documents.
-
-        Args:
-            upload_url: The resumable upload URL from _start_resumable_upload.
-            file_path: Path to the file to upload.
-        """
+    def _upload_headers(self, command: str, offset: int | None = None) -> dict[str, str]:
+        """Build headers for a command on an open resumable upload session."""
         headers = {
             "Accept": "*/*",
             "Content-Type": "application/x-www-form-urlencoded;charset=utf-8",
@@ -991,16 +2003,159 @@ class SourcesAPI:
             "Origin": "https://notebooklm.google.com",
             "Referer": "https://notebooklm.google.com/",
             "x-goog-authuser": "0",
-            "x-goog-upload-command": "upload, finalize",
-            "x-goog-upload-offset": "0",
+            "x-goog-upload-command": command,
         }
+        if offset is not None:
+            headers["x-goog-upload-offset"] = str(offset)
+        return headers
+
+    async def _query_upload_offset(
+        self, upload_url: str, client: httpx.AsyncClient | None = None
+    ) -> tuple[int, bool] | None:
+        """Ask the upload server how many bytes it has committed.
+
+        Args:
+            upload_url: The resumable upload URL.
+            client: HTTP client to reuse; a short-lived one is opened if None.
+
+        Returns:
+            ``(committed_bytes, finalized)``, or None if the session no longer
+            exists or the server did not report an offset.
+        """
+        if client is None:
+            async with httpx.AsyncClient(timeout=60.0) as own_client:
+                return await self._query_upload_offset(upload_url, own_client)
+
+        try:
+            async with self._core.request_slot():
+                response = await client.post(upload_url, headers=self._upload_headers("query"))
+            response.raise_for_status()
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            logger.debug("Upload offset query failed: %s", e)
+            return None
+
+        status = response.headers.get("x-goog-upload-status")
+        received = response.headers.get("x-goog-upload-size-received")
+        if status not in ("active", "final") or received is None:
+            return None
+        try:
+            return int(received), status == "final"
+        except ValueError:
+            return None
+
+    async def _upload_file_streaming(
+        self,
+        upload_url: str,
+        file_path: Path,
+        start_offset: int = 0,
+        chunk_size: int | None = None,
+        max_retries: int = 5,
+    ) -> None:
+        """Upload file content to the resumable upload URL in chunks.
+
+        The file is memory-mapped and each chunk is streamed in 1 MiB slices
+        of the mapping, so large files are never loaded into memory and are
+        read without a syscall per small block. Files that cannot be mapped
+        fall back to buffered reads.
+
+        Args:
+            upload_url: The resumable upload URL from _start_resumable_upload.
+            file_path: Path to the file to upload.
+            start_offset: Byte offset to resume from (default: 0).
+            chunk_size: Bytes per chunk; None sizes chunks from the file size.
+            max_retries: Consecutive failed attempts allowed per chunk.
+        """
 
-        # Stream the file content instead of loading it all into memory
-        async def file_stream():
+        async def read_range(start: int, end: int) -> AsyncIterator[bytes]:
+            if end <= start:
+                return
             with open(file_path, "rb") as f:
-                while chunk := f.read(65536):  # 64KB chunks
-                    yield chunk
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    mapped = None
+                if mapped is None:
+                    f.seek(start)
+                    for pos in range(start, end, _STREAM_PIECE_SIZE):
+                        yield f.read(min(_STREAM_PIECE_SIZE, end - pos))
+                    return
+                with mapped:
+                    for pos in range(start, end, _STREAM_PIECE_SIZE):
+                        # Slicing copies out of the page cache; a memoryview
+                        # would keep the mapping pinned after the request
+                        yield mapped[pos : min(pos + _STREAM_PIECE_SIZE, end)]
+
+        await self._upload_content(
+            upload_url,
+            read_range,
+            file_path.stat().st_size,
+            start_offset=start_offset,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+        )
+
+    async def _upload_content(
+        self,
+        upload_url: str,
+        read_range: Callable[[int, int], AsyncIterator[bytes | memoryview]],
+        total_size: int,
+        start_offset: int = 0,
+        chunk_size: int | None = None,
+        max_retries: int = 5,
+    ) -> None:
+        """Upload content to the resumable upload URL in chunks.
+
+        On a transient failure (network error, 408/429/5xx) the committed
+        offset is queried and the upload continues from there, so only the
+        unconfirmed part of the content is sent again.
+
+        Args:
+            upload_url: The resumable upload URL from _start_resumable_upload.
+            read_range: Returns an async iterator over bytes ``[start, end)``
+                of the content; called again for every (re)sent chunk.
+            total_size: Total content size in bytes.
+            start_offset: Byte offset to resume from (default: 0).
+            chunk_size: Bytes per chunk; None sizes chunks from total_size.
+            max_retries: Consecutive failed attempts allowed per chunk.
+
+        Raises:
+            httpx.HTTPStatusError: On a non-transient HTTP error, or when
+                retries are exhausted.
+            httpx.RequestError: When retries are exhausted on network errors.
+        """
+        chunk_size = chunk_size or _adaptive_chunk_size(total_size)
+        offset = start_offset
+        attempt = 0
 
         async with httpx.AsyncClient(timeout=300.0) as client:
-            response = await client.post(upload_url, headers=headers, content=file_stream())
-            response.raise_for_status()
+            while True:
+                end = min(offset + chunk_size, total_size)
+                is_last = end >= total_size
+                headers = self._upload_headers("upload, finalize" if is_last else "upload", offset)
+                try:
+                    async with self._core.request_slot():
+                        response = await client.post(
+                            upload_url, headers=headers, content=read_range(offset, end)
+                        )
+                    response.raise_for_status()
+                except (httpx.HTTPStatusError, httpx.RequestError) as e:
+                    attempt += 1
+                    if not _is_transient_upload_error(e) or attempt > max_retries:
+                        raise
+                    await asyncio.sleep(min(2.0**attempt, 30.0))
+                    progress = await self._query_upload_offset(upload_url, client)
+                    if progress is None:
+                        raise
+                    committed, finalized = progress
+                    if finalized:
+                        return
+                    logger.debug(
+                        "Upload chunk at %d failed (%s); resuming at %d", offset, e, committed
+                    )
+                    offset = committed
+                    continue
+
+                if is_last:
+                    return
+                attempt = 0
+                offset = end
@@ -0,0 +1,280 @@
+"""Synchronise a local directory of files into a notebook.
+
+``DirectorySync`` records, per file, the content hash and the source it was
+uploaded as. Each pass uploads only files whose content is not yet in the
+notebook, replaces sources of changed files and deletes sources of files
+that disappeared. The record is kept on disk, so restarting never uploads
+unchanged files again.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._callbacks import invoke_callback
+from ._fingerprints import hash_file
+from .exceptions import NotebookLMError
+from .paths import get_cache_dir
+from .types import SyncReport
+
+if TYPE_CHECKING:
+    from ._sources import SourcesAPI
+
+logger = logging.getLogger(__name__)
+
+SyncCallback = Callable[[SyncReport], Awaitable[None] | None]
+
+
+class DirectorySync:
+    """Keep a notebook's file sources in step with a local directory.
+
+    Usage:
+        async with NotebookLMClient.from_storage() as client:
+            sync = DirectorySync(client.sources, nb_id, "papers/", pattern="*.pdf")
+            report = await sync.sync()          # one pass
+            await sync.watch(interval=10)       # or keep syncing until cancelled
+    """
+
+    def __init__(
+        self,
+        sources: "SourcesAPI",
+        notebook_id: str,
+        directory: str | Path,
+        pattern: str = "*",
+        recursive: bool = False,
+        delete_missing: bool = True,
+        max_concurrency: int = 4,
+        state_path: str | Path | None = None,
+    ):
+        """Initialize the synchroniser.
+
+        Args:
+            sources: The client's SourcesAPI.
+            notebook_id: Notebook to sync into.
+            directory: Local directory to mirror.
+            pattern: Glob pattern selecting files (default: all files).
+            recursive: Include files in subdirectories.
+            delete_missing: Delete sources whose files vanished or changed.
+                If False, replaced and orphaned sources are left in place.
+            max_concurrency: Maximum uploads/deletes at once (default: 4).
+            state_path: JSON file recording path → hash → source ID.
+                Defaults to a file under ``get_cache_dir() / "sync"`` unique
+                to this notebook and directory.
+        """
+        self._sources = sources
+        self.notebook_id = notebook_id
+        self.directory = Path(directory).resolve()
+        self.pattern = pattern
+        self.recursive = recursive
+        self.delete_missing = delete_missing
+        self.max_concurrency = max_concurrency
+        if state_path is None:
+            key = hashlib.sha256(f"{notebook_id}\0{self.directory}".encode()).hexdigest()[:16]
+            state_path = get_cache_dir() / "sync" / f"{key}.json"
+        self.state_path = Path(state_path)
+
+    async def sync(self) -> SyncReport:
+        """Run one synchronisation pass.
+
+        Returns:
+            What was uploaded, replaced, renamed, deleted or failed.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+        """
+        if not self.directory.is_dir():
+            raise FileNotFoundError(f"Directory not found: {self.directory}")
+
+        state = self._load_state()
+        files = await asyncio.to_thread(self._scan, state)
+        live_ids = {source.id for source in await self._sources.list(self.notebook_id)}
+        report = SyncReport()
+
+        # Content already in the notebook, by hash (covers renames and copies)
+        known: dict[str, str] = {
+            entry["sha256"]: entry["source_id"]
+            for entry in state.values()
+            if entry.get("source_id") in live_ids
+        }
+
+        new_state: dict[str, dict[str, Any]] = {}
+        to_upload: list[str] = []
+        for rel_path, (sha256, size, mtime_ns) in files.items():
+            entry = {"sha256": sha256, "size": size, "mtime_ns": mtime_ns}
+            previous = state.get(rel_path)
+            if sha256 in known:
+                new_state[rel_path] = {**entry, "source_id": known[sha256]}
+                if previous and previous.get("sha256") == sha256:
+                    report.unchanged.append(rel_path)
+                else:
+                    report.renamed.append(rel_path)
+            else:
+                to_upload.append(rel_path)
+
+        if to_upload:
+            results = await self._sources.add_many(
+                self.notebook_id,
+                [self.directory / rel_path for rel_path in to_upload],
+                concurrency=self.max_concurrency,
+                skip_existing=False,
+            )
+            uploaded: dict[str, str] = {}
+            for rel_path, result in zip(to_upload, results, strict=True):
+                sha256, size, mtime_ns = files[rel_path]
+                if result.is_added and result.source:
+                    uploaded[sha256] = result.source.id
+                if sha256 in uploaded:
+                    new_state[rel_path] = {
+                        "sha256": sha256,
+                        "size": size,
+                        "mtime_ns": mtime_ns,
+                        "source_id": uploaded[sha256],
+                    }
+                    (report.updated if rel_path in state else report.added).append(rel_path)
+                else:
+                    report.failed[rel_path] = result.error or "upload failed"
+                    if rel_path in state:
+                        # Keep the old source until the new version uploads
+                        new_state[rel_path] = state[rel_path]
+
+        # Sources no file maps to any more: their file vanished or changed
+        referenced = {entry["source_id"] for entry in new_state.values()}
+        previous_ids = {entry["source_id"] for entry in state.values()}
+        orphaned = sorted((previous_ids - referenced) & live_ids)
+        if self.delete_missing and orphaned:
+            report.deleted = await self._delete(orphaned, report)
+
+        self._save_state(new_state)
+        return report
+
+    async def watch(
+        self,
+        interval: float = 5.0,
+        debounce: float = 2.0,
+        on_sync: SyncCallback | None = None,
+    ) -> None:
+        """Sync now, then keep syncing whenever the directory changes.
+
+        The directory is polled every ``interval`` seconds. After a change,
+        the next pass waits until nothing has changed for ``debounce``
+        seconds, so a batch of files being copied in is uploaded together.
+        Runs until cancelled.
+
+        Args:
+            interval: Seconds between directory scans (default: 5).
+            debounce: Quiet period before syncing a change (default: 2).
+            on_sync: Optional callback (sync or async) receiving each
+                pass's SyncReport.
+        """
+        last = await asyncio.to_thread(self._snapshot)
+        await self._run_pass(on_sync)
+        while True:
+            await asyncio.sleep(interval)
+            current = await asyncio.to_thread(self._snapshot)
+            if current == last:
+                continue
+            while True:
+                await asyncio.sleep(debounce)
+                settled = await asyncio.to_thread(self._snapshot)
+                if settled == current:
+                    break
+                current = settled
+            last = current
+            await self._run_pass(on_sync)
+
+    async def _run_pass(self, on_sync: SyncCallback | None) -> None:
+        try:
+            report = await self.sync()
+        except (NotebookLMError, OSError) as e:
+            # Keep watching; the next change (or restart) retries
+            logger.warning("Directory sync pass failed: %s", e)
+            return
+        await invoke_callback(on_sync, report)
+
+    async def _delete(self, source_ids: list[str], report: SyncReport) -> list[str]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        deleted: list[str] = []
+
+        async def delete_one(source_id: str) -> None:
+            async with semaphore:
+                try:
+                    await self._sources.delete(self.notebook_id, source_id)
+                    deleted.append(source_id)
+                except NotebookLMError as e:
+                    report.failed[source_id] = str(e)
+
+        await asyncio.gather(*(delete_one(source_id) for source_id in source_ids))
+        return sorted(deleted)
+
+    def _iter_files(self) -> list[Path]:
+        paths = (
+            self.directory.rglob(self.pattern)
+            if self.recursive
+            else self.directory.glob(self.pattern)
+        )
+        return sorted(p for p in paths if p.is_file() and not p.name.startswith("."))
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        """Cheap change signature: (size, mtime) per file."""
+        snapshot = {}
+        for path in self._iter_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path.relative_to(self.directory).as_posix()] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def _scan(self, state: dict[str, dict[str, Any]]) -> dict[str, tuple[str, int, int]]:
+        """Hash files, reusing recorded hashes when size and mtime are unchanged."""
+        files = {}
+        for rel_path, (size, mtime_ns) in self._snapshot().items():
+            previous = state.get(rel_path)
+            if previous and previous.get("size") == size and previous.get("mtime_ns") == mtime_ns:
+                sha256 = previous["sha256"]
+            else:
+                try:
+                    sha256 = hash_file(self.directory / rel_path)
+                except OSError as e:
+                    logger.warning("Skipping unreadable file %s: %s", rel_path, e)
+                    continue
+            files[rel_path] = (sha256, size, mtime_ns)
+        return files
+
+    def _load_state(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("notebook_id") != self.notebook_id:
+            return {}
+        files = data.get("files")
+        if not isinstance(files, dict):
+            return {}
+        return {
+            path: entry
+            for path, entry in files.items()
+            if isinstance(entry, dict) and "sha256" in entry and "source_id" in entry
+        }
+
+    def _save_state(self, files: dict[str, dict[str, Any]]) -> None:
+        """Write the state atomically; failures are logged and ignored."""
+        data = {"notebook_id": self.notebook_id, "directory": str(self.directory), "files": files}
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            fd, tmp_name = tempfile.mkstemp(dir=self.state_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_name, self.state_path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning("Failed to save sync state: %s", e)
@@ -0,0 +1,126 @@
+"""Persisted resumable upload sessions.
+
+``add_file`` uploads through Google's resumable upload protocol. The upload
+URL it gets back stays valid for a while after a crash, so recording it lets
+a restarted process ask the server how many bytes were committed and
+continue from there instead of uploading the file again from byte zero.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .paths import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Sessions older than this are not resumed (the server expires them too)
+DEFAULT_SESSION_MAX_AGE = 24 * 60 * 60
+
+
+@dataclass
+class UploadSession:
+    """A started resumable upload that has not been confirmed complete."""
+
+    upload_url: str
+    source_id: str
+    created_at: float
+
+
+class UploadSessionStore:
+    """Resumable upload sessions keyed by notebook and file, persisted as JSON.
+
+    Usage:
+        store = UploadSessionStore()  # ~/.notebooklm/cache/upload_sessions.json
+        async with NotebookLMClient(auth, upload_sessions=store) as client:
+            await client.sources.add_file(nb_id, "large.pdf")
+    """
+
+    def __init__(self, path: str | Path | None = None, max_age: float = DEFAULT_SESSION_MAX_AGE):
+        """Initialize the session store.
+
+        Args:
+            path: JSON file to persist sessions in. Defaults to
+                ``get_cache_dir() / "upload_sessions.json"``.
+            max_age: Seconds after which a session is no longer resumed.
+        """
+        self.path = Path(path) if path else get_cache_dir() / "upload_sessions.json"
+        self.max_age = max_age
+        self._sessions: dict[str, dict] | None = None
+
+    @staticmethod
+    def session_key(notebook_id: str, file_path: Path) -> str:
+        """Key identifying one upload of one version of a file.
+
+        Includes the file's size and modification time so an edited file is
+        never resumed onto a session holding its old bytes.
+        """
+        stat = file_path.stat()
+        raw = f"{notebook_id}\0{file_path}\0{stat.st_size}\0{stat.st_mtime_ns}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> UploadSession | None:
+        """Return the unexpired session for ``key``, or None."""
+        entry = self._load().get(key)
+        if entry is None:
+            return None
+        try:
+            session = UploadSession(
+                upload_url=str(entry["upload_url"]),
+                source_id=str(entry["source_id"]),
+                created_at=float(entry["created_at"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            self.remove(key)
+            return None
+        if time.time() - session.created_at > self.max_age:
+            self.remove(key)
+            return None
+        return session
+
+    def put(self, key: str, upload_url: str, source_id: str) -> None:
+        """Record a started upload session."""
+        self._load()[key] = {
+            "upload_url": upload_url,
+            "source_id": source_id,
+            "created_at": time.time(),
+        }
+        self._save()
+
+    def remove(self, key: str) -> None:
+        """Forget a session once its upload has finished or is unusable."""
+        if self._load().pop(key, None) is not None:
+            self._save()
+
+    def _load(self) -> dict[str, dict]:
+        if self._sessions is None:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            self._sessions = (
+                {key: value for key, value in data.items() if isinstance(value, dict)}
+                if isinstance(data, dict)
+                else {}
+            )
+        return self._sessions
+
+    def _save(self) -> None:
+        """Write sessions atomically; failures are logged and ignored."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._sessions, f)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug("Failed to save upload sessions: %s", e)
@@ -5,7 +5,7 @@ flagged by CodeQL (py/incomplete-url-substring-sanitization).
 """
 
 import re
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlunparse
 
 
 def is_youtube_url(url: str) -> bool:
@@ -64,3 +64,35 @@ def contains_google_auth_redirect(text: str) -> bool:
     url_pattern = r'https?://[^\s"\'<>]+'
     urls = re.findall(url_pattern, text)
     return any(is_google_auth_redirect(url) for url in urls)
+
+
+def normalize_source_url(url: str) -> str:
+    """Normalize a URL for duplicate-source comparison.
+
+    Lowercases the scheme and hostname, drops the fragment and any trailing
+    slash on the path. Query strings are kept because they often select
+    content (e.g. YouTube ``?v=``).
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Normalized URL, or the stripped input if it cannot be parsed
+    """
+    url = url.strip()
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return url
+    if not parsed.scheme or not parsed.netloc:
+        return url
+    return urlunparse(
+        (
+            parsed.scheme.lower(),
+            parsed.netloc.lower(),
+            parsed.path.rstrip("/"),
+            parsed.params,
+            parsed.query,
+            "",
+        )
+    )
@@ -16,6 +16,7 @@ import json
 import click
 from rich.table import Table
 
+from .._polling import GenerationStats
 from ..client import NotebookLMClient
 from ..rpc import ExportType
 from .helpers import (
@@ -354,7 +355,7 @@ def artifact_wait(ctx, artifact_id, notebook_id, timeout, interval, json_output,
     nb_id = require_notebook(notebook_id)
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        async with NotebookLMClient(client_auth, generation_stats=GenerationStats()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             resolved_id = await resolve_artifact_id(client, nb_id_resolved, artifact_id)
 
@@ -6,11 +6,16 @@ Commands:
     history    Get conversation history or clear local cache
 """
 
+import json
 import logging
+from contextlib import closing
+from dataclasses import asdict
 
 import click
 from rich.table import Table
 
+from .._answers import AnswerCache
+from .._conversations import SQLiteConversationStore
 from ..client import NotebookLMClient
 from ..types import ChatMode
 from .helpers import (
@@ -85,11 +90,80 @@ async def _get_latest_conversation_from_history(
     return None
 
 
+async def _stream_answer(client, notebook_id, question, source_ids, conversation_id):
+    """Print an answer as it streams in and return the final AskResult."""
+    console.print("[bold cyan]Answer:[/bold cyan]")
+    result = None
+    async for chunk in client.chat.ask_stream(
+        notebook_id, question, source_ids=source_ids, conversation_id=conversation_id
+    ):
+        if chunk.replaced:
+            # The server revised earlier text; start the answer over
+            console.print("\n[dim](revised)[/dim]")
+        if chunk.delta:
+            console.print(chunk.delta, end="", markup=False, highlight=False, soft_wrap=True)
+        if chunk.result is not None:
+            result = chunk.result
+    console.print()
+    return result
+
+
+def _read_batch(path: str) -> list[dict]:
+    """Read a JSONL batch file into records that each have a "question" key.
+
+    Each line is a JSON string or an object with a "question" field; other
+    fields are copied into that question's output record.
+    """
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise click.UsageError(f"{path}:{line_number}: invalid JSON: {e}") from e
+            if isinstance(record, str):
+                record = {"question": record}
+            if not isinstance(record, dict) or not isinstance(record.get("question"), str):
+                raise click.UsageError(
+                    f'{path}:{line_number}: expected a JSON string or an object with a "question"'
+                )
+            records.append(record)
+    return records
+
+
+async def _run_batch(client, notebook_id, records, source_ids, concurrency, use_cache, out):
+    """Ask all batch questions, writing one JSONL record per answer as it finishes."""
+
+    def write(result):
+        record = dict(records[result.index])
+        answer = result.result
+        record.update(
+            status=result.status,
+            answer=answer.answer if answer else None,
+            conversation_id=answer.conversation_id if answer else None,
+            references=[asdict(ref) for ref in answer.references] if answer else [],
+            error=result.error,
+        )
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+
+    return await client.chat.ask_many(
+        notebook_id,
+        [record["question"] for record in records],
+        source_ids=source_ids,
+        concurrency=concurrency,
+        use_cache=use_cache,
+        on_result=write,
+    )
+
+
 def register_chat_commands(cli):
     """Register chat commands on the main CLI group."""
 
     @cli.command("ask")
-    @click.argument("question")
+    @click.argument("question", required=False)
     @click.option(
         "-n",
         "--notebook",
@@ -109,6 +183,33 @@ def register_chat_commands(cli):
     @click.option(
         "--json", "json_output", is_flag=True, help="Output as JSON (includes references)"
     )
+    @click.option("--stream", is_flag=True, help="Print the answer as it is generated")
+    @click.option(
+        "--batch",
+        "batch_file",
+        type=click.Path(exists=True, dir_okay=False),
+        default=None,
+        help="Ask every question in a JSONL file (one new conversation each)",
+    )
+    @click.option(
+        "-o",
+        "--output",
+        type=click.Path(dir_okay=False, writable=True),
+        default=None,
+        help="With --batch: write JSONL results here instead of stdout",
+    )
+    @click.option(
+        "--concurrency",
+        type=click.IntRange(min=1),
+        default=5,
+        show_default=True,
+        help="With --batch: questions asked at once",
+    )
+    @click.option(
+        "--no-cache",
+        is_flag=True,
+        help="With --batch: ask again even if an answer is cached",
+    )
     @with_client
     def ask_cmd(
         ctx,
@@ -118,6 +219,11 @@ def register_chat_commands(cli):
         new_conversation,
         source_ids,
         json_output,
+        stream,
+        batch_file,
+        output,
+        concurrency,
+        no_cache,
         client_auth,
     ):
         """Ask a notebook a question.
@@ -133,51 +239,117 @@ def register_chat_commands(cli):
           notebooklm ask -c <id> "continue this one"
           notebooklm ask -s src_001 -s src_002 "question about specific sources"
           notebooklm ask "explain X" --json     # Get answer with source references
+          notebooklm ask --stream "long question"  # Print the answer live
+          notebooklm ask --batch questions.jsonl -o answers.jsonl
+
+        \b
+        Batch mode:
+          Each line of the --batch file is a JSON string or an object with a
+          "question" field. Results are written as JSONL in completion order,
+          with the input fields plus status, answer, conversation_id,
+          references and error. Answers are cached locally per notebook,
+          source set and question, so re-runs only ask new questions.
         """
+        if stream and json_output:
+            raise click.UsageError("Cannot specify both --stream and --json")
+        if batch_file:
+            if question:
+                raise click.UsageError("Cannot specify both QUESTION and --batch")
+            # Every batch question starts its own conversation
+            for flag, given in (
+                ("--stream", stream),
+                ("--conversation-id", conversation_id),
+                ("--new", new_conversation),
+            ):
+                if given:
+                    raise click.UsageError(f"Cannot specify both {flag} and --batch")
+        elif not question:
+            raise click.UsageError("Missing argument 'QUESTION' (or use --batch)")
         nb_id = require_notebook(notebook_id)
 
-        async def _run():
-            async with NotebookLMClient(client_auth) as client:
-                nb_id_resolved = await resolve_notebook_id(client, nb_id)
-                effective_conv_id = _determine_conversation_id(
-                    new_conversation=new_conversation,
-                    explicit_conversation_id=conversation_id,
-                    explicit_notebook_id=notebook_id,
-                    resolved_notebook_id=nb_id_resolved,
-                    json_output=json_output,
-                )
-
-                # If no conversation ID yet, try to get the most recent one from history
-                if effective_conv_id is None and not new_conversation:
-                    effective_conv_id = await _get_latest_conversation_from_history(
-                        client, nb_id_resolved, json_output
-                    )
-
-                sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
-                result = await client.chat.ask(
-                    nb_id_resolved, question, source_ids=sources, conversation_id=effective_conv_id
-                )
-
-                if result.conversation_id:
-                    set_current_conversation(result.conversation_id)
-
-                if json_output:
-                    from dataclasses import asdict
+        if batch_file:
+            records = _read_batch(batch_file)
+
+            async def _run_batch_cmd():
+                with closing(AnswerCache()) as cache:
+                    async with NotebookLMClient(client_auth, answer_cache=cache) as client:
+                        nb_id_resolved = await resolve_notebook_id(client, nb_id)
+                        sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
+                        with click.open_file(output or "-", "w", encoding="utf-8") as out:
+                            results = await _run_batch(
+                                client,
+                                nb_id_resolved,
+                                records,
+                                sources,
+                                concurrency,
+                                not no_cache,
+                                out,
+                            )
+                        if output:
+                            cached = sum(r.is_cached for r in results)
+                            failed = sum(r.is_failed for r in results)
+                            console.print(
+                                f"Answered {len(results) - cached - failed}, cached {cached}, "
+                                f"failed {failed} → {output}"
+                            )
+                        if any(r.is_failed for r in results):
+                            raise SystemExit(1)
 
-                    data = asdict(result)
-                    # Exclude raw_response from CLI output for brevity
-                    del data["raw_response"]
-                    json_output_response(data)
-                    return
+            return _run_batch_cmd()
 
-                console.print("[bold cyan]Answer:[/bold cyan]")
-                console.print(result.answer)
-                if result.is_follow_up:
-                    console.print(
-                        f"\n[dim]Conversation: {result.conversation_id} (turn {result.turn_number or '?'})[/dim]"
+        async def _run():
+            # Turns are kept on disk so the next `ask` can send them as history
+            with closing(SQLiteConversationStore()) as store:
+                async with NotebookLMClient(client_auth, conversation_store=store) as client:
+                    nb_id_resolved = await resolve_notebook_id(client, nb_id)
+                    effective_conv_id = _determine_conversation_id(
+                        new_conversation=new_conversation,
+                        explicit_conversation_id=conversation_id,
+                        explicit_notebook_id=notebook_id,
+                        resolved_notebook_id=nb_id_resolved,
+                        json_output=json_output,
                     )
-                else:
-                    console.print(f"\n[dim]New conversation: {result.conversation_id}[/dim]")
+
+                    # If no conversation ID yet, try to get the most recent one from history
+                    if effective_conv_id is None and not new_conversation:
+                        effective_conv_id = await _get_latest_conversation_from_history(
+                            client, nb_id_resolved, json_output
+                        )
+
+                    sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
+                    if stream:
+                        result = await _stream_answer(
+                            client, nb_id_resolved, question, sources, effective_conv_id
+                        )
+                    else:
+                        result = await client.chat.ask(
+                            nb_id_resolved,
+                            question,
+                            source_ids=sources,
+                            conversation_id=effective_conv_id,
+                        )
+
+                    if result.conversation_id:
+                        set_current_conversation(result.conversation_id)
+
+                    if json_output:
+                        from dataclasses import asdict
+
+                        data = asdict(result)
+                        # Exclude raw_response from CLI output for brevity
+                        del data["raw_response"]
+                        json_output_response(data)
+                        return
+
+                    if not stream:
+                        console.print("[bold cyan]Answer:[/bold cyan]")
+                        console.print(result.answer)
+                    if result.is_follow_up:
+                        console.print(
+                            f"\n[dim]Conversation: {result.conversation_id} (turn {result.turn_number or '?'})[/dim]"
+                        )
+                    else:
+                        console.print(f"\n[dim]New conversation: {result.conversation_id}[/dim]")
 
         return _run()
 
@@ -292,39 +464,42 @@ def register_chat_commands(cli):
         """
 
         async def _run():
-            async with NotebookLMClient(client_auth) as client:
-                if clear_cache:
-                    result = client.chat.clear_cache()
-                    if result:
-                        console.print("[green]Local conversation cache cleared[/green]")
-                    else:
-                        console.print("[yellow]No cache to clear[/yellow]")
-                    return
-
-                nb_id = require_notebook(notebook_id)
-                nb_id_resolved = await resolve_notebook_id(client, nb_id)
-                history = await client.chat.get_history(nb_id_resolved, limit=limit)
-
-                if history:
-                    console.print("[bold cyan]Conversation History:[/bold cyan]")
-                    try:
-                        conversations = history[0] if history else []
-                        if conversations:
-                            table = Table()
-                            table.add_column("#", style="dim")
-                            table.add_column("Conversation ID", style="cyan")
-                            for i, conv in enumerate(conversations, 1):
-                                conv_id = conv[0] if isinstance(conv, list) and conv else str(conv)
-                                table.add_row(str(i), conv_id)
-                            console.print(table)
-                            console.print(
-                                "\n[dim]Note: Only conversation IDs available. Use 'notebooklm ask -c <id>' to continue.[/dim]"
-                            )
+            with closing(SQLiteConversationStore()) as store:
+                async with NotebookLMClient(client_auth, conversation_store=store) as client:
+                    if clear_cache:
+                        result = client.chat.clear_cache()
+                        if result:
+                            console.print("[green]Local conversation cache cleared[/green]")
                         else:
-                            console.print("[yellow]No conversations found[/yellow]")
-                    except (IndexError, TypeError):
-                        console.print(history)
-                else:
-                    console.print("[yellow]No conversation history[/yellow]")
+                            console.print("[yellow]No cache to clear[/yellow]")
+                        return
+
+                    nb_id = require_notebook(notebook_id)
+                    nb_id_resolved = await resolve_notebook_id(client, nb_id)
+                    history = await client.chat.get_history(nb_id_resolved, limit=limit)
+
+                    if history:
+                        console.print("[bold cyan]Conversation History:[/bold cyan]")
+                        try:
+                            conversations = history[0] if history else []
+                            if conversations:
+                                table = Table()
+                                table.add_column("#", style="dim")
+                                table.add_column("Conversation ID", style="cyan")
+                                for i, conv in enumerate(conversations, 1):
+                                    conv_id = (
+                                        conv[0] if isinstance(conv, list) and conv else str(conv)
+                                    )
+                                    table.add_row(str(i), conv_id)
+                                console.print(table)
+                                console.print(
+                                    "\n[dim]Note: Only conversation IDs available. Use 'notebooklm ask -c <id>' to continue.[/dim]"
+                                )
+                            else:
+                                console.print("[yellow]No conversations found[/yellow]")
+                        except (IndexError, TypeError):
+                            console.print(history)
+                    else:
+                        console.print("[yellow]No conversation history[/yellow]")
 
         return _run()
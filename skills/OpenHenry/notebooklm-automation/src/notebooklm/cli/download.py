@@ -18,6 +18,7 @@ from typing import Any, TypedDict
 
 import click
 
+from .._cache import ArtifactCache
 from ..auth import AuthTokens, fetch_tokens, load_auth_from_storage
 from ..client import NotebookLMClient
 from ..types import Artifact, ArtifactType
@@ -141,7 +142,7 @@ async def _download_artifacts_generic(
     auth = AuthTokens(cookies=cookies, csrf_token=csrf, session_id=session_id)
 
     async def _download() -> dict[str, Any]:
-        async with NotebookLMClient(auth) as client:
+        async with NotebookLMClient(auth, artifact_cache=ArtifactCache()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
 
             # Setup download method dispatch
@@ -750,7 +751,7 @@ async def _download_interactive(
     csrf, session_id = await fetch_tokens(cookies)
     auth = AuthTokens(cookies=cookies, csrf_token=csrf, session_id=session_id)
 
-    async with NotebookLMClient(auth) as client:
+    async with NotebookLMClient(auth, artifact_cache=ArtifactCache()) as client:
         nb_id_resolved = await resolve_notebook_id(client, nb_id)
         ext = FORMAT_EXTENSIONS[output_format]
         path = output_path or f"{artifact_type}{ext}"
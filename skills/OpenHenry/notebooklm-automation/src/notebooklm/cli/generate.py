@@ -18,6 +18,7 @@ from typing import Any
 
 import click
 
+from .._polling import GenerationStats
 from ..client import NotebookLMClient
 from ..types import (
     AudioFormat,
@@ -363,7 +364,7 @@ def generate_audio(
     }
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        async with NotebookLMClient(client_auth, generation_stats=GenerationStats()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
 
@@ -462,7 +463,7 @@ def generate_video(
     }
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        async with NotebookLMClient(client_auth, generation_stats=GenerationStats()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
 
@@ -545,7 +546,7 @@ def generate_slide_deck(
     }
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        async with NotebookLMClient(client_auth, generation_stats=GenerationStats()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
 
@@ -618,7 +619,7 @@ def generate_quiz(
     }
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        async with NotebookLMClient(client_auth, generation_stats=GenerationStats()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
 
@@ -690,7 +691,7 @@ def generate_flashcards(
     }
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        async with NotebookLMClient(client_auth, generation_stats=GenerationStats()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
 
@@ -772,7 +773,7 @@ def generate_infographic(
     }
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        async with NotebookLMClient(client_auth, generation_stats=GenerationStats()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
 
@@ -833,7 +834,7 @@ def generate_data_table(
     nb_id = require_notebook(notebook_id)
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        async with NotebookLMClient(client_auth, generation_stats=GenerationStats()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
 
@@ -873,7 +874,7 @@ def generate_mind_map(ctx, notebook_id, source_ids, json_output, client_auth):
     nb_id = require_notebook(notebook_id)
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        async with NotebookLMClient(client_auth, generation_stats=GenerationStats()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
 
@@ -991,7 +992,7 @@ def generate_report_cmd(
     }[actual_format]
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        async with NotebookLMClient(client_auth, generation_stats=GenerationStats()) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             sources = await resolve_source_ids(client, nb_id_resolved, source_ids)
 
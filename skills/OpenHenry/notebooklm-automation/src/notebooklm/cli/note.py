@@ -7,6 +7,8 @@ Commands:
     save    Update note content
     rename  Rename a note
     delete  Delete a note
+    export  Export notes to Markdown files
+    import  Create or update notes from Markdown files
 """
 
 import click
@@ -16,6 +18,7 @@ from ..client import NotebookLMClient
 from ..types import Note
 from .helpers import (
     console,
+    json_output_response,
     require_notebook,
     resolve_note_id,
     resolve_notebook_id,
@@ -34,6 +37,8 @@ def note():
       get     Get note content
       save    Update note content
       delete  Delete a note
+      export  Export notes to Markdown files
+      import  Create or update notes from Markdown files
 
     \b
     Partial ID Support:
@@ -252,3 +257,115 @@ def note_delete(ctx, note_id, notebook_id, yes, client_auth):
             console.print(f"[green]Deleted note:[/green] {resolved_id}")
 
     return _run()
+
+
+@note.command("export")
+@click.option(
+    "-n",
+    "--notebook",
+    "notebook_ids",
+    multiple=True,
+    help="Notebook ID, repeatable (uses current if not set)",
+)
+@click.option(
+    "-o",
+    "--output",
+    "output_dir",
+    required=True,
+    type=click.Path(file_okay=False),
+    help="Directory to write <notebook_id>/<title>.md files into",
+)
+@with_client
+def note_export(ctx, notebook_ids, output_dir, client_auth):
+    """Export all notes to Markdown files.
+
+    Each note is written with a front matter header holding its ID, so the
+    files can be edited and applied back with 'note import'. Re-exports only
+    rewrite notes that changed.
+
+    \b
+    Examples:
+      notebooklm note export -o notes/
+      notebooklm note export -n nb_a -n nb_b -o notes/
+    """
+    nb_ids = notebook_ids or (require_notebook(None),)
+
+    async def _run():
+        async with NotebookLMClient(client_auth) as client:
+            resolved = [await resolve_notebook_id(client, nb_id) for nb_id in nb_ids]
+            with console.status(f"Exporting notes of {len(resolved)} notebook(s)..."):
+                written = await client.notes.export_markdown(resolved, output_dir)
+            console.print(f"[green]Exported {len(written)} changed note(s) to {output_dir}[/green]")
+
+    return _run()
+
+
+@note.command("import")
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "-n",
+    "--notebook",
+    "notebook_id",
+    default=None,
+    help="Notebook ID (uses current if not set)",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Notes created or updated at once (default: 4)",
+)
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@with_client
+def note_import(ctx, directory, notebook_id, concurrency, json_output, client_auth):
+    """Create or update notes from a directory of Markdown files.
+
+    Files are matched to notes by the note ID in their front matter (as
+    written by 'note export'), or else by title. Only notes whose title or
+    content differ are updated; unmatched files become new notes.
+
+    \b
+    Examples:
+      notebooklm note import notes/nb_123 -n nb_123
+      notebooklm note import drafts/ --json
+    """
+    nb_id = require_notebook(notebook_id)
+
+    async def _run():
+        async with NotebookLMClient(client_auth) as client:
+            nb_id_resolved = await resolve_notebook_id(client, nb_id)
+            with console.status("Importing notes..."):
+                results = await client.notes.import_markdown(
+                    nb_id_resolved, directory, concurrency=concurrency
+                )
+
+            counts = dict.fromkeys(("created", "updated", "unchanged", "failed"), 0)
+            for r in results:
+                counts[r.status] += 1
+            if json_output:
+                json_output_response(
+                    {
+                        **counts,
+                        "results": [
+                            {
+                                "path": r.path,
+                                "status": r.status,
+                                "note_id": r.note.id if r.note else None,
+                                "error": r.error,
+                            }
+                            for r in results
+                        ],
+                    }
+                )
+            else:
+                for r in results:
+                    if r.is_failed:
+                        console.print(f"[red]✗[/red] {r.path}: {r.error}")
+                console.print(
+                    f"[green]{counts['created']} created, {counts['updated']} updated[/green], "
+                    f"{counts['unchanged']} unchanged, {counts['failed']} failed"
+                )
+            if counts["failed"]:
+                raise SystemExit(1)
+
+    return _run()
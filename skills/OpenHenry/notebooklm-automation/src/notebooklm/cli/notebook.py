@@ -6,6 +6,7 @@ Commands:
     delete     Delete a notebook
     rename     Rename a notebook
     summary    Get notebook summary with AI-generated insights
+    inventory  Catalog every notebook's contents into JSONL or SQLite
 
 Note: Sharing commands moved to 'share' command group.
 """
@@ -13,7 +14,9 @@ Note: Sharing commands moved to 'share' command group.
 import click
 from rich.table import Table
 
+from .._inventory import open_inventory_writer, write_inventory
 from ..client import NotebookLMClient
+from ..exceptions import ValidationError
 from .helpers import (
     clear_context,
     console,
@@ -198,3 +201,70 @@ def register_notebook_commands(cli):
                     console.print("[yellow]No summary available[/yellow]")
 
         return _run()
+
+    @cli.command("inventory")
+    @click.option(
+        "-o",
+        "--output",
+        required=True,
+        type=click.Path(dir_okay=False),
+        help="Catalog file: .jsonl, or .db/.sqlite for an SQLite database",
+    )
+    @click.option(
+        "-n",
+        "--notebook",
+        "notebook_ids",
+        multiple=True,
+        help="Notebook ID, repeatable (default: all notebooks)",
+    )
+    @click.option(
+        "--concurrency",
+        default=4,
+        type=click.IntRange(min=1),
+        help="Notebooks read at once (default: 4)",
+    )
+    @with_client
+    def inventory_cmd(ctx, output, notebook_ids, concurrency, client_auth):
+        """Catalog sources, artifacts, notes and sharing of every notebook.
+
+        Notebooks are read concurrently and written to the catalog as each
+        one completes. An SQLite catalog is updated in place on re-runs; a run
+        over all notebooks also removes the ones deleted since.
+
+        \b
+        Examples:
+          notebooklm inventory -o catalog.jsonl
+          notebooklm inventory -o catalog.db --concurrency 8
+          notebooklm inventory -n nb_a -n nb_b -o subset.jsonl
+        """
+        try:
+            open_inventory_writer(output)  # validates the extension; opens nothing yet
+        except ValidationError as e:
+            raise click.UsageError(str(e)) from None
+
+        async def _run():
+            async with NotebookLMClient(client_auth) as client:
+                nb_ids = None
+                if notebook_ids:
+                    nb_ids = [await resolve_notebook_id(client, nb_id) for nb_id in notebook_ids]
+
+                incomplete = []
+
+                async def track():
+                    async for inv in client.inventory(nb_ids, concurrency=concurrency):
+                        if not inv.is_complete:
+                            incomplete.append(inv)
+                        yield inv
+
+                with console.status("Taking inventory..."):
+                    # A whole-account run also drops notebooks deleted since the last one
+                    count = await write_inventory(track(), output, prune=nb_ids is None)
+
+                console.print(f"[green]Inventoried {count} notebook(s) into {output}[/green]")
+                for inv in incomplete:
+                    parts = ", ".join(sorted(inv.errors))
+                    console.print(f"[yellow]{inv.notebook.id}: could not read {parts}[/yellow]")
+                if incomplete:
+                    raise SystemExit(1)
+
+        return _run()
@@ -3,9 +3,11 @@
 Commands:
     status      Check research status (single check)
     wait        Wait for research to complete (blocking)
+    sweep       Run many research queries and import the deduplicated results
 """
 
 import asyncio
+import json
 
 import click
 
@@ -28,6 +30,7 @@ def research():
     Commands:
       status    Check research status (non-blocking)
       wait      Wait for research to complete (blocking)
+      sweep     Run many queries in parallel, import deduplicated sources
 
     \b
     Use 'source add-research' to start a research session.
@@ -199,3 +202,162 @@ def research_wait(ctx, notebook_id, timeout, interval, import_all, json_output,
                     console.print(f"[green]Imported {len(imported)} sources[/green]")
 
     return _run()
+
+
+def _read_sweep_file(path: str) -> list[dict]:
+    """Read a JSONL sweep file into records that each have a "query" key.
+
+    Each line is a JSON string or an object with a "query" field and
+    optional "notebook" and "mode" fields.
+    """
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise click.UsageError(f"{path}:{line_number}: invalid JSON: {e}") from e
+            if isinstance(record, str):
+                record = {"query": record}
+            if not isinstance(record, dict) or not isinstance(record.get("query"), str):
+                raise click.UsageError(
+                    f'{path}:{line_number}: expected a JSON string or an object with a "query"'
+                )
+            records.append(record)
+    return records
+
+
+@research.command("sweep")
+@click.argument("queries", nargs=-1)
+@click.option(
+    "-n",
+    "--notebook",
+    "notebook_id",
+    default=None,
+    help="Notebook ID (uses current if not set)",
+)
+@click.option(
+    "--file",
+    "sweep_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help='JSONL file of queries: strings or {"query", "notebook", "mode"} objects',
+)
+@click.option(
+    "--mode",
+    type=click.Choice(["fast", "deep"]),
+    default="fast",
+    help="Default search mode (default: fast)",
+)
+@click.option(
+    "--from",
+    "search_source",
+    type=click.Choice(["web", "drive"]),
+    default="web",
+    help="Search source (default: web)",
+)
+@click.option("--no-import", is_flag=True, help="Only report the sources found")
+@click.option(
+    "--timeout",
+    default=600,
+    type=int,
+    help="Maximum seconds to wait for all queries (default: 600)",
+)
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@with_client
+def research_sweep(
+    ctx,
+    queries,
+    notebook_id,
+    sweep_file,
+    mode,
+    search_source,
+    no_import,
+    timeout,
+    json_output,
+    client_auth,
+):
+    """Run many research queries in parallel and import their sources.
+
+    All queries start at once; each notebook is polled with backoff until
+    its queries finish. The union of the sources found is imported with
+    duplicate URLs (and URLs already in the notebook) skipped.
+
+    \b
+    Examples:
+      notebooklm research sweep "solid-state batteries" "sodium-ion batteries"
+      notebooklm research sweep --file queries.jsonl --mode deep
+      notebooklm research sweep "topic" --no-import --json
+    """
+    records = [{"query": query} for query in queries]
+    if sweep_file:
+        records.extend(_read_sweep_file(sweep_file))
+    if not records:
+        raise click.UsageError("Provide QUERIES or --file")
+    default_nb = None
+    if any(not record.get("notebook") for record in records):
+        default_nb = require_notebook(notebook_id)
+
+    async def _run():
+        async with NotebookLMClient(client_auth) as client:
+            resolved: dict[str, str] = {}
+            jobs = []
+            for record in records:
+                nb_id = record.get("notebook") or default_nb
+                if nb_id not in resolved:
+                    resolved[nb_id] = await resolve_notebook_id(client, nb_id)
+                jobs.append(
+                    {
+                        "notebook_id": resolved[nb_id],
+                        "query": record["query"],
+                        "mode": record.get("mode", mode),
+                        "source": search_source,
+                    }
+                )
+
+            with console.status(f"Researching {len(jobs)} queries..."):
+                results = await client.research.run_many(
+                    jobs, import_sources=not no_import, timeout=timeout
+                )
+
+            failed = [r for r in results if not r.is_completed]
+            if json_output:
+                json_output_response(
+                    {
+                        "queries": len(results),
+                        "completed": len(results) - len(failed),
+                        "imported": sum(len(r.imported) for r in results),
+                        "results": [
+                            {
+                                "notebook_id": r.notebook_id,
+                                "query": r.query,
+                                "mode": r.mode,
+                                "status": r.status,
+                                "task_id": r.task_id,
+                                "sources_found": len(r.sources),
+                                "imported": len(r.imported),
+                                "error": r.error,
+                            }
+                            for r in results
+                        ],
+                    }
+                )
+            else:
+                for r in results:
+                    if r.is_completed:
+                        console.print(
+                            f"[green]✓[/green] {r.query}: {len(r.sources)} found, "
+                            f"{len(r.imported)} imported"
+                        )
+                    else:
+                        console.print(f"[red]✗[/red] {r.query}: {r.status} ({r.error})")
+                total = sum(len(r.imported) for r in results)
+                console.print(
+                    f"\n{len(results) - len(failed)}/{len(results)} queries completed, "
+                    f"{total} sources imported"
+                )
+            if failed:
+                raise SystemExit(1)
+
+    return _run()
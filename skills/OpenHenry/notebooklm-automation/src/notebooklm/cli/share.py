@@ -7,8 +7,11 @@ Commands:
     add          Share with a user
     update       Update user's permission
     remove       Remove user's access
+    apply        Apply a sharing spec to many notebooks
 """
 
+import json
+
 import click
 from rich.table import Table
 
@@ -58,6 +61,7 @@ def share():
       add          Share with a user (editor or viewer)
       update       Update user's permission level
       remove       Remove user's access
+      apply        Apply users x permission to many notebooks (minimal diff)
 
     \b
     Examples:
@@ -401,3 +405,220 @@ def share_remove(ctx, email, notebook_id, yes, json_output, client_auth):
             console.print(f"[green]Removed access for {email}[/green]")
 
     return _run()
+
+
+_SPEC_PERMISSIONS = {
+    "editor": SharePermission.EDITOR,
+    "viewer": SharePermission.VIEWER,
+    "remove": None,
+}
+
+
+def _parse_user_spec(value: str) -> tuple[str, SharePermission | None]:
+    """Parse an ``EMAIL=editor|viewer|remove`` option value."""
+    email, sep, permission = value.rpartition("=")
+    if not sep or not email or permission.lower() not in _SPEC_PERMISSIONS:
+        raise click.BadParameter(f"Expected EMAIL=editor|viewer|remove, got {value!r}")
+    return email, _SPEC_PERMISSIONS[permission.lower()]
+
+
+def _read_share_spec(path: str) -> dict:
+    """Read a JSON sharing spec: {"notebooks": [...] | "all", "users": {...}, "public": bool}."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            spec = json.load(f)
+    except ValueError as e:
+        raise click.UsageError(f"{path}: invalid JSON: {e}") from e
+    if not isinstance(spec, dict):
+        raise click.UsageError(f"{path}: expected a JSON object")
+    users = spec.get("users") or {}
+    if not isinstance(users, dict):
+        raise click.UsageError(f'{path}: "users" must map emails to editor/viewer/remove')
+    parsed = {}
+    for email, permission in users.items():
+        if not isinstance(permission, str) or permission.lower() not in _SPEC_PERMISSIONS:
+            raise click.UsageError(f"{path}: invalid permission for {email}: {permission!r}")
+        parsed[email] = _SPEC_PERMISSIONS[permission.lower()]
+    notebooks = spec.get("notebooks") or []
+    if notebooks != "all" and not isinstance(notebooks, list):
+        raise click.UsageError(f'{path}: "notebooks" must be a list of IDs or "all"')
+    public = spec.get("public")
+    if public is not None and not isinstance(public, bool):
+        raise click.UsageError(f'{path}: "public" must be true or false')
+    return {"notebooks": notebooks, "users": parsed, "public": public}
+
+
+def _change_summary(result) -> str:
+    """One-line description of a notebook's sharing changes."""
+    parts = []
+    if result.added:
+        parts.append(f"add {', '.join(result.added)}")
+    if result.updated:
+        parts.append(f"update {', '.join(result.updated)}")
+    if result.removed:
+        parts.append(f"remove {', '.join(result.removed)}")
+    if result.public is not None:
+        parts.append("make public" if result.public else "make private")
+    return "; ".join(parts) or "no changes"
+
+
+@share.command("apply")
+@click.option(
+    "-n",
+    "--notebook",
+    "notebook_ids",
+    multiple=True,
+    help="Notebook ID, repeatable. Supports partial IDs.",
+)
+@click.option("--all", "all_notebooks", is_flag=True, help="Apply to every notebook you own")
+@click.option(
+    "--user",
+    "-u",
+    "user_specs",
+    multiple=True,
+    help="EMAIL=editor|viewer|remove, repeatable",
+)
+@click.option(
+    "--public/--private",
+    "public",
+    default=None,
+    help="Also enable or disable public link sharing",
+)
+@click.option(
+    "--spec",
+    "spec_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help='JSON spec: {"notebooks": [...] or "all", "users": {email: permission}, "public": bool}',
+)
+@click.option("--notify", is_flag=True, help="Email newly added users")
+@click.option("--message", "-m", default="", help="Welcome message for newly added users")
+@click.option(
+    "--concurrency",
+    default=5,
+    type=click.IntRange(min=1),
+    help="Notebooks read or changed at once (default: 5)",
+)
+@click.option("--dry-run", is_flag=True, help="Only show the changes that would be made")
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation")
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@with_client
+def share_apply(
+    ctx,
+    notebook_ids,
+    all_notebooks,
+    user_specs,
+    public,
+    spec_file,
+    notify,
+    message,
+    concurrency,
+    dry_run,
+    yes,
+    json_output,
+    client_auth,
+):
+    """Apply a sharing spec (notebooks x users x permission) in bulk.
+
+    Reads the sharing status of every notebook concurrently and sends only
+    the changes needed: users are added, updated or removed, and the public
+    link toggled, only where they differ from the spec. Owners are never
+    changed. Without --yes, the planned changes are shown for confirmation.
+
+    \b
+    Examples:
+      notebooklm share apply --all -u leaver@example.com=remove -y
+      notebooklm share apply -n nb1 -n nb2 -u team@example.com=editor --notify
+      notebooklm share apply --spec onboarding.json --dry-run
+    """
+    spec = _read_share_spec(spec_file) if spec_file else {"notebooks": [], "users": {}}
+    users = dict(spec["users"])
+    users.update(_parse_user_spec(value) for value in user_specs)
+    if public is None:
+        public = spec.get("public")
+    use_all = all_notebooks or spec["notebooks"] == "all"
+    requested = list(notebook_ids) + ([] if use_all else list(spec["notebooks"]))
+    if use_all and notebook_ids:
+        raise click.UsageError("Cannot specify both --all and --notebook")
+    if not use_all and not requested:
+        raise click.UsageError("Provide --notebook, --all or a spec with notebooks")
+    if not users and public is None:
+        raise click.UsageError("Provide --user, --public/--private or a spec with users")
+
+    async def _run():
+        async with NotebookLMClient(client_auth) as client:
+            if use_all:
+                nb_ids = [nb.id for nb in await client.notebooks.list() if nb.is_owner]
+            else:
+                nb_ids = list(
+                    dict.fromkeys([await resolve_notebook_id(client, nb) for nb in requested])
+                )
+
+            async def run(plan_only: bool):
+                with console.status(f"Checking sharing of {len(nb_ids)} notebook(s)..."):
+                    return await client.sharing.apply_many(
+                        nb_ids,
+                        users,
+                        public=public,
+                        notify=notify,
+                        welcome_message=message,
+                        concurrency=concurrency,
+                        dry_run=plan_only,
+                    )
+
+            confirm = not (yes or dry_run or json_output)
+            results = await run(plan_only=dry_run or confirm)
+            if confirm:
+                pending = [r for r in results if r.has_changes]
+                for r in pending:
+                    console.print(f"{r.notebook_id}: {_change_summary(r)}")
+                if not pending:
+                    console.print("[green]All notebooks already match the spec[/green]")
+                    return
+                if not click.confirm(f"Apply changes to {len(pending)} notebook(s)?"):
+                    return
+                results = await run(plan_only=False)
+
+            if json_output:
+                json_output_response(
+                    {
+                        "dry_run": dry_run,
+                        "results": [
+                            {
+                                "notebook_id": r.notebook_id,
+                                "status": r.status,
+                                "added": r.added,
+                                "updated": r.updated,
+                                "removed": r.removed,
+                                "public": r.public,
+                                "skipped": r.skipped,
+                                "applied": r.applied,
+                                "error": r.error,
+                            }
+                            for r in results
+                        ],
+                    }
+                )
+            else:
+                for r in results:
+                    if r.is_failed:
+                        console.print(f"[red]✗[/red] {r.notebook_id}: {r.error}")
+                        if r.applied:
+                            planned = ("added", "updated", "removed", "public")
+                            missing = [
+                                step
+                                for step in planned
+                                if step not in r.applied and getattr(r, step) not in ([], None)
+                            ]
+                            console.print(
+                                f"  [yellow]applied: {', '.join(r.applied)}; "
+                                f"not applied: {', '.join(missing)}[/yellow]"
+                            )
+                    elif r.has_changes:
+                        console.print(f"{r.notebook_id}: {_change_summary(r)}")
+                changed = sum(r.has_changes and not r.is_failed for r in results)
+                verb = "would change" if dry_run else "changed"
+                console.print(f"[green]{changed} of {len(results)} notebook(s) {verb}[/green]")
+            if any(r.is_failed for r in results):
+                raise SystemExit(1)
+
+    return _run()
@@ -15,11 +15,18 @@ Commands:
 """
 
 import asyncio
+import re
+from contextlib import closing
+from dataclasses import asdict
 from pathlib import Path
 
 import click
+from rich.markup import escape
 from rich.table import Table
 
+from .._search import SourceIndex, fts_phrase
+from .._sync import DirectorySync
+from .._uploads import UploadSessionStore
 from .._url_utils import is_youtube_url
 from ..client import NotebookLMClient
 from ..types import source_status_to_str
@@ -45,11 +52,14 @@ def source():
       add          Add a source (url, text, file, youtube)
       get          Get source details
       fulltext     Get full indexed text content
+      grep         Search source fulltexts (local index)
+      sync-dir     Sync a local directory of files into the notebook
       guide        Get AI-generated source summary and keywords
       stale        Check if source needs refresh
       delete       Delete a source
       rename       Rename a source
       refresh      Refresh a URL/Drive source
+      refresh-stale  Refresh all stale URL/Drive sources
 
     \b
     Partial ID Support:
@@ -181,7 +191,9 @@ def source_add(ctx, content, notebook_id, source_type, title, mime_type, json_ou
             file_title = title or "Pasted Text"
 
     async def _run():
-        async with NotebookLMClient(client_auth) as client:
+        # Record file upload sessions so an interrupted upload resumes on retry
+        upload_sessions = UploadSessionStore() if detected_type == "file" else None
+        async with NotebookLMClient(client_auth, upload_sessions=upload_sessions) as client:
             nb_id_resolved = await resolve_notebook_id(client, nb_id)
             if detected_type == "url" or detected_type == "youtube":
                 src = await client.sources.add_url(nb_id_resolved, content)
@@ -353,6 +365,65 @@ def source_refresh(ctx, source_id, notebook_id, client_auth):
     return _run()
 
 
+@source.command("refresh-stale")
+@click.option(
+    "-n",
+    "--notebook",
+    "notebook_id",
+    default=None,
+    help="Notebook ID (uses current if not set)",
+)
+@click.option("--all", "all_notebooks", is_flag=True, help="Check sources in every notebook")
+@click.option("--no-wait", is_flag=True, help="Don't wait for refreshed sources to process")
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@with_client
+def source_refresh_stale(ctx, notebook_id, all_notebooks, no_wait, json_output, client_auth):
+    """Refresh all stale URL/Drive sources.
+
+    Checks freshness of every web page, YouTube and Google Drive source
+    concurrently and refreshes only the stale ones.
+
+    \b
+    Examples:
+      source refresh-stale                 # Current notebook
+      source refresh-stale --all --json    # Every notebook
+    """
+    nb_id = None if all_notebooks else require_notebook(notebook_id)
+
+    async def _run():
+        async with NotebookLMClient(client_auth) as client:
+            nb_id_resolved = await resolve_notebook_id(client, nb_id) if nb_id else None
+            with console.status("Checking source freshness..."):
+                results = await client.sources.refresh_stale(nb_id_resolved, wait=not no_wait)
+
+            failed = [r for r in results if r.status == "failed"]
+            if json_output:
+                json_output_response(
+                    {
+                        "results": [asdict(r) for r in results],
+                        "checked": len(results),
+                        "refreshed": sum(r.status == "refreshed" for r in results),
+                        "failed": len(failed),
+                    }
+                )
+            else:
+                for r in results:
+                    title = escape(r.title or r.source_id or f"notebook {r.notebook_id}")
+                    if r.status == "refreshed":
+                        console.print(f"[green]↻ {title}[/green] [dim]{r.source_id}[/dim]")
+                    elif r.status == "failed":
+                        console.print(f"[red]! {title}: {escape(r.error or 'failed')}[/red]")
+                refreshed = sum(r.status == "refreshed" for r in results)
+                console.print(
+                    f"[dim]{len(results)} checked, {refreshed} refreshed, "
+                    f"{len(failed)} failed[/dim]"
+                )
+            if failed:
+                raise SystemExit(1)
+
+    return _run()
+
+
 @source.command("add-drive")
 @click.argument("file_id")
 @click.argument("title")
@@ -459,17 +530,23 @@ def source_add_research(
                 )
                 return
 
-            status = None
-            for _ in range(60):
+            # Poll with backoff: fast research often finishes within seconds
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 300
+            interval = 2.0
+            while True:
                 status = await client.research.poll(nb_id_resolved)
                 if status.get("status") == "completed":
                     break
                 elif status.get("status") == "no_research":
                     console.print("[red]Research failed to start[/red]")
                     raise SystemExit(1)
-                await asyncio.sleep(5)
-            else:
-                status = {"status": "timeout"}
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    status = {"status": "timeout"}
+                    break
+                await asyncio.sleep(min(interval, remaining))
+                interval = min(interval * 2, 10.0)
 
             if status.get("status") == "completed":
                 sources = status.get("sources", [])
@@ -524,8 +601,6 @@ def source_fulltext(ctx, source_id, notebook_id, json_output, output, client_aut
                 fulltext = await client.sources.get_fulltext(nb_id_resolved, resolved_id)
 
             if json_output:
-                from dataclasses import asdict
-
                 json_output_response(asdict(fulltext))
                 return
 
@@ -553,6 +628,182 @@ def source_fulltext(ctx, source_id, notebook_id, json_output, output, client_aut
     return _run()
 
 
+@source.command("grep")
+@click.argument("query")
+@click.option(
+    "-n",
+    "--notebook",
+    "notebook_id",
+    default=None,
+    help="Notebook ID (uses current if not set)",
+)
+@click.option("--limit", default=20, type=int, help="Maximum results (default: 20)")
+@click.option("--fts", is_flag=True, help="Treat QUERY as FTS5 syntax (AND/OR/NOT, prefix*)")
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@with_client
+def source_grep(ctx, query, notebook_id, limit, fts, json_output, client_auth):
+    """Find sources whose full text mentions QUERY.
+
+    Searches a local full-text index kept in the cache directory. The first
+    search of a notebook downloads every source's text; later searches only
+    fetch sources added or renamed since.
+
+    \b
+    Examples:
+      source grep "attention mechanism"          # Exact phrase
+      source grep "optim* NOT adam" --fts        # FTS5 query syntax
+      source grep transformer --json
+    """
+    nb_id = require_notebook(notebook_id)
+    fts_query = query if fts else fts_phrase(query)
+
+    async def _run():
+        with closing(SourceIndex()) as index:
+            async with NotebookLMClient(client_auth, source_index=index) as client:
+                nb_id_resolved = await resolve_notebook_id(client, nb_id)
+                with console.status("Updating search index..."):
+                    hits = await client.sources.search(nb_id_resolved, fts_query, limit=limit)
+
+                if json_output:
+                    data = {
+                        "notebook_id": nb_id_resolved,
+                        "query": query,
+                        "results": [
+                            {
+                                "source_id": hit.source_id,
+                                "title": hit.title,
+                                "snippet": hit.snippet,
+                                "score": hit.score,
+                            }
+                            for hit in hits
+                        ],
+                        "count": len(hits),
+                    }
+                    json_output_response(data)
+                    return
+
+                if not hits:
+                    console.print(f"[yellow]No sources match {query!r}[/yellow]")
+                    return
+
+                for hit in hits:
+                    console.print(f"[cyan]{hit.source_id}[/cyan]  [bold]{escape(hit.title)}[/bold]")
+                    snippet = re.sub(
+                        r"\*\*(.+?)\*\*",
+                        r"[bold yellow]\1[/bold yellow]",
+                        escape(hit.snippet),
+                    )
+                    console.print(f"  {snippet}")
+
+    return _run()
+
+
+@source.command("sync-dir")
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "-n",
+    "--notebook",
+    "notebook_id",
+    default=None,
+    help="Notebook ID (uses current if not set)",
+)
+@click.option("--pattern", default="*", help="Glob of files to sync (default: all files)")
+@click.option("--recursive", "-r", is_flag=True, help="Include subdirectories")
+@click.option(
+    "--no-delete",
+    is_flag=True,
+    help="Keep sources whose files were deleted or changed",
+)
+@click.option("--watch", is_flag=True, help="Keep running and sync on changes")
+@click.option(
+    "--interval",
+    default=5.0,
+    type=float,
+    help="Seconds between directory scans with --watch (default: 5)",
+)
+@click.option(
+    "--debounce",
+    default=2.0,
+    type=float,
+    help="Quiet seconds before syncing a change with --watch (default: 2)",
+)
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@with_client
+def source_sync_dir(
+    ctx,
+    directory,
+    notebook_id,
+    pattern,
+    recursive,
+    no_delete,
+    watch,
+    interval,
+    debounce,
+    json_output,
+    client_auth,
+):
+    """Sync a local directory of files into a notebook.
+
+    Uploads files that are new or changed since the last sync, and deletes
+    sources whose files were removed (or replaced by a new version). File
+    hashes and their source IDs are recorded in the cache directory, so
+    re-running never uploads unchanged files, and renamed files are not
+    uploaded again.
+
+    \b
+    Examples:
+      source sync-dir ./papers --pattern "*.pdf"
+      source sync-dir ./papers -r --watch          # Keep syncing until Ctrl+C
+      source sync-dir ./notes --no-delete --json
+    """
+    nb_id = require_notebook(notebook_id)
+
+    def show(report):
+        if json_output:
+            json_output_response(asdict(report))
+            return
+        for label, paths, style in (
+            ("+", report.added, "green"),
+            ("~", report.updated, "yellow"),
+            (">", report.renamed, "cyan"),
+        ):
+            for path in paths:
+                console.print(f"[{style}]{label} {escape(path)}[/{style}]")
+        for source_id in report.deleted:
+            console.print(f"[red]- {source_id}[/red]")
+        for item, error in report.failed.items():
+            console.print(f"[red]! {escape(item)}: {escape(error)}[/red]")
+        console.print(
+            f"[dim]{len(report.added)} added, {len(report.updated)} updated, "
+            f"{len(report.deleted)} deleted, {len(report.unchanged)} unchanged[/dim]"
+        )
+
+    async def _run():
+        async with NotebookLMClient(client_auth) as client:
+            nb_id_resolved = await resolve_notebook_id(client, nb_id)
+            sync = DirectorySync(
+                client.sources,
+                nb_id_resolved,
+                directory,
+                pattern=pattern,
+                recursive=recursive,
+                delete_missing=not no_delete,
+            )
+            if watch:
+                if not json_output:
+                    console.print(f"Watching {directory} (Ctrl+C to stop)")
+                await sync.watch(interval=interval, debounce=debounce, on_sync=show)
+                return
+
+            with console.status("Syncing directory..."):
+                report = await sync.sync()
+            show(report)
+            if report.failed:
+                raise SystemExit(1)
+
+    return _run()
+
+
 @source.command("guide")
 @click.argument("source_id")
 @click.option(
@@ -21,19 +21,34 @@ Example:
 
 import logging
 import re
+from collections.abc import AsyncIterator
 from pathlib import Path
 
+from ._answers import AnswerCache
 from ._artifacts import ArtifactsAPI
+from ._cache import ArtifactCache
 from ._chat import ChatAPI
-from ._core import DEFAULT_TIMEOUT, ClientCore
+from ._conversations import ConversationStore
+from ._core import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_SOURCE_IDS_TTL,
+    DEFAULT_TIMEOUT,
+    ClientCore,
+)
+from ._fingerprints import SourceFingerprints
+from ._inventory import iter_inventory
 from ._notebooks import NotebooksAPI
 from ._notes import NotesAPI
+from ._polling import GenerationStats
 from ._research import ResearchAPI
+from ._search import SourceIndex
 from ._settings import SettingsAPI
 from ._sharing import SharingAPI
 from ._sources import SourcesAPI
+from ._uploads import UploadSessionStore
 from ._url_utils import is_google_auth_redirect
 from .auth import AuthTokens
+from .types import NotebookInventory
 
 logger = logging.getLogger(__name__)
 
@@ -73,24 +88,75 @@ class NotebookLMClient:
         auth: The AuthTokens used for authentication
     """
 
-    def __init__(self, auth: AuthTokens, timeout: float = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        auth: AuthTokens,
+        timeout: float = DEFAULT_TIMEOUT,
+        artifact_cache: ArtifactCache | None = None,
+        generation_stats: GenerationStats | None = None,
+        upload_sessions: UploadSessionStore | None = None,
+        source_index: SourceIndex | None = None,
+        source_fingerprints: SourceFingerprints | None = None,
+        max_concurrent_requests: int | None = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        source_ids_ttl: float = DEFAULT_SOURCE_IDS_TTL,
+        conversation_store: ConversationStore | None = None,
+        answer_cache: AnswerCache | None = None,
+    ):
         """Initialize the NotebookLM client.
 
         Args:
             auth: Authentication tokens from browser login.
             timeout: HTTP request timeout in seconds. Defaults to 30 seconds.
+            artifact_cache: Optional on-disk cache for completed artifact content
+                (quiz/flashcard HTML). Disabled by default.
+            generation_stats: Optional per-type generation durations used to
+                schedule artifact status polls. Disabled by default.
+            upload_sessions: Optional store of in-progress file uploads so an
+                interrupted ``add_file`` resumes after a restart. Disabled by
+                default.
+            source_index: Optional persistent full-text index used by
+                ``sources.search()``. Defaults to an in-memory index.
+            source_fingerprints: Optional manifest of added sources' content
+                fingerprints; when given, adding a URL, text or file already
+                in the notebook returns the existing source. Disabled by
+                default.
+            max_concurrent_requests: Maximum HTTP requests in flight at once
+                across all APIs (default: 8). None disables the limit.
+            source_ids_ttl: Seconds to reuse a notebook's source IDs when a
+                chat or generation call targets all sources (default: 30).
+                0 always fetches them.
+            conversation_store: Optional store of answered chat turns, e.g.
+                ``SQLiteConversationStore()`` to continue conversations across
+                processes. Defaults to an in-memory store.
+            answer_cache: Optional local cache of answers; ``chat.ask_many()``
+                skips questions already answered for the same notebook and
+                sources. Disabled by default.
         """
         # Pass refresh_auth as callback for automatic retry on auth failures
         # Note: refresh_auth calls update_auth_headers internally
-        self._core = ClientCore(auth, timeout=timeout, refresh_callback=self.refresh_auth)
+        self._core = ClientCore(
+            auth,
+            timeout=timeout,
+            refresh_callback=self.refresh_auth,
+            max_concurrent_requests=max_concurrent_requests,
+            source_ids_ttl=source_ids_ttl,
+            conversation_store=conversation_store,
+        )
 
         # Initialize sub-client APIs
         # Note: notes must be initialized before artifacts (artifacts uses notes API)
         self.notebooks = NotebooksAPI(self._core)
-        self.sources = SourcesAPI(self._core)
+        self.sources = SourcesAPI(
+            self._core,
+            upload_sessions=upload_sessions,
+            index=source_index,
+            fingerprints=source_fingerprints,
+        )
         self.notes = NotesAPI(self._core)
-        self.artifacts = ArtifactsAPI(self._core, notes_api=self.notes)
-        self.chat = ChatAPI(self._core)
+        self.artifacts = ArtifactsAPI(
+            self._core, notes_api=self.notes, cache=artifact_cache, stats=generation_stats
+        )
+        self.chat = ChatAPI(self._core, answer_cache=answer_cache)
         self.research = ResearchAPI(self._core)
         self.settings = SettingsAPI(self._core)
         self.sharing = SharingAPI(self._core)
@@ -185,3 +251,35 @@ class NotebookLMClient:
         self._core.update_auth_headers()
 
         return self._core.auth
+
+    def inventory(
+        self, notebook_ids: list[str] | None = None, concurrency: int = 4
+    ) -> AsyncIterator[NotebookInventory]:
+        """Read the sources, artifacts, notes and sharing of every notebook.
+
+        Notebooks are inventoried concurrently, and each notebook's four reads
+        run in parallel, all under the client's ``max_concurrent_requests``
+        limit. Metadata and sources come from the same GET_NOTEBOOK call.
+        Results are yielded as each notebook completes, not in input order.
+        A part that fails to load is recorded in ``errors`` and does not
+        stop the run.
+
+        Args:
+            notebook_ids: Notebooks to inventory. Defaults to all notebooks
+                returned by ``notebooks.list()``.
+            concurrency: Maximum number of notebooks read at once.
+
+        Returns:
+            Async iterator of NotebookInventory.
+
+        Raises:
+            ValidationError: If concurrency is less than 1.
+
+        Example:
+            async for inv in client.inventory():
+                print(inv.notebook.title, len(inv.sources), len(inv.artifacts))
+
+            # Or stream straight into a catalog
+            await write_inventory(client.inventory(), "catalog.db")
+        """
+        return iter_inventory(self, notebook_ids, concurrency=concurrency)
@@ -8,6 +8,7 @@ All paths are derived from the home directory:
 - storage_state.json: Authentication cookies from Playwright
 - context.json: CLI context (current notebook/conversation)
 - browser_profile/: Playwright browser profile directory
+- cache/: Local caches (e.g. completed artifact content)
 
 Usage:
     from notebooklm.paths import get_home_dir, get_storage_path
@@ -91,6 +92,15 @@ def get_config_path() -> Path:
     return get_home_dir() / "config.json"
 
 
+def get_cache_dir() -> Path:
+    """Get local cache directory.
+
+    Returns:
+        Path to cache/ within NOTEBOOKLM_HOME.
+    """
+    return get_home_dir() / "cache"
+
+
 def get_path_info() -> dict[str, str]:
     """Get diagnostic info about resolved paths.
 
@@ -112,4 +122,5 @@ def get_path_info() -> dict[str, str]:
         "context_path": str(get_context_path()),
         "config_path": str(get_config_path()),
         "browser_profile_dir": str(get_browser_profile_dir()),
+        "cache_dir": str(get_cache_dir()),
     }
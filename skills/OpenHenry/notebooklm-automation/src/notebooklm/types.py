@@ -16,6 +16,15 @@ from enum import Enum
 from typing import Any, Optional
 
 # Import exceptions from centralized module (re-export for backward compatibility)
+from ._source_rows import (
+    SourceColumns,
+    row_fields,
+    row_id,
+    row_metadata_first,
+    row_title,
+    row_type_code,
+    row_url,
+)
 from .exceptions import (
     ArtifactDownloadError,
     ArtifactError,
@@ -246,17 +255,28 @@ __all__ = [
     "NotebookDescription",
     "SuggestedTopic",
     "Source",
+    "SourceColumns",
     "SourceFulltext",
+    "SourceAddResult",
+    "SourceSearchHit",
+    "SourceRefreshResult",
+    "ResearchTaskResult",
+    "SyncReport",
     "Artifact",
     "GenerationStatus",
     "ReportSuggestion",
     "Note",
+    "NoteImportResult",
     "ConversationTurn",
     "ChatReference",
     "AskResult",
+    "AskStreamChunk",
+    "QuestionResult",
     "ChatMode",
     "SharedUser",
     "ShareStatus",
+    "ShareChangeResult",
+    "NotebookInventory",
     # Exceptions
     "SourceError",
     "SourceAddError",
@@ -485,45 +505,29 @@ class Source:
         if isinstance(data[0], list) and len(data[0]) > 0:
             if isinstance(data[0][0], list) and len(data[0][0]) > 0:
                 # Check if deeply nested vs medium nested
-                if isinstance(data[0][0][0], list):
-                    # Deeply nested: [[[[id], title, ...]]]
-                    entry = data[0][0]
-                    source_id = entry[0][0] if isinstance(entry[0], list) else entry[0]
-                    title = entry[1] if len(entry) > 1 else None
-                else:
+                if not isinstance(data[0][0][0], list):
                     # Medium nested: [[['id'], 'title', ...]]
                     entry = data[0]
-                    source_id = entry[0][0] if isinstance(entry[0], list) else entry[0]
-                    title = entry[1] if len(entry) > 1 else None
-
-                    # Try to extract URL if present
-                    url = None
-                    if len(entry) > 2 and isinstance(entry[2], list):
-                        if len(entry[2]) > 7 and isinstance(entry[2][7], list):
-                            url = entry[2][7][0] if entry[2][7] else None
-
-                    return cls(id=str(source_id), title=title, url=url, _type_code=None)
-
-                # Deeply nested: continue with URL and type code extraction
-                url = None
-                type_code = None
-                if len(entry) > 2 and isinstance(entry[2], list):
-                    if len(entry[2]) > 7:
-                        url_list = entry[2][7]
-                        if isinstance(url_list, list) and len(url_list) > 0:
-                            url = url_list[0]
-                    if not url and len(entry[2]) > 0:
-                        if isinstance(entry[2][0], str) and entry[2][0].startswith("http"):
-                            url = entry[2][0]
-                    # Extract type code at entry[2][4] if available
-                    if len(entry[2]) > 4 and isinstance(entry[2][4], int):
-                        type_code = entry[2][4]
-
+                    url = row_url(entry)
+                    return cls(
+                        id=str(row_id(entry)),
+                        title=row_title(entry),
+                        url=url if isinstance(url, str) else None,
+                        _type_code=None,
+                    )
+
+                # Deeply nested: [[[[id], title, ...]]]
+                entry = data[0][0]
+                url = row_url(entry)
+                if not isinstance(url, str) or not url:
+                    first = row_metadata_first(entry)
+                    url = first if isinstance(first, str) and first.startswith("http") else None
+                type_code = row_type_code(entry)
                 return cls(
-                    id=str(source_id),
-                    title=title,
+                    id=str(row_id(entry)),
+                    title=row_title(entry),
                     url=url,
-                    _type_code=type_code,
+                    _type_code=type_code if isinstance(type_code, int) else None,
                 )
 
         # Simple flat format: [id, title] or [id, title, ...]
@@ -531,6 +535,25 @@ class Source:
         title = data[1] if len(data) > 1 else None
         return cls(id=str(source_id), title=title, _type_code=None)
 
+    @classmethod
+    def from_notebook_row(cls, row: Any) -> Optional["Source"]:
+        """Parse one source row of a GET_NOTEBOOK response, including status.
+
+        Returns None for rows without a source ID.
+        """
+        fields = row_fields(row)
+        if fields is None:
+            return None
+        source_id, title, url, type_code, status, created_at = fields
+        return cls(
+            id=source_id,
+            title=title,
+            url=url,
+            _type_code=type_code,
+            created_at=created_at,
+            status=status,
+        )
+
 
 @dataclass
 class SourceFulltext:
@@ -624,6 +647,104 @@ class SourceFulltext:
         return matches
 
 
+@dataclass
+class SourceAddResult:
+    """Outcome of one item in a bulk ``sources.add_many()`` call.
+
+    Attributes:
+        item: The input item as passed to ``add_many()``.
+        status: "added", "skipped" (duplicate), or "failed".
+        source: The created Source (refreshed after waiting when wait=True),
+            or the existing Source a skipped item duplicates, if known.
+        error: Error message for failed items, or the skip reason.
+    """
+
+    item: Any
+    status: str
+    source: "Source | None" = None
+    error: str | None = None
+
+    @property
+    def is_added(self) -> bool:
+        """Check if the item was added to the notebook."""
+        return self.status == "added"
+
+    @property
+    def is_skipped(self) -> bool:
+        """Check if the item was skipped as a duplicate."""
+        return self.status == "skipped"
+
+    @property
+    def is_failed(self) -> bool:
+        """Check if adding the item failed."""
+        return self.status == "failed"
+
+
+@dataclass
+class SourceRefreshResult:
+    """Outcome for one source in a bulk ``sources.refresh_stale()`` call.
+
+    Attributes:
+        notebook_id: Notebook containing the source.
+        source_id: The source ID, or "" if the notebook's sources could not
+            be listed.
+        title: Source title.
+        status: "fresh" (no refresh needed), "refreshed", or "failed".
+        error: Error message for failed sources.
+    """
+
+    notebook_id: str
+    source_id: str
+    title: str | None
+    status: str
+    error: str | None = None
+
+
+@dataclass
+class SyncReport:
+    """Outcome of one directory synchronisation pass.
+
+    File paths are relative to the synced directory.
+
+    Attributes:
+        added: New files uploaded as sources.
+        updated: Changed files whose new version was uploaded.
+        renamed: Files moved or copied whose content was already uploaded.
+        unchanged: Files already in sync.
+        deleted: IDs of sources removed because their file vanished or changed.
+        failed: Path (or source ID, for failed deletes) to error message.
+    """
+
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    renamed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def has_changes(self) -> bool:
+        """Check if the pass changed anything in the notebook."""
+        return bool(self.added or self.updated or self.deleted)
+
+
+@dataclass
+class SourceSearchHit:
+    """A source matching a local full-text search.
+
+    Attributes:
+        source_id: The matching source's ID.
+        title: Source title.
+        snippet: Matching excerpt, with matched terms wrapped in ``**``.
+        score: Relevance score (higher is more relevant).
+    """
+
+    source_id: str
+    title: str
+    snippet: str
+    score: float
+
+
 # =============================================================================
 # Artifact Types
 # =============================================================================
@@ -986,6 +1107,33 @@ class Note:
         )
 
 
+@dataclass
+class NoteImportResult:
+    """Outcome for one file in a bulk ``notes.import_markdown()`` call.
+
+    Attributes:
+        path: The Markdown file.
+        status: "created", "updated", "unchanged", or "failed".
+        note: The created, updated or matching Note.
+        error: Error message for failed files.
+    """
+
+    path: str
+    status: str
+    note: Note | None = None
+    error: str | None = None
+
+    @property
+    def is_changed(self) -> bool:
+        """Check if the file created or updated a note."""
+        return self.status in ("created", "updated")
+
+    @property
+    def is_failed(self) -> bool:
+        """Check if importing the file failed."""
+        return self.status == "failed"
+
+
 # =============================================================================
 # Conversation Types
 # =============================================================================
@@ -1046,6 +1194,99 @@ class AskResult:
     raw_response: str = ""
 
 
+@dataclass
+class AskStreamChunk:
+    """One increment of a streamed answer from ``ChatAPI.ask_stream()``.
+
+    Attributes:
+        delta: Answer text added since the previous chunk.
+        answer: The answer text so far.
+        references: Citations first seen in this chunk.
+        replaced: True if the server revised earlier text or citations;
+            ``delta`` then holds the whole revised answer and ``references``
+            all of its citations, replacing those yielded before.
+        result: The complete AskResult, set on the final chunk only.
+    """
+
+    delta: str
+    answer: str
+    references: list["ChatReference"] = field(default_factory=list)
+    replaced: bool = False
+    result: AskResult | None = None
+
+    @property
+    def is_final(self) -> bool:
+        """Check if this is the last chunk of the stream."""
+        return self.result is not None
+
+
+@dataclass
+class QuestionResult:
+    """Outcome of one question in a batch ``chat.ask_many()`` call.
+
+    Attributes:
+        index: Position of the question in the input list.
+        question: The question text.
+        status: "answered", "cached" (served from the answer cache), or
+            "failed".
+        result: The AskResult for answered and cached questions.
+        error: Error message for failed questions.
+    """
+
+    index: int
+    question: str
+    status: str
+    result: AskResult | None = None
+    error: str | None = None
+
+    @property
+    def is_cached(self) -> bool:
+        """Check if the answer came from the local answer cache."""
+        return self.status == "cached"
+
+    @property
+    def is_failed(self) -> bool:
+        """Check if asking the question failed."""
+        return self.status == "failed"
+
+
+# =============================================================================
+# Research Types
+# =============================================================================
+
+
+@dataclass
+class ResearchTaskResult:
+    """Outcome of one query in a ``research.run_many()`` call.
+
+    Attributes:
+        notebook_id: Notebook the research ran in.
+        query: The research query.
+        mode: "fast" or "deep".
+        status: "completed", "failed" (did not start), or "timeout".
+        task_id: The research task ID, if the task started.
+        sources: Sources the task discovered, each with 'url' and 'title'.
+        imported: Sources imported from this task, each with 'id' and
+            'title'. URLs found by an earlier query, or already in the
+            notebook, are imported only once.
+        error: Error message for failed and timed-out tasks.
+    """
+
+    notebook_id: str
+    query: str
+    mode: str
+    status: str
+    task_id: str | None = None
+    sources: list[dict[str, str]] = field(default_factory=list)
+    imported: list[dict[str, str]] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def is_completed(self) -> bool:
+        """Check if the research task completed."""
+        return self.status == "completed"
+
+
 # =============================================================================
 # Sharing Types
 # =============================================================================
@@ -1133,3 +1374,75 @@ class ShareStatus:
             shared_users=users,
             share_url=share_url,
         )
+
+
+@dataclass
+class ShareChangeResult:
+    """Outcome for one notebook in a bulk ``sharing.apply_many()`` call.
+
+    Attributes:
+        notebook_id: The notebook ID.
+        status: "changed", "unchanged", "planned" (dry run with pending
+            changes), or "failed".
+        added: Emails given access.
+        updated: Emails whose permission changed.
+        removed: Emails whose access was removed.
+        public: The new public-link setting, or None if it was not changed.
+        skipped: Emails left alone because they own the notebook.
+        applied: Planned changes that were sent successfully: any of
+            "added", "updated", "removed" and "public". When a notebook
+            fails part-way, the changes not listed here were not made.
+        error: Error message for failed notebooks.
+    """
+
+    notebook_id: str
+    status: str
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    public: bool | None = None
+    skipped: list[str] = field(default_factory=list)
+    applied: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def has_changes(self) -> bool:
+        """Check if the notebook needs (or received) any mutation."""
+        return bool(self.added or self.updated or self.removed or self.public is not None)
+
+    @property
+    def is_failed(self) -> bool:
+        """Check if reading or changing the notebook failed."""
+        return self.status == "failed"
+
+
+# =============================================================================
+# Inventory Types
+# =============================================================================
+
+
+@dataclass
+class NotebookInventory:
+    """Everything ``client.inventory()`` read about one notebook.
+
+    Attributes:
+        notebook: Notebook metadata.
+        sources: Sources in the notebook.
+        artifacts: Studio artifacts, including mind maps.
+        notes: Text notes.
+        share_status: Sharing configuration, or None if it could not be read.
+        errors: Mapping of part ("notebook", "artifacts", "notes",
+            "sharing") to the error message for parts that failed to load.
+    """
+
+    notebook: Notebook
+    sources: list[Source] = field(default_factory=list)
+    artifacts: list[Artifact] = field(default_factory=list)
+    notes: list[Note] = field(default_factory=list)
+    share_status: ShareStatus | None = None
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_complete(self) -> bool:
+        """Check if every part of the notebook was read."""
+        return not self.errors
@@ -1,12 +1,13 @@
 """Tests for note CLI commands."""
 
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from click.testing import CliRunner
 
 from notebooklm.notebooklm_cli import cli
-from notebooklm.types import Note
+from notebooklm.types import Note, NoteImportResult
 
 from .conftest import create_mock_client, patch_client_for_module
 
@@ -299,6 +300,54 @@ class TestNoteDelete:
             assert "Deleted note" in result.output
 
 
+# =============================================================================
+# NOTE EXPORT / IMPORT TESTS
+# =============================================================================
+
+
+class TestNoteExportImport:
+    def test_note_export_multiple_notebooks(self, runner, mock_auth, tmp_path):
+        with patch_client_for_module("note") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.notes.export_markdown = AsyncMock(return_value={"n1": "x.md"})
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["note", "export", "-n", "nb_123", "-n", "nb_456", "-o", str(tmp_path)]
+                )
+
+        assert result.exit_code == 0
+        assert "Exported 1 changed note(s)" in result.output
+        mock_client.notes.export_markdown.assert_awaited_once_with(
+            ["nb_123", "nb_456"], str(tmp_path)
+        )
+
+    def test_note_import_json_reports_failures(self, runner, mock_auth, tmp_path):
+        with patch_client_for_module("note") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.notes.import_markdown = AsyncMock(
+                return_value=[
+                    NoteImportResult("a.md", "updated", note=make_note("n1", "A", "a")),
+                    NoteImportResult("b.md", "failed", error="boom"),
+                ]
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["note", "import", str(tmp_path), "-n", "nb_123", "--json"]
+                )
+
+        assert result.exit_code == 1
+        data = json.loads(result.output)
+        assert data["updated"] == 1
+        assert data["failed"] == 1
+        assert data["results"][0]["note_id"] == "n1"
+
+
 # =============================================================================
 # COMMAND EXISTENCE TESTS
 # =============================================================================
@@ -1,6 +1,7 @@
 """Tests for notebook CLI commands (now top-level commands)."""
 
 import json
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,7 +10,13 @@ import pytest
 from click.testing import CliRunner
 
 from notebooklm.notebooklm_cli import cli
-from notebooklm.types import AskResult, Notebook
+from notebooklm.types import (
+    AskResult,
+    AskStreamChunk,
+    Notebook,
+    NotebookInventory,
+    QuestionResult,
+)
 
 from .conftest import create_mock_client, patch_client_for_module, patch_main_cli_client
 
@@ -486,6 +493,111 @@ class TestNotebookAsk:
             assert result.exit_code == 0
             assert "Follow-up answer" in result.output
 
+    def test_notebook_ask_stream(self, runner, mock_auth):
+        final = AskResult(
+            answer="Streamed answer [1].",
+            conversation_id="conv_s",
+            is_follow_up=False,
+            turn_number=1,
+        )
+
+        async def fake_stream(*args, **kwargs):
+            yield AskStreamChunk(delta="Streamed ", answer="Streamed ")
+            yield AskStreamChunk(delta="answer [1].", answer="Streamed answer [1].")
+            yield AskStreamChunk(delta="", answer=final.answer, result=final)
+
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.chat.ask_stream = MagicMock(side_effect=fake_stream)
+            mock_client.chat.ask = AsyncMock()
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["ask", "-n", "nb_123", "--new", "--stream", "Q?"])
+
+            assert result.exit_code == 0, result.output
+            assert "Streamed answer [1]." in result.output
+            assert "conv_s" in result.output
+            mock_client.chat.ask.assert_not_awaited()
+
+    def test_notebook_ask_stream_rejects_json(self, runner, mock_auth):
+        with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = ("csrf", "session")
+            result = runner.invoke(cli, ["ask", "-n", "nb_123", "--stream", "--json", "Q?"])
+
+        assert result.exit_code != 0
+        assert "Cannot specify both --stream and --json" in result.output
+
+    def test_notebook_ask_batch(self, runner, mock_auth, tmp_path):
+        batch = tmp_path / "questions.jsonl"
+        batch.write_text('{"id": "q1", "question": "What?"}\n\n"Why?"\n', encoding="utf-8")
+        output = tmp_path / "answers.jsonl"
+
+        async def fake_ask_many(notebook_id, questions, **kwargs):
+            results = [
+                QuestionResult(
+                    1,
+                    questions[1],
+                    "cached",
+                    result=AskResult(
+                        answer="Because.", conversation_id="c2", turn_number=1, is_follow_up=False
+                    ),
+                ),
+                QuestionResult(0, questions[0], "failed", error="boom"),
+            ]
+            for result in results:
+                kwargs["on_result"](result)
+            return results
+
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.chat.ask_many = AsyncMock(side_effect=fake_ask_many)
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli,
+                    ["ask", "-n", "nb_123", "--batch", str(batch), "-o", str(output)],
+                )
+
+        assert result.exit_code == 1  # one question failed
+        assert "cached 1, failed 1" in result.output
+        assert mock_client.chat.ask_many.await_args.args[1] == ["What?", "Why?"]
+        lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert lines[0]["question"] == "Why?"
+        assert lines[0]["answer"] == "Because."
+        assert lines[1] == {
+            "id": "q1",
+            "question": "What?",
+            "status": "failed",
+            "answer": None,
+            "conversation_id": None,
+            "references": [],
+            "error": "boom",
+        }
+
+    def test_notebook_ask_batch_rejects_question(self, runner, mock_auth, tmp_path):
+        batch = tmp_path / "questions.jsonl"
+        batch.write_text('"Why?"\n', encoding="utf-8")
+        with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = ("csrf", "session")
+            result = runner.invoke(cli, ["ask", "-n", "nb_123", "--batch", str(batch), "Q?"])
+
+        assert result.exit_code != 0
+        assert "Cannot specify both QUESTION and --batch" in result.output
+
+    def test_notebook_ask_batch_rejects_new(self, runner, mock_auth, tmp_path):
+        batch = tmp_path / "questions.jsonl"
+        batch.write_text('"Why?"\n', encoding="utf-8")
+        with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = ("csrf", "session")
+            result = runner.invoke(cli, ["ask", "-n", "nb_123", "--batch", str(batch), "--new"])
+
+        assert result.exit_code != 0
+        assert "Cannot specify both --new and --batch" in result.output
+
 
 # =============================================================================
 # NOTEBOOK CONFIGURE TESTS
@@ -599,6 +711,95 @@ class TestSourceAddResearch:
             assert "Imported 1 sources" in result.output
 
 
+# =============================================================================
+# NOTEBOOK INVENTORY TESTS
+# =============================================================================
+
+
+class TestNotebookInventory:
+    def _invoke(self, runner, args, inventories):
+        calls = []
+
+        def inventory(notebook_ids=None, concurrency=4):
+            calls.append((notebook_ids, concurrency))
+
+            async def stream():
+                for inv in inventories:
+                    yield inv
+
+            return stream()
+
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.inventory = inventory
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["inventory", *args])
+        return result, calls
+
+    def test_writes_jsonl_catalog(self, runner, mock_auth, tmp_path):
+        output = tmp_path / "catalog.jsonl"
+        result, calls = self._invoke(
+            runner,
+            ["-o", str(output), "-n", "nb_123", "--concurrency", "2"],
+            [NotebookInventory(notebook=Notebook(id="nb_123", title="Test Notebook"))],
+        )
+
+        assert result.exit_code == 0
+        assert "Inventoried 1 notebook(s)" in result.output
+        assert calls == [(["nb_123"], 2)]
+        record = json.loads(output.read_text())
+        assert record["notebook"]["title"] == "Test Notebook"
+
+    def test_reports_incomplete_notebooks(self, runner, mock_auth, tmp_path):
+        result, calls = self._invoke(
+            runner,
+            ["-o", str(tmp_path / "catalog.db")],
+            [
+                NotebookInventory(
+                    notebook=Notebook(id="nb_123", title="A"), errors={"sharing": "boom"}
+                )
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "nb_123: could not read sharing" in result.output
+        assert calls == [(None, 4)]
+        assert (tmp_path / "catalog.db").exists()
+
+    def test_full_run_prunes_deleted_notebooks(self, runner, mock_auth, tmp_path):
+        output = tmp_path / "catalog.db"
+        listed = [
+            NotebookInventory(notebook=Notebook(id="nb_123", title="A")),
+            NotebookInventory(notebook=Notebook(id="nb_456", title="B")),
+        ]
+        self._invoke(runner, ["-o", str(output)], listed)
+        self._invoke(runner, ["-o", str(output), "-n", "nb_123"], listed[:1])
+        assert self._catalog_ids(output) == ["nb_123", "nb_456"]
+
+        result, _ = self._invoke(runner, ["-o", str(output)], listed[1:])
+
+        assert result.exit_code == 0
+        assert self._catalog_ids(output) == ["nb_456"]
+
+    @staticmethod
+    def _catalog_ids(path):
+        conn = sqlite3.connect(path)
+        try:
+            return [row[0] for row in conn.execute("SELECT id FROM notebooks ORDER BY id")]
+        finally:
+            conn.close()
+
+    def test_rejects_unknown_extension(self, runner, mock_auth, tmp_path):
+        result, calls = self._invoke(runner, ["-o", str(tmp_path / "catalog.csv")], [])
+
+        assert result.exit_code != 0
+        assert "Unsupported inventory file" in result.output
+        assert calls == []
+
+
 # =============================================================================
 # COMMAND EXISTENCE TESTS
 # =============================================================================
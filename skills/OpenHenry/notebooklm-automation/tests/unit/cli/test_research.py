@@ -4,6 +4,7 @@ import json
 from unittest.mock import AsyncMock
 
 from notebooklm.notebooklm_cli import cli
+from notebooklm.types import ResearchTaskResult
 
 from .conftest import create_mock_client, patch_client_for_module
 
@@ -266,6 +267,76 @@ class TestResearchWait:
         assert data["status"] == "timeout"
 
 
+# =============================================================================
+# RESEARCH SWEEP TESTS
+# =============================================================================
+
+
+class TestResearchSweep:
+    def test_sweep_args_and_file(self, runner, mock_auth, mock_fetch_tokens, tmp_path):
+        sweep_file = tmp_path / "queries.jsonl"
+        sweep_file.write_text(
+            '"from file"\n{"query": "other nb", "notebook": "nb_456", "mode": "deep"}\n',
+            encoding="utf-8",
+        )
+        with patch_client_for_module("research") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.research.run_many = AsyncMock(
+                return_value=[
+                    ResearchTaskResult("nb_123", "cli query", "fast", "completed", "t1"),
+                    ResearchTaskResult("nb_123", "from file", "fast", "completed", "t2"),
+                    ResearchTaskResult("nb_456", "other nb", "deep", "timeout", "t3"),
+                ]
+            )
+            mock_client_cls.return_value = mock_client
+
+            result = runner.invoke(
+                cli,
+                ["research", "sweep", "cli query", "-n", "nb_123", "--file", str(sweep_file)],
+            )
+
+        assert result.exit_code == 1
+        assert "2/3 queries completed" in result.output
+        jobs = mock_client.research.run_many.call_args.args[0]
+        assert [(j["notebook_id"], j["query"], j["mode"]) for j in jobs] == [
+            ("nb_123", "cli query", "fast"),
+            ("nb_123", "from file", "fast"),
+            ("nb_456", "other nb", "deep"),
+        ]
+
+    def test_sweep_json_no_import(self, runner, mock_auth, mock_fetch_tokens):
+        with patch_client_for_module("research") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.research.run_many = AsyncMock(
+                return_value=[
+                    ResearchTaskResult(
+                        "nb_123",
+                        "q",
+                        "fast",
+                        "completed",
+                        "t1",
+                        sources=[{"url": "https://a.com", "title": "A"}],
+                    )
+                ]
+            )
+            mock_client_cls.return_value = mock_client
+
+            result = runner.invoke(
+                cli, ["research", "sweep", "q", "-n", "nb_123", "--no-import", "--json"]
+            )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["completed"] == 1
+        assert data["results"][0]["sources_found"] == 1
+        assert mock_client.research.run_many.call_args.kwargs["import_sources"] is False
+
+    def test_sweep_requires_queries(self, runner, mock_auth, mock_fetch_tokens):
+        result = runner.invoke(cli, ["research", "sweep", "-n", "nb_123"])
+        assert result.exit_code != 0
+        assert "Provide QUERIES or --file" in result.output
+
+
 # =============================================================================
 # COMMAND EXISTENCE TESTS
 # =============================================================================
@@ -286,3 +357,8 @@ class TestResearchCommandsExist:
         result = runner.invoke(cli, ["research", "wait", "--help"])
         assert result.exit_code == 0
         assert "Wait for research to complete" in result.output
+
+    def test_research_sweep_command_exists(self, runner):
+        result = runner.invoke(cli, ["research", "sweep", "--help"])
+        assert result.exit_code == 0
+        assert "Run many research queries" in result.output
@@ -1,5 +1,6 @@
 """Tests for share CLI commands."""
 
+import json
 from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
@@ -7,6 +8,7 @@ from notebooklm.notebooklm_cli import cli
 from notebooklm.types import (
     Notebook,
     ShareAccess,
+    ShareChangeResult,
     SharedUser,
     SharePermission,
     ShareStatus,
@@ -508,3 +510,133 @@ class TestShareStatusWithUsers:
             assert "Shared Users" in result.output
             assert "editor@example.com" in result.output
             assert "viewer@example.com" in result.output
+
+
+# =============================================================================
+# SHARE APPLY TESTS
+# =============================================================================
+
+
+class TestShareApply:
+    def test_apply_all_owned_notebooks(self, runner, mock_auth):
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.notebooks.list = AsyncMock(
+                return_value=[
+                    Notebook(id="nb_123", title="Mine"),
+                    Notebook(id="nb_shared", title="Theirs", is_owner=False),
+                ]
+            )
+            mock_client.sharing.apply_many = AsyncMock(
+                return_value=[
+                    ShareChangeResult("nb_123", "changed", removed=["leaver@example.com"]),
+                ]
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["share", "apply", "--all", "-u", "leaver@example.com=remove", "-y"]
+                )
+
+        assert result.exit_code == 0
+        assert "remove leaver@example.com" in result.output
+        args, kwargs = mock_client.sharing.apply_many.call_args
+        assert args == (["nb_123"], {"leaver@example.com": None})
+        assert kwargs["dry_run"] is False
+
+    def test_apply_reports_partially_applied_notebook(self, runner, mock_auth):
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sharing.apply_many = AsyncMock(
+                return_value=[
+                    ShareChangeResult(
+                        "nb_123",
+                        "failed",
+                        added=["new@example.com"],
+                        removed=["leaver@example.com"],
+                        applied=["added"],
+                        error="boom",
+                    )
+                ]
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli,
+                    [
+                        "share",
+                        "apply",
+                        "-n",
+                        "nb_123",
+                        "-u",
+                        "new@example.com=viewer",
+                        "-u",
+                        "leaver@example.com=remove",
+                        "-y",
+                    ],
+                )
+
+        assert result.exit_code == 1
+        assert "applied: added; not applied: removed" in result.output
+
+    def test_apply_spec_file_json(self, runner, mock_auth, tmp_path):
+        spec = tmp_path / "spec.json"
+        spec.write_text(
+            json.dumps(
+                {
+                    "notebooks": ["nb_123"],
+                    "users": {"team@example.com": "editor"},
+                    "public": False,
+                }
+            ),
+            encoding="utf-8",
+        )
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sharing.apply_many = AsyncMock(
+                return_value=[ShareChangeResult("nb_123", "planned", added=["team@example.com"])]
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["share", "apply", "--spec", str(spec), "--dry-run", "--json"]
+                )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data["results"][0]["added"] == ["team@example.com"]
+        args, kwargs = mock_client.sharing.apply_many.call_args
+        assert args == (["nb_123"], {"team@example.com": SharePermission.EDITOR})
+        assert kwargs["public"] is False
+        assert kwargs["dry_run"] is True
+
+    def test_apply_confirms_planned_changes(self, runner, mock_auth):
+        with patch_main_cli_client() as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sharing.apply_many = AsyncMock(
+                return_value=[ShareChangeResult("nb_123", "planned", public=True)]
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["share", "apply", "-n", "nb_123", "--public"], input="n\n"
+                )
+
+        assert result.exit_code == 0
+        assert "make public" in result.output
+        mock_client.sharing.apply_many.assert_awaited_once()  # declined: plan only
+
+    def test_apply_rejects_bad_user_spec(self, runner, mock_auth):
+        with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = ("csrf", "session")
+            result = runner.invoke(cli, ["share", "apply", "-n", "nb_123", "-u", "someone@x.com"])
+        assert result.exit_code != 0
+        assert "EMAIL=editor|viewer|remove" in result.output
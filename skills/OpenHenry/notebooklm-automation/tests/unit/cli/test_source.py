@@ -630,3 +630,146 @@ class TestSourceCommandsExist:
         assert result.exit_code == 0
         assert "SOURCE_ID" in result.output
         assert "exit code" in result.output.lower()
+
+
+# =============================================================================
+# SOURCE GREP TESTS
+# =============================================================================
+
+
+class TestSourceGrep:
+    def test_source_grep_quotes_query_as_phrase(self, runner, mock_auth):
+        from notebooklm.types import SourceSearchHit
+
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sources.search = AsyncMock(
+                return_value=[
+                    SourceSearchHit("src_1", "Paper [draft]", "the **attention** op", 1.5)
+                ]
+            )
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["source", "grep", "attention op", "-n", "nb_123"])
+
+            assert result.exit_code == 0, result.output
+            assert "src_1" in result.output
+            assert "Paper [draft]" in result.output
+            assert mock_client.sources.search.call_args[0][1] == '"attention op"'
+
+    def test_source_grep_json_and_fts(self, runner, mock_auth):
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sources.search = AsyncMock(return_value=[])
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["source", "grep", "optim*", "--fts", "--json", "-n", "nb_123"]
+                )
+
+            assert result.exit_code == 0, result.output
+            data = json.loads(result.output)
+            assert data["count"] == 0
+            assert mock_client.sources.search.call_args[0][1] == "optim*"
+
+
+# =============================================================================
+# SOURCE SYNC-DIR TESTS
+# =============================================================================
+
+
+class TestSourceSyncDir:
+    def test_sync_dir_reports_changes(self, runner, mock_auth, tmp_path):
+        from notebooklm.types import SyncReport
+
+        report = SyncReport(added=["a.pdf"], unchanged=["b.pdf"], deleted=["src_old"])
+        with (
+            patch_client_for_module("source") as mock_client_cls,
+            patch("notebooklm.cli.source.DirectorySync") as mock_sync_cls,
+        ):
+            mock_client_cls.return_value = create_mock_client()
+            mock_sync_cls.return_value.sync = AsyncMock(return_value=report)
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli,
+                    ["source", "sync-dir", str(tmp_path), "-n", "nb_123", "--pattern", "*.pdf"],
+                )
+
+        assert result.exit_code == 0, result.output
+        assert "a.pdf" in result.output
+        assert "src_old" in result.output
+        kwargs = mock_sync_cls.call_args.kwargs
+        assert kwargs["pattern"] == "*.pdf"
+        assert kwargs["delete_missing"] is True
+
+    def test_sync_dir_json_and_failure_exit_code(self, runner, mock_auth, tmp_path):
+        from notebooklm.types import SyncReport
+
+        report = SyncReport(failed={"bad.pdf": "boom"})
+        with (
+            patch_client_for_module("source") as mock_client_cls,
+            patch("notebooklm.cli.source.DirectorySync") as mock_sync_cls,
+        ):
+            mock_client_cls.return_value = create_mock_client()
+            mock_sync_cls.return_value.sync = AsyncMock(return_value=report)
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli,
+                    ["source", "sync-dir", str(tmp_path), "-n", "nb_123", "--no-delete", "--json"],
+                )
+
+        assert result.exit_code == 1
+        assert json.loads(result.output)["failed"] == {"bad.pdf": "boom"}
+        assert mock_sync_cls.call_args.kwargs["delete_missing"] is False
+
+
+class TestSourceRefreshStale:
+    def test_refresh_stale_current_notebook(self, runner, mock_auth):
+        from notebooklm.types import SourceRefreshResult
+
+        results = [
+            SourceRefreshResult("nb_123", "src_1", "Fresh Page", "fresh"),
+            SourceRefreshResult("nb_123", "src_2", "Stale Page", "refreshed"),
+        ]
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sources.refresh_stale = AsyncMock(return_value=results)
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(cli, ["source", "refresh-stale", "-n", "nb_123"])
+
+        assert result.exit_code == 0, result.output
+        assert "Stale Page" in result.output
+        assert "2 checked, 1 refreshed" in result.output
+        mock_client.sources.refresh_stale.assert_awaited_once_with("nb_123", wait=True)
+
+    def test_refresh_stale_all_json_and_failure_exit_code(self, runner, mock_auth):
+        from notebooklm.types import SourceRefreshResult
+
+        results = [SourceRefreshResult("nb_1", "src_1", "Page", "failed", error="boom")]
+        with patch_client_for_module("source") as mock_client_cls:
+            mock_client = create_mock_client()
+            mock_client.sources.refresh_stale = AsyncMock(return_value=results)
+            mock_client_cls.return_value = mock_client
+
+            with patch("notebooklm.cli.helpers.fetch_tokens", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = ("csrf", "session")
+                result = runner.invoke(
+                    cli, ["source", "refresh-stale", "--all", "--no-wait", "--json"]
+                )
+
+        assert result.exit_code == 1
+        data = json.loads(result.output)
+        assert data["failed"] == 1
+        assert data["results"][0]["error"] == "boom"
+        mock_client.sources.refresh_stale.assert_awaited_once_with(None, wait=False)
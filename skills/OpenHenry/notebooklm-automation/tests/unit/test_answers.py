@@ -0,0 +1,116 @@
+"""Unit tests for the answer cache and ChatAPI.ask_many."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notebooklm._answers import AnswerCache, sources_key
+from notebooklm._chat import ChatAPI
+from notebooklm.exceptions import ChatError, ValidationError
+from notebooklm.types import AskResult, ChatReference
+
+
+def _answer(text: str, conversation_id: str = "conv") -> AskResult:
+    return AskResult(
+        answer=text,
+        conversation_id=conversation_id,
+        turn_number=1,
+        is_follow_up=False,
+        references=[ChatReference(source_id="src_1", citation_number=1, cited_text="quote")],
+    )
+
+
+class TestAnswerCache:
+    def test_round_trip(self, tmp_path):
+        cache = AnswerCache(tmp_path / "answers.db")
+        cache.put("nb_1", ["s2", "s1"], "Q?", _answer("A."))
+
+        cached = AnswerCache(tmp_path / "answers.db").get("nb_1", ["s1", "s2"], "Q?")
+
+        assert cached is not None
+        assert cached.answer == "A."
+        assert cached.references == _answer("A.").references
+
+    def test_keyed_by_source_set_and_notebook(self):
+        cache = AnswerCache(":memory:")
+        cache.put("nb_1", ["s1"], "Q?", _answer("A."))
+
+        assert cache.get("nb_1", ["s1", "s2"], "Q?") is None
+        assert cache.get("nb_2", ["s1"], "Q?") is None
+        assert sources_key(["a", "b", "a"]) == sources_key(["b", "a"])
+
+    def test_clear(self):
+        cache = AnswerCache(":memory:")
+        cache.put("nb_1", [], "Q?", _answer("A."))
+        cache.clear("nb_1")
+
+        assert cache.get("nb_1", [], "Q?") is None
+
+
+@pytest.fixture
+def mock_core():
+    core = MagicMock()
+    core.get_source_ids = AsyncMock(return_value=["s1"])
+    return core
+
+
+class TestAskMany:
+    @pytest.mark.asyncio
+    async def test_cached_answers_are_not_asked_again(self, mock_core):
+        cache = AnswerCache(":memory:")
+        cache.put("nb_1", ["s1"], "Old?", _answer("Old answer."))
+        api = ChatAPI(mock_core, answer_cache=cache)
+        seen = []
+
+        with patch.object(
+            api, "ask", new_callable=AsyncMock, return_value=_answer("New answer.")
+        ) as ask:
+            results = await api.ask_many("nb_1", ["Old?", "New?"], on_result=seen.append)
+
+        ask.assert_awaited_once_with("nb_1", "New?", source_ids=["s1"])
+        mock_core.get_source_ids.assert_awaited_once_with("nb_1")
+        assert [r.status for r in results] == ["cached", "answered"]
+        assert len(seen) == 2
+        assert cache.get("nb_1", ["s1"], "New?").answer == "New answer."
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_asks_everything(self, mock_core):
+        cache = AnswerCache(":memory:")
+        cache.put("nb_1", ["s1"], "Q?", _answer("Old."))
+        api = ChatAPI(mock_core, answer_cache=cache)
+
+        with patch.object(api, "ask", new_callable=AsyncMock, return_value=_answer("Fresh.")):
+            results = await api.ask_many("nb_1", ["Q?"], use_cache=False)
+
+        assert results[0].status == "answered"
+        assert cache.get("nb_1", ["s1"], "Q?").answer == "Fresh."
+
+    @pytest.mark.asyncio
+    async def test_repeated_questions_asked_once(self, mock_core):
+        api = ChatAPI(mock_core)
+        with patch.object(api, "ask", new_callable=AsyncMock, return_value=_answer("A.")) as ask:
+            results = await api.ask_many("nb_1", ["Q?", "Other?", "Q?"], source_ids=["x"])
+
+        assert ask.await_count == 2
+        assert [r.index for r in results] == [0, 1, 2]
+        assert results[2].result is results[0].result
+        mock_core.get_source_ids.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_abort_batch(self, mock_core):
+        api = ChatAPI(mock_core, answer_cache=AnswerCache(":memory:"))
+        with patch.object(
+            api,
+            "ask",
+            new_callable=AsyncMock,
+            side_effect=[ChatError("boom"), _answer("A.")],
+        ):
+            results = await api.ask_many("nb_1", ["Bad?", "Good?"], concurrency=1)
+
+        assert results[0].is_failed and "boom" in results[0].error
+        assert results[1].status == "answered"
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency_raises(self, mock_core):
+        with pytest.raises(ValidationError, match="concurrency"):
+            await ChatAPI(mock_core).ask_many("nb_1", ["Q?"], concurrency=0)
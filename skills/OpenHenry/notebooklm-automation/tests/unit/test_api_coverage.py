@@ -271,6 +271,26 @@ class TestGetNotebookDescription:
         assert result.suggested_topics[0].question == "What is the future of AI?"
         assert "briefing" in result.suggested_topics[0].prompt
 
+    @pytest.mark.asyncio
+    async def test_get_with_sources_uses_one_call(self, mock_client):
+        """Test get_with_sources parses notebook and sources from one GET_NOTEBOOK."""
+        rows = [
+            [["src_1"], "First", [None, None, [1700000000, 0], None, 5], [None, 2]],
+            [["src_2"], "Second", [None, None, [1700000000, 0], None, 5], [None, 2]],
+        ]
+        mock_client._core.rpc_call = AsyncMock(
+            return_value=[["Research", rows, "nb_123", None, None, [None, False]]]
+        )
+
+        notebook, sources = await mock_client.notebooks.get_with_sources("nb_123")
+
+        assert notebook.id == "nb_123"
+        assert notebook.title == "Research"
+        assert notebook.sources_count == 2
+        assert [s.id for s in sources] == ["src_1", "src_2"]
+        mock_client._core.rpc_call.assert_awaited_once()
+        assert mock_client._core.rpc_call.await_args.args[0] == RPCMethod.GET_NOTEBOOK
+
 
 class TestPayloadFixes:
     """Tests for fixed payload structures."""
@@ -1,13 +1,17 @@
 """Unit tests for artifact download methods."""
 
 import os
+import sys
 import tempfile
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from notebooklm._artifacts import ArtifactsAPI
+from notebooklm._artifacts import ArtifactsAPI, _extract_cell_text, _iter_data_table
+from notebooklm._cache import ArtifactCache
 from notebooklm.auth import AuthTokens
+from notebooklm.exceptions import ConfigurationError, ValidationError
+from notebooklm.rpc import RPCError
 from notebooklm.types import (
     ArtifactNotFoundError,
     ArtifactNotReadyError,
@@ -652,3 +656,238 @@ class TestDownloadDataTable:
 
             with pytest.raises(ArtifactParseError):
                 await api.download_data_table("nb_123", "/tmp/data.csv")
+
+
+def _cell(start, end, text):
+    return [start, end, [[start, end, [[start, end, [[text]]]]]]]
+
+
+def _data_table_artifact(rows_data, artifact_id="table_001"):
+    artifact = [artifact_id, "Data Table", 9, None, 3]
+    artifact.extend([None] * 13)  # Pad to index 18
+    artifact.append([[[[[0, 100, None, None, [6, 7, rows_data]]]]]])
+    return artifact
+
+
+class TestDataTableStreaming:
+    """Test streaming data table parsing and Parquet output."""
+
+    def test_iter_data_table_yields_rows_lazily(self):
+        """The iterator yields the header first and parses rows on demand."""
+        rows_data = [
+            [0, 10, [_cell(0, 5, "Name"), _cell(5, 10, "Score")]],
+            [10, 20, [_cell(10, 15, "Ada"), _cell(15, 20, "1")]],
+            "not a row",
+            [20, 30, [_cell(20, 25, "Bob"), _cell(25, 30, "2")]],
+        ]
+        rows = _iter_data_table(_data_table_artifact(rows_data)[18])
+
+        assert next(rows) == ["Name", "Score"]
+        assert list(rows) == [["Ada", "1"], ["Bob", "2"]]
+
+    def test_iter_data_table_missing_header_row(self):
+        """A malformed header row is an error even if data rows are valid."""
+        rows_data = [[0, 10], [10, 20, [_cell(10, 20, "A")]]]
+
+        with pytest.raises(ArtifactParseError):
+            list(_iter_data_table(_data_table_artifact(rows_data)[18]))
+
+    def test_extract_cell_text_deep_nesting(self):
+        """Deeply nested cells do not hit the recursion limit."""
+        cell: list = ["deep"]
+        for i in range(5000):
+            cell = [i, [cell]]
+
+        assert _extract_cell_text(cell) == "deep"
+
+    @pytest.mark.asyncio
+    async def test_download_data_table_invalid_format(self, mock_artifacts_api):
+        """Unknown output formats are rejected before any RPC."""
+        api, mock_core = mock_artifacts_api
+
+        with pytest.raises(ValidationError):
+            await api.download_data_table("nb_123", "/tmp/data.xlsx", output_format="xlsx")
+        mock_core.rpc_call.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_download_data_table_parquet_requires_pyarrow(self, mock_artifacts_api):
+        """Parquet output without pyarrow raises and leaves no partial file."""
+        api, _ = mock_artifacts_api
+        rows_data = [[0, 5, [_cell(0, 5, "Col")]], [5, 10, [_cell(5, 10, "A")]]]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "data.parquet")
+            with (
+                patch.object(api, "_list_raw", new_callable=AsyncMock) as mock_list,
+                patch.dict(sys.modules, {"pyarrow": None, "pyarrow.parquet": None}),
+            ):
+                mock_list.return_value = [_data_table_artifact(rows_data)]
+
+                with pytest.raises(ConfigurationError):
+                    await api.download_data_table("nb_123", output_path, output_format="parquet")
+
+            assert os.listdir(tmpdir) == []
+
+    @pytest.mark.asyncio
+    async def test_download_data_table_parquet(self, mock_artifacts_api):
+        """Parquet output writes string columns with de-duplicated names."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        api, _ = mock_artifacts_api
+        rows_data = [
+            [0, 10, [_cell(0, 5, "Col"), _cell(5, 10, "Col"), _cell(10, 10, "")]],
+            [10, 20, [_cell(10, 15, "A"), _cell(15, 20, "B")]],
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, "data.parquet")
+            with patch.object(api, "_list_raw", new_callable=AsyncMock) as mock_list:
+                mock_list.return_value = [_data_table_artifact(rows_data)]
+
+                result = await api.download_data_table(
+                    "nb_123", output_path, output_format="parquet"
+                )
+
+            table = pq.read_table(result)
+            assert table.column_names == ["Col", "Col_2", "column_3"]
+            assert table.to_pylist() == [{"Col": "A", "Col_2": "B", "column_3": ""}]
+
+
+class TestDownloadAll:
+    """Test download_all single-snapshot export."""
+
+    @staticmethod
+    def _report(artifact_id, title, body):
+        return [artifact_id, title, 2, None, 3, None, None, [body]]
+
+    @staticmethod
+    def _interactive(artifact_id, title, variant):
+        return [artifact_id, title, 4, None, 3, None, None, None, None, [None, [variant]]]
+
+    @pytest.mark.asyncio
+    async def test_download_all_uses_one_snapshot(self, mock_artifacts_api):
+        """All artifacts are written from a single list call per source."""
+        api, mock_core = mock_artifacts_api
+        quiz_html = (
+            '<div data-app-data="{&quot;quiz&quot;: [{&quot;question&quot;: &quot;Q1&quot;}]}">'
+        )
+        cards_html = '<div data-app-data="{&quot;flashcards&quot;: [{&quot;f&quot;: &quot;F&quot;, &quot;b&quot;: &quot;B&quot;}]}">'
+        mock_core.rpc_call.side_effect = [
+            [[None] * 9 + [[quiz_html]]],
+            [[None] * 9 + [[cards_html]]],
+        ]
+        api._notes.list_mind_maps = AsyncMock(
+            return_value=[["mm_001", ["mm_001", '{"name": "Root", "children": []}'], None]]
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(api, "_list_raw", new_callable=AsyncMock) as mock_list:
+                mock_list.return_value = [
+                    self._report("rep_001", "Guide", "# One"),
+                    self._report("rep_002", "Guide", "# Two"),
+                    self._report("rep_003", "Pending", "# Skip")[:4] + [1, None, None, ["x"]],
+                    self._interactive("quiz_001", "Quiz", 2),
+                    self._interactive("cards_001", "Cards", 1),
+                ]
+
+                result = await api.download_all("nb_123", tmpdir)
+
+            mock_list.assert_awaited_once_with("nb_123")
+            api._notes.list_mind_maps.assert_awaited_once_with("nb_123")
+            assert mock_core.rpc_call.await_count == 2
+            assert set(result) == {"rep_001", "rep_002", "quiz_001", "cards_001", "mm_001"}
+            assert sorted(os.listdir(tmpdir)) == [
+                "Cards.json",
+                "Guide (2).md",
+                "Guide.md",
+                "Quiz.json",
+                "mind_map.json",
+            ]
+            with open(result["cards_001"], encoding="utf-8") as f:
+                assert '"front": "F"' in f.read()
+
+    @pytest.mark.asyncio
+    async def test_download_all_filters_types_and_skips_unparseable(self, mock_artifacts_api):
+        """Only requested types are fetched; broken artifacts are skipped."""
+        api, mock_core = mock_artifacts_api
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(api, "_list_raw", new_callable=AsyncMock) as mock_list:
+                mock_list.return_value = [
+                    self._report("rep_001", "Good", "# Fine"),
+                    ["rep_002", "Broken", 2, None, 3, None, None, [None]],
+                    self._interactive("quiz_001", "Quiz", 2),
+                ]
+
+                result = await api.download_all("nb_123", tmpdir, artifact_types=["report"])
+
+            assert list(result) == ["rep_001"]
+            api._notes.list_mind_maps.assert_not_awaited()
+            mock_core.rpc_call.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_download_all_skips_failed_fetch(self, mock_artifacts_api):
+        """A failed interactive fetch is skipped; the rest of the export is kept."""
+        api, mock_core = mock_artifacts_api
+        quiz_html = (
+            '<div data-app-data="{&quot;quiz&quot;: [{&quot;question&quot;: &quot;Q1&quot;}]}">'
+        )
+
+        async def content(method, params, **kwargs):
+            if params[0] == "cards_001":
+                raise RPCError("boom")
+            return [[None] * 9 + [[quiz_html]]]
+
+        mock_core.rpc_call.side_effect = content
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(api, "_list_raw", new_callable=AsyncMock) as mock_list:
+                mock_list.return_value = [
+                    self._report("rep_001", "Guide", "# One"),
+                    self._interactive("cards_001", "Cards", 1),
+                    self._interactive("quiz_001", "Quiz", 2),
+                ]
+
+                result = await api.download_all(
+                    "nb_123", tmpdir, artifact_types=["report", "quiz", "flashcards"]
+                )
+
+            assert set(result) == {"rep_001", "quiz_001"}
+            assert sorted(os.listdir(tmpdir)) == ["Guide.md", "Quiz.json"]
+
+    @pytest.mark.asyncio
+    async def test_download_all_rejects_media_types(self, mock_artifacts_api):
+        """Media artifacts are not exportable from the list snapshot."""
+        api, _ = mock_artifacts_api
+
+        with pytest.raises(ValidationError):
+            await api.download_all("nb_123", "/tmp/out", artifact_types=["audio"])
+        with pytest.raises(ValidationError):
+            await api.download_all("nb_123", "/tmp/out", output_format="pdf")
+
+
+class TestArtifactContentCache:
+    """Test that interactive content is served from the artifact cache."""
+
+    @pytest.mark.asyncio
+    async def test_get_artifact_content_uses_cache(self, tmp_path):
+        """The second fetch of completed content is served from disk."""
+        mock_core = MagicMock()
+        mock_core.rpc_call = AsyncMock(return_value=[[None] * 9 + [["<html>quiz</html>"]]])
+        api = ArtifactsAPI(mock_core, notes_api=MagicMock(), cache=ArtifactCache(tmp_path))
+
+        first = await api._get_artifact_content("nb_123", "quiz_001")
+        second = await api._get_artifact_content("nb_123", "quiz_001")
+
+        assert first == second == "<html>quiz</html>"
+        mock_core.rpc_call.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_artifact_content_does_not_cache_missing(self, tmp_path):
+        """Empty responses are not cached, so they are retried next time."""
+        mock_core = MagicMock()
+        mock_core.rpc_call = AsyncMock(return_value=None)
+        api = ArtifactsAPI(mock_core, notes_api=MagicMock(), cache=ArtifactCache(tmp_path))
+
+        assert await api._get_artifact_content("nb_123", "quiz_001") is None
+        assert await api._get_artifact_content("nb_123", "quiz_001") is None
+        assert mock_core.rpc_call.await_count == 2
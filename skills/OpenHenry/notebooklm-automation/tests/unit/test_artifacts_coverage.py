@@ -11,6 +11,7 @@ import httpx
 import pytest
 
 from notebooklm._artifacts import ArtifactsAPI
+from notebooklm._polling import GenerationStats
 from notebooklm.rpc.decoder import RPCError
 from notebooklm.types import ArtifactDownloadError
 
@@ -273,6 +274,134 @@ class TestWaitForCompletion:
         assert result.task_id == "task_123"
 
 
+class TestAdaptivePolling:
+    """Test wait_for_completion with recorded generation stats."""
+
+    @staticmethod
+    def _row(status, created):
+        # AUDIO type without media would never be ready, so use REPORT (2)
+        row = ["task_123", "Title", 2, None, status] + [None] * 10
+        row.append([created, 0])
+        return row
+
+    @pytest.mark.asyncio
+    async def test_schedules_around_expected_duration(self, tmp_path):
+        """Sleeps follow the recorded duration and completion is recorded."""
+        stats = GenerationStats(tmp_path / "stats.json")
+        for _ in range(3):
+            stats.record(2, 100.0)
+        mock_core = MagicMock()
+        api = ArtifactsAPI(mock_core, notes_api=MagicMock(), stats=stats)
+        mock_core.rpc_call = AsyncMock(
+            side_effect=[[[self._row(1, 1000.0)]], [[self._row(3, 1000.0)]]]
+        )
+
+        with (
+            patch("notebooklm._artifacts.time.time", return_value=1010.0),
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await api.wait_for_completion(
+                "nb_123", "task_123", timeout=600.0, max_interval=60.0
+            )
+
+        assert result.is_complete
+        # 90s remaining until the typical finish -> sleep half of it
+        mock_sleep.assert_awaited_once_with(45.0)
+        assert GenerationStats(tmp_path / "stats.json")._load()["2"][-1] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_already_complete_is_not_recorded(self, tmp_path):
+        """Artifacts finished before waiting started don't skew the stats."""
+        stats = GenerationStats(tmp_path / "stats.json")
+        mock_core = MagicMock()
+        api = ArtifactsAPI(mock_core, notes_api=MagicMock(), stats=stats)
+        mock_core.rpc_call = AsyncMock(return_value=[[self._row(3, 1000.0)]])
+
+        await api.wait_for_completion("nb_123", "task_123")
+
+        assert not (tmp_path / "stats.json").exists()
+
+
+class TestAsCompleted:
+    """Test as_completed iteration over multiple generation tasks."""
+
+    @staticmethod
+    def _row(task_id, status):
+        # REPORT type (no URL check needed)
+        return [task_id, "Title", 2, None, status]
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self, mock_artifacts_api):
+        """Tasks are yielded as they finish, with one list call per tick."""
+        api, mock_core = mock_artifacts_api
+        mock_core.rpc_call.side_effect = [
+            [[self._row("a", 1), self._row("b", 3)]],
+            [[self._row("a", 1), self._row("b", 3), self._row("c", 4)]],
+            [[self._row("a", 3), self._row("b", 3), self._row("c", 4)]],
+        ]
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            results = [s async for s in api.as_completed("nb_123", ["a", "b", "c", "a"])]
+
+        assert [(s.task_id, s.status) for s in results] == [
+            ("b", "completed"),
+            ("c", "failed"),
+            ("a", "completed"),
+        ]
+        assert mock_core.rpc_call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_status_change_callback(self, mock_artifacts_api):
+        """Sync and async callbacks fire once per status transition."""
+        api, mock_core = mock_artifacts_api
+        mock_core.rpc_call.side_effect = [
+            [[]],
+            [[self._row("a", 1)]],
+            [[self._row("a", 1)]],
+            [[self._row("a", 3)]],
+        ]
+        seen = []
+        async_seen = []
+
+        async def async_callback(status):
+            async_seen.append(status.status)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            async for _ in api.as_completed(
+                "nb_123", ["a"], on_status_change=lambda s: seen.append(s.status)
+            ):
+                pass
+        mock_core.rpc_call.side_effect = [[[self._row("a", 3)]]]
+        async for _ in api.as_completed("nb_123", ["a"], on_status_change=async_callback):
+            pass
+
+        assert seen == ["pending", "in_progress", "completed"]
+        assert async_seen == ["completed"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_names_pending_tasks(self, mock_artifacts_api):
+        """Finished tasks are still yielded before the timeout is raised."""
+        api, mock_core = mock_artifacts_api
+        mock_core.rpc_call.return_value = [[self._row("a", 3), self._row("b", 1)]]
+
+        loop = asyncio.get_running_loop()
+        time_values = iter([0, 0.5])
+
+        def mock_time():
+            return next(time_values, 10.0)
+
+        results = []
+        with (
+            patch.object(loop, "time", mock_time),
+            patch("asyncio.sleep", new_callable=AsyncMock),
+            pytest.raises(TimeoutError, match="Tasks b timed out"),
+        ):
+            async for status in api.as_completed("nb_123", ["a", "b"], timeout=1.0):
+                results.append(status.task_id)
+
+        assert results == ["a"]
+
+
 # =============================================================================
 # TIER 1: _parse_generation_result tests (lines 1423-1457)
 # =============================================================================
@@ -0,0 +1,73 @@
+"""Tests for the on-disk artifact content cache."""
+
+import os
+
+from notebooklm._cache import ArtifactCache
+
+
+class TestArtifactCache:
+    def test_miss_then_hit(self, tmp_path):
+        """Stored content is returned for the same key only."""
+        cache = ArtifactCache(tmp_path)
+
+        assert cache.get("nb", "art", "html") is None
+        cache.put("nb", "art", "html", "<div>ü</div>")
+
+        assert cache.get("nb", "art", "html") == "<div>ü</div>"
+        assert cache.get("nb", "art", "json") is None
+        assert cache.get("other_nb", "art", "html") is None
+
+    def test_keys_are_hashed(self, tmp_path):
+        """IDs never appear verbatim in file names."""
+        cache = ArtifactCache(tmp_path)
+        cache.put("nb/../x", "art", "html", "content")
+
+        names = os.listdir(tmp_path)
+        assert len(names) == 1
+        assert "art" not in names[0]
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Entries not read recently are evicted first once over the cap."""
+        cache = ArtifactCache(tmp_path, max_bytes=25)
+        cache.put("nb", "a", "html", "x" * 10)
+        cache.put("nb", "b", "html", "x" * 10)
+        # Age both entries, then touch "a" so "b" becomes least recently used
+        for name in os.listdir(tmp_path):
+            os.utime(tmp_path / name, (1, 1))
+        assert cache.get("nb", "a", "html") is not None
+
+        cache.put("nb", "c", "html", "x" * 10)
+
+        assert cache.get("nb", "b", "html") is None
+        assert cache.get("nb", "a", "html") is not None
+        assert cache.get("nb", "c", "html") is not None
+        assert cache.size <= 25
+
+    def test_clear(self, tmp_path):
+        """clear() removes every entry."""
+        cache = ArtifactCache(tmp_path)
+        cache.put("nb", "a", "html", "one")
+        cache.put("nb", "b", "html", "two")
+
+        cache.clear()
+
+        assert cache.size == 0
+        assert cache.get("nb", "a", "html") is None
+
+    def test_defaults_to_notebooklm_home(self, tmp_path, monkeypatch):
+        """Without an explicit directory the cache lives under NOTEBOOKLM_HOME."""
+        monkeypatch.setenv("NOTEBOOKLM_HOME", str(tmp_path))
+
+        cache = ArtifactCache()
+
+        assert cache.cache_dir == tmp_path.resolve() / "cache" / "artifacts"
+
+    def test_write_failure_is_ignored(self, tmp_path):
+        """An unwritable cache directory does not raise."""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        cache = ArtifactCache(blocker / "sub")
+
+        cache.put("nb", "a", "html", "content")
+
+        assert cache.get("nb", "a", "html") is None
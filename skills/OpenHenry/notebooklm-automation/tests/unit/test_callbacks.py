@@ -0,0 +1,20 @@
+"""Unit tests for sync/async callback invocation."""
+
+import pytest
+
+from notebooklm._callbacks import invoke_callback
+
+
+class TestInvokeCallback:
+    @pytest.mark.asyncio
+    async def test_sync_and_async_callbacks(self):
+        seen = []
+
+        async def async_callback(value):
+            seen.append(("async", value))
+
+        await invoke_callback(lambda value: seen.append(("sync", value)), 1)
+        await invoke_callback(async_callback, 2)
+        await invoke_callback(None, 3)
+
+        assert seen == [("sync", 1), ("async", 2)]
@@ -434,3 +434,192 @@ class TestAskWithReferences:
         # All references should have the same source_id
         for ref in result.references:
             assert ref.source_id == "aaaaaaaa-1234-5678-9012-abcdefabcdef"
+
+
+def _answer_chunk(text: str, citations: list | None = None) -> str:
+    """Build one length-prefixed chunk of a GenerateFreeFormStreamed response."""
+    inner = [[text, None, ["chunk-1", 1], None, [[], None, None, citations or [], 1]]]
+    chunk_json = json.dumps([["wrb.fr", None, json.dumps(inner)]])
+    return f"{len(chunk_json)}\n{chunk_json}\n"
+
+
+_CITATION = [
+    ["chunk-1"],
+    [
+        None,
+        None,
+        0.9,
+        [[None]],
+        [[[10, 50, [[[5, 20, "Cited passage."]]]]]],
+        [[[["aaaaaaaa-1234-5678-9012-abcdefabcdef"]]]],
+        ["chunk-1"],
+    ],
+]
+
+
+_SECOND_CITATION = [
+    ["chunk-2"],
+    [
+        None,
+        None,
+        0.8,
+        [[None]],
+        [[[60, 90, [[[55, 80, "Another passage."]]]]]],
+        [[["bbbbbbbb-1234-5678-9012-abcdefabcdef"]]],
+        ["chunk-2"],
+    ],
+]
+
+
+class TestDeferredCitations:
+    def test_only_final_answer_citations_are_decoded(self, auth_tokens):
+        """Snapshots repeat earlier citations; they must not be decoded or duplicated."""
+        from unittest.mock import patch
+
+        chat_api = NotebookLMClient(auth_tokens).chat
+        first = "The answer begins here and continues"
+        body = (
+            ")]}'\n"
+            + _answer_chunk(first, [_CITATION])
+            + _answer_chunk(first + " further [1] [2].", [_CITATION, _SECOND_CITATION])
+        )
+
+        with patch.object(
+            chat_api, "_parse_single_citation", wraps=chat_api._parse_single_citation
+        ) as parse_one:
+            answer, refs = chat_api._parse_ask_response_with_references(body)
+
+        assert answer.endswith("further [1] [2].")
+        assert parse_one.call_count == 2
+        assert [(r.citation_number, r.source_id[:8]) for r in refs] == [
+            (1, "aaaaaaaa"),
+            (2, "bbbbbbbb"),
+        ]
+
+    def test_non_json_lines_are_skipped_without_decoding(self, auth_tokens):
+        chat_api = NotebookLMClient(auth_tokens).chat
+
+        assert chat_api._extract_answer_chunk(")]}'") is None
+        assert chat_api._extract_answer_chunk("12345") is None
+        assert chat_api._extract_answer_chunk('[["di", 42]]') is None
+
+
+class TestAskStream:
+    @pytest.mark.asyncio
+    async def test_yields_deltas_then_final_result(self, auth_tokens, httpx_mock):
+        import re
+
+        first = "The answer begins here and continues"
+        second = first + " with more detail [1]."
+        body = ")]}'\n" + _answer_chunk(first) + _answer_chunk(second, [_CITATION])
+        httpx_mock.add_response(
+            url=re.compile(r".*GenerateFreeFormStreamed.*"),
+            content=body.encode(),
+            method="POST",
+        )
+
+        async with NotebookLMClient(auth_tokens) as client:
+            chunks = [
+                chunk async for chunk in client.chat.ask_stream("nb_123", "Q?", source_ids=["src"])
+            ]
+
+        assert [c.delta for c in chunks] == [first, " with more detail [1].", ""]
+        assert chunks[1].references[0].source_id == "aaaaaaaa-1234-5678-9012-abcdefabcdef"
+        assert chunks[1].references[0].citation_number == 1
+        assert not any(c.replaced for c in chunks)
+
+        final = chunks[-1]
+        assert final.is_final
+        assert final.result.answer == second
+        assert final.result.turn_number == 1
+        assert len(final.result.references) == 1
+        assert client.chat.get_cached_turns(final.result.conversation_id)[0].answer == second
+
+    @pytest.mark.asyncio
+    async def test_matches_ask_result(self, auth_tokens, httpx_mock):
+        import re
+
+        body = ")]}'\n" + _answer_chunk("An answer long enough to count [1].", [_CITATION])
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=re.compile(r".*GenerateFreeFormStreamed.*"),
+                content=body.encode(),
+                method="POST",
+            )
+
+        async with NotebookLMClient(auth_tokens) as client:
+            asked = await client.chat.ask("nb_123", "Q?", source_ids=["src"])
+            streamed = [
+                chunk async for chunk in client.chat.ask_stream("nb_123", "Q?", source_ids=["src"])
+            ][-1].result
+
+        assert streamed.answer == asked.answer
+        assert streamed.references == asked.references
+
+    @pytest.mark.asyncio
+    async def test_repeated_citations_are_yielded_once(self, auth_tokens, httpx_mock):
+        import re
+
+        first = "The answer begins here and continues [1]"
+        body = (
+            ")]}'\n"
+            + _answer_chunk(first, [_CITATION])
+            + _answer_chunk(first + " and more [2].", [_CITATION, _SECOND_CITATION])
+        )
+        httpx_mock.add_response(
+            url=re.compile(r".*GenerateFreeFormStreamed.*"),
+            content=body.encode(),
+            method="POST",
+        )
+
+        async with NotebookLMClient(auth_tokens) as client:
+            chunks = [
+                chunk async for chunk in client.chat.ask_stream("nb_123", "Q?", source_ids=["src"])
+            ]
+
+        assert [len(c.references) for c in chunks] == [1, 1, 0]
+        assert chunks[1].references[0].citation_number == 2
+        assert len(chunks[-1].result.references) == 2
+
+    @pytest.mark.asyncio
+    async def test_replaced_snapshot_drops_earlier_references(self, auth_tokens, httpx_mock):
+        import re
+
+        body = (
+            ")]}'\n"
+            + _answer_chunk("A first draft of the answer [1]", [_CITATION, _SECOND_CITATION])
+            + _answer_chunk("The revised and longer answer text [1].", [_SECOND_CITATION])
+        )
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=re.compile(r".*GenerateFreeFormStreamed.*"),
+                content=body.encode(),
+                method="POST",
+            )
+
+        async with NotebookLMClient(auth_tokens) as client:
+            chunks = [
+                chunk async for chunk in client.chat.ask_stream("nb_123", "Q?", source_ids=["src"])
+            ]
+            asked = await client.chat.ask("nb_123", "Q?", source_ids=["src"])
+
+        assert chunks[1].replaced
+        assert [r.source_id[:8] for r in chunks[1].references] == ["bbbbbbbb"]
+        final = chunks[-1].result
+        assert [(r.citation_number, r.source_id[:8]) for r in final.references] == [(1, "bbbbbbbb")]
+        assert final.references == asked.references
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises_chat_error(self, auth_tokens, httpx_mock):
+        import re
+
+        from notebooklm.exceptions import ChatError
+
+        httpx_mock.add_response(
+            url=re.compile(r".*GenerateFreeFormStreamed.*"), status_code=500, method="POST"
+        )
+
+        async with NotebookLMClient(auth_tokens) as client:
+            with pytest.raises(ChatError, match="HTTP 500"):
+                async for _ in client.chat.ask_stream("nb_123", "Q?", source_ids=["src"]):
+                    pass
@@ -706,3 +706,56 @@ class TestRpcCallAutoRetry:
         assert refresh_count[0] == 1, (
             f"Refresh should be called exactly once, got {refresh_count[0]}"
         )
+
+
+# =============================================================================
+# REQUEST CONCURRENCY LIMIT TESTS
+# =============================================================================
+
+
+class TestRequestConcurrencyLimit:
+    @pytest.fixture
+    def auth(self):
+        return AuthTokens(
+            cookies={"SID": "test"},
+            csrf_token="csrf",
+            session_id="sid",
+        )
+
+    @pytest.mark.asyncio
+    async def test_rpc_calls_capped_at_max_concurrent_requests(self, auth):
+        """Concurrent rpc_call() posts should never exceed the configured limit."""
+        core = ClientCore(auth, max_concurrent_requests=2)
+        in_flight = [0]
+        peak = [0]
+
+        async def mock_post(*args, **kwargs):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            response = MagicMock()
+            response.text = ""
+            response.raise_for_status = MagicMock()
+            return response
+
+        core._http_client = MagicMock()
+        core._http_client.post = mock_post
+
+        with patch("notebooklm._core.decode_response", return_value=["result"]):
+            await asyncio.gather(*(core.rpc_call(RPCMethod.LIST_NOTEBOOKS, []) for _ in range(6)))
+
+        assert peak[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_request_slot_is_noop_when_disabled(self, auth):
+        """max_concurrent_requests=None should disable the limiter."""
+        core = ClientCore(auth, max_concurrent_requests=None)
+        assert core._request_semaphore is None
+        async with core.request_slot():
+            pass
+
+    def test_client_passes_limit_to_core(self, auth):
+        """NotebookLMClient should forward max_concurrent_requests to ClientCore."""
+        client = NotebookLMClient(auth, max_concurrent_requests=3)
+        assert client._core._request_semaphore._value == 3
@@ -76,9 +76,7 @@ class TestAsk:
 
         async with NotebookLMClient(auth_tokens) as client:
             # Seed cache via core client
-            client._core._conversation_cache["conv_123"] = [
-                {"query": "Q1", "answer": "A1", "turn_number": 1}
-            ]
+            client._core.cache_conversation_turn("conv_123", "Q1", "A1", 1)
 
             result = await client.chat.ask(
                 notebook_id="nb_123",
@@ -94,3 +92,27 @@ class TestAsk:
         )
         assert result.is_follow_up is True
         assert result.turn_number == 2
+
+    @pytest.mark.asyncio
+    async def test_turn_number_continues_after_truncation(self, auth_tokens, httpx_mock):
+        """Stores keep only the latest turns; numbering follows the last kept turn."""
+        from notebooklm import MemoryConversationStore
+
+        inner_json = json.dumps(
+            [["A third answer that is longer than twenty chars.", None, None, None, [1]]]
+        )
+        chunk_json = json.dumps([["wrb.fr", None, inner_json]])
+        httpx_mock.add_response(
+            content=f")]}}'\n{len(chunk_json)}\n{chunk_json}\n".encode(), method="POST"
+        )
+        store = MemoryConversationStore(max_turns=1)
+        store.append("conv_123", "Q1", "A1", 1)
+        store.append("conv_123", "Q2", "A2", 2)
+
+        async with NotebookLMClient(auth_tokens, conversation_store=store) as client:
+            result = await client.chat.ask(
+                "nb_123", "Q3?", conversation_id="conv_123", source_ids=["test_source"]
+            )
+
+        assert result.turn_number == 3
+        assert [turn["turn_number"] for turn in store.get("conv_123")] == [3]
@@ -0,0 +1,153 @@
+"""Unit tests for conversation turn stores."""
+
+import asyncio
+import json
+import re
+import threading
+
+import pytest
+
+from notebooklm._conversations import MemoryConversationStore, SQLiteConversationStore
+from notebooklm._core import ClientCore
+from notebooklm.auth import AuthTokens
+from notebooklm.client import NotebookLMClient
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    def make(**kwargs):
+        if request.param == "memory":
+            return MemoryConversationStore(**kwargs)
+        return SQLiteConversationStore(tmp_path / "conversations.db", **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def auth_tokens():
+    return AuthTokens(cookies={"SID": "test"}, csrf_token="csrf", session_id="sid")
+
+
+class TestConversationStores:
+    def test_append_and_get(self, make_store):
+        store = make_store()
+        store.append("c1", "Q1", "A1", 1)
+        store.append("c1", "Q2", "A2", 2)
+
+        assert store.get("c1") == [
+            {"query": "Q1", "answer": "A1", "turn_number": 1},
+            {"query": "Q2", "answer": "A2", "turn_number": 2},
+        ]
+        assert store.get("unknown") == []
+
+    def test_keeps_only_latest_turns(self, make_store):
+        store = make_store(max_turns=2)
+        for n in range(1, 5):
+            store.append("c1", f"Q{n}", f"A{n}", n)
+
+        assert [turn["turn_number"] for turn in store.get("c1")] == [3, 4]
+
+    def test_evicts_least_recently_used(self, make_store, monkeypatch):
+        clock = iter(range(100))
+        monkeypatch.setattr("notebooklm._conversations.time.time", lambda: next(clock))
+        store = make_store(max_conversations=2)
+        store.append("old", "Q", "A", 1)
+        store.append("recent", "Q", "A", 1)
+        store.get("old")  # touch: "recent" is now least recently used
+        store.append("new", "Q", "A", 1)
+
+        assert store.get("recent") == []
+        assert store.get("old") and store.get("new")
+
+    def test_clear(self, make_store):
+        store = make_store()
+        store.append("c1", "Q", "A", 1)
+        store.append("c2", "Q", "A", 1)
+
+        assert store.clear("c1") is True
+        assert store.clear("c1") is False
+        assert store.get("c2")
+        assert store.clear() is True
+        assert store.get("c2") == []
+
+
+class TestSQLiteConversationStore:
+    def test_shared_between_instances(self, tmp_path):
+        """Two processes (here: two connections) see each other's turns."""
+        path = tmp_path / "conversations.db"
+        first = SQLiteConversationStore(path)
+        second = SQLiteConversationStore(path)
+
+        first.append("c1", "Q1", "A1", 1)
+        second.append("c1", "Q2", "A2", 2)
+
+        assert [turn["query"] for turn in first.get("c1")] == ["Q1", "Q2"]
+        first.close()
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_usable_from_worker_threads(self, tmp_path):
+        store = SQLiteConversationStore(tmp_path / "conversations.db")
+        await asyncio.to_thread(store.append, "c1", "Q", "A", 1)
+
+        assert await asyncio.to_thread(store.get, "c1") == store.get("c1")
+        store.close()
+
+    def test_memory_path_writes_nothing(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        store = SQLiteConversationStore(":memory:")
+        store.append("c1", "Q", "A", 1)
+
+        assert store.get("c1")
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestCoreConversationStore:
+    def test_core_uses_given_store(self, tmp_path, auth_tokens):
+        auth = auth_tokens
+        store = SQLiteConversationStore(tmp_path / "conversations.db")
+        ClientCore(auth, conversation_store=store).cache_conversation_turn("c1", "Q", "A", 1)
+
+        core = ClientCore(
+            auth, conversation_store=SQLiteConversationStore(tmp_path / "conversations.db")
+        )
+        assert core.get_cached_conversation("c1") == [
+            {"query": "Q", "answer": "A", "turn_number": 1}
+        ]
+
+
+class _ThreadRecordingStore(MemoryConversationStore):
+    def __init__(self):
+        super().__init__()
+        self.threads: set[int] = set()
+
+    def get(self, conversation_id):
+        self.threads.add(threading.get_ident())
+        return super().get(conversation_id)
+
+    def append(self, conversation_id, query, answer, turn_number):
+        self.threads.add(threading.get_ident())
+        super().append(conversation_id, query, answer, turn_number)
+
+
+class TestChatStoreAccess:
+    @pytest.mark.asyncio
+    async def test_ask_reads_and_writes_store_off_the_event_loop(self, auth_tokens, httpx_mock):
+        inner = [["An answer long enough to count.", None, ["c"], None, [[], None, None, [], 1]]]
+        chunk = json.dumps([["wrb.fr", None, json.dumps(inner)]])
+        for _ in range(2):
+            httpx_mock.add_response(
+                url=re.compile(r".*GenerateFreeFormStreamed.*"),
+                content=f")]}}'\n{len(chunk)}\n{chunk}\n".encode(),
+                method="POST",
+            )
+        store = _ThreadRecordingStore()
+
+        async with NotebookLMClient(auth_tokens, conversation_store=store) as client:
+            first = await client.chat.ask("nb_123", "Q1?", source_ids=["src"])
+            second = await client.chat.ask(
+                "nb_123", "Q2?", source_ids=["src"], conversation_id=first.conversation_id
+            )
+
+        assert second.turn_number == 2
+        assert store.threads and threading.get_ident() not in store.threads
@@ -0,0 +1,18 @@
+"""Unit tests for export filename utilities."""
+
+from notebooklm._file_utils import unique_filename
+
+
+class TestUniqueFilename:
+    def test_replaces_invalid_characters(self):
+        assert unique_filename('a/b:c*?"<>|', ".md", set()) == "a_b_c______.md"
+
+    def test_deduplicates_case_insensitively(self):
+        used: set[str] = set()
+
+        names = [unique_filename(title, ".md", used) for title in ("Guide", "guide", "Guide")]
+
+        assert names == ["Guide.md", "guide (2).md", "Guide (3).md"]
+
+    def test_empty_title_gets_placeholder(self):
+        assert unique_filename(" .. ", ".json", set()) == "untitled.json"
@@ -0,0 +1,228 @@
+"""Unit tests for source fingerprints and duplicate-free ingestion."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notebooklm._fingerprints import (
+    SourceFingerprints,
+    content_fingerprint,
+    text_fingerprint,
+    url_fingerprint,
+)
+from notebooklm._sources import SourcesAPI
+from notebooklm.types import Source
+
+
+class TestFingerprintHelpers:
+    def test_url_fingerprint_is_normalized(self):
+        assert url_fingerprint("HTTPS://Example.com/a/#top") == url_fingerprint(
+            "https://example.com/a"
+        )
+
+    def test_text_fingerprint_depends_on_content(self):
+        assert text_fingerprint("hello") == text_fingerprint("hello")
+        assert text_fingerprint("hello") != text_fingerprint("hello!")
+
+    def test_kinds_do_not_collide(self):
+        assert content_fingerprint("ab").startswith("sha256:")
+        assert text_fingerprint("ab").startswith("text:")
+
+
+class TestSourceFingerprints:
+    def test_persists_and_reloads(self, tmp_path):
+        path = tmp_path / "fp.json"
+        store = SourceFingerprints(path)
+        store.add("nb_1", "text:abc", "src_1")
+        store.add("nb_1", "url:https://a.com", "src_2")
+
+        reloaded = SourceFingerprints(path)
+        assert reloaded.get("nb_1") == {"text:abc": "src_1", "url:https://a.com": "src_2"}
+        assert reloaded.get("nb_2") == {}
+
+    def test_remove_sources(self, tmp_path):
+        path = tmp_path / "fp.json"
+        store = SourceFingerprints(path)
+        store.add("nb_1", "text:abc", "src_1")
+        store.add("nb_1", "text:def", "src_2")
+
+        store.remove_sources("nb_1", {"src_1"})
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"nb_1": {"text:def": "src_2"}}
+
+    def test_memory_store_never_writes(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        store = SourceFingerprints(":memory:")
+        store.add("nb_1", "text:abc", "src_1")
+
+        assert store.get("nb_1") == {"text:abc": "src_1"}
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "fp.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert SourceFingerprints(path).get("nb_1") == {}
+
+
+@pytest.fixture
+def mock_core():
+    core = MagicMock()
+    core.rpc_call = AsyncMock()
+    return core
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SourceFingerprints(tmp_path / "fp.json")
+
+
+@pytest.fixture
+def sources_api(mock_core, store):
+    return SourcesAPI(mock_core, fingerprints=store)
+
+
+class TestDeduplicatedAdds:
+    @pytest.mark.asyncio
+    async def test_url_already_in_notebook_is_not_added(self, sources_api, mock_core):
+        existing = Source(id="src_1", title="A", url="https://example.com/a")
+        with patch.object(sources_api, "list", new_callable=AsyncMock, return_value=[existing]):
+            source = await sources_api.add_url("nb_1", "https://EXAMPLE.com/a/")
+
+        assert source is existing
+        mock_core.rpc_call.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_same_text_under_new_title_is_skipped(self, sources_api, mock_core, store):
+        mock_core.rpc_call.return_value = [[[["src_t"], "Notes"]]]
+        with patch.object(sources_api, "list", new_callable=AsyncMock) as list_sources:
+            list_sources.return_value = []
+            first = await sources_api.add_text("nb_1", "Notes", "same body")
+            list_sources.return_value = [first]
+            second = await sources_api.add_text("nb_1", "Other title", "same body")
+
+        assert second.id == "src_t"
+        assert mock_core.rpc_call.await_count == 1
+        assert list_sources.await_count == 2  # seeded once, then the hit confirmed
+        assert store.get("nb_1") == {text_fingerprint("same body"): "src_t"}
+
+    @pytest.mark.asyncio
+    async def test_identical_file_is_not_uploaded_again(self, sources_api, tmp_path):
+        original = tmp_path / "paper.pdf"
+        copy = tmp_path / "paper-copy.pdf"
+        original.write_bytes(b"%PDF same bytes")
+        copy.write_bytes(b"%PDF same bytes")
+        live: list[Source] = []
+
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock, return_value=live),
+            patch.object(
+                sources_api, "_register_file_source", new_callable=AsyncMock, return_value="src_f"
+            ) as register,
+            patch.object(
+                sources_api, "_start_resumable_upload", new_callable=AsyncMock, return_value="u"
+            ),
+            patch.object(sources_api, "_upload_file_streaming", new_callable=AsyncMock),
+        ):
+            first = await sources_api.add_file("nb_1", original)
+            live.append(first)
+            second = await sources_api.add_file("nb_1", copy)
+
+        assert second is first
+        register.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_skip_duplicates_false_adds_anyway(self, sources_api, mock_core):
+        mock_core.rpc_call.return_value = [[[["src_2"], "A"]]]
+        existing = Source(id="src_1", title="A", url="https://example.com/a")
+        with patch.object(sources_api, "list", new_callable=AsyncMock, return_value=[existing]):
+            source = await sources_api.add_url(
+                "nb_1", "https://example.com/a", skip_duplicates=False
+            )
+
+        assert source.id == "src_2"
+
+    @pytest.mark.asyncio
+    async def test_manifest_seeds_new_session_and_prunes_deleted(self, mock_core, store, tmp_path):
+        store.add("nb_1", text_fingerprint("kept"), "src_kept")
+        store.add("nb_1", text_fingerprint("gone"), "src_gone")
+        api = SourcesAPI(mock_core, fingerprints=SourceFingerprints(store.path))
+        live = [Source(id="src_kept", title="Kept")]
+
+        with patch.object(api, "list", new_callable=AsyncMock, return_value=live):
+            source = await api.add_text("nb_1", "Anything", "kept")
+
+        assert source.id == "src_kept"
+        mock_core.rpc_call.assert_not_awaited()
+        assert SourceFingerprints(store.path).get("nb_1") == {text_fingerprint("kept"): "src_kept"}
+
+    @pytest.mark.asyncio
+    async def test_source_deleted_elsewhere_is_added_again(self, sources_api, mock_core, store):
+        mock_core.rpc_call.return_value = [[[["src_t"], "Notes"]]]
+        with patch.object(sources_api, "list", new_callable=AsyncMock) as list_sources:
+            list_sources.return_value = []
+            await sources_api.add_text("nb_1", "Notes", "body")
+            # Deleted in the web UI: the next list() no longer has it
+            mock_core.rpc_call.return_value = [[[["src_new"], "Notes"]]]
+            again = await sources_api.add_text("nb_1", "Notes", "body")
+
+        assert again.id == "src_new"
+        assert store.get("nb_1") == {text_fingerprint("body"): "src_new"}
+
+    @pytest.mark.asyncio
+    async def test_add_many_lists_once_per_batch(self, sources_api, mock_core, store):
+        store.add("nb_1", text_fingerprint("body"), "src_gone")
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock, return_value=[]) as listed,
+            patch.object(
+                sources_api,
+                "_add_bulk_item",
+                new_callable=AsyncMock,
+                return_value=Source(id="src_new", title="Notes"),
+            ),
+        ):
+            await sources_api.add_many("nb_1", [{"content": "a"}])
+            results = await sources_api.add_many("nb_1", [{"content": "body"}])
+
+        assert results[0].is_added
+        assert listed.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_forgets_fingerprint(self, sources_api, mock_core, store):
+        mock_core.rpc_call.return_value = [[[["src_t"], "Notes"]]]
+        with patch.object(sources_api, "list", new_callable=AsyncMock, return_value=[]):
+            await sources_api.add_text("nb_1", "Notes", "body")
+            await sources_api.delete("nb_1", "src_t")
+            mock_core.rpc_call.return_value = [[[["src_new"], "Notes"]]]
+            again = await sources_api.add_text("nb_1", "Notes", "body")
+
+        assert again.id == "src_new"
+        assert store.get("nb_1") == {text_fingerprint("body"): "src_new"}
+
+    @pytest.mark.asyncio
+    async def test_add_many_skips_previously_added_files(self, sources_api, store, tmp_path):
+        paper = tmp_path / "paper.pdf"
+        paper.write_bytes(b"content")
+        fingerprint = content_fingerprint(sources_api._file_sha256(paper.resolve()))
+        store.add("nb_1", fingerprint, "src_old")
+        old = Source(id="src_old", title="paper.pdf")
+
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock, return_value=[old]),
+            patch.object(sources_api, "add_file", new_callable=AsyncMock) as add_file,
+        ):
+            results = await sources_api.add_many("nb_1", [paper])
+
+        assert results[0].is_skipped
+        assert results[0].source is old
+        add_file.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_without_store_nothing_is_listed(self, mock_core):
+        mock_core.rpc_call.return_value = [[[["src_1"], "A"]]]
+        api = SourcesAPI(mock_core)
+        with patch.object(api, "list", new_callable=AsyncMock) as list_sources:
+            await api.add_url("nb_1", "https://example.com/a")
+
+        list_sources.assert_not_awaited()
@@ -0,0 +1,284 @@
+"""Unit tests for the account inventory fan-out and writers."""
+
+import asyncio
+import json
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from notebooklm._inventory import iter_inventory, write_inventory
+from notebooklm._notebooks import NotebooksAPI
+from notebooklm.exceptions import RPCError, ValidationError
+from notebooklm.rpc import RPCMethod
+from notebooklm.types import (
+    Artifact,
+    Note,
+    Notebook,
+    NotebookInventory,
+    ShareAccess,
+    SharedUser,
+    SharePermission,
+    ShareStatus,
+    ShareViewLevel,
+    Source,
+)
+
+
+def _notebook_response(notebook_id, title, source_ids):
+    rows = [
+        [[source_id], f"Source {source_id}", [None, None, [1700000000, 0], None, 5], [None, 2]]
+        for source_id in source_ids
+    ]
+    return [[title, rows, notebook_id, None, None, [None, False]]]
+
+
+def _status(notebook_id, users=()):
+    return ShareStatus(
+        notebook_id=notebook_id,
+        is_public=False,
+        access=ShareAccess.RESTRICTED,
+        view_level=ShareViewLevel.FULL_NOTEBOOK,
+        shared_users=[SharedUser(email, SharePermission.VIEWER) for email in users],
+    )
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    core = MagicMock()
+    core.rpc_call = AsyncMock(
+        side_effect=lambda method, params, **kwargs: _notebook_response(
+            params[0], f"Title {params[0]}", [f"{params[0]}_s1", f"{params[0]}_s2"]
+        )
+    )
+    client.notebooks = NotebooksAPI(core)
+    client.notebooks.list = AsyncMock(
+        return_value=[
+            Notebook(id="nb_1", title="One", is_owner=True),
+            Notebook(id="nb_2", title="Two", is_owner=False),
+        ]
+    )
+    client.artifacts.list = AsyncMock(
+        side_effect=lambda nb: [Artifact(id=f"{nb}_a", title="Audio", _artifact_type=1, status=3)]
+    )
+    client.notes.list = AsyncMock(
+        side_effect=lambda nb: [Note(id=f"{nb}_n", notebook_id=nb, title="Note", content="Body")]
+    )
+    client.sharing.get_status = AsyncMock(side_effect=lambda nb: _status(nb, ["a@x.com"]))
+    return client
+
+
+async def _collect(inventories):
+    return [inv async for inv in inventories]
+
+
+class TestIterInventory:
+    @pytest.mark.asyncio
+    async def test_reads_every_part_of_every_notebook(self, client):
+        inventories = await _collect(iter_inventory(client))
+
+        by_id = {inv.notebook.id: inv for inv in inventories}
+        assert set(by_id) == {"nb_1", "nb_2"}
+        second = by_id["nb_2"]
+        assert second.notebook.title == "Title nb_2"
+        assert second.notebook.is_owner is False  # ownership as reported by the list
+        assert second.notebook.sources_count == 2
+        assert [s.id for s in second.sources] == ["nb_2_s1", "nb_2_s2"]
+        assert [a.id for a in second.artifacts] == ["nb_2_a"]
+        assert [n.id for n in second.notes] == ["nb_2_n"]
+        assert second.share_status.shared_users[0].email == "a@x.com"
+        assert all(inv.is_complete for inv in inventories)
+
+    @pytest.mark.asyncio
+    async def test_one_get_notebook_per_notebook(self, client):
+        await _collect(iter_inventory(client, ["nb_1", "nb_2"]))
+
+        client.notebooks.list.assert_not_awaited()
+        assert [c.args[0] for c in client.notebooks._core.rpc_call.await_args_list] == [
+            RPCMethod.GET_NOTEBOOK,
+            RPCMethod.GET_NOTEBOOK,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_part_is_recorded(self, client):
+        client.sharing.get_status = AsyncMock(side_effect=RPCError("denied"))
+        client.notebooks._core.rpc_call = AsyncMock(side_effect=RPCError("gone"))
+
+        [inventory] = await _collect(iter_inventory(client, ["nb_1"]))
+
+        assert inventory.errors == {"notebook": "gone", "sharing": "denied"}
+        assert inventory.notebook.id == "nb_1"
+        assert inventory.sources == []
+        assert inventory.share_status is None
+        assert [a.id for a in inventory.artifacts] == ["nb_1_a"]
+
+    @pytest.mark.asyncio
+    async def test_streams_in_completion_order_within_concurrency(self, client):
+        release = {nb: asyncio.Event() for nb in ("nb_1", "nb_2", "nb_3")}
+        active = 0
+        peak = 0
+
+        async def artifacts(notebook_id):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await release[notebook_id].wait()
+            active -= 1
+            return []
+
+        client.artifacts.list = AsyncMock(side_effect=artifacts)
+        stream = iter_inventory(client, ["nb_1", "nb_2", "nb_3"], concurrency=2)
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        release["nb_2"].set()
+        assert (await first).notebook.id == "nb_2"
+
+        release["nb_1"].set()
+        release["nb_3"].set()
+        rest = await _collect(stream)
+
+        assert sorted(inv.notebook.id for inv in rest) == ["nb_1", "nb_3"]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_early_close_waits_for_cancelled_reads(self, client):
+        started = []
+        finished = []
+
+        async def artifacts(notebook_id):
+            started.append(notebook_id)
+            try:
+                await asyncio.sleep(0 if notebook_id == "nb_1" else 60)
+                return []
+            finally:
+                finished.append(notebook_id)
+
+        client.artifacts.list = AsyncMock(side_effect=artifacts)
+        stream = iter_inventory(client, ["nb_1", "nb_2", "nb_3"])
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first.notebook.id == "nb_1"
+        # Every read that started has unwound by the time aclose() returns
+        assert sorted(finished) == sorted(started) == ["nb_1", "nb_2", "nb_3"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_bad_concurrency(self, client):
+        with pytest.raises(ValidationError, match="concurrency must be at least 1"):
+            await _collect(iter_inventory(client, concurrency=0))
+
+
+def _inventory(notebook_id, source_ids=(), users=(), errors=None):
+    return NotebookInventory(
+        notebook=Notebook(id=notebook_id, title=f"Title {notebook_id}", sources_count=2),
+        sources=[Source(id=source_id, title=source_id) for source_id in source_ids],
+        artifacts=[Artifact(id="a1", title="Audio", _artifact_type=1, status=3)],
+        notes=[Note(id="n1", notebook_id=notebook_id, title="Note", content="Body")],
+        share_status=None if errors and "sharing" in errors else _status(notebook_id, users),
+        errors=errors or {},
+    )
+
+
+async def _stream(*inventories):
+    for inventory in inventories:
+        yield inventory
+
+
+class TestWriteInventory:
+    @pytest.mark.asyncio
+    async def test_jsonl_one_record_per_notebook(self, tmp_path):
+        path = tmp_path / "catalog.jsonl"
+        count = await write_inventory(
+            _stream(_inventory("nb_1", ["s1"], ["a@x.com"]), _inventory("nb_2")), path
+        )
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert count == 2
+        assert [r["notebook"]["id"] for r in records] == ["nb_1", "nb_2"]
+        assert records[0]["sources"][0]["id"] == "s1"
+        assert records[0]["artifacts"][0]["kind"] == "audio"
+        assert records[0]["sharing"]["users"] == [
+            {"email": "a@x.com", "permission": "viewer", "display_name": None}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sqlite_updates_in_place(self, tmp_path):
+        path = tmp_path / "catalog.db"
+        await write_inventory(_stream(_inventory("nb_1", ["s1", "s2"], ["a@x.com"])), path)
+        await write_inventory(
+            _stream(_inventory("nb_1", ["s3"], errors={"sharing": "denied"})), path
+        )
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT id FROM sources").fetchall() == [("s3",)]
+        # Sharing failed on the second run, so the previous rows are kept
+        assert conn.execute("SELECT email FROM shared_users").fetchall() == [("a@x.com",)]
+        assert conn.execute("SELECT title, errors FROM notebooks").fetchall() == [
+            ("Title nb_1", '{"sharing": "denied"}')
+        ]
+        conn.close()
+
+    @pytest.mark.asyncio
+    async def test_sqlite_keeps_columns_of_failed_parts(self, tmp_path):
+        path = tmp_path / "catalog.db"
+        first = _inventory("nb_1", ["s1"])
+        first.share_status.is_public = True
+        await write_inventory(_stream(first), path)
+        failed = _inventory("nb_1", errors={"notebook": "gone", "sharing": "denied"})
+        failed.notebook = Notebook(id="nb_1", title="")
+        await write_inventory(_stream(failed), path)
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT title, sources_count, is_public FROM notebooks").fetchall() == [
+            ("Title nb_1", 2, 1)
+        ]
+        conn.close()
+
+    @pytest.mark.asyncio
+    async def test_sqlite_prune_drops_unlisted_notebooks(self, tmp_path):
+        path = tmp_path / "catalog.db"
+        await write_inventory(
+            _stream(_inventory("nb_1", ["s1"], ["a@x.com"]), _inventory("nb_2", ["s2"])), path
+        )
+        await write_inventory(_stream(_inventory("nb_2", ["s2"])), path)
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT id FROM notebooks ORDER BY id").fetchall() == [
+            ("nb_1",),
+            ("nb_2",),
+        ]
+        conn.close()
+
+        await write_inventory(_stream(_inventory("nb_2", ["s2"])), path, prune=True)
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT id FROM notebooks").fetchall() == [("nb_2",)]
+        for table in ("sources", "artifacts", "notes", "shared_users"):
+            assert conn.execute(f"SELECT DISTINCT notebook_id FROM {table}").fetchall() in (
+                [("nb_2",)],
+                [],
+            )
+        assert conn.execute("SELECT id FROM sources").fetchall() == [("s2",)]
+        conn.close()
+
+    @pytest.mark.asyncio
+    async def test_no_prune_when_stream_fails(self, tmp_path):
+        path = tmp_path / "catalog.db"
+        await write_inventory(_stream(_inventory("nb_1"), _inventory("nb_2")), path)
+
+        async def broken():
+            yield _inventory("nb_2")
+            raise RPCError("list failed")
+
+        with pytest.raises(RPCError):
+            await write_inventory(broken(), path, prune=True)
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT COUNT(*) FROM notebooks").fetchone() == (2,)
+        conn.close()
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_extension(self, tmp_path):
+        with pytest.raises(ValidationError, match="Unsupported inventory file"):
+            await write_inventory(_stream(), tmp_path / "catalog.csv")
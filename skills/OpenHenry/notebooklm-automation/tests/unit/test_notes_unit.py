@@ -1,10 +1,14 @@
 """Unit tests for NotesAPI private helpers and edge cases."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from notebooklm._notes import NotesAPI
+from notebooklm._notes import NotesAPI, note_to_markdown, parse_note_markdown
+from notebooklm.exceptions import RPCError
+from notebooklm.rpc import RPCMethod
+from notebooklm.types import Note
 
 
 @pytest.fixture
@@ -635,3 +639,150 @@ class TestDeleteMindMap:
         assert params[0] == "nb_123"
         assert params[1] is None
         assert params[2] == ["mm_456"]
+
+
+# =============================================================================
+# Shared snapshot and bulk Markdown tests
+# =============================================================================
+
+
+def _note_item(note_id, title, content):
+    return [note_id, [note_id, content, None, None, title]]
+
+
+class TestNotesSnapshot:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self, notes_api, mock_core):
+        async def fetch(*args, **kwargs):
+            await asyncio.sleep(0)
+            return [[_note_item("n1", "T", "C"), ["mm", '{"children": []}']]]
+
+        mock_core.rpc_call.side_effect = fetch
+
+        notes, mind_maps, note = await asyncio.gather(
+            notes_api.list("nb_1"), notes_api.list_mind_maps("nb_1"), notes_api.get("nb_1", "n1")
+        )
+
+        assert [n.id for n in notes] == ["n1"]
+        assert [m[0] for m in mind_maps] == ["mm"]
+        assert note.title == "T"
+        assert mock_core.rpc_call.await_count == 1
+
+        await notes_api.list("nb_1")
+        assert mock_core.rpc_call.await_count == 2  # no caching after the fetch ends
+
+    @pytest.mark.asyncio
+    async def test_write_is_not_served_a_fetch_from_before_it(self, notes_api, mock_core):
+        release = asyncio.Event()
+        snapshots = [[[_note_item("n1", "Old", "C")]], [[_note_item("n1", "New", "C")]]]
+
+        async def rpc_call(method, params, **kwargs):
+            if method == RPCMethod.GET_NOTES_AND_MIND_MAPS:
+                snapshot = snapshots.pop(0)
+                if snapshots:  # hold the first (stale) fetch open
+                    await release.wait()
+                return snapshot
+            return None
+
+        mock_core.rpc_call.side_effect = rpc_call
+
+        stale_reader = asyncio.ensure_future(notes_api.list("nb_1"))
+        await asyncio.sleep(0)
+        await notes_api.update("nb_1", "n1", "C", "New")
+        note = await notes_api.get("nb_1", "n1")
+        release.set()
+
+        assert note.title == "New"
+        assert [n.title for n in await stale_reader] == ["Old"]
+
+
+class TestMarkdownFormat:
+    def test_round_trip(self):
+        note = Note(id="n1", notebook_id="nb_1", title='Says "hi": ok', content="# H\n\n---\nx")
+        fields, content = parse_note_markdown(note_to_markdown(note))
+
+        assert fields == {"note_id": "n1", "notebook_id": "nb_1", "title": 'Says "hi": ok'}
+        assert content == note.content
+
+    def test_plain_markdown_has_no_fields(self):
+        assert parse_note_markdown("# Title\nbody") == ({}, "# Title\nbody")
+
+
+class TestExportMarkdown:
+    @pytest.mark.asyncio
+    async def test_exports_notebooks_incrementally(self, notes_api, tmp_path):
+        notes = {
+            "nb_1": [Note("n1", "nb_1", "Alpha", "a"), Note("n2", "nb_1", "Alpha", "b")],
+            "nb_2": [Note("n3", "nb_2", "Beta", "c")],
+        }
+        with patch.object(notes_api, "list", side_effect=lambda nb: notes[nb]):
+            first = await notes_api.export_markdown(["nb_1", "nb_2"], tmp_path)
+            notes["nb_1"] = [Note("n1", "nb_1", "Alpha", "a")]
+            notes["nb_2"] = [Note("n3", "nb_2", "Gamma", "c")]
+            second = await notes_api.export_markdown(["nb_1", "nb_2"], tmp_path)
+
+        assert set(first) == {"n1", "n2", "n3"}
+        assert sorted(p.name for p in (tmp_path / "nb_1").iterdir()) == ["Alpha.md"]
+        assert sorted(p.name for p in (tmp_path / "nb_2").iterdir()) == ["Gamma.md"]
+        assert second == {"n3": str(tmp_path / "nb_2" / "Gamma.md")}
+
+
+class TestImportMarkdown:
+    @pytest.mark.asyncio
+    async def test_diff_based_import(self, notes_api, tmp_path):
+        live = [
+            Note("n1", "nb_1", "Same", "unchanged body"),
+            Note("n2", "nb_1", "Old title", "body"),
+            Note("n3", "nb_1", "By title", "old body"),
+        ]
+        (tmp_path / "a.md").write_text(note_to_markdown(live[0]), encoding="utf-8")
+        (tmp_path / "b.md").write_text(
+            note_to_markdown(Note("n2", "nb_1", "New title", "body")), encoding="utf-8"
+        )
+        (tmp_path / "By title.md").write_text("new body", encoding="utf-8")
+        (tmp_path / "d.md").write_text("fresh", encoding="utf-8")
+        reported = []
+
+        with (
+            patch.object(notes_api, "list", new_callable=AsyncMock, return_value=live),
+            patch.object(notes_api, "update", new_callable=AsyncMock) as update,
+            patch.object(
+                notes_api,
+                "create",
+                new_callable=AsyncMock,
+                return_value=Note("n4", "nb_1", "d", "fresh"),
+            ) as create,
+        ):
+            results = await notes_api.import_markdown("nb_1", tmp_path, on_result=reported.append)
+
+        assert [(r.status, r.note.id) for r in results] == [
+            ("updated", "n3"),
+            ("unchanged", "n1"),
+            ("updated", "n2"),
+            ("created", "n4"),
+        ]
+        assert sorted(c.args for c in update.await_args_list) == [
+            ("nb_1", "n2", "body", "New title"),
+            ("nb_1", "n3", "new body", "By title"),
+        ]
+        create.assert_awaited_once_with("nb_1", "d", "fresh")
+        assert len(reported) == 4
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_abort(self, notes_api, tmp_path):
+        (tmp_path / "a.md").write_text("one", encoding="utf-8")
+        (tmp_path / "b.md").write_text("two", encoding="utf-8")
+
+        with (
+            patch.object(notes_api, "list", new_callable=AsyncMock, return_value=[]),
+            patch.object(
+                notes_api,
+                "create",
+                new_callable=AsyncMock,
+                side_effect=[RPCError("boom"), Note("n2", "nb_1", "b", "two")],
+            ),
+        ):
+            results = await notes_api.import_markdown("nb_1", tmp_path, concurrency=1)
+
+        assert [r.status for r in results] == ["failed", "created"]
+        assert results[0].error == "boom"
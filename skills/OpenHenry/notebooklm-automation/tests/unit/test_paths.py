@@ -9,6 +9,7 @@ import pytest
 
 from notebooklm.paths import (
     get_browser_profile_dir,
+    get_cache_dir,
     get_context_path,
     get_home_dir,
     get_path_info,
@@ -114,6 +115,21 @@ class TestGetBrowserProfileDir:
             assert result == custom_path.resolve() / "browser_profile"
 
 
+class TestGetCacheDir:
+    def test_default_path(self):
+        """Returns cache in home dir."""
+        with patch.dict(os.environ, _get_env_without_notebooklm_home(), clear=True):
+            result = get_cache_dir()
+            assert result == Path.home() / ".notebooklm" / "cache"
+
+    def test_respects_home_env_var(self, tmp_path):
+        """Cache dir follows NOTEBOOKLM_HOME."""
+        custom_path = tmp_path / "custom_home"
+        with patch.dict(os.environ, {"NOTEBOOKLM_HOME": str(custom_path)}):
+            result = get_cache_dir()
+            assert result == custom_path.resolve() / "cache"
+
+
 class TestGetPathInfo:
     def test_default_paths(self):
         """Returns correct info with default paths."""
@@ -125,6 +141,7 @@ class TestGetPathInfo:
             assert "storage_state.json" in info["storage_path"]
             assert "context.json" in info["context_path"]
             assert "browser_profile" in info["browser_profile_dir"]
+            assert info["cache_dir"].endswith("cache")
 
     def test_custom_home(self, tmp_path):
         """Returns correct info with NOTEBOOKLM_HOME set."""
@@ -0,0 +1,66 @@
+"""Tests for adaptive generation polling."""
+
+import json
+
+import pytest
+
+from notebooklm._polling import GenerationStats, schedule_poll
+
+
+class TestGenerationStats:
+    def test_needs_minimum_samples(self, tmp_path):
+        """No expectation is reported until enough samples exist."""
+        stats = GenerationStats(tmp_path / "stats.json")
+        stats.record(1, 100.0)
+        stats.record(1, 120.0)
+
+        assert stats.expected_duration(1) is None
+        stats.record(1, 300.0)
+        assert stats.expected_duration(1) == 120.0
+        assert stats.expected_duration(2) is None
+
+    def test_persists_and_trims(self, tmp_path):
+        """Samples survive a reload and only the most recent are kept."""
+        path = tmp_path / "sub" / "stats.json"
+        stats = GenerationStats(path, max_samples=3)
+        for duration in (10.0, 20.0, 30.0, 40.0):
+            stats.record(7, duration)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {"7": [20.0, 30.0, 40.0]}
+        assert GenerationStats(path).expected_duration(7) == 30.0
+
+    def test_ignores_corrupt_file(self, tmp_path):
+        """A corrupt stats file is treated as empty."""
+        path = tmp_path / "stats.json"
+        path.write_text("not json", encoding="utf-8")
+
+        stats = GenerationStats(path)
+
+        assert stats.expected_duration(1) is None
+        stats.record(1, 5.0)
+        assert json.loads(path.read_text(encoding="utf-8")) == {"1": [5.0]}
+
+    def test_defaults_to_cache_dir(self, tmp_path, monkeypatch):
+        """Without an explicit path the stats live in the cache directory."""
+        monkeypatch.setenv("NOTEBOOKLM_HOME", str(tmp_path))
+
+        assert GenerationStats().path == tmp_path.resolve() / "cache" / "generation_stats.json"
+
+
+class TestSchedulePoll:
+    @pytest.mark.parametrize(
+        ("age", "expected_sleep"),
+        [
+            (0.0, 60.0),  # Far from expected finish: sparse, capped
+            (200.0, 50.0),  # Half the remaining time
+            (299.0, 2.0),  # Near expected finish: dense
+            (340.0, 10.0),  # Overrun: grows with overrun
+            (800.0, 120.0),  # Long overrun: capped at max_interval
+        ],
+    )
+    def test_schedule(self, age, expected_sleep):
+        assert schedule_poll(300.0, age, 2.0, 120.0) == expected_sleep
+
+    @pytest.mark.parametrize("age", [0.0, 200.0, 340.0])
+    def test_never_sleeps_past_max_interval(self, age):
+        assert schedule_poll(300.0, age, 2.0, 10.0) == 10.0
@@ -1,8 +1,11 @@
 """Tests for research functionality."""
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from notebooklm import NotebookLMClient
+from notebooklm._research import ResearchAPI
 from notebooklm.auth import AuthTokens
 from notebooklm.rpc import RPCMethod
 
@@ -351,3 +354,78 @@ class TestResearch:
             assert len(imported) == 2
             assert imported[0]["id"] == "deep_src_001"
             assert imported[1]["id"] == "deep_src_002"
+
+
+def _poll_response(*tasks):
+    """POLL_RESEARCH payload for (task_id, status_code, urls) tuples."""
+    return [
+        [
+            [task_id, [None, [f"query {task_id}", 1], 1, [[[u, u, "", 1] for u in urls], ""], code]]
+            for task_id, code, urls in tasks
+        ]
+    ]
+
+
+class TestPollAll:
+    @pytest.fixture
+    def api(self):
+        core = MagicMock()
+        core.rpc_call = AsyncMock()
+        return ResearchAPI(core)
+
+    @pytest.mark.asyncio
+    async def test_returns_all_tasks_with_new_sources(self, api):
+        api._core.rpc_call.side_effect = [
+            _poll_response(("t2", 1, ["u1"]), ("t1", 2, ["a", "b"])),
+            _poll_response(("t2", 1, ["u1", "u2", "u3"]), ("t1", 2, ["a", "b"])),
+        ]
+
+        first = await api.poll_all("nb_1")
+        second = await api.poll_all("nb_1")
+
+        assert [t["task_id"] for t in first] == ["t2", "t1"]
+        assert [s["url"] for s in first[0]["new_sources"]] == ["u1"]
+        assert [s["url"] for s in second[0]["sources"]] == ["u1", "u2", "u3"]
+        assert [s["url"] for s in second[0]["new_sources"]] == ["u2", "u3"]
+        assert second[1]["new_sources"] == []
+        assert second[1]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_only_unseen_rows_are_parsed(self, api, monkeypatch):
+        parsed = []
+        original = ResearchAPI._parse_source
+        monkeypatch.setattr(
+            ResearchAPI,
+            "_parse_source",
+            staticmethod(lambda src: parsed.append(src) or original(src)),
+        )
+        api._core.rpc_call.side_effect = [
+            _poll_response(("t1", 1, ["a", "b"])),
+            _poll_response(("t1", 1, ["a", "b", "c"])),
+        ]
+
+        await api.poll_all("nb_1")
+        await api.poll("nb_1")
+
+        assert [src[0] for src in parsed] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_rewritten_list_reports_only_unseen(self, api):
+        api._core.rpc_call.side_effect = [
+            _poll_response(("t1", 1, ["a", "b"])),
+            _poll_response(("t1", 2, ["b", "c"])),
+        ]
+
+        await api.poll_all("nb_1")
+        tasks = await api.poll_all("nb_1")
+
+        assert [s["url"] for s in tasks[0]["sources"]] == ["b", "c"]
+        assert [s["url"] for s in tasks[0]["new_sources"]] == ["c"]
+
+    @pytest.mark.asyncio
+    async def test_state_of_vanished_tasks_is_dropped(self, api):
+        api._core.rpc_call.side_effect = [_poll_response(("t1", 2, ["a"])), []]
+
+        await api.poll_all("nb_1")
+        assert await api.poll_all("nb_1") == []
+        assert api._task_sources == {}
@@ -0,0 +1,167 @@
+"""Unit tests for ResearchAPI.run_many()."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notebooklm._research import ResearchAPI
+from notebooklm.exceptions import RPCError, ValidationError
+
+
+@pytest.fixture
+def api():
+    core = MagicMock()
+    core.rpc_call = AsyncMock()
+    return ResearchAPI(core)
+
+
+def _task(task_id, status, urls=()):
+    return {
+        "task_id": task_id,
+        "status": status,
+        "query": "",
+        "sources": [{"url": url, "title": url} for url in urls],
+        "summary": "",
+    }
+
+
+def _starter(task_ids):
+    async def start(notebook_id, query, source, mode):
+        task_id = task_ids[query]
+        if task_id is None:
+            return None
+        return {"task_id": task_id, "notebook_id": notebook_id, "query": query, "mode": mode}
+
+    return start
+
+
+@pytest.fixture
+def sleeps():
+    with patch("notebooklm._research.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        yield sleep
+
+
+class TestRunMany:
+    @pytest.mark.asyncio
+    async def test_imports_union_once_per_url(self, api, sleeps):
+        polls = [
+            [_task("t1", "in_progress"), _task("t2", "in_progress")],
+            [
+                _task("t1", "completed", ["https://a.com/x", "https://b.com"]),
+                _task("t2", "in_progress"),
+            ],
+            [_task("t2", "completed", ["https://A.com/x/", "https://c.com"])],
+        ]
+        with (
+            patch.object(api, "start", side_effect=_starter({"q1": "t1", "q2": "t2"})),
+            patch.object(api, "_poll_tasks", new_callable=AsyncMock, side_effect=polls),
+            patch.object(
+                api, "_notebook_urls", new_callable=AsyncMock, return_value=["https://c.com"]
+            ),
+            patch.object(api, "import_sources", new_callable=AsyncMock) as import_sources,
+        ):
+            import_sources.side_effect = lambda nb, task_id, sources: [
+                {"id": s["url"], "title": s["title"]} for s in sources
+            ]
+            results = await api.run_many([("nb_1", "q1"), ("nb_1", "q2")])
+
+        assert [r.status for r in results] == ["completed", "completed"]
+        assert [s["id"] for s in results[0].imported] == ["https://a.com/x", "https://b.com"]
+        assert results[1].imported == []  # one URL found by q1, the other already present
+        import_sources.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_backoff_doubles_and_resets_on_progress(self, api, sleeps):
+        polls = [
+            [_task("t1", "in_progress"), _task("t2", "in_progress")],
+            [_task("t1", "in_progress"), _task("t2", "in_progress")],
+            [_task("t1", "completed"), _task("t2", "in_progress")],
+            [_task("t2", "in_progress")],
+            [_task("t2", "completed")],
+        ]
+        with (
+            patch.object(api, "start", side_effect=_starter({"q1": "t1", "q2": "t2"})),
+            patch.object(api, "_poll_tasks", new_callable=AsyncMock, side_effect=polls),
+        ):
+            await api.run_many(
+                [("nb_1", "q1"), ("nb_1", "q2")],
+                import_sources=False,
+                initial_interval=1.0,
+                max_interval=3.0,
+            )
+
+        assert [c.args[0] for c in sleeps.await_args_list] == [2.0, 3.0, 1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_one_poll_per_notebook_per_tick(self, api, sleeps):
+        async def poll(notebook_id):
+            return [_task(f"{notebook_id}_t{n}", "completed") for n in (1, 2)]
+
+        starts = {"a1": "nb_a_t1", "a2": "nb_a_t2", "b1": "nb_b_t1", "b2": "nb_b_t2"}
+        with (
+            patch.object(api, "start", side_effect=_starter(starts)),
+            patch.object(api, "_poll_tasks", side_effect=poll) as poll_tasks,
+        ):
+            jobs = [("nb_a", "a1"), ("nb_a", "a2"), ("nb_b", "b1"), ("nb_b", "b2")]
+            results = await api.run_many(jobs, import_sources=False)
+
+        assert all(r.is_completed for r in results)
+        assert poll_tasks.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts_do_not_abort(self, api, sleeps):
+        reported = []
+        with (
+            patch.object(
+                api, "start", side_effect=_starter({"ok": "t1", "none": None, "slow": "t3"})
+            ),
+            patch.object(
+                api,
+                "_poll_tasks",
+                new_callable=AsyncMock,
+                side_effect=[
+                    RPCError("boom"),
+                    [_task("t1", "completed", ["https://a.com"]), _task("t3", "in_progress")],
+                ]
+                + [[_task("t3", "in_progress")]] * 10,
+            ),
+            patch.object(api, "_notebook_urls", new_callable=AsyncMock, return_value=[]),
+            patch.object(api, "import_sources", new_callable=AsyncMock, return_value=[{"id": "s"}]),
+            patch("notebooklm._research.asyncio.get_running_loop") as get_loop,
+        ):
+            get_loop.return_value.time.side_effect = [0.0, 1.0, 2.0, 100.0]
+            results = await api.run_many(
+                [("nb_1", "ok"), ("nb_1", "none"), ("nb_1", "slow")],
+                timeout=50,
+                on_result=reported.append,
+            )
+
+        assert [r.status for r in results] == ["completed", "failed", "timeout"]
+        assert results[0].imported == [{"id": "s"}]
+        assert results[1].error == "Research failed to start"
+        assert sorted(r.query for r in reported) == ["none", "ok", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_dict_jobs_override_mode(self, api, sleeps):
+        with (
+            patch.object(api, "start", side_effect=_starter({"q": "t1"})) as start,
+            patch.object(
+                api, "_poll_tasks", new_callable=AsyncMock, return_value=[_task("t1", "completed")]
+            ),
+        ):
+            results = await api.run_many(
+                [{"notebook_id": "nb_1", "query": "q", "mode": "Deep"}], import_sources=False
+            )
+
+        start.assert_called_once_with("nb_1", "q", "web", "deep")
+        assert results[0].mode == "deep"
+
+    @pytest.mark.asyncio
+    async def test_invalid_job_fails_before_starting(self, api):
+        with patch.object(api, "start", new_callable=AsyncMock) as start:
+            with pytest.raises(ValidationError, match="Deep Research only supports Web"):
+                await api.run_many([("nb_1", "q1"), ("nb_1", "q2")], source="drive", mode="deep")
+            with pytest.raises(ValidationError, match="needs 'notebook_id' and 'query'"):
+                await api.run_many([{"query": "q"}])
+
+        start.assert_not_awaited()
@@ -0,0 +1,175 @@
+"""Tests for the local source full-text index."""
+
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notebooklm._search import SourceIndex, fts_phrase
+from notebooklm._sources import SourcesAPI
+from notebooklm.exceptions import RPCError, ValidationError
+from notebooklm.types import Source
+
+
+def _fulltext_response(*blocks) -> list:
+    return [[["src"], "T", [None, 11, None, None, 3]], None, None, [list(blocks)]]
+
+
+class TestSourceIndex:
+    def test_search_ranks_and_scopes_by_notebook(self, tmp_path):
+        """Hits are limited to the notebook and carry a highlighted snippet."""
+        index = SourceIndex(tmp_path / "index.db")
+        index.upsert("nb_1", "s1", "Attention", "attention is all you need, attention")
+        index.upsert("nb_1", "s2", "RNNs", "recurrent networks and a little attention")
+        index.upsert("nb_2", "s3", "Other", "attention elsewhere")
+
+        hits = index.search("nb_1", "attention")
+
+        assert [hit.source_id for hit in hits] == ["s1", "s2"]
+        assert "**attention**" in hits[0].snippet
+        assert hits[0].score >= hits[1].score
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "sub" / "index.db"
+        index = SourceIndex(path)
+        index.upsert("nb_1", "s1", "Title", "persistent text", url="https://x")
+        index.close()
+
+        reopened = SourceIndex(path)
+        assert reopened.indexed("nb_1") == {"s1": "Title"}
+        assert [hit.source_id for hit in reopened.search("nb_1", "persistent")] == ["s1"]
+
+    def test_upsert_replaces_and_remove_drops(self):
+        index = SourceIndex(":memory:")
+        index.upsert("nb_1", "s1", "T", "old words")
+        index.upsert("nb_1", "s1", "T", "new words")
+
+        assert index.search("nb_1", "old") == []
+        assert len(index.search("nb_1", "new")) == 1
+
+        index.remove("nb_1", ["s1"])
+        assert index.search("nb_1", "new") == []
+        assert index.indexed("nb_1") == {}
+
+    def test_invalidate_marks_for_refetch(self):
+        index = SourceIndex(":memory:")
+        index.upsert("nb_1", "s1", "T", "text")
+        index.upsert("nb_1", "s2", "T", "text")
+
+        index.invalidate("nb_1", ["s1"])
+        assert index.invalidated("nb_1") == {"s1"}
+        assert len(index.search("nb_1", "text")) == 2  # still searchable meanwhile
+
+        index.upsert("nb_1", "s1", "T", "text")
+        assert index.invalidated("nb_1") == set()
+
+    def test_adds_hash_column_to_older_databases(self, tmp_path):
+        path = tmp_path / "index.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            "CREATE TABLE indexed_sources (notebook_id TEXT NOT NULL, source_id TEXT NOT NULL, "
+            "title TEXT NOT NULL, url TEXT, char_count INTEGER NOT NULL, "
+            "indexed_at REAL NOT NULL, PRIMARY KEY (notebook_id, source_id));"
+            "INSERT INTO indexed_sources VALUES ('nb_1', 's1', 'T', NULL, 4, 0);"
+        )
+        conn.close()
+
+        assert SourceIndex(path).invalidated("nb_1") == {"s1"}
+
+    def test_phrase_quoting_and_invalid_query(self):
+        index = SourceIndex(":memory:")
+        index.upsert("nb_1", "s1", "T", 'she said "hello world" AND left')
+
+        assert len(index.search("nb_1", fts_phrase('"hello world" AND'))) == 1
+        with pytest.raises(ValidationError, match="Invalid search query"):
+            index.search("nb_1", '"unbalanced')
+
+
+class TestSourcesSearch:
+    @pytest.fixture
+    def api(self):
+        core = MagicMock()
+        core.rpc_call = AsyncMock(return_value=_fulltext_response(["deep learning notes"]))
+        return SourcesAPI(core, index=SourceIndex(":memory:"))
+
+    @pytest.mark.asyncio
+    async def test_search_indexes_only_new_or_renamed_sources(self, api):
+        """Repeated searches do not refetch unchanged sources."""
+        sources = [Source(id="s1", title="A"), Source(id="s2", title="B", status=1)]
+        with patch.object(api, "list", new_callable=AsyncMock, return_value=sources):
+            hits = await api.search("nb_1", "learning")
+            assert [hit.source_id for hit in hits] == ["s1"]
+            assert api._core.rpc_call.await_count == 1
+
+            await api.search("nb_1", "learning")
+            assert api._core.rpc_call.await_count == 1
+
+            sources[0] = Source(id="s1", title="A renamed")
+            assert await api.update_index("nb_1") == 1
+            assert api._core.rpc_call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refreshed_sources_are_reindexed(self, api):
+        """Refreshing a source (here or, seen mid-processing, elsewhere) re-fetches its text."""
+        sources = [Source(id="s1", title="A", _type_code=5)]
+        with patch.object(api, "list", new_callable=AsyncMock, return_value=sources):
+            await api.update_index("nb_1")
+            api._core.rpc_call.return_value = None
+            await api.refresh("nb_1", "s1")
+
+            api._core.rpc_call.return_value = _fulltext_response(["refreshed text"])
+            assert await api.update_index("nb_1") == 1
+            assert [hit.source_id for hit in await api.search("nb_1", "refreshed")] == ["s1"]
+
+            sources[0] = Source(id="s1", title="A", _type_code=5, status=1)
+            assert await api.update_index("nb_1") == 0
+            assert [hit.source_id for hit in await api.search("nb_1", "refreshed")] == ["s1"]
+
+            api._core.rpc_call.return_value = _fulltext_response(["edited in the web UI"])
+            sources[0] = Source(id="s1", title="A", _type_code=5)
+            assert await api.update_index("nb_1") == 1
+            assert await api.search("nb_1", "refreshed") == []
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_keeps_old_entry_and_search_runs(self, api):
+        """One source failing to download neither aborts the search nor loses its entry."""
+        sources = [Source(id="s1", title="A"), Source(id="s2", title="B")]
+        with patch.object(api, "list", new_callable=AsyncMock, return_value=sources):
+            await api.update_index("nb_1")
+
+            async def rpc_call(method, params, **kwargs):
+                if params[0] == ["s1"]:
+                    raise RPCError("server error")
+                return _fulltext_response(["renamed text"])
+
+            api._core.rpc_call.side_effect = rpc_call
+            sources[:] = [Source(id="s1", title="A2"), Source(id="s2", title="B2")]
+            hits = await api.search("nb_1", "learning")
+            assert [hit.source_id for hit in hits] == ["s1"]
+            assert [hit.source_id for hit in await api.search("nb_1", "renamed")] == ["s2"]
+
+            # The failed source is still outdated and is retried
+            api._core.rpc_call.side_effect = None
+            assert await api.update_index("nb_1") == 1
+
+    @pytest.mark.asyncio
+    async def test_removed_sources_are_dropped(self, api):
+        with patch.object(
+            api, "list", new_callable=AsyncMock, return_value=[Source(id="s1", title="A")]
+        ) as mock_list:
+            await api.update_index("nb_1")
+            mock_list.return_value = []
+            assert await api.search("nb_1", "learning") == []
+
+    @pytest.mark.asyncio
+    async def test_defaults_to_in_memory_index(self):
+        core = MagicMock()
+        core.rpc_call = AsyncMock(return_value=_fulltext_response(["alpha"]))
+        api = SourcesAPI(core)
+        with patch.object(
+            api, "list", new_callable=AsyncMock, return_value=[Source(id="s1", title="A")]
+        ):
+            hits = await api.search("nb_1", "alpha")
+
+        assert [hit.source_id for hit in hits] == ["s1"]
+        assert api._index is not None and api._index.path is None
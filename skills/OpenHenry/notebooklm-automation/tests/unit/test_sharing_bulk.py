@@ -0,0 +1,170 @@
+"""Unit tests for SharingAPI.apply_many()."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notebooklm._sharing import SharingAPI
+from notebooklm.exceptions import RPCError, ValidationError
+from notebooklm.rpc import RPCMethod
+from notebooklm.types import (
+    ShareAccess,
+    SharedUser,
+    SharePermission,
+    ShareStatus,
+    ShareViewLevel,
+)
+
+EDITOR = SharePermission.EDITOR
+VIEWER = SharePermission.VIEWER
+
+
+def _status(notebook_id, users=(), is_public=False):
+    return ShareStatus(
+        notebook_id=notebook_id,
+        is_public=is_public,
+        access=ShareAccess.ANYONE_WITH_LINK if is_public else ShareAccess.RESTRICTED,
+        view_level=ShareViewLevel.FULL_NOTEBOOK,
+        shared_users=[SharedUser(email, permission) for email, permission in users],
+    )
+
+
+@pytest.fixture
+def api():
+    core = MagicMock()
+    core.rpc_call = AsyncMock()
+    return SharingAPI(core)
+
+
+def _share_calls(api):
+    """(notebook_id, [(email, permission value)], notify flag) of each SHARE_NOTEBOOK call."""
+    calls = []
+    for call in api._core.rpc_call.await_args_list:
+        method, params = call.args
+        assert method == RPCMethod.SHARE_NOTEBOOK
+        entry = params[0][0]
+        users = [(user[0], user[2]) for user in entry[1]] if entry[1] else None
+        calls.append((entry[0], users, params[1]))
+    return calls
+
+
+class TestApplyMany:
+    @pytest.mark.asyncio
+    async def test_sends_only_the_diff(self, api):
+        statuses = {
+            "nb_1": _status(
+                "nb_1",
+                [
+                    ("owner@x.com", SharePermission.OWNER),
+                    ("Team@x.com", VIEWER),
+                    ("leaver@x.com", EDITOR),
+                ],
+            ),
+            "nb_2": _status("nb_2", [("team@x.com", EDITOR)], is_public=True),
+        }
+        with patch.object(api, "get_status", side_effect=lambda nb: statuses[nb]):
+            results = await api.apply_many(
+                ["nb_1", "nb_2"],
+                {
+                    "team@x.com": EDITOR,
+                    "new@x.com": VIEWER,
+                    "leaver@x.com": None,
+                    "owner@x.com": None,
+                },
+                public=True,
+                notify=True,
+            )
+
+        first, second = results
+        assert first.status == "changed"
+        assert (first.added, first.updated, first.removed) == (
+            ["new@x.com"],
+            ["Team@x.com"],
+            ["leaver@x.com"],
+        )
+        assert first.public is True
+        assert first.skipped == ["owner@x.com"]
+        assert (second.added, second.updated, second.removed, second.public) == (
+            ["new@x.com"],
+            [],
+            [],
+            None,
+        )
+        assert sorted(_share_calls(api), key=str) == sorted(
+            [
+                ("nb_1", [("new@x.com", 3)], 1),
+                ("nb_1", [("Team@x.com", 2), ("leaver@x.com", 4)], 0),
+                ("nb_1", None, 1),
+                ("nb_2", [("new@x.com", 3)], 1),
+            ],
+            key=str,
+        )
+
+    @pytest.mark.asyncio
+    async def test_matching_notebook_is_untouched(self, api):
+        with patch.object(
+            api,
+            "get_status",
+            new_callable=AsyncMock,
+            return_value=_status("nb_1", [("a@x.com", VIEWER)]),
+        ):
+            results = await api.apply_many(["nb_1"], {"a@x.com": VIEWER, "b@x.com": None})
+
+        assert results[0].status == "unchanged"
+        api._core.rpc_call.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_dry_run_plans_without_mutating(self, api):
+        reported = []
+        with patch.object(api, "get_status", new_callable=AsyncMock, return_value=_status("nb_1")):
+            results = await api.apply_many(
+                ["nb_1"], {"a@x.com": EDITOR}, dry_run=True, on_result=reported.append
+            )
+
+        assert results[0].status == "planned"
+        assert results[0].added == ["a@x.com"]
+        assert reported == results
+        api._core.rpc_call.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_abort(self, api):
+        async def get_status(notebook_id):
+            if notebook_id == "nb_bad":
+                raise RPCError("boom")
+            return _status(notebook_id)
+
+        with patch.object(api, "get_status", side_effect=get_status):
+            results = await api.apply_many(["nb_bad", "nb_ok"], public=True)
+
+        assert [r.status for r in results] == ["failed", "changed"]
+        assert results[0].error == "boom"
+        assert results[1].applied == ["public"]
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_reports_applied_steps(self, api):
+        api._core.rpc_call.side_effect = [None, RPCError("removal failed")]
+        with patch.object(
+            api,
+            "get_status",
+            new_callable=AsyncMock,
+            return_value=_status("nb_1", [("leaver@x.com", EDITOR)]),
+        ):
+            [result] = await api.apply_many(
+                ["nb_1"], {"new@x.com": VIEWER, "leaver@x.com": None}, public=True
+            )
+
+        assert result.is_failed
+        assert result.error == "removal failed"
+        assert (result.added, result.removed, result.public) == (
+            ["new@x.com"],
+            ["leaver@x.com"],
+            True,
+        )
+        assert result.applied == ["added"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_owner_permission(self, api):
+        with pytest.raises(ValidationError, match="Invalid permission"):
+            await api.apply_many(["nb_1"], {"a@x.com": SharePermission.OWNER})
+        with pytest.raises(ValidationError, match="concurrency must be at least 1"):
+            await api.apply_many(["nb_1"], {"a@x.com": VIEWER}, concurrency=0)
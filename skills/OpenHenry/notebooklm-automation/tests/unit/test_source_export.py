@@ -0,0 +1,211 @@
+"""Unit tests for SourcesAPI fulltext extraction and bulk export."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notebooklm._sources import SourcesAPI
+from notebooklm.exceptions import RPCError, ValidationError
+from notebooklm.types import Source
+
+
+def _fulltext_response(title: str, *blocks) -> list:
+    """Build a GET_SOURCE response with a web page type and nested blocks."""
+    return [
+        [["src"], title, [None, 11, None, None, 5, None, 1, ["https://example.com"]]],
+        None,
+        None,
+        [list(blocks)],
+    ]
+
+
+@pytest.fixture
+def mock_core():
+    core = MagicMock()
+    core.rpc_call = AsyncMock()
+    return core
+
+
+@pytest.fixture
+def sources_api(mock_core):
+    return SourcesAPI(mock_core)
+
+
+class TestIterTextBlocks:
+    def test_yields_strings_in_document_order(self, sources_api):
+        """Nested strings are yielded depth-first, skipping empties and non-strings."""
+        data = [["a", ["b", "", 3, ["c"]]], None, "d"]
+
+        assert list(sources_api._iter_text_blocks(data)) == ["a", "b", "c", "d"]
+
+    def test_handles_deep_nesting_without_recursion(self, sources_api):
+        """Nesting beyond max_depth is skipped instead of overflowing the stack."""
+        data: list = ["top"]
+        node = data
+        for _ in range(5000):
+            child: list = []
+            node.append(child)
+            node = child
+        node.append("too deep")
+
+        assert list(sources_api._iter_text_blocks(data)) == ["top"]
+        assert list(sources_api._iter_text_blocks(data, max_depth=10_000)) == [
+            "top",
+            "too deep",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_fulltext_joins_blocks(self, sources_api, mock_core):
+        """get_fulltext() content is the newline-joined text blocks."""
+        mock_core.rpc_call.return_value = _fulltext_response("Page", ["one", ["two"]], ["three"])
+
+        fulltext = await sources_api.get_fulltext("nb_1", "src_1")
+
+        assert fulltext.content == "one\ntwo\nthree"
+        assert fulltext.char_count == len("one\ntwo\nthree")
+        assert fulltext.title == "Page"
+        assert fulltext.url == "https://example.com"
+
+
+class TestExportFulltexts:
+    @pytest.mark.asyncio
+    async def test_exports_ready_sources_and_manifest(self, sources_api, mock_core, tmp_path):
+        """Ready sources are written to <id>.txt and recorded in the manifest."""
+        sources = [
+            Source(id="s1", title="Paper", _type_code=3),
+            Source(id="s2", title="Pending", _type_code=3, status=1),
+        ]
+        mock_core.rpc_call.return_value = _fulltext_response("Paper", ["alpha", ["beta"]])
+
+        with patch.object(sources_api, "list", new_callable=AsyncMock, return_value=sources):
+            written = await sources_api.export_fulltexts("nb_1", tmp_path)
+
+        assert written == {"s1": str(tmp_path / "s1.txt")}
+        assert (tmp_path / "s1.txt").read_text(encoding="utf-8") == "alpha\nbeta"
+        manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+        assert manifest["notebook_id"] == "nb_1"
+        assert manifest["sources"]["s1"]["char_count"] == len("alpha\nbeta")
+        assert manifest["sources"]["s1"]["kind"] == "pdf"
+        assert "s2" not in manifest["sources"]
+
+    @pytest.mark.asyncio
+    async def test_rerun_is_incremental(self, sources_api, mock_core, tmp_path):
+        """Unchanged sources are not fetched again; removed sources are cleaned up."""
+        mock_core.rpc_call.return_value = _fulltext_response("T", ["text"])
+        first = [Source(id="s1", title="A", _type_code=3), Source(id="s2", title="B", _type_code=3)]
+        with patch.object(sources_api, "list", new_callable=AsyncMock, return_value=first):
+            await sources_api.export_fulltexts("nb_1", tmp_path)
+        assert mock_core.rpc_call.await_count == 2
+
+        mock_core.rpc_call.reset_mock()
+        second = [
+            Source(id="s1", title="A", _type_code=3),
+            Source(id="s3", title="C", _type_code=3),
+        ]
+        with patch.object(sources_api, "list", new_callable=AsyncMock, return_value=second):
+            written = await sources_api.export_fulltexts("nb_1", tmp_path)
+
+        assert list(written) == ["s3"]
+        assert mock_core.rpc_call.await_count == 1
+        assert not (tmp_path / "s2.txt").exists()
+        manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+        assert list(manifest["sources"]) == ["s1", "s3"]
+
+    @pytest.mark.asyncio
+    async def test_refreshed_source_is_reexported(self, sources_api, mock_core, tmp_path):
+        """A source recorded as stale that is now fresh was refreshed; re-export it."""
+        mock_core.rpc_call.return_value = _fulltext_response("W", ["old"])
+        web = [Source(id="w1", title="Site", _type_code=5)]
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock, return_value=web),
+            patch.object(sources_api, "check_freshness", new_callable=AsyncMock) as freshness,
+        ):
+            freshness.return_value = False
+            await sources_api.export_fulltexts("nb_1", tmp_path)
+
+            freshness.return_value = False
+            assert await sources_api.export_fulltexts("nb_1", tmp_path) == {}
+
+            mock_core.rpc_call.return_value = _fulltext_response("W", ["new"])
+            freshness.return_value = True
+            written = await sources_api.export_fulltexts("nb_1", tmp_path)
+
+        assert list(written) == ["w1"]
+        assert (tmp_path / "w1.txt").read_text(encoding="utf-8") == "new"
+
+    @pytest.mark.asyncio
+    async def test_fresh_source_is_not_fetched_again(self, sources_api, mock_core, tmp_path):
+        """A source fresh at both exports keeps its export without a fulltext fetch."""
+        mock_core.rpc_call.return_value = _fulltext_response("W", ["v1"])
+        web = [Source(id="w1", title="Site", _type_code=5)]
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock, return_value=web),
+            patch.object(sources_api, "check_freshness", new_callable=AsyncMock) as freshness,
+        ):
+            freshness.return_value = True
+            await sources_api.export_fulltexts("nb_1", tmp_path)
+            mock_core.rpc_call.reset_mock()
+
+            assert await sources_api.export_fulltexts("nb_1", tmp_path) == {}
+            mock_core.rpc_call.assert_not_awaited()
+
+            # Unknown freshness falls back to fetching and comparing the text
+            freshness.side_effect = RPCError("unavailable")
+            mock_core.rpc_call.return_value = _fulltext_response("W", ["v2"])
+            written = await sources_api.export_fulltexts("nb_1", tmp_path)
+
+        assert list(written) == ["w1"]
+        assert (tmp_path / "w1.txt").read_text(encoding="utf-8") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_processing_source_keeps_its_export(self, sources_api, mock_core, tmp_path):
+        """A source that is mid-refresh is not treated as removed."""
+        mock_core.rpc_call.return_value = _fulltext_response("T", ["text"])
+        ready = [Source(id="s1", title="A", _type_code=3)]
+        busy = [Source(id="s1", title="A", _type_code=3, status=1)]
+        with patch.object(sources_api, "list", new_callable=AsyncMock, side_effect=[ready, busy]):
+            await sources_api.export_fulltexts("nb_1", tmp_path)
+            await sources_api.export_fulltexts("nb_1", tmp_path)
+
+        assert (tmp_path / "s1.txt").exists()
+        manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+        assert list(manifest["sources"]) == ["s1"]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded_in_manifest(self, sources_api, mock_core, tmp_path):
+        """One failing source does not stop the export or the manifest write."""
+
+        async def rpc_call(method, params, **kwargs):
+            if params[0] == ["bad"]:
+                raise RPCError("server error")
+            return _fulltext_response("T", ["text"])
+
+        mock_core.rpc_call.side_effect = rpc_call
+        sources = [
+            Source(id="bad", title="B", _type_code=3),
+            Source(id="ok", title="O", _type_code=3),
+        ]
+        with patch.object(sources_api, "list", new_callable=AsyncMock, return_value=sources):
+            written = await sources_api.export_fulltexts("nb_1", tmp_path)
+
+        assert list(written) == ["ok"]
+        manifest = json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+        assert list(manifest["sources"]) == ["ok"]
+        assert manifest["failed"] == {"bad": "server error"}
+
+    @pytest.mark.asyncio
+    async def test_force_reexports_everything(self, sources_api, mock_core, tmp_path):
+        """force=True ignores the manifest."""
+        mock_core.rpc_call.return_value = _fulltext_response("T", ["text"])
+        sources = [Source(id="s1", title="A", _type_code=3)]
+        with patch.object(sources_api, "list", new_callable=AsyncMock, return_value=sources):
+            await sources_api.export_fulltexts("nb_1", tmp_path)
+            written = await sources_api.export_fulltexts("nb_1", tmp_path, force=True)
+
+        assert list(written) == ["s1"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency_raises(self, sources_api, tmp_path):
+        with pytest.raises(ValidationError, match="max_concurrency"):
+            await sources_api.export_fulltexts("nb_1", tmp_path, max_concurrency=0)
@@ -0,0 +1,181 @@
+"""Unit tests for SourcesAPI.refresh_stale bulk refresh."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notebooklm._sources import SourcesAPI
+from notebooklm.exceptions import RPCError, SourceTimeoutError, ValidationError
+from notebooklm.rpc import RPCMethod
+from notebooklm.types import Source, SourceStatus
+
+
+@pytest.fixture
+def sources_api():
+    core = MagicMock()
+    core.rpc_call = AsyncMock()
+    return SourcesAPI(core)
+
+
+def _sources() -> list[Source]:
+    return [
+        Source(id="web_fresh", title="Fresh", _type_code=5),
+        Source(id="web_stale", title="Stale", _type_code=5),
+        Source(id="yt_stale", title="Video", _type_code=9),
+        Source(id="pdf", title="Paper", _type_code=3),
+        Source(id="web_busy", title="Busy", _type_code=5, status=SourceStatus.PROCESSING),
+    ]
+
+
+class TestRefreshStale:
+    @pytest.mark.asyncio
+    async def test_refreshes_only_stale_refreshable_sources(self, sources_api):
+        """Uploaded files and still-processing sources are not checked."""
+        freshness = {"web_fresh": True, "web_stale": False, "yt_stale": False}
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock, return_value=_sources()),
+            patch.object(
+                sources_api,
+                "check_freshness",
+                new_callable=AsyncMock,
+                side_effect=lambda nb, sid: freshness[sid],
+            ) as check,
+            patch.object(sources_api, "refresh", new_callable=AsyncMock) as refresh,
+            patch.object(sources_api, "wait_for_sources", new_callable=AsyncMock) as wait,
+        ):
+            results = await sources_api.refresh_stale("nb_1")
+
+        assert sorted(call.args[1] for call in check.await_args_list) == sorted(freshness)
+        assert sorted(call.args[1] for call in refresh.await_args_list) == [
+            "web_stale",
+            "yt_stale",
+        ]
+        wait.assert_awaited_once_with("nb_1", ["web_stale", "yt_stale"], timeout=300.0)
+        assert {r.source_id: r.status for r in results} == {
+            "web_fresh": "fresh",
+            "web_stale": "refreshed",
+            "yt_stale": "refreshed",
+        }
+
+    @pytest.mark.asyncio
+    async def test_all_notebooks_when_notebook_id_is_none(self, sources_api):
+        sources_api._core.rpc_call.return_value = [[["A", None, "nb_1"], ["B", None, "nb_2"]]]
+        with (
+            patch.object(
+                sources_api,
+                "list",
+                new_callable=AsyncMock,
+                return_value=[Source(id="w", title="W", _type_code=5)],
+            ) as list_sources,
+            patch.object(sources_api, "check_freshness", new_callable=AsyncMock, return_value=True),
+        ):
+            results = await sources_api.refresh_stale()
+
+        assert sources_api._core.rpc_call.await_args.args[0] == RPCMethod.LIST_NOTEBOOKS
+        assert sorted(call.args[0] for call in list_sources.await_args_list) == ["nb_1", "nb_2"]
+        assert sorted(r.notebook_id for r in results) == ["nb_1", "nb_2"]
+
+    @pytest.mark.asyncio
+    async def test_unreadable_notebook_does_not_abort_others(self, sources_api):
+        sources_api._core.rpc_call.return_value = [[["Gone", None, "nb_gone"], ["B", None, "nb_2"]]]
+
+        async def list_sources(notebook_id):
+            if notebook_id == "nb_gone":
+                raise RPCError("not found")
+            return [Source(id="w", title="W", _type_code=5)]
+
+        with (
+            patch.object(sources_api, "list", side_effect=list_sources),
+            patch.object(
+                sources_api, "check_freshness", new_callable=AsyncMock, return_value=False
+            ),
+            patch.object(sources_api, "refresh", new_callable=AsyncMock) as refresh,
+            patch.object(sources_api, "wait_for_sources", new_callable=AsyncMock),
+        ):
+            results = await sources_api.refresh_stale()
+
+        by_notebook = {r.notebook_id: r for r in results}
+        assert by_notebook["nb_gone"].status == "failed"
+        assert by_notebook["nb_gone"].source_id == ""
+        assert by_notebook["nb_gone"].error == "not found"
+        assert by_notebook["nb_2"].status == "refreshed"
+        refresh.assert_awaited_once_with("nb_2", "w")
+
+    @pytest.mark.asyncio
+    async def test_rpc_error_marks_source_failed(self, sources_api):
+        with (
+            patch.object(
+                sources_api,
+                "list",
+                new_callable=AsyncMock,
+                return_value=[Source(id="w", title="W", _type_code=5)],
+            ),
+            patch.object(
+                sources_api, "check_freshness", new_callable=AsyncMock, return_value=False
+            ),
+            patch.object(
+                sources_api, "refresh", new_callable=AsyncMock, side_effect=RPCError("boom")
+            ),
+            patch.object(sources_api, "wait_for_sources", new_callable=AsyncMock) as wait,
+        ):
+            results = await sources_api.refresh_stale("nb_1")
+
+        assert results[0].status == "failed"
+        assert "boom" in results[0].error
+        wait.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_reports_current_states(self, sources_api):
+        """After a wait failure, one list() decides which refreshes failed."""
+        before = [
+            Source(id="a", title="A", _type_code=5),
+            Source(id="b", title="B", _type_code=5),
+        ]
+        after = [
+            Source(id="a", title="A", _type_code=5, status=SourceStatus.ERROR),
+            Source(id="b", title="B", _type_code=5, status=SourceStatus.PROCESSING),
+        ]
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock, side_effect=[before, after]),
+            patch.object(
+                sources_api, "check_freshness", new_callable=AsyncMock, return_value=False
+            ),
+            patch.object(sources_api, "refresh", new_callable=AsyncMock),
+            patch.object(
+                sources_api,
+                "wait_for_sources",
+                new_callable=AsyncMock,
+                side_effect=SourceTimeoutError("b", 300.0),
+            ),
+        ):
+            results = await sources_api.refresh_stale("nb_1")
+
+        by_id = {r.source_id: r for r in results}
+        assert by_id["a"].status == "failed"
+        assert by_id["b"].status == "refreshed"
+        assert by_id["b"].error == "still processing"
+
+    @pytest.mark.asyncio
+    async def test_no_wait(self, sources_api):
+        with (
+            patch.object(
+                sources_api,
+                "list",
+                new_callable=AsyncMock,
+                return_value=[Source(id="w", title="W", _type_code=5)],
+            ),
+            patch.object(
+                sources_api, "check_freshness", new_callable=AsyncMock, return_value=False
+            ),
+            patch.object(sources_api, "refresh", new_callable=AsyncMock),
+            patch.object(sources_api, "wait_for_sources", new_callable=AsyncMock) as wait,
+        ):
+            results = await sources_api.refresh_stale("nb_1", wait=False)
+
+        assert results[0].status == "refreshed"
+        wait.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency_raises(self, sources_api):
+        with pytest.raises(ValidationError, match="max_concurrency"):
+            await sources_api.refresh_stale("nb_1", max_concurrency=0)
@@ -0,0 +1,112 @@
+"""Unit tests for the shared GET_NOTEBOOK source row parser."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from notebooklm._core import ClientCore
+from notebooklm._source_rows import (
+    notebook_source_rows,
+    row_fields,
+    source_columns,
+    source_ids,
+)
+from notebooklm._sources import SourcesAPI
+from notebooklm.auth import AuthTokens
+from notebooklm.rpc.types import SourceStatus
+from notebooklm.types import Source
+
+
+def _row(source_id, title, type_code=5, status=2, url="https://example.com", created=1700000000):
+    metadata = [None, None, [created, 0], None, type_code, None, None, [url]]
+    return [[source_id], title, metadata, [None, status]]
+
+
+def _notebook(*rows) -> list:
+    return [["Notebook", list(rows), "nb_1"]]
+
+
+class TestRowFields:
+    def test_full_row(self):
+        assert row_fields(_row("s1", "Title")) == (
+            "s1",
+            "Title",
+            "https://example.com",
+            5,
+            2,
+            datetime.fromtimestamp(1700000000),
+        )
+
+    def test_malformed_fields_fall_back(self):
+        """Strings where lists are expected never yield single characters."""
+        row = [["s1"], "Title", "not-a-list", [None, 99]]
+
+        assert row_fields(row) == ("s1", "Title", None, None, SourceStatus.READY, None)
+
+    def test_flat_id_and_missing_id(self):
+        assert row_fields(["s1"])[0] == "s1"
+        assert row_fields([[]]) is None
+        assert row_fields("junk") is None
+
+    def test_unhashable_status_defaults_to_ready(self):
+        assert row_fields([["s1"], "T", None, [None, [1]]])[4] == SourceStatus.READY
+
+
+class TestColumnsAndIds:
+    def test_source_columns_are_parallel(self):
+        rows = [_row("s1", "A", type_code=3), "junk", _row("s2", "B", status=1, url=None)]
+
+        columns = source_columns(rows)
+
+        assert len(columns) == 2
+        assert columns.ids == ["s1", "s2"]
+        assert columns.titles == ["A", "B"]
+        assert columns.urls == ["https://example.com", None]
+        assert columns.type_codes == [3, 5]
+        assert columns.statuses == [2, 1]
+
+    def test_columns_match_list_objects(self):
+        rows = [_row("s1", "A"), _row("s2", "B", status=3)]
+        sources = [Source.from_notebook_row(row) for row in rows]
+        columns = source_columns(rows)
+
+        assert columns.ids == [s.id for s in sources]
+        assert columns.statuses == [s.status for s in sources]
+        assert columns.created_at == [s.created_at for s in sources]
+
+    def test_source_ids_only_string_ids(self):
+        rows = [_row("s1", "A"), [[123], "B"], ["flat"], None]
+
+        assert source_ids(rows) == ["s1"]
+
+    def test_notebook_source_rows(self):
+        assert notebook_source_rows(_notebook(_row("s1", "A"))) == [_row("s1", "A")]
+        assert notebook_source_rows([["Notebook", None]]) is None
+        assert notebook_source_rows(None) is None
+
+
+class TestApiUsesRows:
+    @pytest.fixture
+    def mock_core(self):
+        core = MagicMock()
+        core.rpc_call = AsyncMock(
+            return_value=_notebook(_row("s1", "A"), _row("s2", "B", status=1))
+        )
+        return core
+
+    @pytest.mark.asyncio
+    async def test_list_columns(self, mock_core):
+        columns = await SourcesAPI(mock_core).list_columns("nb_1")
+
+        assert columns.ids == ["s1", "s2"]
+        assert columns.statuses == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_list_and_get_source_ids_agree(self, mock_core):
+        sources = await SourcesAPI(mock_core).list("nb_1")
+
+        core = ClientCore(AuthTokens(cookies={"SID": "test"}, csrf_token="csrf", session_id="sid"))
+        core.rpc_call = mock_core.rpc_call
+        assert await core.get_source_ids("nb_1") == [s.id for s in sources]
+        assert [s.is_processing for s in sources] == [False, True]
@@ -124,7 +124,7 @@ class TestChatSourceSelection:
         assert result.answer == "Answer from all sources with enough length."
 
         # Verify get_source_ids was called on core
-        mock_core.get_source_ids.assert_called_once_with("nb_123")
+        mock_core.get_source_ids.assert_called_once_with("nb_123", allow_stale=True)
 
     @pytest.mark.asyncio
     async def test_ask_source_encoding_format(self, mock_core):
@@ -619,3 +619,80 @@ class TestGetSourceIds:
 
         # Should only extract the valid source
         assert source_ids == ["valid_id"]
+
+
+class TestSourceIdsCache:
+    """Tests for the per-notebook source ID cache in ClientCore."""
+
+    NOTEBOOK = [["nb_123", [[["src_a"], "A"]]]]
+
+    @pytest.fixture
+    def core(self, auth_tokens):
+        from notebooklm._core import ClientCore
+
+        core = ClientCore(auth_tokens)
+        core.rpc_call = AsyncMock(return_value=self.NOTEBOOK)
+        return core
+
+    @staticmethod
+    def _expire(core):
+        fetched_at, ids = core._source_ids_cache["nb_123"]
+        core._source_ids_cache["nb_123"] = (fetched_at - 60, ids)
+
+    @pytest.mark.asyncio
+    async def test_fresh_ids_are_reused(self, core):
+        assert await core.get_source_ids("nb_123") == ["src_a"]
+        assert await core.get_source_ids("nb_123") == ["src_a"]
+
+        assert core.rpc_call.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_fetch(self, core):
+        await core.get_source_ids("nb_123")
+        core.invalidate_source_ids("nb_123")
+        await core.get_source_ids("nb_123")
+
+        assert core.rpc_call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self, auth_tokens):
+        from notebooklm._core import ClientCore
+
+        core = ClientCore(auth_tokens, source_ids_ttl=0)
+        core.rpc_call = AsyncMock(return_value=self.NOTEBOOK)
+        await core.get_source_ids("nb_123")
+        await core.get_source_ids("nb_123")
+
+        assert core.rpc_call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_ids_served_while_refreshing(self, core):
+        import asyncio
+
+        await core.get_source_ids("nb_123")
+        self._expire(core)
+        core.rpc_call.return_value = [["nb_123", [[["src_a"], "A"], [["src_b"], "B"]]]]
+
+        assert await core.get_source_ids("nb_123", allow_stale=True) == ["src_a"]
+        await asyncio.gather(*core._source_ids_refreshes.values())
+
+        assert await core.get_source_ids("nb_123") == ["src_a", "src_b"]
+        assert core.rpc_call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_ids_refetched_without_allow_stale(self, core):
+        await core.get_source_ids("nb_123")
+        self._expire(core)
+        await core.get_source_ids("nb_123")
+
+        assert core.rpc_call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_adding_a_source_invalidates(self, core):
+        from notebooklm._sources import SourcesAPI
+
+        await core.get_source_ids("nb_123")
+        core.rpc_call.return_value = [[[["src_new"], "Notes"]]]
+        await SourcesAPI(core).add_text("nb_123", "Notes", "body")
+
+        assert "nb_123" not in core._source_ids_cache
@@ -233,35 +233,70 @@ class TestWaitForSources:
 
     @pytest.mark.asyncio
     async def test_waits_for_multiple_sources(self, sources_api):
-        """Test wait_for_sources waits for all sources in parallel."""
-        ready_sources = [
-            Source(id="src_1", status=SourceStatus.READY),
-            Source(id="src_2", status=SourceStatus.READY),
+        """Test wait_for_sources resolves all sources from one list per tick."""
+        snapshots = [
+            [
+                Source(id="src_1", status=SourceStatus.READY),
+                Source(id="src_2", status=SourceStatus.PROCESSING),
+                Source(id="src_3", status=SourceStatus.PROCESSING),
+            ],
+            [
+                Source(id="src_1", status=SourceStatus.READY),
+                Source(id="src_2", status=SourceStatus.READY),
+                Source(id="src_3", status=SourceStatus.PROCESSING),
+            ],
         ]
 
-        async def mock_wait(notebook_id, source_id, **kwargs):
-            for s in ready_sources:
-                if s.id == source_id:
-                    return s
-            raise SourceNotFoundError(source_id)
-
-        with patch.object(sources_api, "wait_until_ready", side_effect=mock_wait):
-            results = await sources_api.wait_for_sources("nb_1", ["src_1", "src_2"], timeout=10.0)
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock) as mock_list,
+            patch("notebooklm._sources.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_list.side_effect = snapshots
+            results = await sources_api.wait_for_sources("nb_1", ["src_2", "src_1"], timeout=10.0)
 
-            assert len(results) == 2
-            assert all(s.is_ready for s in results)
+        assert [s.id for s in results] == ["src_2", "src_1"]
+        assert all(s.is_ready for s in results)
+        assert mock_list.await_count == 2
 
     @pytest.mark.asyncio
     async def test_raises_on_any_failure(self, sources_api):
         """Test wait_for_sources raises if any source fails."""
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock) as mock_list,
+            pytest.raises(SourceProcessingError) as exc_info,
+        ):
+            mock_list.return_value = [
+                Source(id="src_1", status=SourceStatus.READY),
+                Source(id="src_2", status=SourceStatus.ERROR),
+            ]
+            await sources_api.wait_for_sources("nb_1", ["src_1", "src_2"], timeout=10.0)
 
-        async def mock_wait(notebook_id, source_id, **kwargs):
-            if source_id == "src_2":
-                raise SourceProcessingError(source_id, status=3)
-            return Source(id=source_id, status=SourceStatus.READY)
+        assert exc_info.value.source_id == "src_2"
 
+    @pytest.mark.asyncio
+    async def test_raises_not_found(self, sources_api):
+        """Test wait_for_sources raises if a source is missing from the notebook."""
         with (
-            patch.object(sources_api, "wait_until_ready", side_effect=mock_wait),
-            pytest.raises(SourceProcessingError),
+            patch.object(sources_api, "list", new_callable=AsyncMock) as mock_list,
+            pytest.raises(SourceNotFoundError),
         ):
+            mock_list.return_value = [Source(id="src_1", status=SourceStatus.READY)]
             await sources_api.wait_for_sources("nb_1", ["src_1", "src_2"], timeout=10.0)
+
+    @pytest.mark.asyncio
+    async def test_raises_timeout_with_pending_source(self, sources_api):
+        """Test wait_for_sources reports the first source still processing."""
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock) as mock_list,
+            pytest.raises(SourceTimeoutError) as exc_info,
+        ):
+            mock_list.return_value = [
+                Source(id="src_1", status=SourceStatus.READY),
+                Source(id="src_2", status=SourceStatus.PROCESSING),
+            ]
+            await sources_api.wait_for_sources(
+                "nb_1", ["src_1", "src_2"], timeout=0.05, initial_interval=0.02
+            )
+
+        assert exc_info.value.source_id == "src_2"
+        assert exc_info.value.last_status == SourceStatus.PROCESSING
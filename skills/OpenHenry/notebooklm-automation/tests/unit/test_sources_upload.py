@@ -1,10 +1,13 @@
-"""Unit tests for SourcesAPI file upload pipeline and YouTube detection."""
+"""Unit tests for SourcesAPI upload pipeline, bulk import and YouTube detection."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from notebooklm._sources import SourcesAPI
+from notebooklm.exceptions import ValidationError
+from notebooklm.types import Source, SourceAddError, SourceTimeoutError
 
 
 @pytest.fixture
@@ -369,6 +372,329 @@ class TestUploadFileStreaming:
                 await sources_api._upload_file_streaming("https://upload.example.com", test_file)
 
 
+def _upload_response(status: str | None = None, received: int | None = None) -> MagicMock:
+    """Build a mock upload response carrying resumable-upload status headers."""
+    response = MagicMock()
+    response.headers = {}
+    if status is not None:
+        response.headers["x-goog-upload-status"] = status
+    if received is not None:
+        response.headers["x-goog-upload-size-received"] = str(received)
+    return response
+
+
+class TestChunkedUpload:
+    """Tests for chunked, resumable uploads."""
+
+    @pytest.mark.asyncio
+    async def test_uploads_in_chunks_then_finalizes(self, sources_api, tmp_path):
+        """Large files are sent as sequential chunks with the last one finalizing."""
+        test_file = tmp_path / "big.bin"
+        test_file.write_bytes(b"a" * 10)
+        bodies = []
+
+        async def record_post(url, headers, content=None):
+            bodies.append((headers["x-goog-upload-command"], headers["x-goog-upload-offset"]))
+            bodies[-1] += (b"".join([chunk async for chunk in content]),)
+            return _upload_response()
+
+        with patch("httpx.AsyncClient") as mock_client_cls:
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.post.side_effect = record_post
+            mock_client_cls.return_value = mock_client
+
+            await sources_api._upload_file_streaming("https://upload", test_file, chunk_size=4)
+
+        assert bodies == [
+            ("upload", "0", b"aaaa"),
+            ("upload", "4", b"aaaa"),
+            ("upload, finalize", "8", b"aa"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_committed_offset_after_failure(self, sources_api, tmp_path):
+        """A failed chunk queries the committed offset and resumes from it."""
+        import httpx
+
+        test_file = tmp_path / "big.bin"
+        test_file.write_bytes(b"0123456789")
+        calls = []
+
+        async def flaky_post(url, headers, content=None):
+            command = headers["x-goog-upload-command"]
+            calls.append((command, headers.get("x-goog-upload-offset")))
+            if command == "query":
+                return _upload_response("active", 2)
+            if len(calls) == 2:
+                raise httpx.ConnectError("connection reset")
+            body = b"".join([chunk async for chunk in content])
+            calls[-1] += (body,)
+            return _upload_response()
+
+        with (
+            patch("httpx.AsyncClient") as mock_client_cls,
+            patch("notebooklm._sources.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.post.side_effect = flaky_post
+            mock_client_cls.return_value = mock_client
+
+            await sources_api._upload_file_streaming("https://upload", test_file, chunk_size=4)
+
+        assert calls == [
+            ("upload", "0", b"0123"),
+            ("upload", "4"),
+            ("query", None),
+            ("upload", "2", b"2345"),
+            ("upload, finalize", "6", b"6789"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, sources_api, tmp_path):
+        """Persistent transient failures eventually propagate."""
+        import httpx
+
+        test_file = tmp_path / "f.bin"
+        test_file.write_bytes(b"data")
+
+        async def failing_post(url, headers, content=None):
+            if headers["x-goog-upload-command"] == "query":
+                return _upload_response("active", 0)
+            raise httpx.ReadTimeout("slow link")
+
+        with (
+            patch("httpx.AsyncClient") as mock_client_cls,
+            patch("notebooklm._sources.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.post.side_effect = failing_post
+            mock_client_cls.return_value = mock_client
+
+            with pytest.raises(httpx.ReadTimeout):
+                await sources_api._upload_file_streaming("https://upload", test_file, max_retries=2)
+
+        upload_calls = [
+            c
+            for c in mock_client.post.call_args_list
+            if c.kwargs["headers"]["x-goog-upload-command"] != "query"
+        ]
+        assert len(upload_calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_add_file_resumes_persisted_session(self, mock_core, tmp_path):
+        """A recorded session is resumed without registering a new source."""
+        from notebooklm._uploads import UploadSessionStore
+
+        store = UploadSessionStore(tmp_path / "sessions.json")
+        api = SourcesAPI(mock_core, upload_sessions=store)
+        test_file = tmp_path / "doc.pdf"
+        test_file.write_bytes(b"0123456789")
+        key = store.session_key("nb_123", test_file.resolve())
+        store.put(key, "https://upload.example.com/s1", "src_resumed")
+
+        with (
+            patch.object(
+                api, "_query_upload_offset", new_callable=AsyncMock, return_value=(6, False)
+            ),
+            patch.object(api, "_upload_file_streaming", new_callable=AsyncMock) as upload,
+        ):
+            result = await api.add_file("nb_123", test_file)
+
+        mock_core.rpc_call.assert_not_awaited()
+        upload.assert_awaited_once_with(
+            "https://upload.example.com/s1", test_file.resolve(), start_offset=6
+        )
+        assert result.id == "src_resumed"
+        assert store.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_add_file_restarts_when_session_expired(self, mock_core, tmp_path):
+        """If the server no longer knows the session, a fresh upload starts."""
+        from notebooklm._uploads import UploadSessionStore
+
+        store = UploadSessionStore(tmp_path / "sessions.json")
+        api = SourcesAPI(mock_core, upload_sessions=store)
+        test_file = tmp_path / "doc.pdf"
+        test_file.write_bytes(b"data")
+        key = store.session_key("nb_123", test_file.resolve())
+        store.put(key, "https://upload.example.com/old", "src_old")
+        mock_core.rpc_call.return_value = [[[["src_new"]]]]
+
+        with (
+            patch.object(api, "_query_upload_offset", new_callable=AsyncMock, return_value=None),
+            patch.object(
+                api,
+                "_start_resumable_upload",
+                new_callable=AsyncMock,
+                return_value="https://upload.example.com/new",
+            ),
+            patch.object(api, "_upload_file_streaming", new_callable=AsyncMock) as upload,
+        ):
+            result = await api.add_file("nb_123", test_file)
+
+        upload.assert_awaited_once_with(
+            "https://upload.example.com/new", test_file.resolve(), start_offset=0
+        )
+        assert result.id == "src_new"
+        assert store.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_add_file_keeps_session_when_upload_fails(self, mock_core, tmp_path):
+        """An interrupted upload leaves its session recorded for the next attempt."""
+        import httpx
+
+        from notebooklm._uploads import UploadSessionStore
+
+        store = UploadSessionStore(tmp_path / "sessions.json")
+        api = SourcesAPI(mock_core, upload_sessions=store)
+        test_file = tmp_path / "doc.pdf"
+        test_file.write_bytes(b"data")
+        mock_core.rpc_call.return_value = [[[["src_new"]]]]
+
+        with (
+            patch.object(
+                api,
+                "_start_resumable_upload",
+                new_callable=AsyncMock,
+                return_value="https://upload.example.com/new",
+            ),
+            patch.object(
+                api,
+                "_upload_file_streaming",
+                new_callable=AsyncMock,
+                side_effect=httpx.ConnectError("offline"),
+            ),
+            pytest.raises(httpx.ConnectError),
+        ):
+            await api.add_file("nb_123", test_file)
+
+        session = store.get(store.session_key("nb_123", test_file.resolve()))
+        assert session is not None
+        assert session.source_id == "src_new"
+
+
+class TestInMemoryUpload:
+    """Tests for add_bytes(), add_stream() and upload chunk sizing."""
+
+    async def _capture_upload(self, api, call):
+        """Run an add_* call with registration mocked; return uploaded bytes."""
+        uploaded = []
+
+        async def record_post(url, headers, content=None):
+            uploaded.append(b"".join([bytes(piece) async for piece in content]))
+            return _upload_response()
+
+        with (
+            patch.object(
+                api, "_register_file_source", new_callable=AsyncMock, return_value="src_mem"
+            ),
+            patch.object(
+                api, "_start_resumable_upload", new_callable=AsyncMock, return_value="https://up"
+            ) as start,
+            patch("httpx.AsyncClient") as mock_client_cls,
+        ):
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.post.side_effect = record_post
+            mock_client_cls.return_value = mock_client
+
+            source = await call()
+
+        return source, start, b"".join(uploaded)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("data", [b"%PDF-1.4 body", bytearray(b"%PDF-1.4 body")])
+    async def test_add_bytes_uploads_buffer(self, sources_api, data):
+        """add_bytes() uploads the buffer without touching the filesystem."""
+        source, start, uploaded = await self._capture_upload(
+            sources_api, lambda: sources_api.add_bytes("nb_123", data, "report.pdf")
+        )
+
+        start.assert_awaited_once_with("nb_123", "report.pdf", len(data), "src_mem")
+        assert uploaded == bytes(data)
+        assert source.id == "src_mem"
+        assert source.title == "report.pdf"
+
+    @pytest.mark.asyncio
+    async def test_add_bytes_accepts_memoryview(self, sources_api):
+        """Non-byte memoryviews are uploaded as their raw bytes."""
+        import array
+
+        values = array.array("i", [1, 2, 3])
+        _, start, uploaded = await self._capture_upload(
+            sources_api, lambda: sources_api.add_bytes("nb_123", memoryview(values), "a.bin")
+        )
+
+        assert uploaded == values.tobytes()
+        assert start.call_args[0][2] == len(values.tobytes())
+
+    @pytest.mark.asyncio
+    async def test_add_stream_accepts_async_iterator(self, sources_api):
+        """add_stream() buffers async chunks and uploads them with the total size."""
+
+        async def chunks():
+            yield b"# Title\n"
+            yield b"body\n"
+
+        _, start, uploaded = await self._capture_upload(
+            sources_api, lambda: sources_api.add_stream("nb_123", chunks(), "notes.md")
+        )
+
+        assert uploaded == b"# Title\nbody\n"
+        assert start.call_args[0][2] == len(uploaded)
+
+    @pytest.mark.asyncio
+    async def test_add_stream_accepts_sync_iterable(self, sources_api):
+        """add_stream() also accepts plain iterables of bytes."""
+        _, _, uploaded = await self._capture_upload(
+            sources_api, lambda: sources_api.add_stream("nb_123", [b"a", b"b"], "x.txt")
+        )
+
+        assert uploaded == b"ab"
+
+    @pytest.mark.asyncio
+    async def test_file_upload_falls_back_when_mmap_fails(self, sources_api, tmp_path):
+        """Files that cannot be memory-mapped are read normally."""
+        test_file = tmp_path / "doc.txt"
+        test_file.write_bytes(b"fallback content")
+        uploaded = []
+
+        async def record_post(url, headers, content=None):
+            uploaded.append(b"".join([piece async for piece in content]))
+            return _upload_response()
+
+        with (
+            patch("notebooklm._sources.mmap.mmap", side_effect=OSError("no mmap")),
+            patch("httpx.AsyncClient") as mock_client_cls,
+        ):
+            mock_client = AsyncMock()
+            mock_client.__aenter__.return_value = mock_client
+            mock_client.post.side_effect = record_post
+            mock_client_cls.return_value = mock_client
+
+            await sources_api._upload_file_streaming("https://up", test_file)
+
+        assert uploaded == [b"fallback content"]
+
+    @pytest.mark.parametrize(
+        "total_size,expected",
+        [
+            (0, 8 * 1024 * 1024),
+            (10 * 1024 * 1024, 8 * 1024 * 1024),
+            (512 * 1024 * 1024, 32 * 1024 * 1024),
+            (4 * 1024 * 1024 * 1024, 64 * 1024 * 1024),
+        ],
+    )
+    def test_adaptive_chunk_size(self, total_size, expected):
+        """Chunk size grows with the upload, within fixed bounds."""
+        from notebooklm._sources import _adaptive_chunk_size
+
+        assert _adaptive_chunk_size(total_size) == expected
+
+
 # =============================================================================
 # add_file() tests
 # =============================================================================
@@ -520,3 +846,234 @@ class TestAddUrlSource:
         assert params[2] == [2]
         assert params[3] is None
         assert params[4] is None
+
+
+# =============================================================================
+# add_many() tests
+# =============================================================================
+
+
+class TestAddMany:
+    """Tests for the add_many() bulk import method."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_each_item_kind(self, sources_api, tmp_path):
+        """Each item kind should be routed to the matching add_* method."""
+        test_file = tmp_path / "a.pdf"
+        test_file.write_bytes(b"pdf")
+        items = [
+            "https://example.com/a",
+            test_file,
+            {"title": "Notes", "content": "hello"},
+            {"drive_id": "drive_1", "title": "Doc"},
+        ]
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock, return_value=[]),
+            patch.object(
+                sources_api, "add_url", new_callable=AsyncMock, return_value=Source(id="s_url")
+            ) as add_url,
+            patch.object(
+                sources_api, "add_file", new_callable=AsyncMock, return_value=Source(id="s_file")
+            ) as add_file,
+            patch.object(
+                sources_api, "add_text", new_callable=AsyncMock, return_value=Source(id="s_text")
+            ) as add_text,
+            patch.object(
+                sources_api, "add_drive", new_callable=AsyncMock, return_value=Source(id="s_drv")
+            ) as add_drive,
+        ):
+            results = await sources_api.add_many("nb_123", items)
+
+        assert [r.status for r in results] == ["added"] * 4
+        assert [r.source.id for r in results] == ["s_url", "s_file", "s_text", "s_drv"]
+        assert [r.item for r in results] == items
+        add_url.assert_awaited_once_with("nb_123", "https://example.com/a", skip_duplicates=False)
+        add_file.assert_awaited_once_with("nb_123", test_file, skip_duplicates=False)
+        add_text.assert_awaited_once_with("nb_123", "Notes", "hello", skip_duplicates=False)
+        add_drive.assert_awaited_once_with("nb_123", "drive_1", "Doc")
+
+    @pytest.mark.asyncio
+    async def test_hashes_files_off_the_event_loop(self, sources_api, tmp_path):
+        """File dedup keys are computed in worker threads; copies are skipped."""
+        first = tmp_path / "a.pdf"
+        second = tmp_path / "b.pdf"
+        first.write_bytes(b"same")
+        second.write_bytes(b"same")
+        with (
+            patch(
+                "notebooklm._sources.asyncio.to_thread", side_effect=asyncio.to_thread
+            ) as to_thread,
+            patch.object(
+                sources_api, "add_file", new_callable=AsyncMock, return_value=Source(id="s_file")
+            ),
+        ):
+            results = await sources_api.add_many("nb_123", [first, second], skip_existing=False)
+
+        assert [r.status for r in results] == ["added", "skipped"]
+        hashed = [
+            c.args[1] for c in to_thread.call_args_list if c.args[0] == sources_api._file_sha256
+        ]
+        assert sorted(hashed) == [first.resolve(), second.resolve()]
+
+    @pytest.mark.asyncio
+    async def test_skips_existing_and_duplicate_urls(self, sources_api):
+        """URLs already in the notebook or repeated in the batch are skipped."""
+        existing = Source(id="s_old", url="https://example.com/old/")
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock, return_value=[existing]),
+            patch.object(
+                sources_api, "add_url", new_callable=AsyncMock, return_value=Source(id="s_new")
+            ) as add_url,
+        ):
+            results = await sources_api.add_many(
+                "nb_123",
+                [
+                    "https://EXAMPLE.com/old#top",
+                    "https://example.com/new",
+                    "https://example.com/new/",
+                ],
+            )
+
+        assert [r.status for r in results] == ["skipped", "added", "skipped"]
+        assert results[0].source is existing
+        assert results[2].error == "duplicate of item 1"
+        add_url.assert_awaited_once_with("nb_123", "https://example.com/new", skip_duplicates=False)
+
+    @pytest.mark.asyncio
+    async def test_skip_existing_false_does_not_list(self, sources_api):
+        """With skip_existing=False the notebook's sources are not fetched."""
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock) as mock_list,
+            patch.object(
+                sources_api, "add_url", new_callable=AsyncMock, return_value=Source(id="s_1")
+            ),
+        ):
+            results = await sources_api.add_many(
+                "nb_123", ["https://example.com"], skip_existing=False
+            )
+
+        mock_list.assert_not_awaited()
+        assert results[0].is_added
+
+    @pytest.mark.asyncio
+    async def test_duplicate_files_by_content(self, sources_api, tmp_path):
+        """Files with identical content are uploaded once."""
+        first = tmp_path / "a.txt"
+        second = tmp_path / "b.txt"
+        first.write_bytes(b"same")
+        second.write_bytes(b"same")
+        with patch.object(
+            sources_api, "add_file", new_callable=AsyncMock, return_value=Source(id="s_1")
+        ) as add_file:
+            results = await sources_api.add_many("nb_123", [first, {"file": second}])
+
+        assert [r.status for r in results] == ["added", "skipped"]
+        add_file.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported_not_raised(self, sources_api, tmp_path):
+        """A failing item is reported without aborting the rest of the batch."""
+        progress = []
+        with (
+            patch.object(sources_api, "list", new_callable=AsyncMock, return_value=[]),
+            patch.object(
+                sources_api,
+                "add_url",
+                new_callable=AsyncMock,
+                side_effect=[SourceAddError("https://bad.example"), Source(id="s_ok")],
+            ),
+        ):
+            results = await sources_api.add_many(
+                "nb_123",
+                [
+                    "https://bad.example",
+                    "https://good.example",
+                    tmp_path / "missing.pdf",
+                    {"unknown": 1},
+                ],
+                concurrency=1,
+                on_progress=progress.append,
+            )
+
+        assert [r.status for r in results] == ["failed", "added", "failed", "failed"]
+        assert "bad.example" in results[0].error
+        assert len(progress) == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, sources_api):
+        """No more than `concurrency` items should be added at once."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_add(notebook_id, url, skip_duplicates=True):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Source(id=url)
+
+        urls = [f"https://example.com/{i}" for i in range(8)]
+        with patch.object(sources_api, "add_url", side_effect=slow_add):
+            results = await sources_api.add_many("nb_123", urls, concurrency=3, skip_existing=False)
+
+        assert peak == 3
+        assert [r.source.id for r in results] == urls
+
+    @pytest.mark.asyncio
+    async def test_wait_refreshes_sources_in_one_batch(self, sources_api):
+        """wait=True should wait on all added sources together."""
+        ready = [Source(id="s_1", status=2), Source(id="s_2", status=2)]
+        with (
+            patch.object(
+                sources_api,
+                "add_url",
+                new_callable=AsyncMock,
+                side_effect=[Source(id="s_1", status=1), Source(id="s_2", status=1)],
+            ),
+            patch.object(
+                sources_api, "wait_for_sources", new_callable=AsyncMock, return_value=ready
+            ) as wait_for_sources,
+        ):
+            results = await sources_api.add_many(
+                "nb_123", ["https://a.com", "https://b.com"], skip_existing=False, wait=True
+            )
+
+        wait_for_sources.assert_awaited_once_with("nb_123", ["s_1", "s_2"], timeout=120.0)
+        assert all(r.source.is_ready for r in results)
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_reports_latest_state(self, sources_api):
+        """If waiting times out, results carry the latest listed state."""
+        with (
+            patch.object(
+                sources_api,
+                "add_url",
+                new_callable=AsyncMock,
+                return_value=Source(id="s_1", status=1),
+            ),
+            patch.object(
+                sources_api,
+                "wait_for_sources",
+                new_callable=AsyncMock,
+                side_effect=SourceTimeoutError("s_1", 1.0),
+            ),
+            patch.object(
+                sources_api,
+                "list",
+                new_callable=AsyncMock,
+                return_value=[Source(id="s_1", status=3)],
+            ),
+        ):
+            results = await sources_api.add_many(
+                "nb_123", ["https://a.com"], skip_existing=False, wait=True
+            )
+
+        assert results[0].is_added
+        assert results[0].source.is_error
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency_raises(self, sources_api):
+        """concurrency below 1 is rejected."""
+        with pytest.raises(ValidationError, match="concurrency"):
+            await sources_api.add_many("nb_123", ["https://a.com"], concurrency=0)
@@ -0,0 +1,211 @@
+"""Tests for local directory → notebook synchronisation."""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from notebooklm._sync import DirectorySync
+from notebooklm.types import Source, SourceAddResult
+
+
+class FakeSources:
+    """In-memory stand-in for SourcesAPI tracking live source IDs."""
+
+    def __init__(self):
+        self.live: dict[str, str] = {}
+        self.uploads: list[str] = []
+        self.deleted: list[str] = []
+        self.fail: set[str] = set()
+
+    async def list(self, notebook_id):
+        return [Source(id=source_id, title=title) for source_id, title in self.live.items()]
+
+    async def add_many(self, notebook_id, items, concurrency=5, skip_existing=True):
+        results = []
+        seen: dict[bytes, Source] = {}
+        for path in items:
+            content = path.read_bytes()
+            if path.name in self.fail:
+                results.append(SourceAddResult(item=path, status="failed", error="boom"))
+            elif content in seen:
+                results.append(SourceAddResult(item=path, status="skipped"))
+            else:
+                source = Source(id=f"src_{len(self.uploads)}", title=path.name)
+                self.uploads.append(path.name)
+                self.live[source.id] = path.name
+                seen[content] = source
+                results.append(SourceAddResult(item=path, status="added", source=source))
+        return results
+
+    async def delete(self, notebook_id, source_id):
+        self.deleted.append(source_id)
+        self.live.pop(source_id, None)
+        return True
+
+
+def _touch(path, content: bytes):
+    path.write_bytes(content)
+    # Ensure mtime changes even on coarse-grained filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def sources():
+    return FakeSources()
+
+
+@pytest.fixture
+def make_sync(sources, tmp_path):
+    directory = tmp_path / "docs"
+    directory.mkdir()
+
+    def factory(**kwargs):
+        return DirectorySync(
+            sources, "nb_1", directory, state_path=tmp_path / "state.json", **kwargs
+        )
+
+    return directory, factory
+
+
+class TestDirectorySync:
+    @pytest.mark.asyncio
+    async def test_restart_does_not_reupload(self, sources, make_sync):
+        directory, factory = make_sync
+        (directory / "a.pdf").write_bytes(b"A")
+        (directory / "b.pdf").write_bytes(b"B")
+
+        first = await factory().sync()
+        second = await factory().sync()
+
+        assert first.added == ["a.pdf", "b.pdf"]
+        assert second.unchanged == ["a.pdf", "b.pdf"]
+        assert not second.has_changes
+        assert sources.uploads == ["a.pdf", "b.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_changed_file_replaces_source(self, sources, make_sync):
+        directory, factory = make_sync
+        _touch(directory / "a.pdf", b"v1")
+        await factory().sync()
+
+        _touch(directory / "a.pdf", b"v2")
+        report = await factory().sync()
+
+        assert report.updated == ["a.pdf"]
+        assert report.deleted == ["src_0"]
+        assert list(sources.live) == ["src_1"]
+
+    @pytest.mark.asyncio
+    async def test_vanished_file_deletes_source_unless_disabled(self, sources, make_sync):
+        directory, factory = make_sync
+        (directory / "a.pdf").write_bytes(b"A")
+        await factory().sync()
+        (directory / "a.pdf").unlink()
+
+        kept = await factory(delete_missing=False).sync()
+        assert kept.deleted == []
+        assert "src_0" in sources.live
+
+        (directory / "b.pdf").write_bytes(b"B")
+        await factory(delete_missing=False).sync()
+        assert sources.live.keys() == {"src_0", "src_1"}
+
+    @pytest.mark.asyncio
+    async def test_rename_and_copy_reuse_source(self, sources, make_sync):
+        directory, factory = make_sync
+        (directory / "a.pdf").write_bytes(b"same")
+        await factory().sync()
+
+        (directory / "a.pdf").rename(directory / "renamed.pdf")
+        (directory / "copy.pdf").write_bytes(b"same")
+        report = await factory().sync()
+
+        assert sorted(report.renamed) == ["copy.pdf", "renamed.pdf"]
+        assert report.deleted == []
+        assert sources.uploads == ["a.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_failed_update_keeps_old_source(self, sources, make_sync):
+        directory, factory = make_sync
+        _touch(directory / "a.pdf", b"v1")
+        await factory().sync()
+
+        _touch(directory / "a.pdf", b"v2")
+        sources.fail.add("a.pdf")
+        report = await factory().sync()
+
+        assert report.failed == {"a.pdf": "boom"}
+        assert report.deleted == []
+        sources.fail.clear()
+        retry = await factory().sync()
+        assert retry.updated == ["a.pdf"]
+        assert retry.deleted == ["src_0"]
+
+    @pytest.mark.asyncio
+    async def test_source_deleted_in_notebook_is_reuploaded(self, sources, make_sync):
+        directory, factory = make_sync
+        (directory / "a.pdf").write_bytes(b"A")
+        await factory().sync()
+        sources.live.clear()
+
+        report = await factory().sync()
+
+        assert report.updated == ["a.pdf"]
+        assert sources.uploads == ["a.pdf", "a.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_pattern_and_recursive(self, sources, make_sync):
+        directory, factory = make_sync
+        (directory / "a.pdf").write_bytes(b"A")
+        (directory / "notes.txt").write_bytes(b"N")
+        (directory / "sub").mkdir()
+        (directory / "sub" / "b.pdf").write_bytes(b"B")
+
+        flat = await factory(pattern="*.pdf").sync()
+        assert flat.added == ["a.pdf"]
+
+        deep = await factory(pattern="*.pdf", recursive=True).sync()
+        assert deep.added == ["sub/b.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_missing_directory_raises(self, sources, tmp_path):
+        sync = DirectorySync(sources, "nb_1", tmp_path / "nope", state_path=tmp_path / "s.json")
+        with pytest.raises(FileNotFoundError):
+            await sync.sync()
+
+
+class TestWatch:
+    @pytest.mark.asyncio
+    async def test_watch_debounces_changes_into_one_pass(self, sources, make_sync):
+        """A burst of changes is synced once, after the directory settles."""
+        directory, factory = make_sync
+        sync = factory()
+        reports = []
+        snapshots = iter(
+            [
+                {},  # initial
+                {"a.pdf": (1, 1)},  # change detected
+                {"a.pdf": (1, 1), "b.pdf": (1, 1)},  # still changing
+                {"a.pdf": (1, 1), "b.pdf": (1, 1)},  # settled
+            ]
+        )
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) > 3:
+                raise asyncio.CancelledError
+
+        with (
+            patch.object(sync, "_snapshot", side_effect=lambda: next(snapshots)),
+            patch.object(sync, "sync", new_callable=AsyncMock, return_value=MagicMock()),
+            patch("notebooklm._sync.asyncio.sleep", side_effect=fake_sleep),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await sync.watch(interval=5, debounce=2, on_sync=reports.append)
+
+        assert sleeps[:3] == [5, 2, 2]
+        assert len(reports) == 2  # initial pass + one debounced pass
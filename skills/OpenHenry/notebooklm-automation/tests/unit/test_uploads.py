@@ -0,0 +1,59 @@
+"""Tests for persisted resumable upload sessions."""
+
+import json
+import time
+
+from notebooklm._uploads import UploadSessionStore
+
+
+class TestUploadSessionStore:
+    def test_put_get_remove_roundtrip(self, tmp_path):
+        """Sessions survive a reload and are gone after remove()."""
+        path = tmp_path / "sub" / "sessions.json"
+        store = UploadSessionStore(path)
+        store.put("key", "https://upload.example.com/s1", "src_1")
+
+        session = UploadSessionStore(path).get("key")
+        assert session is not None
+        assert session.upload_url == "https://upload.example.com/s1"
+        assert session.source_id == "src_1"
+
+        store.remove("key")
+        assert UploadSessionStore(path).get("key") is None
+
+    def test_expired_session_not_returned(self, tmp_path):
+        """Sessions older than max_age are dropped."""
+        path = tmp_path / "sessions.json"
+        path.write_text(
+            json.dumps(
+                {"key": {"upload_url": "u", "source_id": "s", "created_at": time.time() - 100}}
+            ),
+            encoding="utf-8",
+        )
+
+        store = UploadSessionStore(path, max_age=10)
+
+        assert store.get("key") is None
+        assert json.loads(path.read_text(encoding="utf-8")) == {}
+
+    def test_ignores_corrupt_file(self, tmp_path):
+        """A corrupt sessions file is treated as empty."""
+        path = tmp_path / "sessions.json"
+        path.write_text("not json", encoding="utf-8")
+
+        store = UploadSessionStore(path)
+
+        assert store.get("key") is None
+        store.put("key", "u", "s")
+        assert store.get("key") is not None
+
+    def test_session_key_changes_with_file_content(self, tmp_path):
+        """Editing the file (size/mtime) or switching notebook changes the key."""
+        test_file = tmp_path / "doc.pdf"
+        test_file.write_bytes(b"v1")
+        key = UploadSessionStore.session_key("nb_1", test_file)
+
+        assert UploadSessionStore.session_key("nb_1", test_file) == key
+        assert UploadSessionStore.session_key("nb_2", test_file) != key
+        test_file.write_bytes(b"version two")
+        assert UploadSessionStore.session_key("nb_1", test_file) != key
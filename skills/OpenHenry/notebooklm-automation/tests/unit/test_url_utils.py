@@ -10,6 +10,7 @@ from notebooklm._url_utils import (
     contains_google_auth_redirect,
     is_google_auth_redirect,
     is_youtube_url,
+    normalize_source_url,
 )
 
 
@@ -154,3 +155,33 @@ class TestContainsGoogleAuthRedirect:
         <a href="https://google.com">Google</a>
         """
         assert contains_google_auth_redirect(html) is False
+
+
+class TestNormalizeSourceUrl:
+    """Tests for normalize_source_url function."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://Example.COM/Page/", "https://example.com/Page"),
+            ("HTTPS://example.com/a#section", "https://example.com/a"),
+            ("  https://example.com/  ", "https://example.com"),
+            (
+                "https://www.youtube.com/watch?v=abc123",
+                "https://www.youtube.com/watch?v=abc123",
+            ),
+        ],
+    )
+    def test_normalizes_url(self, url: str, expected: str):
+        """Should lowercase scheme/host and drop fragment and trailing slash."""
+        assert normalize_source_url(url) == expected
+
+    def test_keeps_query_distinct(self):
+        """URLs differing only in query string should stay distinct."""
+        assert normalize_source_url("https://a.com/p?x=1") != normalize_source_url(
+            "https://a.com/p?x=2"
+        )
+
+    def test_non_url_returned_stripped(self):
+        """Inputs without scheme and host should be returned as-is (stripped)."""
+        assert normalize_source_url(" not a url ") == "not a url"